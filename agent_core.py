@@ -17,7 +17,7 @@ import time
 import logging
 from decimal import Decimal
 from types import SimpleNamespace
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, List, TYPE_CHECKING
 from virtual_diary import load_entries
 from config import Config, get_emoji_weights
 from hook_manager import HookManager
@@ -28,7 +28,6 @@ if TYPE_CHECKING:
         Config,
         QuantumContext,
         Vaccine,
-        LogChain,
         SQLAlchemyStorage,
         SessionLocal,
         InMemoryStorage,
@@ -49,37 +48,16 @@ if TYPE_CHECKING:
         CrossRemixPayload,
     )
 
+from logchain import LogChain
 from moderation_utils import Vaccine
+from nonce_store import NonceStore
+from tally_engine import TallyEngine
 
 try:  # pragma: no cover - optional dependency may not be available
     from hooks import events
 except Exception:  # pragma: no cover - graceful fallback
     events = None  # type: ignore[assignment]
 
-# Provide a minimal fallback implementation of ``LogChain`` if the real
-# class is unavailable at runtime. Tests only require ``add``,
-# ``replay_events``, ``verify`` and ``entries`` attributes.
-try:  # pragma: no cover - prefer real implementation when present
-    LogChain  # type: ignore[name-defined]
-except Exception:  # pragma: no cover - lightweight stub for tests
-
-    class LogChain:
-        """Simplified event log used during tests."""
-
-        def __init__(self, filename: str) -> None:
-            self.filename = filename
-            self.entries: list[dict[str, Any]] = []
-
-        def add(self, event: Dict[str, Any]) -> None:
-            self.entries.append(event)
-
-        def replay_events(self, handler: Any, since: Any = None) -> None:
-            for event in self.entries:
-                handler(event)
-
-        def verify(self) -> bool:
-            return True
-
 
 def ScientificModel(*args: Any, **kwargs: Any):  # placeholder
     def decorator(func: Any) -> Any:
@@ -123,7 +101,11 @@ class RemixAgent:
             filename = os.environ.get("LOGCHAIN_FILE", "remix_logchain.log")
         if snapshot is None:
             snapshot = os.environ.get("SNAPSHOT_FILE", "remix_snapshot.json")
-        self.logchain = LogChain(filename)
+        self.logchain = LogChain(
+            filename,
+            segment_bytes=self.config.LOGCHAIN_SEGMENT_BYTES,
+            index_interval=self.config.LOGCHAIN_INDEX_INTERVAL,
+        )
         self.storage = (
             SQLAlchemyStorage(SessionLocal)
             if not USE_IN_MEMORY_STORAGE
@@ -134,36 +116,54 @@ class RemixAgent:
         self.lock = threading.RLock()
         self.snapshot = snapshot
         self.hooks = HookManager()
+        if self.config.HOOK_DISPATCH_ASYNC:
+            # Hooks run off the ingest path; slow ones cannot hold up events.
+            self.hooks.start_dispatcher(
+                max_pending=self.config.HOOK_QUEUE_SIZE,
+                hook_timeout=self.config.HOOK_TIMEOUT_SECONDS,
+                submit_timeout=self.config.HOOK_SUBMIT_TIMEOUT_SECONDS,
+                workers_per_hook=self.config.HOOK_WORKERS_PER_HOOK,
+            )
+        self.tally_engine = TallyEngine(
+            self.config.SPECIES, self.config.GENESIS_BONUS_DECAY_YEARS
+        )
         # Track awarded fork badges for users
         self.fork_badges: Dict[str, list[str]] = {}
         # Register hook for cross remix creation events
         if events is not None:
             self.hooks.register_hook(events.CROSS_REMIX_CREATED, self.on_cross_remix_created)
         self.event_count = 0
-        self.processed_nonces = {}
+        self.processed_nonces = NonceStore(
+            self.config.NONCE_EXPIRATION_SECONDS,
+            slot_seconds=self.config.NONCE_SLOT_SECONDS,
+            bloom_bits=self.config.NONCE_BLOOM_BITS,
+        )
         self._cleanup_thread = threading.Thread(
             target=self._cleanup_nonces, daemon=True
         )
         self._cleanup_thread.start()
         if not self._use_simple:
             self.load_state()
+        else:
+            # No snapshot in this mode; the log is the only record of
+            # which nonces were already accepted.
+            self._restore_logged_nonces(time.time() - self.config.NONCE_EXPIRATION_SECONDS)
+
+    def _restore_logged_nonces(self, since: Any) -> None:
+        """Mark nonces of events logged after ``since`` as processed."""
+        for append_ts, event in self.logchain.iter_timed_events(since):
+            self.processed_nonces.add_at(event.get("nonce"), append_ts)
+
+    def close(self) -> None:
+        """Finish queued hook callbacks and stop the hook dispatcher."""
+        self.hooks.stop_dispatcher(self.config.HOOK_TIMEOUT_SECONDS)
 
     def _cleanup_nonces(self) -> None:
+        # The store also expires slots as nonces arrive; this only trims
+        # memory while the agent is idle, and never takes ``self.lock``.
         while True:
             time.sleep(self.config.NONCE_CLEANUP_INTERVAL_SECONDS)
-            now = ts()
-            with self.lock:
-                to_remove = [
-                    n
-                    for n, t in self.processed_nonces.items()
-                    if (
-                        datetime.datetime.fromisoformat(now.replace("Z", "+00:00"))
-                        - datetime.datetime.fromisoformat(t.replace("Z", "+00:00"))
-                    ).total_seconds()
-                    > self.config.NONCE_EXPIRATION_SECONDS
-                ]
-                for n in to_remove:
-                    del self.processed_nonces[n]
+            self.processed_nonces.expire()
 
     def load_state(self) -> None:
         snapshot_timestamp = None
@@ -181,10 +181,29 @@ class RemixAgent:
                 self.storage.set_proposal(p["proposal_id"], p)
             for l in data.get("marketplace_listings", []):
                 self.storage.set_marketplace_listing(l["listing_id"], l)
-        self.logchain.replay_events(self._apply_event, snapshot_timestamp)
-        self.event_count = len(self.logchain.entries)
-        if not self.logchain.verify():
+            self.processed_nonces.load_dict(data.get("nonces", {}))
+        # Only events appended after the snapshot are read back; the sparse
+        # index lets the log seek straight to them.
+        if not self.logchain.verify(since=snapshot_timestamp):
             raise ValueError("Logchain verification failed.")
+        batch: list[Dict[str, Any]] = []
+
+        def _flush() -> None:
+            with self.storage.unit_of_work():
+                for event in batch:
+                    self._apply_event(event)
+            batch.clear()
+
+        # Events after the snapshot are not covered by its ``nonces``; record
+        # theirs at the time they were logged so replays stay rejected.
+        for append_ts, event in self.logchain.iter_timed_events(snapshot_timestamp):
+            self.processed_nonces.add_at(event.get("nonce"), append_ts)
+            batch.append(event)
+            if len(batch) >= self.config.EVENT_BATCH_SIZE:
+                _flush()
+        if batch:
+            _flush()
+        self.event_count = len(self.logchain)
 
     def save_snapshot(self) -> None:
         with self.lock:
@@ -203,6 +222,7 @@ class RemixAgent:
                     self.storage.get_marketplace_listing(lid)
                     for lid in self.storage.marketplace_listings.keys()
                 ],
+                "nonces": self.processed_nonces.to_dict(),
                 "timestamp": ts(),
             }
             with open(self.snapshot, "w") as f:
@@ -448,28 +468,56 @@ class RemixAgent:
                     self.storage.set_coin(reactor["root_coin_id"], root)
 
     def process_event(self, event: Dict[str, Any]) -> None:
-        if not self.vaccine.scan(json.dumps(event)):
-            raise BlockedContentError("Event content blocked by vaccine.")
-        nonce = event.get("nonce")
-        with self.lock:
-            if nonce in self.processed_nonces:
-                return
-            self.processed_nonces[nonce] = ts()
+        self.process_events([event])
+
+    def process_events(self, batch: List[Dict[str, Any]]) -> int:
+        """Apply ``batch`` in order, logging and committing it as one unit.
+
+        The whole batch is scanned first so blocked content raises
+        :class:`BlockedContentError` before anything is recorded.  Events are
+        then appended with a single log fsync and applied inside one storage
+        unit of work; each event gets its own savepoint, so a failing event is
+        logged and undone without discarding the rest.  Hooks fire after the
+        commit.  Returns the number of events applied.
+        """
+        for event in batch:
+            if not self.vaccine.scan(json.dumps(event)):
+                raise BlockedContentError("Event content blocked by vaccine.")
+        accepted = [e for e in batch if self.processed_nonces.add(e.get("nonce"))]
+        if not accepted:
+            return 0
+        applied = []
+        snapshot_due = False
         try:
-            self.logchain.add(event)
-            if self._use_simple:
-                self._simple_process_event(event)
-            else:
-                self._apply_event(event)
-            self.event_count += 1
-            self.hooks.fire_hooks(event["event"], event)
-            if (
-                not self._use_simple
-                and self.event_count % self.config.SNAPSHOT_INTERVAL == 0
-            ):
-                self.save_snapshot()
+            self.logchain.add_many(accepted)
+            with self.storage.unit_of_work():
+                for event in accepted:
+                    try:
+                        with self.storage.savepoint():
+                            if self._use_simple:
+                                self._simple_process_event(event)
+                            else:
+                                self._apply_event(event)
+                    except Exception as e:
+                        logging.error(
+                            f"Event processing failed for {event.get('event')}: {e}"
+                        )
+                        continue
+                    applied.append(event)
+                    self.event_count += 1
+                    if self.event_count % self.config.SNAPSHOT_INTERVAL == 0:
+                        snapshot_due = True
         except Exception as e:
-            logging.error(f"Event processing failed for {event.get('event')}: {e}")
+            logging.error(f"Event batch processing failed: {e}")
+            return 0
+        for event in applied:
+            try:
+                self.hooks.dispatch(event["event"], event)
+            except Exception as e:
+                logging.error(f"Hook dispatch failed for {event.get('event')}: {e}")
+        if snapshot_due and not self._use_simple:
+            self.save_snapshot()
+        return len(applied)
 
     def _apply_event(self, event: Dict[str, Any]) -> None:
         event_type = event.get("event")
@@ -897,26 +945,24 @@ class RemixAgent:
         self.storage.set_coin(new_coin_id, new_coin.to_dict())
         # Trigger hooks after a successful cross remix
         if events is not None:
-            self.hooks.fire_hooks(
+            self.hooks.dispatch(
                 events.CROSS_REMIX_CREATED, {"coin_id": new_coin_id, "user": user}
             )
 
     def _apply_DAILY_DECAY(self, event: ApplyDailyDecayPayload) -> None:
-        users = self.storage.get_all_users()
-        for u in users:
-            user_obj = User.from_dict(u, self.config)
-            with user_obj.lock:
-                user_obj.karma *= self.config.DAILY_DECAY
-                if user_obj.is_genesis:
-                    # Apply genesis bonus decay
-                    join_time = datetime.datetime.fromisoformat(
-                        u["join_time"].replace("Z", "+00:00")
-                    )
-                    decay_factor = calculate_genesis_bonus_decay(
-                        join_time, self.config.GENESIS_BONUS_DECAY_YEARS
-                    )
-                    user_obj.karma *= decay_factor
-                self.storage.set_user(u["name"], user_obj.to_dict())
+        started = time.perf_counter()
+        count = self.storage.apply_karma_decay(
+            self.config.DAILY_DECAY,
+            self.config.GENESIS_BONUS_DECAY_YEARS,
+            chunk_size=self.config.BULK_UPDATE_CHUNK_SIZE,
+        )
+        # Genesis bonuses moved on by a day; refresh cached vote weights.
+        self.tally_engine.invalidate()
+        logging.info(
+            "Daily decay applied to %d users in %.2fs",
+            count,
+            time.perf_counter() - started,
+        )
 
     def _tally_proposal(self, proposal_id: str) -> Dict[str, Decimal]:
         """
@@ -924,67 +970,11 @@ class RemixAgent:
         Weights votes by Harmony Score, adjusted for genesis decay.
         Returns {'yes': fraction, 'no': fraction, 'quorum': fraction}.
         """
-        proposal_data = self.storage.get_proposal(proposal_id)
-        if not proposal_data:
+        proposal = self.storage.get_proposal(proposal_id)
+        if not proposal:
             raise VoteError("Proposal not found.")
-        proposal = proposal_data
-        users_data = self.storage.get_all_users()
-        total_harmony = Decimal("0")
-        for u in users_data:
-            harmony_score = safe_decimal(u["harmony_score"])
-            is_genesis = u["is_genesis"]
-            join_time = datetime.datetime.fromisoformat(
-                u["join_time"].replace("Z", "+00:00")
-            )
-            decay = (
-                calculate_genesis_bonus_decay(
-                    join_time, self.config.GENESIS_BONUS_DECAY_YEARS
-                )
-                if is_genesis
-                else Decimal("1")
-            )
-            total_harmony += harmony_score * decay
-        species_votes = {
-            s: {"yes": Decimal("0"), "no": Decimal("0"), "total": Decimal("0")}
-            for s in self.config.SPECIES
-        }
-        voted_harmony = Decimal("0")
-        for voter, vote in proposal["votes"].items():
-            user_data = next((ud for ud in users_data if ud["name"] == voter), None)
-            if user_data and user_data["consent"]:
-                harmony_score = safe_decimal(user_data["harmony_score"])
-                is_genesis = user_data["is_genesis"]
-                join_time = datetime.datetime.fromisoformat(
-                    user_data["join_time"].replace("Z", "+00:00")
-                )
-                decay = (
-                    calculate_genesis_bonus_decay(
-                        join_time, self.config.GENESIS_BONUS_DECAY_YEARS
-                    )
-                    if is_genesis
-                    else Decimal("1")
-                )
-                weight = harmony_score * decay
-                s = user_data["species"]
-                species_votes[s][vote] += weight
-                species_votes[s]["total"] += weight
-                voted_harmony += weight
-        active_species = [s for s, v in species_votes.items() if v["total"] > 0]
-        if not active_species:
-            return {"yes": Decimal("0"), "no": Decimal("0"), "quorum": Decimal("0")}
-        species_weight = Decimal("1") / len(active_species)
-        final_yes = sum(
-            (sv["yes"] / sv["total"]) * species_weight
-            for s, sv in species_votes.items()
-            if sv["total"] > 0
-        )
-        final_no = sum(
-            (sv["no"] / sv["total"]) * species_weight
-            for s, sv in species_votes.items()
-            if sv["total"] > 0
-        )
-        quorum = voted_harmony / total_harmony if total_harmony > 0 else Decimal("0")
-        return {"yes": final_yes, "no": final_no, "quorum": quorum}
+        index = self.tally_engine.build_index(self.storage.get_all_users())
+        return self.tally_engine.tally(proposal["votes"], index)
 
     def _process_proposal_lifecycle(self) -> None:
         """
@@ -993,6 +983,19 @@ class RemixAgent:
         proposals = [
             self.storage.get_proposal(pid) for pid in self.storage.proposals.keys()
         ]
+        now = datetime.datetime.utcnow()
+        expired = [
+            p
+            for p in proposals
+            if p["status"] == "open"
+            and now > datetime.datetime.fromisoformat(p["voting_deadline"])
+        ]
+        # One user index serves every expired proposal in this pass.
+        tallies = (
+            self.tally_engine.tally_many(expired, self.storage.get_all_users())
+            if expired
+            else {}
+        )
         for proposal in proposals:
             if proposal["status"] != "open":
                 if proposal["status"] == "approved":
@@ -1012,11 +1015,9 @@ class RemixAgent:
                                 f"Executed proposal {proposal['proposal_id']}: {target} = {value}"
                             )
                 continue
-            voting_deadline = datetime.datetime.fromisoformat(
-                proposal["voting_deadline"]
-            )
-            if datetime.datetime.utcnow() > voting_deadline:
-                tally = self._tally_proposal(proposal["proposal_id"])
+            if proposal["proposal_id"] in tallies:
+                tally = tallies[proposal["proposal_id"]]
+                dynamic_threshold = None
                 if tally["quorum"] < self.config.GOV_QUORUM_THRESHOLD:
                     proposal["status"] = "rejected"
                 else:
@@ -1,7 +1,7 @@
 """Causal influence graph utilities."""
 import math
 from datetime import datetime, timedelta
-from typing import Any, Optional, Iterable, Dict, List
+from typing import Any, Optional, Iterable, Dict, List, Tuple
 import inspect
 import json
 import logging
@@ -114,6 +114,9 @@ except Exception:  # pragma: no cover - optional dependency
 
 from scientific_utils import ScientificModel, VerifiedScientificModel
 
+from .influence_paths import max_product_influence, single_source_influence
+from .temporal_paths import TemporalEdgeIndex
+
 
 class CausalGraph:
     """Wrapper around :class:`networkx.DiGraph` with time weighted edges."""
@@ -308,60 +311,81 @@ class CausalGraph:
         except Exception:  # pragma: no cover - optional feature
             return None
 
-    def query_influence(self, source: Any, target: Any) -> float:
+    def query_influence(
+        self,
+        source: Any,
+        target: Any,
+        *,
+        max_hops: Optional[int] = None,
+        exact: Optional[bool] = None,
+    ) -> float:
         """Compute influence probability from ``source`` to ``target``.
 
-        The method enumerates all simple directed paths between ``source`` and
-        ``target`` and returns the maximum product of edge weights along any
-        path. If no path exists the return value is ``0.0``.
+        Returns the maximum product of edge weights along any simple directed
+        path, or ``0.0`` if no path exists.
+
+        Parameters
+        ----------
+        max_hops : int, optional
+            Only consider paths with at most this many edges.
+        exact : bool, optional
+            Force exact simple-path enumeration.  By default it is used only
+            when the graph contains inhibitory (negative) or ``> 1`` weights.
 
         Notes
         -----
-        Enumerating all simple paths has worst-case exponential complexity in
-        the number of nodes between ``source`` and ``target``.
+        Weights in ``[0, 1]`` are searched with Dijkstra over ``-log(weight)``
+        (or a hop-bounded relaxation), see :mod:`causal_graph.influence_paths`.
+        The exact mode has worst-case exponential complexity.
         """
-        if not self.has_path(source, target):
-            return 0.0
-        paths = self.all_simple_paths(source, target)
-        strengths = []
-        for p in paths:
-            w = 1.0
-            for u, v in zip(p[:-1], p[1:]):
-                w *= self.graph[u][v].get("weight", 1.0)
-            strengths.append(w)
-        return max(strengths) if strengths else 0.0
-
-
-def build_causal_graph(db) -> "InfluenceGraph":
-    """Construct an :class:`InfluenceGraph` from a database session.
+        return max_product_influence(
+            self.graph, source, target, max_hops=max_hops, exact=exact
+        )
 
-    Nodes correspond to ``Harmonizer`` IDs. Directed edges capture:
+    def influence_from(
+        self,
+        source: Any,
+        *,
+        max_hops: Optional[int] = None,
+        exact: Optional[bool] = None,
+    ) -> Dict[Any, float]:
+        """Return influence from ``source`` to every reachable node in one search."""
+        return single_source_influence(
+            self.graph, source, max_hops=max_hops, exact=exact
+        )
 
-    - ``follow`` from follower to followee
-    - ``like`` from a liker to the author of a liked ``VibeNode``
-    - ``remix`` from the author of a remix ``VibeNode`` to the author of its
-      parent
 
-    ``InfluenceGraph.add_interaction`` is used to record each relationship.
+def load_interactions(db) -> Tuple[List[Any], List[Tuple[Any, Any, str]]]:
+    """Return ``(user_ids, interactions)`` for :func:`build_causal_graph`.
 
-    Returns
-    -------
-    InfluenceGraph
-        Populated graph of user interactions.
+    ``interactions`` is a list of ``(source, target, edge_type)`` tuples in the
+    order they are applied to the graph: follows, then likes, then remixes.
+    Follow and like rows are read straight from the association tables so the
+    cost is a fixed number of queries regardless of the user count.
     """
 
     # Import ORM models
-    from db_models import Harmonizer, VibeNode, vibenode_likes
-
-    g = InfluenceGraph()
+    from db_models import Harmonizer, VibeNode, harmonizer_follows, vibenode_likes
 
-    # Add all users as nodes and encode follow relationships.
     users = db.query(Harmonizer).all()
-    for user in users:
-        g.add_node(user.id)
-    for user in users:
-        for followed in getattr(user, "following", []):
-            g.add_interaction(user.id, followed.id, edge_type="follow")
+    user_ids = [user.id for user in users]
+    interactions: List[Tuple[Any, Any, str]] = []
+
+    follow_rows = None
+    if hasattr(db, "execute"):
+        try:
+            follow_rows = db.execute(
+                select(harmonizer_follows.c.follower_id, harmonizer_follows.c.followed_id)
+            ).fetchall()
+        except Exception:
+            follow_rows = None
+    if follow_rows is None:  # pragma: no cover - fallback for dummy objects in tests
+        follow_rows = [
+            (user.id, followed.id)
+            for user in users
+            for followed in getattr(user, "following", [])
+        ]
+    interactions.extend((u, v, "follow") for u, v in follow_rows)
 
     # Cache vibenodes by id for lookups and handle likes.
     nodes = db.query(VibeNode).all()
@@ -383,15 +407,43 @@ def build_causal_graph(db) -> "InfluenceGraph":
     for liker_id, node_id in like_rows:
         node = node_map.get(node_id)
         if node is not None:
-            g.add_interaction(liker_id, node.author_id, edge_type="like")
+            interactions.append((liker_id, node.author_id, "like"))
 
     # Add remix edges between authors when a vibenode references a parent node.
     for node in nodes:
         parent_id = getattr(node, "parent_vibenode_id", None)
         if parent_id and parent_id in node_map:
             parent = node_map[parent_id]
-            g.add_interaction(node.author_id, parent.author_id, edge_type="remix")
+            interactions.append((node.author_id, parent.author_id, "remix"))
+
+    return user_ids, interactions
 
+
+def build_causal_graph(db) -> "InfluenceGraph":
+    """Construct an :class:`InfluenceGraph` from a database session.
+
+    Nodes correspond to ``Harmonizer`` IDs. Directed edges capture:
+
+    - ``follow`` from follower to followee
+    - ``like`` from a liker to the author of a liked ``VibeNode``
+    - ``remix`` from the author of a remix ``VibeNode`` to the author of its
+      parent
+
+    ``InfluenceGraph.add_interaction`` is used to record each relationship.
+    Request handlers should prefer :data:`causal_graph.graph_cache.influence_graph_cache`,
+    which keeps a built graph in memory instead of reloading every row.
+
+    Returns
+    -------
+    InfluenceGraph
+        Populated graph of user interactions.
+    """
+    user_ids, interactions = load_interactions(db)
+    g = InfluenceGraph()
+    for user_id in user_ids:
+        g.add_node(user_id)
+    for source, target, edge_type in interactions:
+        g.add_interaction(source, target, edge_type=edge_type)
     return g
 
 
@@ -526,6 +578,66 @@ class InfluenceGraph(CausalGraph):
         db_session.commit()
         return key
 
+    @classmethod
+    def restore_snapshot(
+        cls, db_session, key: Optional[str] = None, key_prefix: str = "graph_snapshot"
+    ) -> Optional["InfluenceGraph"]:
+        """Load a graph stored by :meth:`snapshot_graph`.
+
+        Parameters
+        ----------
+        db_session : Session
+            Active SQLAlchemy session.
+        key : str, optional
+            Exact ``SystemState`` key.  Defaults to the newest snapshot whose
+            key starts with ``key_prefix``.
+        key_prefix : str, optional
+            Prefix passed to :meth:`snapshot_graph`.
+
+        Returns
+        -------
+        InfluenceGraph or None
+            The restored graph, or ``None`` when no snapshot exists.  The
+            snapshot time is available as ``snapshot_timestamp``.
+        """
+        try:
+            from db_models import SystemState
+        except Exception:
+            return None
+
+        if key is None:
+            keys = db_session.execute(
+                select(SystemState.key).where(SystemState.key.like(f"{key_prefix}_%"))
+            ).scalars().all()
+            stamps = [k.rsplit("_", 1)[-1] for k in keys]
+            candidates = [(int(s), k) for s, k in zip(stamps, keys) if s.isdigit()]
+            if not candidates:
+                return None
+            key = max(candidates)[1]
+        state = db_session.execute(
+            select(SystemState).where(SystemState.key == key)
+        ).scalar_one_or_none()
+        if state is None:
+            return None
+
+        snapshot = json.loads(state.value)
+        g = cls()
+        for node in snapshot.get("nodes", []):
+            attrs = dict(node)
+            g.graph.add_node(attrs.pop("id"), **attrs)
+        for edge in snapshot.get("edges", []):
+            data = dict(edge)
+            source, target = data.pop("source"), data.pop("target")
+            ts = data.get("timestamp")
+            if isinstance(ts, str):
+                try:
+                    data["timestamp"] = datetime.fromisoformat(ts)
+                except ValueError:
+                    pass
+            g.graph.add_edge(source, target, **data)
+        g.snapshot_timestamp = datetime.fromisoformat(snapshot["timestamp"])
+        return g
+
 
 @VerifiedScientificModel(
     citation_uri="https://en.wikipedia.org/wiki/Counterfactual_thinking",
@@ -733,9 +845,11 @@ def temporal_causality_analysis(
 
     Scientific Basis
     ----------------
-    Edges are ordered by timestamp and combined to reveal chains of
-    influence. Decayed edge weights from
-    :meth:`InfluenceGraph.time_weighted_weight` provide a heuristic
+    Edges are ordered by timestamp once and combined to reveal chains of
+    influence: the longest chain with strictly increasing timestamps is found
+    by dynamic programming (see :mod:`causal_graph.temporal_paths`), and all
+    periods are answered from the same sorted index. Decayed edge weights, as
+    in :meth:`InfluenceGraph.time_weighted_weight`, provide a heuristic
     measure of impact.
 
     citation_uri: https://en.wikipedia.org/wiki/Causal_inference
@@ -744,18 +858,6 @@ def temporal_causality_analysis(
     approximation: heuristic
     """
 
-    def _edges():
-        g = graph.graph
-        if hasattr(g, "edges"):
-            return list(g.edges(data=True))
-        if hasattr(g, "_adj"):
-            acc = []
-            for u, nbrs in g._adj.items():
-                for v, d in nbrs.items():
-                    acc.append((u, v, d))
-            return acc
-        return []
-
     def _period_delta(label: str) -> timedelta:
         label = label.lower()
         digits = "".join(ch for ch in label if ch.isdigit())
@@ -770,43 +872,16 @@ def temporal_causality_analysis(
 
     analyses: list[dict] = []
     now = datetime.utcnow()
+    index = TemporalEdgeIndex.from_graph(graph)
+    scores = index.decayed_weights(0.001, now)
 
     for period in time_periods:
         start = now - _period_delta(period)
 
-        edges = [e for e in _edges() if e[2].get("timestamp") and e[2]["timestamp"] >= start]
-        edges.sort(key=lambda x: x[2].get("timestamp", now))
-
-        longest: list[Any] = []
-        for u, v, d in edges:
-            chain = [u, v]
-            last_ts = d.get("timestamp", start)
-            cur = v
-            while True:
-                candidate = None
-                cand_ts = None
-                for uu, vv, dd in edges:
-                    ts = dd.get("timestamp")
-                    if uu == cur and ts and ts > last_ts:
-                        if cand_ts is None or ts < cand_ts:
-                            candidate = (uu, vv, ts)
-                            cand_ts = ts
-                if candidate is None:
-                    break
-                cur = candidate[1]
-                last_ts = candidate[2]
-                chain.append(cur)
-            if len(chain) > len(longest):
-                longest = chain
-
-        max_edge = None
-        max_score = -1.0
-        for u, v, d in edges:
-            meta = graph.time_weighted_weight(u, v, decay_rate=0.001)
-            val = meta.get("value", 0.0)
-            if val > max_score:
-                max_score = val
-                max_edge = (u, v)
+        longest = index.longest_chain(start)
+        max_edge, max_score = index.strongest_edge(scores, start)
+        if max_score <= -1.0:
+            max_edge, max_score = None, -1.0
 
         analyses.append(
             {
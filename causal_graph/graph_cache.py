@@ -0,0 +1,301 @@
+"""Process-wide cache of the interaction :class:`InfluenceGraph`.
+
+Report and prediction endpoints used to call :func:`build_causal_graph` on
+every request, reloading every user, follow, like and VibeNode row.  The
+:class:`InfluenceGraphCache` builds the graph once and keeps it current with
+deltas recorded by the write paths (follow/unfollow, like/unlike, remix):
+
+* Writers only append to a pending list under a short lock.
+* Readers get an immutable *published* graph.  Pending deltas are folded into
+  a fresh copy at most once per ``publish_interval`` seconds, so a reader never
+  sees a graph that is being mutated underneath it.
+* ``version`` increases with every delta and resync; ``published_version`` is
+  the version readers currently see.
+* A full rebuild runs when the graph is older than ``ttl_seconds`` to pick up
+  writes made by other processes.  On a cold start the newest
+  :meth:`InfluenceGraph.snapshot_graph` snapshot is restored if it is younger
+  than the TTL.
+
+Several interaction types can collapse onto one edge, so the cache counts how
+many follows/likes/remixes support each edge and only removes it when the
+count drops to zero.  Counts restored from a snapshot are approximate until
+the next full rebuild.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+
+from . import InfluenceGraph, load_interactions
+from .centrality import CentralityEngine
+
+try:
+    from config import Config
+
+    CACHE_TTL_SECONDS = Config.CAUSAL_GRAPH_CACHE_TTL_SECONDS
+    PUBLISH_INTERVAL_SECONDS = Config.CAUSAL_GRAPH_PUBLISH_INTERVAL_SECONDS
+except Exception:  # pragma: no cover - fallback during circular import
+    CACHE_TTL_SECONDS = 3600
+    PUBLISH_INTERVAL_SECONDS = 5.0
+
+# Snapshots kept in ``SystemState``; older ones are deleted on save
+SNAPSHOTS_KEPT = 3
+
+# ``build_causal_graph`` applies follows, then likes, then remixes, so the
+# label of a shared edge is the last type added.
+_EDGE_PRECEDENCE = {"follow": 0, "like": 1, "remix": 2}
+
+
+def _remove_edge(g: Any, source: Any, target: Any) -> None:
+    if hasattr(g, "remove_edge"):
+        g.remove_edge(source, target)
+    else:  # pragma: no cover - minimal DiGraph fallback
+        g[source].pop(target, None)
+
+
+class InfluenceGraphCache:
+    """Keep a built :class:`InfluenceGraph` in memory between requests.
+
+    Parameters
+    ----------
+    ttl_seconds : float, optional
+        Maximum age of the graph before :meth:`get` rebuilds it from the
+        database.
+    publish_interval : float, optional
+        Minimum time between folding pending deltas into a new published
+        graph.  ``0`` publishes on every read after a write.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        publish_interval: float = PUBLISH_INTERVAL_SECONDS,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.publish_interval = publish_interval
+
+        self._lock = threading.RLock()
+        self._graph: Optional[InfluenceGraph] = None
+        self._support: Dict[Tuple[Any, Any], Counter] = {}
+        self._pending: List[Tuple[str, Any, Any, str]] = []
+        self._synced_at: Optional[float] = None
+        self._published_at = 0.0
+
+        self.version = 0
+        self.published_version = 0
+
+        self._centrality_lock = threading.Lock()
+        self._centrality = CentralityEngine()
+        self._centrality_version = -1
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get(self, db: Any) -> InfluenceGraph:
+        """Return the current graph, rebuilding or publishing deltas if due.
+
+        The returned graph must be treated as read-only; it is shared by every
+        caller until the next publish.
+        """
+        with self._lock:
+            if self._graph is None:
+                if not self._restore_locked(db):
+                    self._resync_locked(db)
+            elif self._expired():
+                self._resync_locked(db)
+            elif self._pending and (
+                time.monotonic() - self._published_at >= self.publish_interval
+            ):
+                self._publish_locked()
+            return self._graph
+
+    def influence_score(self, db: Any, node: Any) -> Dict[str, Optional[float]]:
+        """Return ``node``'s PageRank influence on the cached graph.
+
+        PageRank and its bootstrap confidence are computed once per published
+        version for all users, so repeated per-user reports only pay for a
+        dictionary lookup.  The result follows the
+        :func:`scientific_metrics.calculate_influence_score` schema.
+        """
+        with self._lock:
+            graph = self.get(db)
+            version = self.published_version
+        with self._centrality_lock:
+            if self._centrality_version != version:
+                self._centrality.load(
+                    graph.graph.nodes,
+                    [
+                        (u, v, d.get("weight", 1.0))
+                        for u, v, d in graph.graph.edges(data=True)
+                    ],
+                )
+                self._centrality.refresh()
+                self._centrality_version = version
+            return self._centrality.influence_score(node)
+
+    def _expired(self) -> bool:
+        return (
+            self._synced_at is None
+            or time.monotonic() - self._synced_at >= self.ttl_seconds
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def _record(self, op: str, source: Any, target: Any, edge_type: str) -> None:
+        with self._lock:
+            if self._graph is None:
+                return
+            self._pending.append((op, source, target, edge_type))
+            self.version += 1
+
+    def record_follow(self, follower: Any, followed: Any, following: bool) -> None:
+        """Record a follow (``following=True``) or unfollow."""
+        self._record("add" if following else "remove", follower, followed, "follow")
+
+    def record_like(self, liker: Any, author: Any, liked: bool) -> None:
+        """Record a like (``liked=True``) or unlike of one of ``author``'s VibeNodes."""
+        self._record("add" if liked else "remove", liker, author, "like")
+
+    def record_remix(self, author: Any, parent_author: Any) -> None:
+        """Record that ``author`` remixed a VibeNode owned by ``parent_author``."""
+        self._record("add", author, parent_author, "remix")
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next :meth:`get`."""
+        with self._lock:
+            self._synced_at = None
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def _publish_locked(self) -> None:
+        """Apply pending deltas to a copy of the graph and publish it."""
+        g = InfluenceGraph()
+        g.graph = self._graph.graph.copy()
+        for op, source, target, edge_type in self._pending:
+            counts = self._support.setdefault((source, target), Counter())
+            if op == "add":
+                counts[edge_type] += 1
+            elif counts[edge_type] > 0:
+                counts[edge_type] -= 1
+            counts += Counter()  # drop zero counts
+            if not counts:
+                del self._support[(source, target)]
+                if g.graph.has_edge(source, target):
+                    _remove_edge(g.graph, source, target)
+                continue
+            label = max(counts, key=_EDGE_PRECEDENCE.get)
+            data = g.get_edge_data(source, target)
+            if data is None:
+                g.add_interaction(source, target, edge_type=label)
+            else:
+                data["edge_type"] = label
+            self._support[(source, target)] = counts
+        logging.debug("InfluenceGraphCache applied %s deltas", len(self._pending))
+        self._pending = []
+        self._graph = g
+        self._published_at = time.monotonic()
+        self.published_version = self.version
+
+    def _install_locked(self, graph: InfluenceGraph, synced_at: float) -> None:
+        self._graph = graph
+        self._pending = []
+        self._synced_at = synced_at
+        self._published_at = time.monotonic()
+        self.version += 1
+        self.published_version = self.version
+
+    def _resync_locked(self, db: Any) -> None:
+        start = time.monotonic()
+        user_ids, interactions = load_interactions(db)
+        g = InfluenceGraph()
+        support: Dict[Tuple[Any, Any], Counter] = {}
+        for user_id in user_ids:
+            g.add_node(user_id)
+        for source, target, edge_type in interactions:
+            g.add_interaction(source, target, edge_type=edge_type)
+            support.setdefault((source, target), Counter())[edge_type] += 1
+        self._support = support
+        self._install_locked(g, start)
+        logging.info(
+            "InfluenceGraphCache rebuilt %s nodes / %s edges in %.3fs",
+            len(user_ids),
+            len(support),
+            time.monotonic() - start,
+        )
+
+    def _restore_locked(self, db: Any, key: Optional[str] = None) -> bool:
+        try:
+            g = InfluenceGraph.restore_snapshot(db, key)
+        except Exception as exc:
+            logging.warning(f"InfluenceGraphCache snapshot restore failed: {exc}")
+            return False
+        if g is None:
+            return False
+        age = (datetime.utcnow() - g.snapshot_timestamp).total_seconds()
+        if key is None and age >= self.ttl_seconds:
+            return False
+        self._support = {
+            (u, v): Counter({d.get("edge_type", "follow"): 1})
+            for u, v, d in g.graph.edges(data=True)
+        }
+        self._install_locked(g, time.monotonic() - max(age, 0.0))
+        return True
+
+    def resync(self, db: Any) -> InfluenceGraph:
+        """Rebuild the graph from ``db`` and publish it immediately."""
+        with self._lock:
+            self._resync_locked(db)
+            return self._graph
+
+    def snapshot(
+        self, db: Any, key_prefix: str = "graph_snapshot", keep: int = SNAPSHOTS_KEPT
+    ) -> str:
+        """Persist the published graph via :meth:`InfluenceGraph.snapshot_graph`.
+
+        Only the newest ``keep`` snapshots under ``key_prefix`` are retained.
+        """
+        graph = self.get(db)
+        key = graph.snapshot_graph(db, key_prefix)
+        if key and keep > 0:
+            _prune_snapshots(db, key_prefix, keep)
+        return key
+
+    def restore(self, db: Any, key: Optional[str] = None) -> bool:
+        """Replace the cached graph with a stored snapshot.
+
+        Without ``key`` the newest snapshot is used if it is younger than
+        ``ttl_seconds``.  Returns ``True`` when a snapshot was loaded.
+        """
+        with self._lock:
+            return self._restore_locked(db, key)
+
+
+def _prune_snapshots(db: Any, key_prefix: str, keep: int) -> None:
+    from db_models import SystemState
+
+    keys = db.execute(
+        select(SystemState.key).where(SystemState.key.like(f"{key_prefix}_%"))
+    ).scalars().all()
+    stamped = sorted(
+        (int(k.rsplit("_", 1)[-1]), k) for k in keys if k.rsplit("_", 1)[-1].isdigit()
+    )
+    stale = [k for _, k in stamped[:-keep]]
+    if stale:
+        db.execute(delete(SystemState).where(SystemState.key.in_(stale)))
+        db.commit()
+
+
+# Process-wide cache shared by the API and background tasks
+influence_graph_cache = InfluenceGraphCache()
+
+__all__ = ["InfluenceGraphCache", "influence_graph_cache"]
@@ -0,0 +1,280 @@
+"""Max-product path search for influence queries.
+
+The influence between two users is the maximum product of edge weights over
+all simple paths connecting them.  Enumerating every simple path (as
+:func:`networkx.all_simple_paths` does) is exponential, so this module solves
+the same problem as a shortest-path search:
+
+* With weights in ``[0, 1]`` the product is maximized by minimizing
+  ``sum(-log(weight))``, a non-negative cost, so Dijkstra's algorithm is exact.
+* With a hop limit the search becomes a layered Bellman-Ford relaxation that
+  keeps the best product reachable in at most ``h`` hops.  Because costs are
+  non-negative the best walk can always be shortened to a simple path, so the
+  result matches enumeration with ``cutoff=max_hops``.
+
+Exact mode
+----------
+Inhibitory (negative) or amplifying (``> 1``) weights break the reduction:
+two negative edges multiply to a positive influence and weights above one
+reward longer paths.  Graphs containing such edges fall back to exact
+enumeration of simple paths (bounded by ``max_hops`` when given), which keeps
+the original semantics but also its exponential worst case.  Callers can
+force either mode with ``exact=True``/``exact=False``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from typing import Any, Dict, Iterator, List, Optional
+
+_DONE = object()
+
+
+def _graph(graph: Any) -> Any:
+    """Return the underlying adjacency-capable graph object."""
+    if hasattr(graph, "edges"):
+        return graph
+    return graph.graph
+
+
+def _weight(data: Dict[str, Any]) -> float:
+    return float(data.get("weight", 1.0))
+
+
+def has_inhibitory_edges(graph: Any) -> bool:
+    """Return ``True`` if any edge weight lies outside ``[0, 1]``."""
+    g = _graph(graph)
+    return any(not 0.0 <= _weight(d) <= 1.0 for _, _, d in g.edges(data=True))
+
+
+def _dijkstra(g: Any, source: Any, target: Any = None) -> Dict[Any, float]:
+    """Return ``{node: -log(best product)}`` for nodes reachable from ``source``."""
+    dist: Dict[Any, float] = {source: 0.0}
+    done = set()
+    counter = itertools.count()
+    heap = [(0.0, next(counter), source)]
+    while heap:
+        cost, _, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        if node == target:
+            break
+        for nbr, data in g[node].items():
+            w = _weight(data)
+            if w <= 0.0:
+                continue
+            new_cost = cost - math.log(w)
+            if new_cost < dist.get(nbr, math.inf):
+                dist[nbr] = new_cost
+                heapq.heappush(heap, (new_cost, next(counter), nbr))
+    return {n: dist[n] for n in done}
+
+
+def _hop_bounded(g: Any, source: Any, max_hops: int) -> Dict[Any, float]:
+    """Layered relaxation keeping the best product within ``max_hops`` hops."""
+    best: Dict[Any, float] = {source: 1.0}
+    frontier: Dict[Any, float] = {source: 1.0}
+    for _ in range(max_hops):
+        nxt: Dict[Any, float] = {}
+        for node, value in frontier.items():
+            for nbr, data in g[node].items():
+                w = _weight(data)
+                if w <= 0.0:
+                    continue
+                cand = value * w
+                if cand > best.get(nbr, 0.0) and cand > nxt.get(nbr, 0.0):
+                    nxt[nbr] = cand
+        if not nxt:
+            break
+        best.update(nxt)
+        frontier = nxt
+    return best
+
+
+def _simple_paths(
+    g: Any, source: Any, max_hops: Optional[int], stop_at: Any = None
+) -> Iterator[tuple[Any, float]]:
+    """Yield ``(end_node, product)`` for every simple path starting at ``source``.
+
+    Paths are not extended beyond ``stop_at`` when it is given.
+    """
+    visited = {source}
+    stack: List[tuple[Any, float, Iterator]] = [(source, 1.0, iter(g[source].items()))]
+    while stack:
+        node, value, it = stack[-1]
+        step = next(it, None)
+        if step is None:
+            stack.pop()
+            visited.discard(node)
+            continue
+        nbr, data = step
+        if nbr in visited:
+            continue
+        product = value * _weight(data)
+        yield nbr, product
+        if nbr == stop_at:
+            continue
+        if max_hops is None or len(stack) < max_hops:
+            visited.add(nbr)
+            stack.append((nbr, product, iter(g[nbr].items())))
+
+
+def single_source_influence(
+    graph: Any,
+    source: Any,
+    *,
+    max_hops: Optional[int] = None,
+    exact: Optional[bool] = None,
+) -> Dict[Any, float]:
+    """Return the best path product from ``source`` to every reachable node.
+
+    Parameters
+    ----------
+    graph : CausalGraph | networkx.DiGraph
+        Graph with optional ``weight`` edge attributes (default ``1.0``).
+    source : Any
+        Start node.  ``source`` itself maps to ``1.0``.
+    max_hops : int, optional
+        Only consider paths with at most this many edges.
+    exact : bool, optional
+        Force exact enumeration (``True``) or the shortest-path search
+        (``False``).  By default exact mode is used only when the graph has
+        weights outside ``[0, 1]``.
+
+    Returns
+    -------
+    Dict[Any, float]
+        Mapping of reachable target to influence value.  Targets whose best
+        product is ``0`` are omitted.
+    """
+    g = _graph(graph)
+    if source not in g:
+        return {}
+    if exact is None:
+        exact = has_inhibitory_edges(g)
+    if exact:
+        best: Dict[Any, float] = {source: 1.0}
+        for node, product in _simple_paths(g, source, max_hops):
+            if node not in best or product > best[node]:
+                best[node] = product
+        return {n: v for n, v in best.items() if v != 0.0}
+    if max_hops is not None:
+        return _hop_bounded(g, source, max_hops)
+    return {n: math.exp(-c) for n, c in _dijkstra(g, source).items()}
+
+
+def max_product_influence(
+    graph: Any,
+    source: Any,
+    target: Any,
+    *,
+    max_hops: Optional[int] = None,
+    exact: Optional[bool] = None,
+) -> float:
+    """Return the maximum edge-weight product over paths ``source`` -> ``target``.
+
+    See :func:`single_source_influence` for parameter semantics.  Without a
+    hop limit the Dijkstra search stops as soon as ``target`` is settled.
+    """
+    g = _graph(graph)
+    if source not in g or target not in g:
+        return 0.0
+    if source == target:
+        return 1.0
+    if exact is None:
+        exact = has_inhibitory_edges(g)
+    if exact:
+        best = None
+        for node, product in _simple_paths(g, source, max_hops, stop_at=target):
+            if node == target and (best is None or product > best):
+                best = product
+        return best if best is not None else 0.0
+    if max_hops is not None:
+        return _hop_bounded(g, source, max_hops).get(target, 0.0)
+    cost = _dijkstra(g, source, target).get(target)
+    return math.exp(-cost) if cost is not None else 0.0
+
+
+def _hops_to(g: Any, target: Any, max_hops: Optional[int]) -> Dict[Any, int]:
+    """Fewest hops from each node that can reach ``target`` (reverse BFS)."""
+    reverse: Dict[Any, List[Any]] = {}
+    for u, v in g.edges():
+        reverse.setdefault(v, []).append(u)
+    hops = {target: 0}
+    frontier = [target]
+    depth = 0
+    while frontier and (max_hops is None or depth < max_hops):
+        depth += 1
+        nxt = []
+        for node in frontier:
+            for pred in reverse.get(node, ()):
+                if pred not in hops:
+                    hops[pred] = depth
+                    nxt.append(pred)
+        frontier = nxt
+    return hops
+
+
+def count_simple_paths(
+    graph: Any,
+    source: Any,
+    target: Any,
+    *,
+    limit: int = 1000,
+    max_hops: Optional[int] = None,
+    max_steps: Optional[int] = 100_000,
+) -> int:
+    """Count simple paths ``source`` -> ``target``, stopping after ``limit``.
+
+    Used for path-count based confidence, which saturates quickly
+    (``1 - 1/(count + 1)``), so counting beyond ``limit`` adds no precision.
+
+    The search only enters nodes that can still reach ``target`` within the
+    remaining hops, so an unreachable target costs one reverse BFS.  Dense
+    graphs can still hold exponentially many paths; after expanding
+    ``max_steps`` edges the count so far is returned, a lower bound.
+    """
+    g = _graph(graph)
+    if source not in g or target not in g:
+        return 0
+    if source == target:
+        return 1
+    hops = _hops_to(g, target, max_hops)
+    if source not in hops:
+        return 0
+    bound = math.inf if max_hops is None else max_hops
+    count = steps = 0
+    visited = {source}
+    stack: List[tuple[Any, Iterator]] = [(source, iter(g[source]))]
+    while stack:
+        node, it = stack[-1]
+        nbr = next(it, _DONE)
+        if nbr is _DONE:
+            stack.pop()
+            visited.discard(node)
+            continue
+        steps += 1
+        if max_steps is not None and steps > max_steps:
+            break
+        if nbr == target:
+            count += 1
+            if count >= limit:
+                break
+            continue
+        # ``len(stack)`` edges reach ``nbr``; it needs ``hops[nbr]`` more.
+        if nbr in visited or nbr not in hops or len(stack) + hops[nbr] > bound:
+            continue
+        visited.add(nbr)
+        stack.append((nbr, iter(g[nbr])))
+    return count
+
+
+__all__ = [
+    "count_simple_paths",
+    "has_inhibitory_edges",
+    "max_product_influence",
+    "single_source_influence",
+]
@@ -0,0 +1,221 @@
+"""Time-respecting path queries over timestamped influence edges.
+
+A *time-respecting* chain is a walk ``n0 -> n1 -> ... -> nk`` whose edge
+timestamps strictly increase.  :class:`TemporalEdgeIndex` sorts the edges by
+timestamp once and computes, for every edge, the longest chain that starts
+with it by dynamic programming in reverse time order:
+
+``length(u -> v @ t) = 1 + max(length(v -> w @ t') for t' > t)``
+
+Sweeping edges from newest to oldest, the inner maximum is a per-node
+frontier (the best chain leaving ``v`` after the current time), so the whole
+table costs ``O(E log E)`` for the sort plus ``O(E)`` for the sweep.  Edges
+sharing a timestamp are processed as one group so they never extend each
+other.
+
+An analysis window ``[start, ...)`` is a suffix of the sorted edges, and a
+chain starting inside the window stays inside it because its timestamps only
+grow.  Every window is therefore answered from the same table with a binary
+search and an ``argmax`` over the suffix, which is how several
+``time_periods`` share a single pass.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _graph_edges(graph: Any) -> Iterable[Tuple[Any, Any, dict]]:
+    g = getattr(graph, "graph", graph)
+    if hasattr(g, "edges"):
+        return g.edges(data=True)
+    if hasattr(g, "_adj"):
+        return ((u, v, d) for u, nbrs in g._adj.items() for v, d in nbrs.items())
+    return ()
+
+
+def _micros(stamp: datetime) -> int:
+    return (stamp - _EPOCH) // _MICROSECOND
+
+
+def _to_micros(stamps: List[datetime]):
+    """Microseconds since the epoch for naive UTC ``stamps``."""
+    try:
+        import pandas as pd
+
+        # ``asi8`` is in the index's own unit (ns by default before pandas 3)
+        return pd.DatetimeIndex(stamps).as_unit("us").asi8.copy()
+    except Exception:  # pragma: no cover - optional dependency
+        pass
+    values = [_micros(ts) for ts in stamps]
+    return np.asarray(values, dtype=np.int64) if np is not None else values
+
+
+def _node_codes(nodes: List[Any]) -> Sequence[int]:
+    """Dense integer codes for hashable ``nodes``."""
+    try:
+        import pandas as pd
+
+        return pd.factorize(np.array(nodes + [None], dtype=object)[:-1])[0]
+    except Exception:  # pragma: no cover - optional dependency
+        pass
+    ids: dict = {}
+    return [ids.setdefault(node, len(ids)) for node in nodes]
+
+
+def _first_argmax(values: Sequence[float], start: int) -> int:
+    """Index of the first maximum of ``values[start:]`` (``-1`` if empty)."""
+    if start >= len(values):
+        return -1
+    if np is not None:
+        return start + int(np.argmax(values[start:]))
+    return max(range(start, len(values)), key=values.__getitem__)
+
+
+class TemporalEdgeIndex:
+    """Timestamped edges sorted by time with their longest-chain table.
+
+    Edges without a ``timestamp`` are ignored.  Ties are broken towards
+    earlier edges, both when choosing where a chain continues and when
+    choosing the chain reported for a window.
+
+    Args:
+        edges: ``(source, target, data)`` triples
+    """
+
+    def __init__(self, edges: Iterable[Tuple[Any, Any, dict]]) -> None:
+        sources, targets, weights, stamps = [], [], [], []
+        for u, v, d in edges:
+            ts = d.get("timestamp")
+            if ts:
+                sources.append(u)
+                targets.append(v)
+                weights.append(d.get("weight", 0.0))
+                stamps.append(ts)
+        micros = _to_micros(stamps)
+        codes = _node_codes(sources + targets)
+        n = len(stamps)
+        if np is not None:
+            order = np.argsort(micros, kind="stable")
+            self.micros = micros[order]
+            self.weights = np.asarray(weights, dtype=float)[order]
+            codes = np.asarray(codes, dtype=np.int64)
+            source_codes = codes[:n][order].tolist()
+            target_codes = codes[n:][order].tolist()
+            node_count = int(codes.max()) + 1 if n else 0
+            order = order.tolist()
+        else:  # pragma: no cover - optional dependency
+            order = sorted(range(n), key=micros.__getitem__)
+            self.micros = [micros[i] for i in order]
+            self.weights = [weights[i] for i in order]
+            source_codes = [codes[i] for i in order]
+            target_codes = [codes[n + i] for i in order]
+            node_count = max(codes, default=-1) + 1
+        self.sources: List[Any] = [sources[i] for i in order]
+        self.targets: List[Any] = [targets[i] for i in order]
+        self._length, self._next = self._chain_table(source_codes, target_codes, node_count)
+
+    @classmethod
+    def from_graph(cls, graph: Any) -> "TemporalEdgeIndex":
+        """Index the edges of a :class:`CausalGraph` or a graph object."""
+        return cls(_graph_edges(graph))
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def _chain_table(
+        self, sources: List[int], targets: List[int], node_count: int
+    ) -> Tuple[Sequence[int], List[int]]:
+        """Per edge: edges in its longest chain and the edge that follows it."""
+        n = len(sources)
+        if np is not None:
+            # Last position of each run of equal timestamps
+            ends = np.flatnonzero(np.diff(self.micros)).tolist() + [n - 1] if n else []
+        else:  # pragma: no cover - optional dependency
+            ends = [k for k in range(n) if k == n - 1 or self.micros[k] != self.micros[k + 1]]
+        length = [0] * n
+        following = [-1] * n
+        # Best chain leaving each node strictly after the current group.
+        best_length = [0] * node_count
+        best_edge = [-1] * node_count
+        starts = [0] + [end + 1 for end in ends[:-1]]
+        for lo, hi in zip(reversed(starts), reversed(ends)):
+            if lo == hi:  # the common case: a unique timestamp
+                target = targets[hi]
+                chain = length[hi] = best_length[target] + 1
+                following[hi] = best_edge[target]
+                source = sources[hi]
+                if chain >= best_length[source]:
+                    best_length[source] = chain
+                    best_edge[source] = hi
+                continue
+            for k in range(hi, lo - 1, -1):
+                target = targets[k]
+                length[k] = best_length[target] + 1
+                following[k] = best_edge[target]
+            # Descending order with >= leaves the earliest edge on ties.
+            for k in range(hi, lo - 1, -1):
+                source = sources[k]
+                if length[k] >= best_length[source]:
+                    best_length[source] = length[k]
+                    best_edge[source] = k
+        if np is not None:
+            return np.asarray(length, dtype=np.int64), following
+        return length, following  # pragma: no cover - optional dependency
+
+    def window_start(self, start: datetime) -> int:
+        """Position of the first edge with ``timestamp >= start``."""
+        if np is not None:
+            return int(np.searchsorted(self.micros, _micros(start), side="left"))
+        return bisect_left(self.micros, _micros(start))  # pragma: no cover
+
+    def longest_chain(self, start: datetime) -> List[Any]:
+        """Nodes of the longest time-respecting chain within ``[start, ...)``."""
+        k = _first_argmax(self._length, self.window_start(start))
+        if k < 0:
+            return []
+        chain = [self.sources[k], self.targets[k]]
+        k = self._next[k]
+        while k >= 0:
+            chain.append(self.targets[k])
+            k = self._next[k]
+        return chain
+
+    def decayed_weights(self, decay_rate: float, now: Optional[datetime] = None):
+        """``weight * exp(-decay_rate * age_seconds)`` for every edge.
+
+        Matches :meth:`InfluenceGraph.time_weighted_weight` but evaluates all
+        edges against one ``now``.
+        """
+        now_us = _micros(now or datetime.utcnow())
+        if np is None:  # pragma: no cover - optional dependency
+            return [
+                w * math.exp(-decay_rate * (now_us - us) / 1e6)
+                for w, us in zip(self.weights, self.micros)
+            ]
+        age = (now_us - self.micros) / 1e6
+        return np.asarray(self.weights, dtype=float) * np.exp(-decay_rate * age)
+
+    def strongest_edge(
+        self, scores: Sequence[float], start: datetime
+    ) -> Tuple[Optional[Tuple[Any, Any]], float]:
+        """Edge with the highest ``scores`` entry within ``[start, ...)``."""
+        k = _first_argmax(scores, self.window_start(start))
+        if k < 0:
+            return None, -1.0
+        return (self.sources[k], self.targets[k]), float(scores[k])
+
+
+__all__ = ["TemporalEdgeIndex"]
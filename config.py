@@ -17,9 +17,15 @@ class Config:
     }  # Add supported emojis
     DAILY_DECAY: Decimal = Decimal("0.99")
     SNAPSHOT_INTERVAL: int = 100
+    LOGCHAIN_SEGMENT_BYTES: int = 64 * 1024 * 1024
+    LOGCHAIN_INDEX_INTERVAL: int = 256
+    EVENT_BATCH_SIZE: int = 500
+    BULK_UPDATE_CHUNK_SIZE: int = 5000
     MAX_INPUT_LENGTH: int = 10000
     VAX_PATTERNS: Dict[str, List[str]] = {"block": [r"\b(blocked_word)\b"]}
     VAX_FUZZY_THRESHOLD: int = 2
+    VAX_FUZZY_EXACT_MAX_LEN: int = 4  # keywords this short must match exactly
+    VAX_FUZZY_ONE_EDIT_MAX_LEN: int = 8  # ...and up to this long, within one edit
     REACTOR_KARMA_PER_REACT: Decimal = Decimal("1")
     CREATOR_KARMA_PER_REACT: Decimal = Decimal("2")
 
@@ -63,8 +69,19 @@ class Config:
     PROPOSAL_LIFECYCLE_INTERVAL_SECONDS: int = 300
     NONCE_CLEANUP_INTERVAL_SECONDS: int = 3600
     NONCE_EXPIRATION_SECONDS: int = 86400
+    NONCE_SLOT_SECONDS: int = 60
+    NONCE_BLOOM_BITS: int = 0
+    HOOK_DISPATCH_ASYNC: bool = True
+    HOOK_QUEUE_SIZE: int = 10000
+    HOOK_TIMEOUT_SECONDS: float = 5.0
+    HOOK_SUBMIT_TIMEOUT_SECONDS: float = 0.1
+    HOOK_WORKERS_PER_HOOK: int = 2
     CONTENT_ENTROPY_UPDATE_INTERVAL_SECONDS: int = 600
     NETWORK_CENTRALITY_UPDATE_INTERVAL_SECONDS: int = 3600
+    NETWORK_CENTRALITY_FULL_RESYNC_SECONDS: int = 86400
+    CAUSAL_GRAPH_CACHE_TTL_SECONDS: int = 3600
+    CAUSAL_GRAPH_PUBLISH_INTERVAL_SECONDS: float = 5.0
+    CAUSAL_GRAPH_SNAPSHOT_INTERVAL_SECONDS: int = 900
     PROACTIVE_INTERVENTION_INTERVAL_SECONDS: int = 3600
     AI_PERSONA_EVOLUTION_INTERVAL_SECONDS: int = 86400
     GUINNESS_PURSUIT_INTERVAL_SECONDS: int = 86400 * 3
@@ -18,6 +18,7 @@ try:
         DateTime,
         ForeignKey,
         UniqueConstraint,
+        Index,
         Table,
         Float,
         JSON,
@@ -72,6 +73,9 @@ except Exception:  # pragma: no cover - optional dependency
     def UniqueConstraint(*_a, **_kw):
         return None
 
+    def Index(*_a, **_kw):
+        return None
+
     class DeclarativeBase:
         metadata = type(
             "Meta",
@@ -465,6 +469,11 @@ class SystemState(Base):
     id = Column(Integer, primary_key=True)
     key = Column(String, unique=True, nullable=False)
     value = Column(String, nullable=False)
+    # Bumped by every ORM update (and by SystemStateService writes) so that
+    # cached reads can be revalidated without re-reading the value.
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __mapper_args__ = {"version_id_col": version}
 
 
 class ValidatorReputation(Base):
@@ -474,10 +483,51 @@ class ValidatorReputation(Base):
 
     validator_id = Column(String, primary_key=True)
     reputation = Column(Float, nullable=False, default=0.0)
+    # Incremental state for ReputationAccumulator: validation count, sum of
+    # undated deltas, and dated deltas scaled to ``reference_epoch``.
+    validation_count = Column(Integer, nullable=False, default=0)
+    undated_sum = Column(Float, nullable=False, default=0.0)
+    decayed_sum = Column(Float, nullable=False, default=0.0)
+    reference_epoch = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow,
                         onupdate=datetime.datetime.utcnow)
 
 
+class PredictionRecord(Base):
+    """A system prediction with typed lifecycle columns.
+
+    ``record`` holds the full JSON document returned by
+    ``PredictionManager.get_prediction``; status, hypothesis and expiry are
+    duplicated into columns so due predictions can be found by index.
+    """
+
+    __tablename__ = "prediction_records"
+
+    prediction_id = Column(String, primary_key=True)
+    status = Column(String, nullable=False, default="pending")
+    hypothesis_id = Column(String, nullable=True, index=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+    record = Column(JSON, nullable=False)
+
+    __table_args__ = (
+        Index("ix_prediction_records_status_expires", "status", "expires_at"),
+        Index("ix_prediction_records_status_updated", "status", "updated_at"),
+    )
+
+
+class ExperimentDesignRecord(Base):
+    """A stored validation experiment design."""
+
+    __tablename__ = "experiment_designs"
+
+    experiment_id = Column(String, primary_key=True)
+    hypothesis_id = Column(String, nullable=True, index=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    record = Column(JSON, nullable=False)
+
+
 class ValidatorProfile(Base):
     """Stores specialty and affiliation metadata for validators."""
 
@@ -24,6 +24,8 @@ from difflib import SequenceMatcher
 from validators.reputation_influence_tracker import compute_validator_reputations
 from temporal_consistency_checker import analyze_temporal_consistency
 from network.network_coordination_detector import detect_score_coordination
+from validation_frame import ValidationFrame
+from near_duplicate_index import NearDuplicateIndex
 
 logger = logging.getLogger("superNova_2177.certifier")
 logger.propagate = False
@@ -54,6 +56,10 @@ class Config:
     DEFAULT_VALIDATOR_REPUTATION = 0.5  # Until reputation tracking implemented
     MAX_NOTE_SCORE = 1.0  # Maximum boost/penalty from note analysis
 
+    # Above this many notes, contradiction checks only compare MinHash/LSH
+    # near-duplicate candidates instead of every pair
+    NEAR_DUPLICATE_EXACT_LIMIT = 2000
+
 
 @lru_cache(maxsize=512)
 def _note_sentiment(note: str) -> float:
@@ -90,7 +96,9 @@ def compute_diversity_score(validations: List[Dict[str, Any]]) -> Dict[str, Any]
     ----------
     validations:
         Sequence of validation dictionaries which may contain the keys
-        ``validator_id``, ``specialty`` and ``affiliation``.
+        ``validator_id``, ``specialty`` and ``affiliation``, or a
+        :class:`~validation_frame.ValidationFrame`, whose interned value
+        lists already hold the distinct values.
 
     Returns
     -------
@@ -99,19 +107,22 @@ def compute_diversity_score(validations: List[Dict[str, Any]]) -> Dict[str, Any]
         optional ``flags`` if low diversity is detected.  Counts of unique
         fields are also returned for debugging purposes.
     """
-    # For very large datasets consider numpy vectorization; profile with
-    # ``cProfile`` to identify any set-building bottlenecks.
-
     total = len(validations) or 1
 
-    ids = {v.get("validator_id") for v in validations if v.get("validator_id")}
-    specialties = {v.get("specialty") for v in validations if v.get("specialty")}
-    affiliations = {v.get("affiliation") for v in validations if v.get("affiliation")}
-    types = {
-        v.get("validator_type") or v.get("type")
-        for v in validations
-        if v.get("validator_type") or v.get("type")
-    }
+    if isinstance(validations, ValidationFrame):
+        ids = validations.validator_ids
+        specialties = validations.specialties
+        affiliations = validations.affiliations
+        types = validations.validator_types
+    else:
+        ids = {v.get("validator_id") for v in validations if v.get("validator_id")}
+        specialties = {v.get("specialty") for v in validations if v.get("specialty")}
+        affiliations = {v.get("affiliation") for v in validations if v.get("affiliation")}
+        types = {
+            v.get("validator_type") or v.get("type")
+            for v in validations
+            if v.get("validator_type") or v.get("type")
+        }
 
     ratios = [
         len(ids) / total,
@@ -140,7 +151,17 @@ def compute_diversity_score(validations: List[Dict[str, Any]]) -> Dict[str, Any]
 def detect_semantic_contradictions(
     validations: List[Dict[str, Any]], threshold: float = 0.7
 ) -> List[Dict[str, Any]]:
-    """Detect pairs of notes that are semantically similar yet opposing."""
+    """Detect pairs of notes that are semantically similar yet opposing.
+
+    Each distinct pair of note texts is compared once, only when exactly one
+    of them contains a contradiction keyword, and the cheap
+    ``SequenceMatcher`` upper bounds are checked before the full ratio.
+    Above ``Config.NEAR_DUPLICATE_EXACT_LIMIT`` distinct notes, only
+    MinHash/LSH near-duplicate candidates are compared. The index is tuned
+    to ``threshold``; recall is probabilistic and holds for notes that
+    differ by insertions such as an appended objection, while notes with
+    many scattered edits can be missed (see ``near_duplicate_index``).
+    """
 
     notes: List[Tuple[str, str]] = [
         (v.get("validator_id", f"v{i}"), str(v.get("note", "")).lower())
@@ -148,17 +169,53 @@ def detect_semantic_contradictions(
         if v.get("note")
     ]
 
-    contradictions: List[Dict[str, Any]] = []
-
-    for (id1, n1), (id2, n2) in combinations(notes, 2):
-        ratio = SequenceMatcher(None, n1, n2).ratio()
-        if ratio >= threshold:
-            has1 = any(k in n1 for k in Config.CONTRADICTION_KEYWORDS)
-            has2 = any(k in n2 for k in Config.CONTRADICTION_KEYWORDS)
-            if has1 != has2:
-                contradictions.append(
-                    {"validators": [id1, id2], "similarity": round(ratio, 3)}
-                )
+    # Identical notes share one set of comparisons.
+    positions: Dict[str, List[int]] = {}
+    for index, (_, note) in enumerate(notes):
+        positions.setdefault(note, []).append(index)
+    texts = list(positions)
+    flags = [any(k in n for k in Config.CONTRADICTION_KEYWORDS) for n in texts]
+
+    candidates: Any = combinations(range(len(texts)), 2)
+    if len(texts) > Config.NEAR_DUPLICATE_EXACT_LIMIT:
+        try:
+            candidates = NearDuplicateIndex.for_edit_ratio(texts, threshold).iter_candidate_pairs()
+        except ImportError:
+            pass
+
+    # SequenceMatcher is not symmetric, so keep each pair in note order.
+    oriented: Dict[int, List[int]] = {}
+    for a, b in candidates:
+        if flags[a] == flags[b]:
+            continue
+        for first, second in {(a, b), (b, a)}:
+            if positions[texts[first]][0] < positions[texts[second]][-1]:
+                oriented.setdefault(second, []).append(first)
+
+    # Reuse one matcher per second sequence; it caches its analysis of b.
+    ratios: Dict[Tuple[int, int], float] = {}
+    matcher = SequenceMatcher(None)
+    for second, firsts in oriented.items():
+        matcher.set_seq2(texts[second])
+        for first in firsts:
+            matcher.set_seq1(texts[first])
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= threshold:
+                ratios[first, second] = ratio
+
+    matches = sorted(
+        (i, j, ratio)
+        for (first, second), ratio in ratios.items()
+        for i in positions[texts[first]]
+        for j in positions[texts[second]]
+        if i < j
+    )
+    contradictions: List[Dict[str, Any]] = [
+        {"validators": [notes[i][0], notes[j][0]], "similarity": round(ratio, 3)}
+        for i, j, ratio in matches
+    ]
 
     return contradictions
 
@@ -1,9 +1,14 @@
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import inspect
 import logging
+import threading
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 
 @dataclass
@@ -13,6 +18,7 @@ class HookManager:
     hooks: Dict[str, List[Callable[..., Any]]] = field(
         default_factory=lambda: defaultdict(list)
     )
+    dispatcher: Optional["HookDispatcher"] = field(default=None, repr=False)
 
     def register_hook(self, name: str, func: Callable[..., Any]) -> None:
         """Safely register a hook callback under a cosmic name."""
@@ -53,12 +59,212 @@ class HookManager:
         """Public entry point to trigger hooks synchronously or asynchronously."""
         coro = self.trigger(name, *args, **kwargs)
         try:
-            loop = asyncio.get_running_loop()
+            asyncio.get_running_loop()
         except RuntimeError:
             return asyncio.run(coro)
-        else:
-            return loop.run_until_complete(coro)
+        # A running loop cannot be re-entered; finish the hooks on a helper
+        # thread with its own loop.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+    def start_dispatcher(self, **options: Any) -> "HookDispatcher":
+        """Route :meth:`dispatch` through a background :class:`HookDispatcher`."""
+        if self.dispatcher is None:
+            self.dispatcher = HookDispatcher(self, **options)
+        return self.dispatcher
+
+    def stop_dispatcher(self, timeout: Optional[float] = None) -> None:
+        """Close the dispatcher; later :meth:`dispatch` calls run inline."""
+        dispatcher, self.dispatcher = self.dispatcher, None
+        if dispatcher is not None:
+            dispatcher.close(timeout)
+
+    def dispatch(self, name: str, *args: Any, **kwargs: Any) -> bool:
+        """Queue hooks for *name* without waiting for them.
+
+        Falls back to :meth:`fire_hooks` when no dispatcher is running.
+        Returns ``False`` if the dispatcher dropped the event under load.
+        """
+        if self.dispatcher is None:
+            self.fire_hooks(name, *args, **kwargs)
+            return True
+        return self.dispatcher.submit(name, *args, **kwargs)
+
+    def hook_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-callback latency and failure counters from the dispatcher."""
+        return self.dispatcher.stats() if self.dispatcher is not None else {}
 
     def dump_hooks(self) -> Dict[str, List[str]]:
         """Inspect current hook bindings for audit clarity."""
         return {n: [getattr(f, "__name__", repr(f)) for f in cbs] for n, cbs in self.hooks.items()}
+
+
+def _hook_key(name: str, func: Callable[..., Any]) -> str:
+    return f"{name}:{getattr(func, '__qualname__', repr(func))}"
+
+
+@dataclass
+class HookStats:
+    """Counters for one callback bound to one hook name."""
+
+    calls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, outcome: str) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if outcome == "failure":
+            self.failures += 1
+        elif outcome == "timeout":
+            self.timeouts += 1
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+        }
+
+
+class HookDispatcher:
+    """Run hook callbacks off the caller's thread.
+
+    Submitted events wait in a bounded queue (``max_pending`` events in
+    flight). When it is full, :meth:`submit` blocks for up to
+    ``submit_timeout`` seconds (``None`` waits indefinitely) and then drops
+    the event, counting it in :attr:`dropped`. Coroutine callbacks run
+    concurrently on a dedicated event loop thread; plain callables run on a
+    small executor per callback, so one slow hook cannot starve the others.
+    Every invocation is bounded by ``hook_timeout`` seconds.
+
+    The dispatcher is closed at interpreter exit if :meth:`close` was not
+    called first.
+    """
+
+    def __init__(
+        self,
+        manager: HookManager,
+        *,
+        max_pending: int = 10000,
+        hook_timeout: float = 5.0,
+        submit_timeout: Optional[float] = 0.0,
+        workers_per_hook: int = 2,
+    ) -> None:
+        self.manager = manager
+        self.hook_timeout = hook_timeout
+        self.submit_timeout = submit_timeout
+        self.workers_per_hook = workers_per_hook
+        self.dropped = 0
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = 0
+        self._stats: Dict[str, HookStats] = defaultdict(HookStats)
+        self._stats_lock = threading.Lock()
+        self._executors: Dict[str, concurrent.futures.ThreadPoolExecutor] = {}
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="hook-dispatcher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close, hook_timeout)
+
+    def submit(self, name: str, *args: Any, **kwargs: Any) -> bool:
+        """Queue the callbacks for *name*; return ``False`` if dropped."""
+        if self._closed:
+            raise RuntimeError("HookDispatcher is closed")
+        callbacks = list(self.manager.hooks.get(name, []))
+        if not callbacks:
+            return True
+        if self.submit_timeout == 0:
+            acquired = self._slots.acquire(blocking=False)
+        else:
+            acquired = self._slots.acquire(timeout=self.submit_timeout)
+        if not acquired:
+            with self._stats_lock:
+                self.dropped += 1
+            logging.warning("Hook queue full; dropped '%s' event", name)
+            return False
+        with self._stats_lock:
+            self._pending += 1
+        asyncio.run_coroutine_threadsafe(self._run(name, callbacks, args, kwargs), self._loop)
+        return True
+
+    async def _run(
+        self, name: str, callbacks: List[Callable[..., Any]], args: tuple, kwargs: dict
+    ) -> None:
+        try:
+            await asyncio.gather(*(self._call(name, f, args, kwargs) for f in callbacks))
+        finally:
+            with self._stats_lock:
+                self._pending -= 1
+            self._slots.release()
+
+    def _executor(self, key: str) -> concurrent.futures.ThreadPoolExecutor:
+        executor = self._executors.get(key)
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers_per_hook, thread_name_prefix=f"hook-{key}"
+            )
+            self._executors[key] = executor
+        return executor
+
+    async def _call(
+        self, name: str, func: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> None:
+        key = _hook_key(name, func)
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            if inspect.iscoroutinefunction(func):
+                awaitable = func(*args, **kwargs)
+            else:
+                awaitable = self._loop.run_in_executor(
+                    self._executor(key), functools.partial(func, *args, **kwargs)
+                )
+            result = await asyncio.wait_for(awaitable, self.hook_timeout)
+            if inspect.isawaitable(result):
+                await asyncio.wait_for(result, self.hook_timeout)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            logging.warning("Hook '%s' timed out after %.1fs", key, self.hook_timeout)
+        except Exception:
+            outcome = "failure"
+            logging.exception("💥 Hook '%s' raised an exception", key)
+        with self._stats_lock:
+            self._stats[key].record(time.perf_counter() - started, outcome)
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted events whose callbacks have not finished."""
+        return self._pending
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._stats_lock:
+            return {key: s.to_dict() for key, s in self._stats.items()}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been handled."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Drain the queue, then stop the loop thread and executors."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self.flush(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
@@ -22,6 +22,7 @@ from sqlalchemy import func, select
 # Assuming these modules are available in the same directory or Python path
 from db_models import SystemState # For accessing hypothesis records
 import hypothesis_tracker as ht # For retrieving and updating hypothesis records
+from near_duplicate_index import NearDuplicateIndex
 
 # --- Configuration Placeholder ---
 # In a real scenario, this would come from a central Config object (e.g., superNova_2177.Config)
@@ -29,6 +30,7 @@ import hypothesis_tracker as ht # For retrieving and updating hypothesis records
 class TempConfig:
     HYPOTHESIS_STALENESS_THRESHOLD_DAYS = 30
     TEXT_SIMILARITY_THRESHOLD = 0.7 # For detecting conflicting hypotheses (Levenshtein/keyword)
+    NEAR_DUPLICATE_EXACT_LIMIT = 2000 # Above this many open hypotheses, only compare MinHash/LSH candidates
 
 # Try to import actual Config if available, otherwise use TempConfig
 try:
@@ -87,14 +89,18 @@ def _get_confidence_band(score: float) -> str:
         return "low"
 
 
+def _normalize_for_similarity(text: str) -> str:
+    """Lowercase ``text`` and drop everything but letters and digits."""
+    return "".join(filter(str.isalnum, text.lower()))
+
+
 def _levenshtein_distance_normalized(s1: str, s2: str) -> float:
     """Calculate normalized Levenshtein distance (0.0 to 1.0, 1.0 being identical)."""
     if not s1 and not s2: return 1.0
     if not s1 or not s2: return 0.0
     
-    # Basic normalization: lowercase and remove non-alphanumeric (except spaces)
-    s1_norm = "".join(filter(str.isalnum, s1.lower()))
-    s2_norm = "".join(filter(str.isalnum, s2.lower()))
+    s1_norm = _normalize_for_similarity(s1)
+    s2_norm = _normalize_for_similarity(s2)
     
     if not s1_norm and not s2_norm: return 1.0 # Both empty after norm
     if not s1_norm or not s2_norm: return 0.0 # One empty after norm
@@ -170,18 +176,37 @@ def detect_conflicting_hypotheses(db: Session) -> List[Tuple[str, str]]:
     """
     all_hypotheses = _get_all_hypotheses(db)
     conflicting_pairs = []
+    threshold = getattr(CONFIG, "TEXT_SIMILARITY_THRESHOLD", TempConfig.TEXT_SIMILARITY_THRESHOLD)
+    exact_limit = getattr(CONFIG, "NEAR_DUPLICATE_EXACT_LIMIT", TempConfig.NEAR_DUPLICATE_EXACT_LIMIT)
 
     open_hypotheses = [h for h in all_hypotheses if h.get("status") == "open"]
+    normalized = [_normalize_for_similarity(h.get("text") or "") for h in open_hypotheses]
+
+    # Large batches only compare near-duplicate candidates from a MinHash/LSH
+    # index tuned to the threshold; unlike the exact path, recall is
+    # probabilistic and weaker for texts with many scattered edits.
+    pairs = itertools.combinations(range(len(open_hypotheses)), 2)
+    if len(open_hypotheses) > exact_limit:
+        try:
+            pairs = NearDuplicateIndex.for_edit_ratio(normalized, threshold).iter_candidate_pairs()
+        except ImportError:
+            pass
 
-    # Iterate through all unique pairs of open hypotheses
-    for hyp1, hyp2 in itertools.combinations(open_hypotheses, 2):
+    for i, j in pairs:
+        hyp1, hyp2 = open_hypotheses[i], open_hypotheses[j]
         text1 = hyp1.get("text", "")
         text2 = hyp2.get("text", "")
 
+        # The edit distance is at least the length difference, so this bound
+        # skips most dissimilar pairs without running the full DP.
+        shorter, longer = sorted((len(normalized[i]), len(normalized[j])))
+        if shorter and text1 and text2 and 1.0 - (longer - shorter) / longer < threshold:
+            continue
+
         # Check textual similarity
         similarity = _levenshtein_distance_normalized(text1, text2)
         
-        if similarity >= CONFIG.TEXT_SIMILARITY_THRESHOLD:
+        if similarity >= threshold:
             # Check for diverging evidence/scores for similar texts
             score1 = hyp1.get("score", 0.0)
             score2 = hyp2.get("score", 0.0)
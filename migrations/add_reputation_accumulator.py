@@ -0,0 +1,24 @@
+"""Add reputation accumulator columns to the validator_reputations table."""
+from sqlalchemy import inspect, text
+from db_models import engine
+
+COLUMNS = {
+    'validation_count': 'INTEGER NOT NULL DEFAULT 0',
+    'undated_sum': 'FLOAT NOT NULL DEFAULT 0',
+    'decayed_sum': 'FLOAT NOT NULL DEFAULT 0',
+    'reference_epoch': 'TIMESTAMP',
+}
+
+def migrate():
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if 'validator_reputations' not in inspector.get_table_names():
+            return
+        cols = {c['name'] for c in inspector.get_columns('validator_reputations')}
+        for name, ddl in COLUMNS.items():
+            if name not in cols:
+                conn.execute(text(f'ALTER TABLE validator_reputations ADD COLUMN {name} {ddl}'))
+
+if __name__ == '__main__':
+    migrate()
+    print('Migration complete')
@@ -0,0 +1,16 @@
+"""Add the version column used for cached SystemState reads."""
+from sqlalchemy import inspect, text
+from db_models import engine
+
+def migrate():
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if 'system_state' not in inspector.get_table_names():
+            return
+        cols = {c['name'] for c in inspector.get_columns('system_state')}
+        if 'version' not in cols:
+            conn.execute(text('ALTER TABLE system_state ADD COLUMN version INTEGER NOT NULL DEFAULT 0'))
+
+if __name__ == '__main__':
+    migrate()
+    print('Migration complete')
@@ -0,0 +1,17 @@
+"""Move prediction:/experiment: SystemState rows into their own tables."""
+from db_models import Base, SessionLocal, engine, ExperimentDesignRecord, PredictionRecord
+from prediction_manager import migrate_legacy_records
+
+def migrate():
+    Base.metadata.create_all(
+        bind=engine, tables=[PredictionRecord.__table__, ExperimentDesignRecord.__table__]
+    )
+    session = SessionLocal()
+    try:
+        return migrate_legacy_records(session)
+    finally:
+        session.close()
+
+if __name__ == '__main__':
+    predictions, experiments = migrate()
+    print(f'Migration complete: {predictions} predictions, {experiments} experiments moved')
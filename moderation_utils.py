@@ -1,9 +1,263 @@
 # RFC_V5_1_INIT
-"""Moderation helper stubs."""
+"""Moderation helper stubs.
 
-from typing import Any
+Blocklists are matched in one pass over the text.  Patterns of the form
+``\\b(word)\\b`` are plain word matches and are checked by intersecting the
+text's words with a set; every other pattern is joined into a single regex
+alternation.  Python's ``re`` tries alternatives one by one, so keeping the
+(usually dominant) literal words out of the regex is what keeps the cost flat
+as the blocklist grows.
+
+Fuzzy keyword matching uses a symmetric-delete index: every keyword is stored
+under all of its variants with up to ``threshold`` characters deleted, and a
+word is looked up through its own deletion variants.  Two strings within edit
+distance ``k`` always share such a variant, so candidates are found with
+dictionary lookups whose count depends on the word length only, not on the
+blocklist size, and are then confirmed with a bounded Levenshtein check.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
 import re
 
+_BACKREF = re.compile(r"\\[1-9]|\(\?P=")
+_WORD_PATTERN = re.compile(r"\\b(?:\((?:\?:)?(\w+)\)|(\w+))\\b")
+_TOKEN = re.compile(r"\w+")
+
+
+def compile_block_patterns(patterns: Iterable[str]) -> List["re.Pattern[str]"]:
+    """Compile ``patterns`` into as few case-insensitive regexes as possible.
+
+    Patterns are joined into one alternation.  Patterns using numbered or
+    named backreferences would be renumbered by the join, so they are kept
+    as separate regexes; if the combined expression does not compile (for
+    example because of inline global flags) every pattern is compiled on its
+    own.
+    """
+    patterns = list(patterns)
+    joinable = [p for p in patterns if not _BACKREF.search(p)]
+    separate = [p for p in patterns if _BACKREF.search(p)]
+    compiled: List["re.Pattern[str]"] = []
+    if joinable:
+        try:
+            compiled.append(
+                re.compile("|".join(f"(?:{p})" for p in joinable), re.IGNORECASE)
+            )
+        except re.error:
+            separate = patterns
+    return compiled + [re.compile(p, re.IGNORECASE) for p in separate]
+
+
+def literal_keyword(pattern: str) -> Optional[str]:
+    """Return the plain word a ``\\b(word)\\b`` style pattern matches, if any."""
+    core = pattern
+    if core.startswith(r"\b"):
+        core = core[2:]
+    if core.endswith(r"\b"):
+        core = core[:-2]
+    for prefix in ("(?:", "("):
+        if core.startswith(prefix) and core.endswith(")"):
+            core = core[len(prefix) : -1]
+            break
+    return core.lower() if re.fullmatch(r"\w+", core) else None
+
+
+def tokenize(text: str) -> Set[str]:
+    """Return the set of maximal ``\\w`` runs in ``text``."""
+    return set(_TOKEN.findall(text))
+
+
+class BlockMatcher:
+    """Match text against a list of block patterns.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        Regular expressions, matched case-insensitively.
+
+    Notes
+    -----
+    ``\\b(word)\\b`` matches exactly when ``word`` is one of the text's
+    maximal ``\\w`` runs, so such patterns become a set lookup.  The matcher
+    is immutable and may be shared between threads.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(patterns)
+        words: Set[str] = set()
+        rest: List[str] = []
+        for p in self.patterns:
+            m = _WORD_PATTERN.fullmatch(p)
+            if m:
+                words.add((m.group(1) or m.group(2)).lower())
+            else:
+                rest.append(p)
+        self.words: FrozenSet[str] = frozenset(words)
+        self.regexes = compile_block_patterns(rest)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def search(self, lower_text: str, tokens: Optional[Set[str]] = None) -> bool:
+        """Return ``True`` if any pattern matches ``lower_text``.
+
+        ``tokens`` may be passed when the caller already tokenized the text.
+        """
+        if self.words:
+            if tokens is None:
+                tokens = tokenize(lower_text)
+            if not self.words.isdisjoint(tokens):
+                return True
+        return any(rx.search(lower_text) for rx in self.regexes)
+
+    def first_match(self, text: str) -> Optional[str]:
+        """Return the first configured pattern matching ``text``.
+
+        Runs each pattern separately and is meant for the rare blocked path
+        when the offending pattern needs to be reported.
+        """
+        for p in self.patterns:
+            if re.search(p, text, re.IGNORECASE):
+                return p
+        return None
+
+
+def bounded_levenshtein(s1: str, s2: str, bound: int) -> int:
+    """Return the edit distance of ``s1`` and ``s2``, or ``bound + 1`` if larger."""
+    if abs(len(s1) - len(s2)) > bound:
+        return bound + 1
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current = [i + 1]
+        for j, c2 in enumerate(s2):
+            current.append(
+                min(previous[j + 1] + 1, current[j] + 1, previous[j] + (c1 != c2))
+            )
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return previous[-1] if previous[-1] <= bound else bound + 1
+
+
+def _deletions(word: str, depth: int) -> Set[str]:
+    """Return ``word`` and every string obtained by deleting up to ``depth`` chars."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        if not frontier:
+            break
+        variants |= frontier
+    return variants
+
+
+def keyword_edit_distance(
+    keyword: str, threshold: int, exact_max_len: int = 4, one_edit_max_len: int = 8
+) -> int:
+    """Edits allowed for ``keyword``: none up to ``exact_max_len`` chars,
+    at most one up to ``one_edit_max_len``, else ``threshold``.
+
+    A fixed distance of two turns short keywords into near-wildcards
+    (``hate`` would match ``have``, ``date``, ``hat`` and ``that``).
+    """
+    if len(keyword) <= exact_max_len:
+        return 0
+    if len(keyword) <= one_edit_max_len:
+        return min(1, threshold)
+    return threshold
+
+
+class FuzzyKeywordIndex:
+    """Find keywords within ``threshold`` edits of a word.
+
+    Parameters
+    ----------
+    keywords : Iterable[str]
+        Lower-case keywords to index.
+    threshold : int
+        Maximum Levenshtein distance considered a match.
+    length_scaled : bool, optional
+        Cap each keyword's distance with :func:`keyword_edit_distance`, so
+        short keywords need longer matches to be exact.
+    exact_max_len, one_edit_max_len : int, optional
+        Length limits passed to :func:`keyword_edit_distance` when
+        ``length_scaled`` is set.
+    cache_size : int, optional
+        Number of recent word lookups memoized; event payloads repeat the
+        same keys and values constantly.
+
+    Notes
+    -----
+    The index is immutable after construction and safe to query from many
+    threads without locking.  Memory grows with ``len(keyword) ** threshold``
+    per keyword, which is small for the usual thresholds of one or two.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        threshold: int,
+        *,
+        cache_size: int = 65536,
+        length_scaled: bool = False,
+        exact_max_len: int = 4,
+        one_edit_max_len: int = 8,
+    ):
+        self.threshold = max(0, int(threshold))
+        self.keywords = sorted(set(keywords))
+        self._bounds: Dict[str, int] = {
+            keyword: keyword_edit_distance(
+                keyword, self.threshold, exact_max_len, one_edit_max_len
+            )
+            if length_scaled
+            else self.threshold
+            for keyword in self.keywords
+        }
+        index: Dict[str, List[str]] = {}
+        for keyword in self.keywords:
+            # A keyword indexed to depth d still meets every word within d
+            # edits, because words are looked up to the larger ``threshold``.
+            for variant in _deletions(keyword, self._bounds[keyword]):
+                index.setdefault(variant, []).append(keyword)
+        self._index = index
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _match(self, word: str) -> Optional[str]:
+        """Return a keyword within ``threshold`` edits of ``word`` or ``None``."""
+        index = self._index
+        seen: Set[str] = set()
+        for variant in _deletions(word, self.threshold):
+            for keyword in index.get(variant, ()):
+                if keyword in seen:
+                    continue
+                seen.add(keyword)
+                bound = self._bounds[keyword]
+                if bounded_levenshtein(word, keyword, bound) <= bound:
+                    return keyword
+        return None
+
+    def find(self, text: str, tokens: Optional[Set[str]] = None) -> Optional[tuple]:
+        """Return ``(word, keyword)`` for the first fuzzy hit in ``text``.
+
+        Only words longer than two characters are considered.  ``tokens``
+        may be passed when the caller already tokenized the lower-cased text.
+        """
+        if not self._index:
+            return None
+        if tokens is None:
+            tokens = tokenize(text.lower())
+        for word in tokens:
+            if len(word) > 2:
+                keyword = self.match(word)
+                if keyword is not None:
+                    return word, keyword
+        return None
+
 
 def check_profanity(text: str) -> bool:
     """Return True if profanity detected (stub)."""
@@ -23,14 +277,12 @@ class Vaccine:
     def __init__(self, config: Any):
         """Compile patterns from ``config.VAX_PATTERNS['block']``."""
         block = config.VAX_PATTERNS.get("block", [])
-        self.patterns = [re.compile(p, re.IGNORECASE) for p in block]
+        self.matcher = BlockMatcher(block)
 
     def scan(self, text: str) -> bool:
         """Return ``True`` if content passes vaccine checks."""
-        lower = text.lower()
-        for pat in self.patterns:
-            if pat.search(lower):
-                return False
+        if self.matcher.search(text.lower()):
+            return False
         if check_profanity(text):
             return False
         return True
@@ -0,0 +1,245 @@
+"""
+near_duplicate_index.py — MinHash/LSH near-duplicate text index (v4.7)
+
+Finds pairs of texts that are likely to be near-duplicates without comparing
+every pair. Each text is cut into overlapping byte shingles; a MinHash
+signature estimates the Jaccard similarity of two shingle sets, and LSH
+banding groups signatures so that only texts agreeing on a whole band become
+candidates.
+
+With ``bands`` bands of ``rows`` rows, a pair with shingle Jaccard
+similarity ``s`` becomes a candidate with probability
+``1 - (1 - s**rows)**bands``, an S-curve rising around
+``(1 / bands) ** (1 / rows)``. :func:`lsh_parameters` picks the split of
+``num_perm`` hashes whose midpoint is closest to a Jaccard ``threshold``, or,
+given a ``recall``, the most rows per band that still find pairs at the
+threshold with at least that probability. More rows make the curve steeper,
+so unrelated texts collide far less often.
+
+Callers filtering by an edit ratio (``SequenceMatcher.ratio`` or normalised
+Levenshtein similarity) use :meth:`NearDuplicateIndex.for_edit_ratio`. An
+edit ratio is a Dice-style coefficient, and a note extended by one
+contiguous insertion (``"x"`` against ``"x but we disagree"``) reaches edit
+ratio ``r`` at shingle Jaccard about ``r / (2 - r)``
+(:func:`edit_ratio_jaccard`, 0.54 for 0.7), so the banding is tuned to that
+Jaccard. Recall is probabilistic and holds for pairs at or above it: edits
+scattered through a note destroy more shingles than they change characters,
+so such a pair can pass the edit ratio with a lower Jaccard and be missed.
+The length prefilter is exact: a pair whose lengths alone rule out the
+ratio is never yielded. Candidates are only a shortlist; callers confirm
+them with their own similarity measure.
+
+:meth:`NearDuplicateIndex.iter_candidate_pairs` streams candidates in
+order, a chunk of texts at a time, so the full candidate set is never held
+in memory.
+
+Shingles are taken over UTF-8 bytes and packed into integers, so no hashing
+of Python strings is involved and signatures are reproducible across runs.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+_EMPTY = np.uint64(np.iinfo(np.uint64).max) if np is not None else None
+
+
+def shingle_codes(text: str, size: int = 4) -> "np.ndarray":
+    """Return the ``size``-byte shingles of ``text`` packed into uint64.
+
+    Texts shorter than ``size`` bytes form a single shingle; empty texts
+    have none.
+    """
+    data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+    if len(data) <= size:
+        codes = np.zeros(1 if len(data) else 0, dtype=np.uint64)
+        for byte in data:
+            codes = (codes << np.uint64(8)) | byte
+        # Mark the length so that e.g. "a" and "\0a" differ.
+        return codes | (np.uint64(len(data)) << np.uint64(8 * size)) if len(data) else codes
+    codes = np.zeros(len(data) - size + 1, dtype=np.uint64)
+    for offset in range(size):
+        codes = (codes << np.uint64(8)) | data[offset : offset + len(codes)]
+    return codes
+
+
+def lsh_parameters(
+    threshold: float, num_perm: int = 256, recall: Optional[float] = None
+) -> Tuple[int, int]:
+    """``(bands, rows)`` using at most ``num_perm`` hashes.
+
+    Without ``recall``, the S-curve midpoint ``(1 / bands) ** (1 / rows)``
+    is closest to ``threshold``. With it, ``rows`` is the largest for which
+    a pair at ``threshold`` is still a candidate with probability at least
+    ``recall``.
+    """
+    if recall is None:
+        rows = min(
+            range(1, num_perm + 1),
+            key=lambda r: abs((1.0 / (num_perm // r)) ** (1.0 / r) - threshold),
+        )
+    else:
+        rows = max(
+            (r for r in range(1, num_perm + 1) if candidate_probability(threshold, num_perm // r, r) >= recall),
+            default=1,
+        )
+    return num_perm // rows, rows
+
+
+def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    """Probability that a pair with shingle Jaccard ``similarity`` shares a band."""
+    return 1.0 - (1.0 - similarity**rows) ** bands
+
+
+def edit_ratio_jaccard(ratio: float) -> float:
+    """Shingle Jaccard at which a contiguous insertion reaches edit ``ratio``."""
+    return ratio / (2.0 - ratio)
+
+
+class NearDuplicateIndex:
+    """MinHash signatures with LSH banding over a batch of texts.
+
+    Args:
+        texts: Texts to index, addressed by position
+        shingle_size: Bytes per shingle (at most 7)
+        threshold: Shingle Jaccard similarity the banding is tuned for
+        num_perm: Hash budget split into bands by :func:`lsh_parameters`
+        bands: Number of LSH bands, overriding ``threshold``
+        rows: Signature rows per band, overriding ``threshold``
+        seed: Seed for the hash permutations
+        recall: Candidate probability wanted at ``threshold``; see
+            :func:`lsh_parameters`
+        length_ratio: Skip pairs with ``2 * min(len) / (len + len)`` below
+            this, which no edit ratio of that value can pass
+    """
+
+    def __init__(
+        self,
+        texts: Sequence[str],
+        shingle_size: int = 4,
+        threshold: float = 0.1,
+        num_perm: int = 256,
+        bands: Optional[int] = None,
+        rows: Optional[int] = None,
+        seed: int = 1,
+        recall: Optional[float] = None,
+        length_ratio: Optional[float] = None,
+    ) -> None:
+        if np is None:  # pragma: no cover - optional dependency
+            raise ImportError("NearDuplicateIndex requires numpy")
+        if not 1 <= shingle_size <= 7:
+            raise ValueError("shingle_size must be between 1 and 7")
+        if bands is None or rows is None:
+            tuned_bands, tuned_rows = lsh_parameters(threshold, num_perm, recall)
+            bands = tuned_bands if bands is None else bands
+            rows = tuned_rows if rows is None else rows
+        self.bands = bands
+        self.rows = rows
+        self.length_ratio = length_ratio
+        self._lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        rng = np.random.default_rng(seed)
+        perms = bands * rows
+        # Multiply-shift hashing: (a * x + b) mod 2**64 with odd a, keeping the
+        # high 32 bits. uint64 arithmetic wraps, which is the modulus we want.
+        self._a = rng.integers(0, 1 << 63, size=perms, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=perms, dtype=np.uint64)
+        self._band_mix = rng.integers(0, 1 << 63, size=rows, dtype=np.uint64) | np.uint64(1)
+        self.signatures = self._signatures([shingle_codes(t, shingle_size) for t in texts])
+
+    @classmethod
+    def for_edit_ratio(
+        cls, texts: Sequence[str], ratio: float, recall: float = 0.95, **kwargs
+    ) -> "NearDuplicateIndex":
+        """Index tuned for pairs whose edit ratio is at least ``ratio``.
+
+        Bands are tuned to :func:`edit_ratio_jaccard` of ``ratio`` with the
+        given ``recall``, and pairs too different in length are skipped.
+        """
+        return cls(texts, threshold=edit_ratio_jaccard(ratio), recall=recall, length_ratio=ratio, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def _signatures(self, shingles: List["np.ndarray"]) -> "np.ndarray":
+        n = len(shingles)
+        signatures = np.full((n, len(self._a)), _EMPTY, dtype=np.uint64)
+        sizes = np.fromiter((len(s) for s in shingles), dtype=np.int64, count=n)
+        present = np.flatnonzero(sizes)
+        if not len(present):
+            return signatures
+        codes = np.concatenate([shingles[i] for i in present.tolist()])
+        starts = np.concatenate(([0], np.cumsum(sizes[present])[:-1]))
+        for k in range(len(self._a)):
+            hashed = (self._a[k] * codes + self._b[k]) >> np.uint64(32)
+            signatures[present, k] = np.minimum.reduceat(hashed, starts)
+        return signatures
+
+    def candidate_pairs(self) -> List[Tuple[int, int]]:
+        """Sorted ``(i, j)`` pairs, ``i < j``, sharing at least one band."""
+        return list(self.iter_candidate_pairs())
+
+    def iter_candidate_pairs(self, chunk_size: int = 4096) -> Iterator[Tuple[int, int]]:
+        """Yield the pairs of :meth:`candidate_pairs` in order.
+
+        Pairs are produced for ``chunk_size`` first indices at a time, so
+        memory is bounded by one chunk's candidates rather than all of them.
+        """
+        n = len(self.signatures)
+        if n < 2:
+            return
+        index = np.int32 if n < 2**31 else np.int64
+        position = np.arange(n)
+        bands = []
+        for band in range(self.bands):
+            block = self.signatures[:, band * self.rows : (band + 1) * self.rows]
+            # Mix the band's rows into one key; rare collisions only add
+            # candidates, which callers verify anyway.
+            bucket = (block * self._band_mix).sum(axis=1, dtype=np.uint64)
+            # A stable sort keeps each bucket's members in index order.
+            order = np.argsort(bucket, kind="stable")
+            bucket = bucket[order]
+            # Rank of the last member of each member's bucket
+            last = np.searchsorted(bucket, bucket, side="right") - 1
+            if (last == position).all():
+                continue
+            rank = np.empty(n, dtype=index)
+            rank[order] = position
+            bands.append((order.astype(index), rank, last.astype(index)))
+        for lo in range(0, n, chunk_size):
+            keys = []
+            for order, rank, last in bands:
+                first = rank[lo : lo + chunk_size].astype(np.int64)
+                # Pair every member with the later members of its bucket.
+                later = last[first] - first
+                total = int(later.sum())
+                if not total:
+                    continue
+                left = np.repeat(first, later)
+                right = left + np.arange(total) - np.repeat(np.cumsum(later) - later, later) + 1
+                keys.append(order[left].astype(np.int64) * n + order[right])
+            if keys:
+                pairs = np.unique(np.concatenate(keys))
+                if self.length_ratio is not None:
+                    a, b = self._lengths[pairs // n], self._lengths[pairs % n]
+                    pairs = pairs[2 * np.minimum(a, b) >= self.length_ratio * (a + b)]
+                yield from zip((pairs // n).tolist(), (pairs % n).tolist())
+
+
+def candidate_pairs(texts: Sequence[str], **kwargs) -> List[Tuple[int, int]]:
+    """Shortcut for ``NearDuplicateIndex(texts, **kwargs).candidate_pairs()``."""
+    return NearDuplicateIndex(texts, **kwargs).candidate_pairs()
+
+
+__all__ = [
+    "NearDuplicateIndex",
+    "candidate_pairs",
+    "candidate_probability",
+    "edit_ratio_jaccard",
+    "lsh_parameters",
+    "shingle_codes",
+]
@@ -0,0 +1,412 @@
+"""Streaming coordination analysis for long-running validator pipelines.
+
+:func:`network.network_coordination_detector.analyze_coordination_patterns`
+recomputes every detector over the full validation list.  ``CoordinationMonitor``
+instead keeps the detectors' intermediate state and folds validations in as
+they arrive:
+
+* co-validation edge weights and their running maximum,
+* per-pair close-submission counts over submissions bucketed by time window,
+  kept for ``Config.MONITOR_SUBMISSION_RETENTION_MINUTES`` behind the newest,
+* per-pair score-similarity counts and summed differences, keyed like the
+  batch detector,
+* per-validator sums of note embeddings and their norms, from which each new
+  note rescores only the pairs involving its author.
+
+Each detector also tracks how many pairs currently clear its flag threshold,
+so :attr:`CoordinationMonitor.overall_risk_score` is O(1).  ``checkpoint`` and
+``restore`` persist the whole state so a process can resume after a restart.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import pickle
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from network import network_coordination_detector as ncd
+from network.network_coordination_detector import (
+    Config,
+    _parse_timestamp,
+    _to_micros,
+    calculate_sophisticated_risk_score,
+    detect_graph_communities,
+    logger,
+)
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+Pair = Tuple[str, str]
+_CHECKPOINT_VERSION = 3
+
+
+def _pair(a: str, b: str) -> Pair:
+    return (a, b) if a < b else (b, a)
+
+
+class CoordinationMonitor:
+    """Incrementally maintained coordination risk.
+
+    Parameters
+    ----------
+    encode:
+        Callable turning a list of notes into embedding rows. Defaults to the
+        detector's sentence model through its embedding cache; when no model
+        is available semantic tracking is skipped, since the TF-IDF fallback
+        only makes sense over a fixed batch.
+
+    Notes
+    -----
+    Co-validation, temporal and semantic pairs are unordered. Score pairs
+    follow the batch score detector: ``(a, b)`` means ``a`` scored the
+    hypothesis first, so ``(a, b)`` and ``(b, a)`` are counted separately
+    and flag at the same counts as ``analyze_coordination_patterns``.
+
+    Submissions older than ``Config.MONITOR_SUBMISSION_RETENTION_MINUTES``
+    before the newest one are dropped, so a validation arriving later than
+    that is only matched against what is still retained.
+    """
+
+    def __init__(self, encode: Optional[Callable[[List[str]], Sequence[Sequence[float]]]] = None) -> None:
+        self._encode = encode
+        self._lock = threading.RLock()
+        self.count = 0
+        # Co-validation graph
+        self.nodes: Dict[str, None] = {}
+        self.hypothesis_validators: Dict[str, List[str]] = defaultdict(list)
+        self._hypothesis_sets: Dict[str, set] = defaultdict(set)
+        self.edge_weights: Dict[Pair, float] = defaultdict(float)
+        self.max_edge_weight = 0.0
+        # Temporal
+        # Submissions keyed by ``timestamp // window``; a heap of the keys
+        # lets the oldest buckets be dropped once out of retention.
+        self._submissions: Dict[int, List[Tuple[int, str]]] = {}
+        self._submission_buckets: List[int] = []
+        self._latest_submission: Optional[int] = None
+        self.close_counts: Dict[Pair, int] = defaultdict(int)
+        self.temporal_flags = 0
+        # Score
+        self._scores: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.similar_counts: Dict[Pair, int] = defaultdict(int)
+        self.similar_diff_sums: Dict[Pair, float] = defaultdict(float)
+        self.score_flags = 0
+        # Semantic
+        self._sem_index: Dict[str, int] = {}
+        self._sem_sums: Any = None
+        self._sem_norms: Any = None
+        self._sem_used = 0
+        self.semantic_pairs: Dict[Pair, float] = {}
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+    def ingest(self, validation: Dict[str, Any]) -> None:
+        """Fold a single validation record into the running state."""
+        self.ingest_many([validation])
+
+    def ingest_many(self, validations: Iterable[Dict[str, Any]]) -> None:
+        """Fold a micro-batch in; its notes are embedded in one call."""
+        validations = list(validations)
+        notes = [self._note(v) for v in validations]
+        embeddings = self._embed([n for n in notes if n is not None])
+        with self._lock:
+            row = 0
+            for v, note in zip(validations, notes):
+                self._ingest_one(v)
+                if note is not None and embeddings is not None:
+                    self._add_embedding(v["validator_id"], embeddings[row])
+                    row += 1
+                self.count += 1
+
+    def ingest_frame(self, frame: Any) -> None:
+        """Fold in every row of a :class:`~validation_frame.ValidationFrame`."""
+
+        def value(codes: Any, values: List[Any], row: int) -> Any:
+            code = int(codes[row])
+            return values[code] if code >= 0 else None
+
+        rows = []
+        for row in range(len(frame)):
+            score = float(frame.score[row]) if frame.has_score[row] else None
+            ts_code = int(frame.ts_code[row])
+            rows.append(
+                {
+                    "validator_id": value(frame.validator, frame.validator_ids, row),
+                    "hypothesis_id": value(frame.hypothesis, frame.hypothesis_ids, row),
+                    "score": None if score is None or score != score else score,
+                    "timestamp": frame.ts_iso[ts_code] if ts_code >= 0 else None,
+                    "note": value(frame.note, frame.notes, row) or "",
+                }
+            )
+        self.ingest_many(rows)
+
+    @staticmethod
+    def _note(v: Dict[str, Any]) -> Optional[str]:
+        note = v.get("note")
+        if (
+            not v.get("validator_id")
+            or not isinstance(note, str)
+            or len(note) < Config.REPEATED_PHRASE_MIN_LENGTH
+        ):
+            return None
+        return note.lower().strip()
+
+    def _embed(self, notes: List[str]):
+        if not notes or np is None:
+            return None
+        if self._encode is not None:
+            return np.asarray(self._encode(notes), dtype=np.float64)
+        model = ncd._sentence_model()
+        if model is None:
+            return None
+        return ncd._get_embedding_cache().get_many(notes, model.encode, ncd.SEMANTIC_MODEL_NAME)
+
+    def _ingest_one(self, v: Dict[str, Any]) -> None:
+        validator = v.get("validator_id")
+        if not validator:
+            return
+        hypothesis = v.get("hypothesis_id")
+        if hypothesis:
+            self._add_covalidation(validator, hypothesis)
+            score = v.get("score")
+            if score is not None:
+                try:
+                    self._add_score(validator, hypothesis, float(score))
+                except (TypeError, ValueError):
+                    pass
+        timestamp = v.get("timestamp")
+        if timestamp:
+            try:
+                self._add_submission(validator, _to_micros(_parse_timestamp(timestamp)))
+            except Exception as e:
+                logger.warning(f"Invalid timestamp for validator {validator}: {e}")
+
+    def _add_covalidation(self, validator: str, hypothesis: str) -> None:
+        self.nodes.setdefault(validator, None)
+        self.hypothesis_validators[hypothesis].append(validator)
+        members = self._hypothesis_sets[hypothesis]
+        if validator in members:
+            return
+        for other in members:
+            key = _pair(validator, other)
+            self.edge_weights[key] += 1.0
+            self.max_edge_weight = max(self.max_edge_weight, self.edge_weights[key])
+        members.add(validator)
+
+    def _add_submission(self, validator: str, ts: int) -> None:
+        window = max(1, Config.TEMPORAL_WINDOW_MINUTES * 60 * 1_000_000)
+        bucket = ts // window
+        for near in (bucket - 1, bucket, bucket + 1):
+            for other_ts, other in self._submissions.get(near, ()):
+                if other == validator or abs(other_ts - ts) > window:
+                    continue
+                key = _pair(validator, other)
+                self.close_counts[key] += 1
+                if self.close_counts[key] == Config.MIN_TEMPORAL_OCCURRENCES:
+                    self.temporal_flags += 1
+        if self._latest_submission is None or ts > self._latest_submission:
+            self._latest_submission = ts
+        retention = Config.MONITOR_SUBMISSION_RETENTION_MINUTES * 60 * 1_000_000
+        horizon = (self._latest_submission - retention) // window
+        while self._submission_buckets and self._submission_buckets[0] < horizon:
+            del self._submissions[heapq.heappop(self._submission_buckets)]
+        if bucket < horizon:
+            return
+        if bucket not in self._submissions:
+            self._submissions[bucket] = []
+            heapq.heappush(self._submission_buckets, bucket)
+        self._submissions[bucket].append((ts, validator))
+
+    def _score_pair(self, key: Pair, diff: float, sign: int) -> None:
+        before = self.similar_counts[key]
+        self.similar_counts[key] += sign
+        self.similar_diff_sums[key] += sign * diff
+        threshold = Config.MIN_SCORE_SIMILARITY_COUNT
+        if before < threshold <= self.similar_counts[key]:
+            self.score_flags += 1
+        elif self.similar_counts[key] < threshold <= before:
+            self.score_flags -= 1
+
+    def _add_score(self, validator: str, hypothesis: str, score: float) -> None:
+        scores = self._scores[hypothesis]
+        previous = scores.get(validator)
+        # A re-submitted score replaces the old one but keeps the validator's
+        # first position, as in the batch detector's per-hypothesis dict.
+        first = True
+        for other, other_score in scores.items():
+            if other == validator:
+                first = False
+                continue
+            key = (other, validator) if first else (validator, other)
+            if previous is not None and abs(previous - other_score) <= Config.SCORE_SIMILARITY_THRESHOLD:
+                self._score_pair(key, abs(previous - other_score), -1)
+            if abs(score - other_score) <= Config.SCORE_SIMILARITY_THRESHOLD:
+                self._score_pair(key, abs(score - other_score), +1)
+        scores[validator] = score
+
+    def _add_embedding(self, validator: str, embedding: Any) -> None:
+        idx = self._sem_index.get(validator)
+        if idx is None:
+            idx = self._sem_used
+            self._sem_index[validator] = idx
+            self._sem_used += 1
+            if self._sem_sums is None:
+                self._sem_sums = np.zeros((16, len(embedding)))
+                self._sem_norms = np.zeros(16)
+            elif idx >= len(self._sem_sums):
+                grown = np.zeros((2 * len(self._sem_sums), self._sem_sums.shape[1]))
+                grown[: len(self._sem_sums)] = self._sem_sums
+                self._sem_sums = grown
+                self._sem_norms = np.concatenate([self._sem_norms, np.zeros(len(self._sem_norms))])
+        self._sem_sums[idx] += embedding
+        self._sem_norms[idx] = np.linalg.norm(self._sem_sums[idx])
+        # Cosine of mean vectors equals cosine of the sums, so only the
+        # author's row of pairs needs rescoring.
+        sums = self._sem_sums[: self._sem_used]
+        norms = self._sem_norms[: self._sem_used]
+        denom = norms * norms[idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sims = np.where(denom > 0, sums @ sums[idx] / denom, 0.0)
+        names = list(self._sem_index)
+        for other_idx, sim in enumerate(sims.tolist()):
+            if other_idx == idx:
+                continue
+            key = _pair(validator, names[other_idx])
+            if sim >= Config.SEMANTIC_SIMILARITY_THRESHOLD:
+                self.semantic_pairs[key] = sim
+            else:
+                self.semantic_pairs.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+    @property
+    def risk_breakdown(self) -> Dict[str, int]:
+        return {
+            "temporal": self.temporal_flags,
+            "score": self.score_flags,
+            "semantic": len(self.semantic_pairs),
+        }
+
+    @property
+    def overall_risk_score(self) -> float:
+        """Current risk score, identical in scale to the batch analysis."""
+        return round(
+            calculate_sophisticated_risk_score(
+                self.temporal_flags, self.score_flags, len(self.semantic_pairs), len(self.nodes)
+            ),
+            3,
+        )
+
+    def report(self) -> Dict[str, Any]:
+        """Full result in the shape of ``analyze_coordination_patterns``.
+
+        Unlike :attr:`overall_risk_score` this walks the tracked pairs.
+        """
+        with self._lock:
+            if not self.count:
+                return {
+                    "overall_risk_score": 0.0,
+                    "coordination_clusters": [],
+                    "flags": ["no_validations"],
+                    "graph": {"edges": [], "nodes": [], "communities": []},
+                    "risk_breakdown": {"temporal": 0, "score": 0, "semantic": 0},
+                }
+            max_weight = self.max_edge_weight or 1.0
+            edges = sorted(
+                (a, b, w / max_weight)
+                for (a, b), w in self.edge_weights.items()
+                if w / max_weight >= 0.1
+            )
+            nodes = list(self.nodes)
+            temporal = [
+                {
+                    "validators": [a, b],
+                    "close_submissions": c,
+                    "coordination_likelihood": min(1.0, c / 10.0),
+                }
+                for (a, b), c in sorted(self.close_counts.items())
+                if c >= Config.MIN_TEMPORAL_OCCURRENCES
+            ]
+            score = [
+                {
+                    "validators": [a, b],
+                    "similar_score_count": c,
+                    "avg_score_difference": round(self.similar_diff_sums[(a, b)] / c, 3),
+                    "coordination_likelihood": min(1.0, c / 10.0),
+                }
+                for (a, b), c in sorted(self.similar_counts.items())
+                if c >= Config.MIN_SCORE_SIMILARITY_COUNT
+            ]
+            semantic = [
+                {
+                    "validators": [a, b],
+                    "similarity_score": round(sim, 3),
+                    "coordination_likelihood": sim,
+                }
+                for (a, b), sim in sorted(self.semantic_pairs.items())
+            ]
+            flags = (
+                [f"temporal_coordination_{c['validators'][0]}_{c['validators'][1]}" for c in temporal]
+                + [f"score_coordination_{c['validators'][0]}_{c['validators'][1]}" for c in score]
+                + [f"semantic_coordination_{c['validators'][0]}_{c['validators'][1]}" for c in semantic]
+            )
+            return {
+                "overall_risk_score": self.overall_risk_score,
+                "coordination_clusters": {
+                    "temporal": temporal,
+                    "score": score,
+                    "semantic": semantic,
+                },
+                "flags": flags,
+                "graph": {
+                    "edges": edges,
+                    "nodes": nodes,
+                    "hypothesis_coverage": dict(self.hypothesis_validators),
+                    "communities": [
+                        list(c) for c in detect_graph_communities(edges, set(nodes))
+                    ],
+                },
+                "risk_breakdown": self.risk_breakdown,
+            }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def checkpoint(self, path: str) -> None:
+        """Atomically write the monitor state to ``path``."""
+        with self._lock:
+            state = {k: v for k, v in self.__dict__.items() if k not in ("_lock", "_encode")}
+            state["version"] = _CHECKPOINT_VERSION
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".coordination-")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                os.replace(tmp, path)
+            except Exception:
+                os.unlink(tmp)
+                raise
+
+    @classmethod
+    def restore(cls, path: str, encode=None) -> "CoordinationMonitor":
+        """Load a monitor written by :meth:`checkpoint`."""
+        monitor = cls(encode)
+        with open(path, "rb") as fh:
+            state = pickle.load(fh)
+        if state.pop("version", None) != _CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported coordination checkpoint: {path}")
+        monitor.__dict__.update(state)
+        return monitor
+
+
+__all__ = ["CoordinationMonitor"]
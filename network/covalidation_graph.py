@@ -0,0 +1,234 @@
+"""Sparse co-validation graph construction and community detection.
+
+Used by :func:`network.network_coordination_detector.build_validation_graph`.
+
+Validations are encoded as a binary validator × hypothesis incidence matrix
+in CSR form; the co-validation counts are its product with its transpose,
+computed one block of validator rows at a time so peak memory tracks the
+number of edges actually produced rather than the square of the validator
+count.  Communities come from an iterative union-find over strong edges, or
+optionally from Louvain modularity optimisation via ``networkx``.  The
+community helpers are pure Python; the matrix helpers need ``scipy``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except Exception:  # pragma: no cover - optional dependency
+    np = sparse = None
+
+from validation_frame import ValidationFrame
+
+try:
+    import networkx as nx
+except Exception:  # pragma: no cover - optional dependency
+    nx = None
+
+Edge = Tuple[str, str, float]
+
+
+class UnionFind:
+    """Disjoint sets over arbitrary hashable items, without recursion."""
+
+    def __init__(self) -> None:
+        self.parent: Dict[Any, Any] = {}
+        self.size: Dict[Any, int] = {}
+
+    def find(self, item: Any) -> Any:
+        parent = self.parent
+        if item not in parent:
+            parent[item] = item
+            self.size[item] = 1
+            return item
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]  # path halving
+            item = parent[item]
+        return item
+
+    def union(self, a: Any, b: Any) -> Any:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        return ra
+
+
+def incidence_matrix(
+    validations: Iterable[Dict[str, Any]],
+) -> Tuple["sparse.csr_matrix", List[str], Dict[str, List[str]]]:
+    """Return the binary validator × hypothesis matrix for ``validations``.
+
+    Also returns validators in first-appearance order and the raw
+    hypothesis → validator lists, matching ``build_validation_graph``.
+    """
+    validator_index: Dict[str, int] = {}
+    hypothesis_index: Dict[str, int] = {}
+    coverage: Dict[str, List[str]] = {}
+    rows, cols = array("q"), array("q")
+    for v in validations:
+        validator_id = v.get("validator_id")
+        hypothesis_id = v.get("hypothesis_id")
+        if not validator_id or not hypothesis_id:
+            continue
+        rows.append(validator_index.setdefault(validator_id, len(validator_index)))
+        cols.append(hypothesis_index.setdefault(hypothesis_id, len(hypothesis_index)))
+        coverage.setdefault(hypothesis_id, []).append(validator_id)
+    matrix = sparse.csr_matrix(
+        (
+            np.ones(len(rows), dtype=np.float32),
+            (np.frombuffer(rows, dtype=np.int64), np.frombuffer(cols, dtype=np.int64)),
+        ),
+        shape=(len(validator_index), len(hypothesis_index)),
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0  # repeat validations of one hypothesis count once
+    return matrix, list(validator_index), coverage
+
+
+def frame_incidence_matrix(
+    frame: "ValidationFrame",
+) -> Tuple["sparse.csr_matrix", List[str], Dict[str, List[str]]]:
+    """:func:`incidence_matrix` for a :class:`~validation_frame.ValidationFrame`.
+
+    Works on the frame's interned code columns, so no per-row dictionary
+    lookups are needed; only the coverage lists are built in Python.
+    """
+    rows = np.flatnonzero((frame.validator >= 0) & (frame.hypothesis >= 0))
+    validator_codes, hypothesis_codes = frame.validator[rows], frame.hypothesis[rows]
+    validator_order = ValidationFrame.first_appearance(validator_codes)
+    hypothesis_order = ValidationFrame.first_appearance(hypothesis_codes)
+    validator_rank = np.empty(len(frame.validator_ids), dtype=np.int64)
+    validator_rank[validator_order] = np.arange(len(validator_order))
+    hypothesis_rank = np.empty(len(frame.hypothesis_ids), dtype=np.int64)
+    hypothesis_rank[hypothesis_order] = np.arange(len(hypothesis_order))
+    r, c = validator_rank[validator_codes], hypothesis_rank[hypothesis_codes]
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (r, c)),
+        shape=(len(validator_order), len(hypothesis_order)),
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+
+    validators = [frame.validator_ids[i] for i in validator_order.tolist()]
+    by_hypothesis = np.argsort(c, kind="stable")
+    bounds = np.searchsorted(c[by_hypothesis], np.arange(len(hypothesis_order) + 1))
+    names = [validators[i] for i in r[by_hypothesis].tolist()]
+    coverage = {
+        frame.hypothesis_ids[h]: names[bounds[k] : bounds[k + 1]]
+        for k, h in enumerate(hypothesis_order.tolist())
+    }
+    return matrix, validators, coverage
+
+
+def co_validation_counts(
+    incidence: "sparse.csr_matrix", block_rows: int = 1024
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Return ``(i, j, count)`` arrays for validator pairs with ``i < j``.
+
+    ``count`` is the number of hypotheses both validators judged.
+    """
+    transposed = incidence.T.tocsr()
+    ii, jj, ww = [], [], []
+    for start in range(0, incidence.shape[0], block_rows):
+        product = (incidence[start : start + block_rows] @ transposed).tocoo()
+        rows = product.row + start
+        upper = product.col > rows
+        ii.append(rows[upper].astype(np.int32))
+        jj.append(product.col[upper].astype(np.int32))
+        ww.append(product.data[upper])
+    if not ii:
+        empty = np.zeros(0, dtype=np.int32)
+        return empty, empty, np.zeros(0, dtype=np.float32)
+    return np.concatenate(ii), np.concatenate(jj), np.concatenate(ww)
+
+
+def normalized_edges(
+    validators: Sequence[str],
+    rows: "np.ndarray",
+    cols: "np.ndarray",
+    weights: "np.ndarray",
+    min_weight: float = 0.1,
+) -> List[Edge]:
+    """Scale ``weights`` by their maximum and keep edges above ``min_weight``.
+
+    Each edge is ``(a, b, weight)`` with ``a < b`` by validator id.
+    """
+    if not len(weights):
+        return []
+    normalized = weights.astype(np.float64) / float(weights.max())
+    keep = normalized >= min_weight
+    # Orient and order pairs by validator-id rank in numpy rather than
+    # sorting millions of Python tuples.
+    order = sorted(range(len(validators)), key=validators.__getitem__)
+    rank = np.empty(len(validators), dtype=np.int64)
+    rank[order] = np.arange(len(validators))
+    ra, rb = rank[rows[keep]], rank[cols[keep]]
+    lo, hi = np.minimum(ra, rb), np.maximum(ra, rb)
+    normalized = normalized[keep]
+    by_pair = np.lexsort((hi, lo))
+    names = [validators[i] for i in order]
+    return [
+        (names[a], names[b], w)
+        for a, b, w in zip(lo[by_pair].tolist(), hi[by_pair].tolist(), normalized[by_pair].tolist())
+    ]
+
+
+def union_find_communities(
+    edges: Iterable[Edge], nodes: Iterable[str], threshold: float, min_size: int
+) -> List[Set[str]]:
+    """Connected components over edges with weight >= ``threshold``.
+
+    Components are returned in the order their first member appears in
+    ``nodes``; only nodes touched by a strong edge are considered.
+    """
+    uf = UnionFind()
+    for a, b, weight in edges:
+        if weight >= threshold:
+            uf.union(a, b)
+    groups: Dict[Any, Set[str]] = {}
+    for node in nodes:
+        if node in uf.parent:
+            groups.setdefault(uf.find(node), set()).add(node)
+    return [g for g in groups.values() if len(g) >= min_size]
+
+
+def louvain_communities(
+    edges: Iterable[Edge],
+    nodes: Iterable[str],
+    min_size: int,
+    resolution: float = 1.0,
+    seed: Optional[int] = 0,
+) -> List[Set[str]]:
+    """Modularity communities of the weighted co-validation graph.
+
+    Falls back to plain weighted components when ``networkx`` is missing.
+    """
+    edges = list(edges)
+    if nx is None:  # pragma: no cover - optional dependency
+        return union_find_communities(edges, nodes, 0.0, min_size)
+    graph = nx.Graph()
+    graph.add_nodes_from(nodes)
+    graph.add_weighted_edges_from(edges)
+    communities = nx.community.louvain_communities(
+        graph, weight="weight", resolution=resolution, seed=seed
+    )
+    return [set(c) for c in communities if len(c) >= min_size]
+
+
+__all__ = [
+    "UnionFind",
+    "co_validation_counts",
+    "frame_incidence_matrix",
+    "incidence_matrix",
+    "louvain_communities",
+    "normalized_edges",
+    "union_find_communities",
+]
@@ -0,0 +1,232 @@
+"""Persistent note-embedding cache and cosine similarity search.
+
+Used by :func:`network.network_coordination_detector.detect_semantic_coordination`.
+
+``EmbeddingCache`` stores one float32 row per distinct note, keyed on a hash
+of the model name and the text, so repeated notes are encoded once across
+calls.  With a ``path`` the rows live in an append-only file that is
+memory-mapped for reads, letting the cache outgrow RAM and survive restarts::
+
+    <path>.keys   4-byte dimension, then one 20-byte SHA-1 digest per row
+    <path>.f32    rows * dimension float32 values
+    <path>.lock   advisory lock held while the files are repaired or appended
+
+Several processes may share one path. Appends and torn-tail repair take an
+exclusive ``fcntl`` lock on ``<path>.lock``, and each writer first loads the
+rows others appended, so row numbers always match the files. Without
+``fcntl`` (Windows) only one process may write to a path.
+
+``similar_pairs`` finds all row pairs whose cosine similarity clears a
+threshold using blocked matrix multiplication over normalised vectors.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+_DIGEST = 20
+_HEADER = struct.Struct("<I")
+# float32 dot products of unit vectors are accurate well within this margin
+_RESCORE_BAND = 1e-4
+
+
+def text_key(model: str, text: str) -> bytes:
+    """Cache key for ``text`` embedded by ``model``."""
+    return hashlib.sha1(f"{model}\0{text}".encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Append-only embedding store keyed by text hash.
+
+    Parameters
+    ----------
+    path:
+        File prefix for the on-disk cache. ``None`` keeps rows in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self.dim: Optional[int] = None
+        self._rows: Dict[bytes, int] = {}
+        self._size = 0  # rows stored, counting any duplicate keys on disk
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._lock = threading.Lock()
+        if path is not None:
+            self._open()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _open(self) -> None:
+        with self._file_lock():
+            self._sync()
+        self._remap()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if fcntl is None:  # pragma: no cover - single writer on Windows
+            yield
+            return
+        with open(f"{self.path}.lock", "a+b") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _sync(self) -> None:
+        """Load rows appended by other writers; the file lock must be held.
+
+        A writer that died mid-append leaves one file longer than the other;
+        with the lock held no append is in flight, so the longer tail is torn
+        and is cut back.
+        """
+        keys_path, vec_path = f"{self.path}.keys", f"{self.path}.f32"
+        key_bytes = os.path.getsize(keys_path) if os.path.exists(keys_path) else 0
+        if key_bytes < _HEADER.size:
+            return
+        with open(keys_path, "rb") as fh:
+            (self.dim,) = _HEADER.unpack(fh.read(_HEADER.size))
+            vec_bytes = os.path.getsize(vec_path) if os.path.exists(vec_path) else 0
+            rows = min((key_bytes - _HEADER.size) // _DIGEST, vec_bytes // (4 * self.dim))
+            fh.seek(_HEADER.size + self._size * _DIGEST)
+            body = fh.read((rows - self._size) * _DIGEST)
+        for i in range(rows - self._size):
+            self._rows[body[i * _DIGEST : (i + 1) * _DIGEST]] = self._size + i
+        self._size = rows
+        if key_bytes != _HEADER.size + rows * _DIGEST:
+            with open(keys_path, "r+b") as fh:
+                fh.truncate(_HEADER.size + rows * _DIGEST)
+        if vec_bytes != rows * self.dim * 4:
+            with open(vec_path, "r+b") as fh:
+                fh.truncate(rows * self.dim * 4)
+
+    def _remap(self) -> None:
+        rows = self._size
+        if self.path is None or rows == 0:
+            return
+        self._matrix = np.memmap(
+            f"{self.path}.f32", dtype=np.float32, mode="r", shape=(rows, self.dim)
+        )
+
+    def _append(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.path is None:
+            self._store(keys, vectors)
+        else:
+            with self._file_lock():
+                self._sync()
+                # Another process may have added some of these meanwhile.
+                fresh = [i for i, key in enumerate(keys) if key not in self._rows]
+                if fresh:
+                    self._store([keys[i] for i in fresh], vectors[fresh])
+        self._remap()
+
+    def _store(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+        start = self._size
+        if self.path is None:
+            if start + len(keys) > self._matrix.shape[0]:
+                capacity = max(2 * self._matrix.shape[0], start + len(keys))
+                grown = np.zeros((capacity, self.dim), dtype=np.float32)
+                if start:
+                    grown[:start] = self._matrix[:start]
+                self._matrix = grown
+            self._matrix[start : start + len(keys)] = vectors
+        else:
+            keys_path = f"{self.path}.keys"
+            new_file = not os.path.exists(keys_path) or os.path.getsize(keys_path) == 0
+            with open(f"{self.path}.f32", "ab") as fh:
+                fh.write(vectors.tobytes())
+            with open(keys_path, "ab") as fh:
+                if new_file:
+                    fh.write(_HEADER.pack(self.dim))
+                fh.write(b"".join(keys))
+        for offset, key in enumerate(keys):
+            self._rows[key] = start + offset
+        self._size = start + len(keys)
+
+    def get_many(
+        self,
+        texts: Sequence[str],
+        encode: Callable[[List[str]], Sequence[Sequence[float]]],
+        model: str = "",
+    ) -> np.ndarray:
+        """Return embeddings for ``texts``, encoding only unseen ones.
+
+        ``encode`` is called at most once, with the distinct missing texts.
+        """
+        keys = [text_key(model, t) for t in texts]
+        with self._lock:
+            if self.path is not None and any(key not in self._rows for key in keys):
+                with self._file_lock():
+                    self._sync()
+                self._remap()
+            missing: Dict[bytes, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in self._rows and key not in missing:
+                    missing[key] = text
+            if missing:
+                vectors = np.asarray(encode(list(missing.values())), dtype=np.float32)
+                self._append(list(missing), vectors)
+            rows = np.fromiter((self._rows[k] for k in keys), dtype=np.int64, count=len(keys))
+            return np.asarray(self._matrix[rows])
+
+
+def similar_pairs(
+    vectors: np.ndarray, threshold: float, block: int = 1024
+) -> List[Tuple[int, int, float]]:
+    """Return ``(i, j, cosine)`` for all ``i < j`` with cosine >= ``threshold``.
+
+    Rows are normalised once and compared block by block in float32.  Only
+    candidates within ``_RESCORE_BAND`` of the threshold, where float32
+    rounding could flip the decision, are rescored in float64, ``block`` at
+    a time; clear matches keep their float32 score.
+    """
+    data = np.asarray(vectors)
+    norms = np.sqrt(np.einsum("ij,ij->i", data, data, dtype=np.float64))
+    norms[norms == 0] = np.inf  # zero vectors have similarity 0
+    n = len(data)
+    fast = np.empty(data.shape, dtype=np.float32)
+    for start in range(0, n, block):
+        rows = slice(start, start + block)
+        fast[rows] = data[rows] / norms[rows, None]
+
+    def _exact(rows: np.ndarray) -> np.ndarray:
+        return np.asarray(data[rows], dtype=np.float64) / norms[rows, None]
+
+    pairs: List[Tuple[int, int, float]] = []
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        sims = fast[start:stop] @ fast[start:].T
+        ii, jj = np.nonzero(sims >= threshold - _RESCORE_BAND)
+        scores = sims[ii, jj]
+        jj = jj + start
+        upper = jj > ii + start
+        ii, jj, scores = ii[upper] + start, jj[upper], scores[upper]
+        clear = scores >= threshold + _RESCORE_BAND
+        pairs.extend(zip(ii[clear].tolist(), jj[clear].tolist(), scores[clear].tolist()))
+        ii, jj = ii[~clear], jj[~clear]
+        for lo in range(0, len(ii), block):
+            bi, bj = ii[lo : lo + block], jj[lo : lo + block]
+            exact = np.einsum("ij,ij->i", _exact(bi), _exact(bj))
+            keep = exact >= threshold
+            pairs.extend(zip(bi[keep].tolist(), bj[keep].tolist(), exact[keep].tolist()))
+    pairs.sort()
+    return pairs
+
+
+__all__ = ["EmbeddingCache", "similar_pairs", "text_key"]
@@ -24,11 +24,19 @@ import math
 import os
 from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 from multiprocessing import get_context
 from statistics import mean
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from network import covalidation_graph
+from validation_frame import ValidationFrame
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None
 
 logger = logging.getLogger("superNova_2177.coordination")
 logger.propagate = False
@@ -43,6 +51,9 @@ class Config:
     # Temporal coordination thresholds
     TEMPORAL_WINDOW_MINUTES = 5
     MIN_TEMPORAL_OCCURRENCES = 3
+    # CoordinationMonitor keeps submissions this far behind the newest one,
+    # so late arrivals within it are still matched
+    MONITOR_SUBMISSION_RETENTION_MINUTES = 7 * 24 * 60
 
     # Score similarity thresholds
     SCORE_SIMILARITY_THRESHOLD = 0.1
@@ -51,6 +62,9 @@ class Config:
     # Graph clustering thresholds
     MIN_CLUSTER_SIZE = 3
     COORDINATION_EDGE_THRESHOLD = 0.7
+    # "components" (union-find over strong edges) or "louvain" (modularity)
+    COMMUNITY_METHOD = os.environ.get("COORDINATION_COMMUNITY_METHOD", "components")
+    LOUVAIN_RESOLUTION = 1.0
 
     # Semantic similarity (placeholder for future NLP)
     SEMANTIC_SIMILARITY_THRESHOLD = 0.8
@@ -69,121 +83,110 @@ def _parse_timestamp(ts: str) -> datetime:
     return datetime.fromisoformat(ts.replace("Z", "+00:00"))
 
 
-def build_validation_graph(validations: List[Dict[str, Any]]) -> Dict[str, Any]:
+def build_validation_graph(
+    validations: List[Dict[str, Any]], community_method: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Build a graph of validator relationships based on co-validation patterns.
 
+    Co-validation counts come from a sparse validator × hypothesis incidence
+    matrix multiplied by its transpose, so a hypothesis with thousands of
+    validators never expands into Python-level pair loops.
+
     Args:
-        validations: List of validation records
+        validations: List of validation records or a ``ValidationFrame``
+        community_method: ``"components"`` or ``"louvain"``; defaults to
+            ``Config.COMMUNITY_METHOD``
 
     Returns:
         Dict containing graph structure and metadata
     """
+    if isinstance(validations, ValidationFrame) and covalidation_graph.sparse is None:
+        frame = validations  # pragma: no cover - exercised only without scipy
+        validations = [
+            {"validator_id": frame.validator_ids[v], "hypothesis_id": frame.hypothesis_ids[h]}
+            for v, h in zip(frame.validator.tolist(), frame.hypothesis.tolist())
+            if v >= 0 and h >= 0
+        ]
+    if covalidation_graph.sparse is not None:
+        if isinstance(validations, ValidationFrame):
+            build = covalidation_graph.frame_incidence_matrix
+        else:
+            build = covalidation_graph.incidence_matrix
+        incidence, nodes, hypothesis_validators = build(validations)
+        rows, cols, weights = covalidation_graph.co_validation_counts(incidence)
+        edges = covalidation_graph.normalized_edges(nodes, rows, cols, weights)
+    else:  # pragma: no cover - exercised only without scipy
+        nodes, hypothesis_validators, edges = _build_edges_py(validations)
+
+    communities = detect_graph_communities(edges, set(nodes), community_method)
+
+    return {
+        "edges": edges,
+        "nodes": nodes,
+        "hypothesis_coverage": hypothesis_validators,
+        "communities": [list(c) for c in communities],
+    }
+
+
+def _build_edges_py(
+    validations: List[Dict[str, Any]],
+) -> Tuple[List[str], Dict[str, List[str]], List[Tuple[str, str, float]]]:
     hypothesis_validators = defaultdict(list)
-    validator_data = defaultdict(list)
+    nodes: Dict[str, None] = {}
 
     for v in validations:
         validator_id = v.get("validator_id")
         hypothesis_id = v.get("hypothesis_id")
         if validator_id and hypothesis_id:
             hypothesis_validators[hypothesis_id].append(validator_id)
-            validator_data[validator_id].append(v)
+            nodes.setdefault(validator_id, None)
 
-    edges = []
     edge_weights = defaultdict(float)
-
-    for hypothesis_id, validators in hypothesis_validators.items():
-        if len(validators) < 2:
-            continue
-        for v1, v2 in itertools.combinations(set(validators), 2):
-            edge_key = tuple(sorted([v1, v2]))
-            edge_weights[edge_key] += 1.0
+    for validators in hypothesis_validators.values():
+        for v1, v2 in itertools.combinations(sorted(set(validators)), 2):
+            edge_weights[(v1, v2)] += 1.0
 
     max_weight = max(edge_weights.values()) if edge_weights else 1.0
-    for (v1, v2), weight in edge_weights.items():
-        normalized_weight = weight / max_weight
-        if normalized_weight >= 0.1:
-            edges.append((v1, v2, normalized_weight))
-
-    # Collect node list explicitly for use by callers expecting an ordered
-    # sequence rather than a set.
-    nodes = list(validator_data.keys())
-
-    # Detect communities using simple clustering
-    communities = detect_graph_communities(edges, set(nodes))
-
-    return {
-        "edges": edges,
-        "nodes": nodes,
-        "hypothesis_coverage": dict(hypothesis_validators),
-        "communities": [list(c) for c in communities],
-    }
+    edges = sorted(
+        (v1, v2, weight / max_weight)
+        for (v1, v2), weight in edge_weights.items()
+        if weight / max_weight >= 0.1
+    )
+    return list(nodes), dict(hypothesis_validators), edges
 
 
 def detect_graph_communities(
-    edges: List[Tuple[str, str, float]], nodes: Set[str]
+    edges: List[Tuple[str, str, float]],
+    nodes: Set[str],
+    method: Optional[str] = None,
 ) -> List[Set[str]]:
     """
-    Simple community detection using connected components.
-    For larger graphs consider using ``networkx`` community functions and
-    profile with ``cProfile`` to locate bottlenecks.
+    Group validators into communities.
+
+    The default ``"components"`` method joins validators connected by edges
+    of at least ``Config.COORDINATION_EDGE_THRESHOLD`` with an iterative
+    union-find, so very large connected groups cannot exhaust the recursion
+    limit. ``"louvain"`` partitions the full weighted graph by modularity.
 
     Args:
         edges: List of (validator1, validator2, weight) tuples
         nodes: Set of all validator nodes
+        method: Community method; defaults to ``Config.COMMUNITY_METHOD``
 
     Returns:
         List of communities (sets of validator_ids)
     """
-    # Build adjacency list for strong connections
-    adj = defaultdict(set)
-    for v1, v2, weight in edges:
-        if weight >= Config.COORDINATION_EDGE_THRESHOLD:
-            adj[v1].add(v2)
-            adj[v2].add(v1)
-
-    visited = set()
-    communities = []
-
-    def dfs(node: str, community: Set[str]):
-        if node in visited:
-            return
-        visited.add(node)
-        community.add(node)
-        for neighbor in adj[node]:
-            dfs(neighbor, community)
-
-    for node in nodes:
-        if node not in visited and node in adj:
-            community = set()
-            dfs(node, community)
-            if len(community) >= Config.MIN_CLUSTER_SIZE:
-                communities.append(community)
-
-    return communities
-
-
-def _temporal_worker(
-    pairs: List[Tuple[str, str, List[datetime], List[datetime]]],
-    window: timedelta,
-) -> Tuple[List[Dict[str, Any]], List[str]]:
-    clusters: List[Dict[str, Any]] = []
-    flags: List[str] = []
-    for v1, v2, ts1_list, ts2_list in pairs:
-        close_submissions = sum(
-            1 for ts1 in ts1_list for ts2 in ts2_list if abs(ts1 - ts2) <= window
+    method = method or Config.COMMUNITY_METHOD
+    if method == "louvain":
+        return covalidation_graph.louvain_communities(
+            edges, nodes, Config.MIN_CLUSTER_SIZE, Config.LOUVAIN_RESOLUTION
         )
-        if close_submissions >= Config.MIN_TEMPORAL_OCCURRENCES:
-            coordination_likelihood = min(1.0, close_submissions / 10.0)
-            clusters.append(
-                {
-                    "validators": [v1, v2],
-                    "close_submissions": close_submissions,
-                    "coordination_likelihood": coordination_likelihood,
-                }
-            )
-            flags.append(f"temporal_coordination_{v1}_{v2}")
-    return clusters, flags
+    if method != "components":
+        raise ValueError(f"Unknown community method: {method}")
+    return covalidation_graph.union_find_communities(
+        edges, nodes, Config.COORDINATION_EDGE_THRESHOLD, Config.MIN_CLUSTER_SIZE
+    )
 
 
 def _score_worker(
@@ -207,17 +210,103 @@ def _score_worker(
     return clusters, flags
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SWEEP_BLOCK_PAIRS = 2_000_000
+
+
+def _to_micros(ts: datetime) -> int:
+    """Integer microseconds since the epoch; naive values are taken as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // timedelta(microseconds=1)
+
+
+def _close_pair_counts(
+    times: List[int], owners: List[int], window_us: int, min_count: int = 1
+) -> Dict[Tuple[int, int], int]:
+    """Count cross-owner submission pairs at most ``window_us`` apart.
+
+    Only owner pairs with at least ``min_count`` close pairs are returned.
+
+    Submissions are sorted once; each one is paired only with the later
+    submissions inside its window, so the work is proportional to the number
+    of close pairs rather than to every validator pair.
+    """
+    try:
+        import numpy as np
+    except Exception:  # pragma: no cover - optional dependency
+        np = None
+
+    if np is None:  # pragma: no cover - exercised only without numpy
+        order = sorted(range(len(times)), key=times.__getitem__)
+        counts: Dict[Tuple[int, int], int] = defaultdict(int)
+        for pos, i in enumerate(order):
+            for j in order[pos + 1 :]:
+                if times[j] - times[i] > window_us:
+                    break
+                if owners[i] != owners[j]:
+                    counts[min(owners[i], owners[j]), max(owners[i], owners[j])] += 1
+        return {k: c for k, c in counts.items() if c >= min_count}
+
+    t = np.asarray(times, dtype=np.int64)
+    order = np.argsort(t, kind="stable")
+    t = t[order]
+    who = np.asarray(owners, dtype=np.int64)[order]
+    n = len(t)
+    span = np.searchsorted(t, t + window_us, side="right") - np.arange(n) - 1
+    n_owners = int(who.max()) + 1 if n else 0
+    keys = []
+    start = 0
+    while start < n:
+        # Bound memory: expand at most ~_SWEEP_BLOCK_PAIRS pairs at a time.
+        budget = np.cumsum(span[start:])
+        stop = start + max(1, int(np.searchsorted(budget, _SWEEP_BLOCK_PAIRS, side="right")))
+        spans = span[start:stop]
+        total = int(spans.sum())
+        if total:
+            left = np.repeat(np.arange(start, stop), spans)
+            offsets = np.arange(total) - np.repeat(np.cumsum(spans) - spans, spans) + 1
+            right = left + offsets
+            a, b = who[left], who[right]
+            cross = a != b
+            a, b = a[cross], b[cross]
+            keys.append(np.minimum(a, b) * n_owners + np.maximum(a, b))
+        start = stop
+    if not keys:
+        return {}
+    uniq, counts = np.unique(np.concatenate(keys), return_counts=True)
+    keep = counts >= min_count
+    uniq, counts = uniq[keep].tolist(), counts[keep].tolist()
+    return {(k // n_owners, k % n_owners): c for k, c in zip(uniq, counts)}
+
+
 def detect_temporal_coordination(validations: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Detect validators who consistently submit validations within suspicious time windows.
 
+    All submissions are sorted once and swept with a window of
+    ``Config.TEMPORAL_WINDOW_MINUTES``; only validator pairs that actually
+    submit close together are ever counted.
+
     Args:
-        validations: List of validation records
+        validations: List of validation records or a ``ValidationFrame``
 
     Returns:
         Dict with temporal coordination analysis
     """
-    validator_timestamps = defaultdict(list)
+    if isinstance(validations, ValidationFrame):
+        frame = validations
+        rows = np.flatnonzero((frame.validator >= 0) & frame.ts_valid)
+        codes = frame.validator[rows]
+        first = ValidationFrame.first_appearance(codes)
+        remap = np.empty(len(frame.validator_ids), dtype=np.int64)
+        remap[first] = np.arange(len(first))
+        validators = [frame.validator_ids[c] for c in first.tolist()]
+        return _temporal_clusters(frame.timestamp[rows], remap[codes], validators)
+
+    index: Dict[str, int] = {}
+    times: List[int] = []
+    owners: List[int] = []
 
     for v in validations:
         validator_id = v.get("validator_id")
@@ -225,39 +314,38 @@ def detect_temporal_coordination(validations: List[Dict[str, Any]]) -> Dict[str,
         if not validator_id or not timestamp_str:
             continue
         try:
-            timestamp = _parse_timestamp(timestamp_str)
-            validator_timestamps[validator_id].append(timestamp)
+            timestamp = _to_micros(_parse_timestamp(timestamp_str))
         except Exception as e:
             logger.warning(f"Invalid timestamp for validator {validator_id}: {e}")
             continue
+        times.append(timestamp)
+        owners.append(index.setdefault(validator_id, len(index)))
 
-    temporal_clusters: List[Dict[str, Any]] = []
-    flags: List[str] = []
-    validators = list(validator_timestamps.keys())
-    window = timedelta(minutes=Config.TEMPORAL_WINDOW_MINUTES)
+    return _temporal_clusters(times, owners, list(index))
 
-    pairs = [
-        (v1, v2, validator_timestamps[v1], validator_timestamps[v2])
-        for v1, v2 in itertools.combinations(validators, 2)
-    ]
 
-    if not pairs:
+def _temporal_clusters(times, owners, validators: List[str]) -> Dict[str, Any]:
+    """Temporal clusters from submission times and owner indices into ``validators``."""
+    temporal_clusters: List[Dict[str, Any]] = []
+    flags: List[str] = []
+    if len(validators) < 2:
         return {"temporal_clusters": [], "flags": []}
 
-    cpu_count = os.cpu_count() or 1
-    chunk_size = max(1, (len(pairs) + cpu_count - 1) // cpu_count)
-    chunks = [
-        pairs[i : i + chunk_size]  # noqa: E203
-        for i in range(0, len(pairs), chunk_size)
-    ]
-
-    executor_cls = ProcessPoolExecutor if USE_PROCESS_POOL else ThreadPoolExecutor
-    ctx = {"mp_context": get_context("spawn")} if USE_PROCESS_POOL else {}
-    with executor_cls(**ctx) as executor:
-        results = executor.map(_temporal_worker, chunks, itertools.repeat(window))
-        for clusters, chunk_flags in results:
-            temporal_clusters.extend(clusters)
-            flags.extend(chunk_flags)
+    window_us = Config.TEMPORAL_WINDOW_MINUTES * 60 * 1_000_000
+    counts = _close_pair_counts(
+        times, owners, window_us, Config.MIN_TEMPORAL_OCCURRENCES
+    )
+    # Sorted by first appearance, matching the previous pairwise order.
+    for (a, b), close_submissions in sorted(counts.items()):
+        v1, v2 = validators[a], validators[b]
+        temporal_clusters.append(
+            {
+                "validators": [v1, v2],
+                "close_submissions": close_submissions,
+                "coordination_likelihood": min(1.0, close_submissions / 10.0),
+            }
+        )
+        flags.append(f"temporal_coordination_{v1}_{v2}")
 
     return {"temporal_clusters": temporal_clusters, "flags": flags}
 
@@ -267,13 +355,30 @@ def detect_score_coordination(validations: List[Dict[str, Any]]) -> Dict[str, An
     Detect validators who give suspiciously similar scores across multiple hypotheses.
 
     Args:
-        validations: List of validation records
+        validations: List of validation records or a ``ValidationFrame``
 
     Returns:
         Dict with score coordination analysis
     """
     hypothesis_scores = defaultdict(dict)
 
+    if isinstance(validations, ValidationFrame):
+        frame = validations
+        rows = np.flatnonzero(
+            (frame.validator >= 0)
+            & (frame.hypothesis >= 0)
+            & frame.has_score
+            & ~np.isnan(frame.score)
+        )
+        validator_ids, hypothesis_ids = frame.validator_ids, frame.hypothesis_ids
+        for h, v, score in zip(
+            frame.hypothesis[rows].tolist(),
+            frame.validator[rows].tolist(),
+            frame.score[rows].tolist(),
+        ):
+            hypothesis_scores[hypothesis_ids[h]][validator_ids[v]] = score
+        return _score_clusters(hypothesis_scores)
+
     for v in validations:
         validator_id = v.get("validator_id")
         hypothesis_id = v.get("hypothesis_id")
@@ -284,6 +389,11 @@ def detect_score_coordination(validations: List[Dict[str, Any]]) -> Dict[str, An
             except (ValueError, TypeError):
                 continue
 
+    return _score_clusters(hypothesis_scores)
+
+
+def _score_clusters(hypothesis_scores: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+    """Score clusters from per-hypothesis ``{validator: score}`` maps."""
     validator_pairs = defaultdict(list)
 
     for hypothesis_id, scores in hypothesis_scores.items():
@@ -320,17 +430,86 @@ def detect_score_coordination(validations: List[Dict[str, Any]]) -> Dict[str, An
     return {"score_clusters": score_clusters, "flags": flags}
 
 
+SEMANTIC_MODEL_NAME = "paraphrase-MiniLM-L6-v2"
+# Set ``COORDINATION_EMBEDDING_CACHE`` to a file prefix to keep note
+# embeddings on disk (memory-mapped) across processes.
+EMBEDDING_CACHE_PATH = os.environ.get("COORDINATION_EMBEDDING_CACHE") or None
+_embedding_cache = None
+
+
+def _get_embedding_cache():
+    """Process-wide :class:`network.embedding_cache.EmbeddingCache`."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        from network.embedding_cache import EmbeddingCache
+
+        _embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH)
+    return _embedding_cache
+
+
+@lru_cache(maxsize=1)
+def _sentence_model():
+    """Load the sentence embedding model once; ``None`` if unavailable."""
+    try:
+        from sentence_transformers import SentenceTransformer
+
+        # Avoid accidental network downloads by forcing offline mode if unset
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+        try:
+            return SentenceTransformer(SEMANTIC_MODEL_NAME)
+        except Exception as st_exc:
+            logger.warning(f"SentenceTransformer failed: {st_exc}; using TF-IDF fallback")
+    except Exception as import_exc:  # pragma: no cover - fallback rarely triggered
+        logger.warning(
+            f"SentenceTransformer unavailable: {import_exc}; using TF-IDF fallback"
+        )
+    return None
+
+
+def _fallback_embeddings(texts: List[str]):
+    """Corpus-relative embeddings used when no sentence model is available.
+
+    These depend on the whole batch of notes, so they are not cached.
+    """
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vec = TfidfVectorizer().fit(texts)
+        return vec.transform(texts).toarray()
+    except Exception as tfidf_exc:  # pragma: no cover - minimal fallback
+        logger.error(f"TF-IDF fallback unavailable: {tfidf_exc}; using simple counts")
+        vocab = sorted({w for t in texts for w in t.split()})
+        return [[float(t.split().count(tok)) for tok in vocab] for t in texts]
+
+
+def _pairwise_similar(vectors: List[List[float]], threshold: float):  # pragma: no cover
+    """Pure-Python pairwise cosine, used only when NumPy is missing."""
+    pairs = []
+    for i, j in itertools.combinations(range(len(vectors)), 2):
+        a, b = vectors[i], vectors[j]
+        norm = math.sqrt(sum(x * x for x in a) * sum(y * y for y in b))
+        similarity = sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
+        if similarity >= threshold:
+            pairs.append((i, j, similarity))
+    return pairs
+
+
 def detect_semantic_coordination(validations: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Detect validators who use suspiciously similar language in their
     validation notes using sentence embeddings.
 
-    This replaces the older phrase-based approach with cosine similarity on
-    averaged sentence embeddings. If the embedding model cannot be loaded (e.g.,
-    due to network restrictions), the function falls back to a TF‑IDF based
-    embedding.
+    Note embeddings come from a persistent cache keyed on a hash of each
+    note, so only unseen notes are encoded. Per-validator mean vectors are
+    normalised and compared with blocked matrix products, returning only
+    pairs at or above ``Config.SEMANTIC_SIMILARITY_THRESHOLD``. If the
+    embedding model cannot be loaded (e.g., due to network restrictions),
+    the function falls back to a TF‑IDF based embedding.
 
     Args:
-        validations: List of validation records
+        validations: List of validation records or a ``ValidationFrame``.
+            Records without a validator or a text note of at least
+            ``Config.REPEATED_PHRASE_MIN_LENGTH`` characters are skipped.
 
     Returns:
         Dict with semantic coordination analysis
@@ -338,134 +517,85 @@ def detect_semantic_coordination(validations: List[Dict[str, Any]]) -> Dict[str,
 
     validator_texts = defaultdict(list)
 
+    if isinstance(validations, ValidationFrame):
+        frame = validations
+        # Normalise each distinct note once; short or non-text notes map to None.
+        texts = [
+            n.lower().strip()
+            if isinstance(n, str) and len(n) >= Config.REPEATED_PHRASE_MIN_LENGTH
+            else None
+            for n in frame.notes
+        ]
+        rows = np.flatnonzero((frame.validator >= 0) & (frame.note >= 0))
+        validator_ids = frame.validator_ids
+        for v, n in zip(frame.validator[rows].tolist(), frame.note[rows].tolist()):
+            if texts[n] is not None:
+                validator_texts[validator_ids[v]].append(texts[n])
+        return _semantic_clusters(validator_texts)
+
     for v in validations:
         validator_id = v.get("validator_id")
-        note = v.get("note", "")
-        if not validator_id or len(note) < Config.REPEATED_PHRASE_MIN_LENGTH:
+        note = v.get("note")
+        if (
+            not validator_id
+            or not isinstance(note, str)
+            or len(note) < Config.REPEATED_PHRASE_MIN_LENGTH
+        ):
             continue
         validator_texts[validator_id].append(note.lower().strip())
 
+    return _semantic_clusters(validator_texts)
+
+
+def _semantic_clusters(validator_texts: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Semantic clusters from each validator's normalised notes."""
     if not validator_texts:
         return {"semantic_clusters": [], "flags": []}
 
     all_notes = [text for notes in validator_texts.values() for text in notes]
+    validators = list(validator_texts.keys())
+    sizes = [len(validator_texts[vid]) for vid in validators]
 
-    @lru_cache(maxsize=128)
-    def _compute_embeddings(texts: Tuple[str, ...]):
-        """Heavy embedding computation cached for reuse."""
-        try:
-            from sentence_transformers import SentenceTransformer
-
-            # Avoid accidental network downloads by forcing offline mode if unset
-            os.environ.setdefault("HF_HUB_OFFLINE", "1")
-            os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
-            try:
-                model = SentenceTransformer("paraphrase-MiniLM-L6-v2")
-                return model.encode(list(texts))
-            except Exception as st_exc:
-                logger.warning(
-                    f"SentenceTransformer failed: {st_exc}; using TF-IDF fallback"
-                )
-        except Exception as import_exc:  # pragma: no cover - fallback rarely triggered
-            logger.warning(
-                f"SentenceTransformer unavailable: {import_exc}; using TF-IDF fallback"
-            )
-        try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-
-            vec = TfidfVectorizer().fit(list(texts))
-            return vec.transform(list(texts)).toarray()
-        except Exception as tfidf_exc:  # pragma: no cover - minimal fallback
-            logger.error(
-                f"TF-IDF fallback unavailable: {tfidf_exc}; using simple counts"
-            )
-            try:
-                import numpy as np
-
-                vocab = sorted({w for t in texts for w in t.split()})
-
-                def to_counts(text: str) -> np.ndarray:
-                    counts = [text.split().count(tok) for tok in vocab]
-                    return np.array(counts, dtype=float)
-
-                return np.stack([to_counts(t) for t in texts])
-            except Exception as np_exc:  # pragma: no cover - extremely rare
-                logger.error(f"NumPy unavailable: {np_exc}; using pure Python counts")
-
-                vocab = sorted({w for t in texts for w in t.split()})
-
-                def to_counts_list(text: str) -> List[float]:
-                    return [float(text.split().count(tok)) for tok in vocab]
-
-                return [to_counts_list(t) for t in texts]
-
-    # Heavy embedding generation can dominate runtime on large datasets.
-    # Profile with ``cProfile`` to verify and consider batching strategies.
-    embeddings = _compute_embeddings(tuple(all_notes))
+    model = _sentence_model()
+    if model is not None:
+        embeddings = _get_embedding_cache().get_many(
+            all_notes, model.encode, SEMANTIC_MODEL_NAME
+        )
+    else:
+        embeddings = _fallback_embeddings(all_notes)
 
-    def _average_vectors(vectors: List[Any]):
-        """Compute mean of vectors supporting numpy arrays or lists."""
-        try:
-            import numpy as np
-
-            if isinstance(vectors, np.ndarray):
-                return vectors.mean(axis=0)
-            if vectors and isinstance(vectors[0], np.ndarray):
-                stacked = np.stack(vectors)
-                return stacked.mean(axis=0)
-        except Exception:
-            pass
-
-        length = len(vectors[0]) if vectors else 0
-        sums = [0.0] * length
-        for v in vectors:
-            for i, val in enumerate(v):
-                sums[i] += float(val)
-        return [s / len(vectors) for s in sums]
-
-    idx = 0
-    validator_embeddings = {}
-    for vid, notes in validator_texts.items():
-        note_embeds = embeddings[idx : idx + len(notes)]  # noqa: E203
-        idx += len(notes)
-        validator_embeddings[vid] = _average_vectors(note_embeds)
+    try:
+        import numpy as np
+
+        from network.embedding_cache import similar_pairs
+    except Exception:  # pragma: no cover - optional dependency
+        np = None
+
+    if np is not None:
+        matrix = np.asarray(embeddings, dtype=np.float64)
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        means = np.add.reduceat(matrix, starts, axis=0) / np.asarray(sizes)[:, None]
+        pairs = similar_pairs(means, Config.SEMANTIC_SIMILARITY_THRESHOLD)
+    else:  # pragma: no cover - exercised only without numpy
+        means, idx = [], 0
+        for size in sizes:
+            rows = embeddings[idx : idx + size]  # noqa: E203
+            idx += size
+            means.append([sum(col) / size for col in zip(*rows)])
+        pairs = _pairwise_similar(means, Config.SEMANTIC_SIMILARITY_THRESHOLD)
 
     semantic_clusters = []
     flags = []
-    validators = list(validator_embeddings.keys())
-
-    for v1, v2 in itertools.combinations(validators, 2):
-        emb1 = validator_embeddings[v1]
-        emb2 = validator_embeddings[v2]
-
-        def _cosine_similarity(a: Any, b: Any) -> float:
-            try:
-                import numpy as np
-
-                if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
-                    dot = float(a @ b)
-                    norm = math.sqrt(float(a @ a) * float(b @ b))
-                    return dot / norm if norm else 0.0
-            except Exception:
-                pass
-
-            dot = sum(x * y for x, y in zip(a, b))
-            norm1 = math.sqrt(sum(x * x for x in a))
-            norm2 = math.sqrt(sum(y * y for y in b))
-            norm = norm1 * norm2
-            return dot / norm if norm else 0.0
-
-        similarity = _cosine_similarity(emb1, emb2)
-
-        if similarity >= Config.SEMANTIC_SIMILARITY_THRESHOLD:
-            semantic_clusters.append(
-                {
-                    "validators": [v1, v2],
-                    "similarity_score": round(similarity, 3),
-                    "coordination_likelihood": similarity,
-                }
-            )
-            flags.append(f"semantic_coordination_{v1}_{v2}")
+    for i, j, similarity in pairs:
+        v1, v2 = validators[i], validators[j]
+        semantic_clusters.append(
+            {
+                "validators": [v1, v2],
+                "similarity_score": round(similarity, 3),
+                "coordination_likelihood": similarity,
+            }
+        )
+        flags.append(f"semantic_coordination_{v1}_{v2}")
 
     return {
         "semantic_clusters": semantic_clusters,
@@ -521,7 +651,7 @@ def analyze_coordination_patterns(validations: List[Dict[str, Any]]) -> Dict[str
     Enhanced with sophisticated risk scoring and community detection.
 
     Args:
-        validations: List of validation records
+        validations: List of validation records or a ``ValidationFrame``
 
     Returns:
         Dict with comprehensive coordination analysis
@@ -595,7 +725,7 @@ def analyze_coordination_patterns(validations: List[Dict[str, Any]]) -> Dict[str
 # TODO v4.6:
 # - Integrate with reputation_influence_tracker for feedback loop
 # - Add advanced NLP for semantic similarity (sentence embeddings)
-# - Implement more sophisticated graph clustering algorithms (Louvain, Leiden)
+# - Add Leiden clustering alongside the Louvain community mode
 # - Add validator organization/affiliation cross-reference
 # - Include validation outcome correlation analysis
 # - Add time-series analysis for evolving coordination patterns
@@ -0,0 +1,199 @@
+"""Bounded replay-protection store for event nonces.
+
+Nonces are kept as 16-byte digests in per-slot buckets of a time wheel.  A
+nonce lives in the slot of the minute (``slot_seconds``) it was first seen;
+once a slot falls out of the expiry window the whole bucket is dropped, so
+expiry work is proportional to the nonces in that one slot rather than to
+everything stored, and it happens incrementally as events arrive instead of
+in a periodic full scan under the agent lock.
+
+An optional pair of rotating Bloom filters answers "never seen" without
+touching the exact index.  The store serialises to a compact JSON-friendly
+dict so it can travel with agent snapshots.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+DIGEST_SIZE = 16
+
+
+def nonce_digest(nonce: Any) -> bytes:
+    """Return the compact key stored for ``nonce``."""
+    return hashlib.blake2b(str(nonce).encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter keyed by already-uniform digests."""
+
+    def __init__(self, bits: int, hashes: int = 4) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray((bits + 7) // 8)
+
+    def _positions(self, digest: bytes):
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def add(self, digest: bytes) -> None:
+        for pos in self._positions(digest):
+            self.array[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self.array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
+
+
+class NonceStore:
+    """Time-wheel nonce set with constant-time membership checks.
+
+    Parameters
+    ----------
+    ttl_seconds:
+        How long a nonce is remembered.
+    slot_seconds:
+        Width of one wheel slot; expiry granularity.
+    bloom_bits:
+        Size of each pre-filter in bits. ``0`` disables the pre-filter.
+    clock:
+        Returns the current time in seconds; injectable for tests.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        slot_seconds: int = 60,
+        bloom_bits: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.slot_seconds = slot_seconds
+        self.bloom_bits = bloom_bits
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._slots: Deque[Tuple[int, List[bytes]]] = deque()
+        self._seen: Dict[bytes, int] = {}
+        self._blooms: Optional[List[_BloomFilter]] = None
+        self._bloom_epoch = int(clock() // ttl_seconds)
+        if bloom_bits:
+            self._blooms = [_BloomFilter(bloom_bits), _BloomFilter(bloom_bits)]
+
+    def _slot(self, now: float) -> int:
+        return int(now // self.slot_seconds)
+
+    def _expire_locked(self, now: float) -> int:
+        horizon = self._slot(now - self.ttl_seconds)
+        dropped = 0
+        while self._slots and self._slots[0][0] < horizon:
+            slot, digests = self._slots.popleft()
+            for digest in digests:
+                if self._seen.get(digest) == slot:
+                    del self._seen[digest]
+                    dropped += 1
+        if self._blooms is not None:
+            # Rotate once per TTL: the previous filter still covers every
+            # nonce younger than one full window.
+            epoch = int(now // self.ttl_seconds)
+            if epoch != self._bloom_epoch:
+                self._blooms = [_BloomFilter(self.bloom_bits), self._blooms[0]]
+                self._bloom_epoch = epoch
+        return dropped
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop slots older than the TTL and return how many nonces expired."""
+        with self._lock:
+            return self._expire_locked(self.clock() if now is None else now)
+
+    def __contains__(self, nonce: Any) -> bool:
+        digest = nonce_digest(nonce)
+        with self._lock:
+            if self._blooms is not None and not any(digest in b for b in self._blooms):
+                return False
+            return digest in self._seen
+
+    def add(self, nonce: Any) -> bool:
+        """Record ``nonce``; return ``False`` if it was already present."""
+        digest = nonce_digest(nonce)
+        now = self.clock()
+        with self._lock:
+            self._expire_locked(now)
+            if self._blooms is None or any(digest in b for b in self._blooms):
+                if digest in self._seen:
+                    return False
+            self._insert_locked(digest, self._slot(now))
+            return True
+
+    def add_at(self, nonce: Any, seen_at: float) -> bool:
+        """Record ``nonce`` as first seen at ``seen_at`` (epoch seconds).
+
+        Used when replaying logged events after a restart.  Nonces already
+        older than the TTL are not stored.  Returns ``False`` if ``nonce``
+        was present or has expired.
+        """
+        digest = nonce_digest(nonce)
+        now = self.clock()
+        with self._lock:
+            self._expire_locked(now)
+            if seen_at < now - self.ttl_seconds or digest in self._seen:
+                return False
+            self._insert_restored_locked(digest, self._slot(seen_at))
+            return True
+
+    def _insert_locked(self, digest: bytes, slot: int) -> None:
+        if not self._slots or self._slots[-1][0] != slot:
+            self._slots.append((slot, []))
+        self._slots[-1][1].append(digest)
+        self._seen[digest] = slot
+        if self._blooms is not None:
+            self._blooms[0].add(digest)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise live nonces as base64-packed digests per slot."""
+        with self._lock:
+            slots = []
+            for slot, digests in self._slots:
+                live = b"".join(d for d in digests if self._seen.get(d) == slot)
+                slots.append([slot, base64.b64encode(live).decode("ascii")])
+            return {"slot_seconds": self.slot_seconds, "slots": slots}
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        """Merge nonces saved by :meth:`to_dict`; stale slots expire on next use."""
+        scale = data.get("slot_seconds", self.slot_seconds) / self.slot_seconds
+        with self._lock:
+            self._expire_locked(self.clock())
+            for slot, packed in data.get("slots", []):
+                raw = base64.b64decode(packed)
+                slot = int(slot * scale)
+                for i in range(0, len(raw), DIGEST_SIZE):
+                    digest = raw[i : i + DIGEST_SIZE]
+                    if digest not in self._seen:
+                        self._insert_restored_locked(digest, slot)
+
+    def _insert_restored_locked(self, digest: bytes, slot: int) -> None:
+        # Restored slots may predate live ones; keep the wheel ordered.
+        if self._slots and self._slots[-1][0] > slot:
+            for i, (existing, digests) in enumerate(self._slots):
+                if existing == slot:
+                    digests.append(digest)
+                    break
+                if existing > slot:
+                    self._slots.insert(i, (slot, [digest]))
+                    break
+            self._seen[digest] = slot
+            if self._blooms is not None:
+                self._blooms[0].add(digest)
+            return
+        self._insert_locked(digest, slot)
+
+
+__all__ = ["NonceStore", "nonce_digest"]
@@ -1,16 +1,26 @@
-"""Management service for system predictions and experiments."""
+"""Management service for system predictions and experiments.
+
+Predictions and experiment designs live in their own tables
+(``PredictionRecord``/``ExperimentDesignRecord``) with typed ``status``,
+``expires_at`` and ``hypothesis_id`` columns, so finding due predictions is an
+index range scan instead of parsing every ``prediction:*`` ``SystemState``
+row. :func:`migrate_legacy_records` moves rows written by older versions.
+"""
 
 import json
 import uuid
 import datetime
 import logging
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Iterable, List, Optional, Callable, Tuple
 
 from quantum_sim import QuantumContext
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
+# Prediction ids per IN (...) query in bulk updates
+_BULK_CHUNK = 500
+
 try:  # Prefer SystemState from db_models if available
     from db_models import SystemState, Base, engine
 except Exception:  # pragma: no cover - fallback definition
@@ -28,14 +38,52 @@ except Exception:  # pragma: no cover - fallback definition
 
     Base.metadata.create_all(bind=engine)
 
+try:  # Prefer the prediction tables from db_models if available
+    from db_models import ExperimentDesignRecord, PredictionRecord
+except Exception:  # pragma: no cover - fallback definitions
+    from sqlalchemy import JSON, Column, DateTime, Index, String
+    from db_models import Base, engine
+
+    class PredictionRecord(Base):  # type: ignore
+        """Fallback table for predictions with typed lifecycle columns."""
+
+        __tablename__ = "prediction_records"
+
+        prediction_id = Column(String, primary_key=True)
+        status = Column(String, nullable=False, default="pending")
+        hypothesis_id = Column(String, nullable=True, index=True)
+        created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+        expires_at = Column(DateTime, nullable=True)
+        updated_at = Column(DateTime, nullable=True)
+        record = Column(JSON, nullable=False)
+
+        __table_args__ = (
+            Index("ix_prediction_records_status_expires", "status", "expires_at"),
+            Index("ix_prediction_records_status_updated", "status", "updated_at"),
+        )
+
+    class ExperimentDesignRecord(Base):  # type: ignore
+        """Fallback table for validation experiment designs."""
+
+        __tablename__ = "experiment_designs"
+
+        experiment_id = Column(String, primary_key=True)
+        hypothesis_id = Column(String, nullable=True, index=True)
+        created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+        record = Column(JSON, nullable=False)
+
+    Base.metadata.create_all(bind=engine)
+
 
 class PredictionManager:
     """Service to persist and retrieve system predictions and experiment designs.
 
     This class centralizes lifecycle management for scientific hypotheses and
     validation experiments generated by the system. Predictions and experiments
-    are serialized to JSON and stored in a simple key-value table (``SystemState``)
-    so they can later be revisited, validated and analyzed.
+    are stored as JSON records in dedicated tables whose ``status`` and
+    ``expires_at`` columns are indexed, so they can later be revisited,
+    validated and analyzed. Records still in ``SystemState`` are read as a
+    fallback until :func:`migrate_legacy_records` has run.
     """
 
     def __init__(
@@ -100,19 +148,41 @@ class PredictionManager:
         """Persist a generated prediction and return its unique identifier."""
 
         prediction_id = uuid.uuid4().hex
+        now = datetime.datetime.utcnow()
         record = {
             "prediction_id": prediction_id,
-            "created_at": datetime.datetime.utcnow().isoformat(),
+            "created_at": now.isoformat(),
             "status": prediction_data.get("status", "pending"),
             "data": prediction_data,
         }
-        self._set_value(f"prediction:{prediction_id}", json.dumps(record))
+        session = self.session_factory()
+        try:
+            session.add(
+                PredictionRecord(
+                    prediction_id=prediction_id,
+                    status=record["status"],
+                    hypothesis_id=_text_or_none(prediction_data.get("hypothesis_id")),
+                    created_at=now,
+                    expires_at=_parse_expiry(prediction_data.get("expires_at"), prediction_id),
+                    record=record,
+                )
+            )
+            session.commit()
+        finally:
+            session.close()
         logging.debug("Stored prediction", extra={"prediction_id": prediction_id})
         return prediction_id
 
     def get_prediction(self, prediction_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a previously stored prediction."""
 
+        session = self.session_factory()
+        try:
+            row = session.get(PredictionRecord, prediction_id)
+            if row is not None:
+                return row.record
+        finally:
+            session.close()
         raw = self._get_value(f"prediction:{prediction_id}")
         return json.loads(raw) if raw else None
 
@@ -120,12 +190,25 @@ class PredictionManager:
         """Persist a validation experiment and return its identifier."""
 
         experiment_id = uuid.uuid4().hex
+        now = datetime.datetime.utcnow()
         record = {
             "experiment_id": experiment_id,
-            "created_at": datetime.datetime.utcnow().isoformat(),
+            "created_at": now.isoformat(),
             "data": experiment_data,
         }
-        self._set_value(f"experiment:{experiment_id}", json.dumps(record))
+        session = self.session_factory()
+        try:
+            session.add(
+                ExperimentDesignRecord(
+                    experiment_id=experiment_id,
+                    hypothesis_id=_text_or_none(experiment_data.get("hypothesis_id")),
+                    created_at=now,
+                    record=record,
+                )
+            )
+            session.commit()
+        finally:
+            session.close()
         logging.debug(
             "Stored experiment design", extra={"experiment_id": experiment_id}
         )
@@ -134,6 +217,13 @@ class PredictionManager:
     def get_experiment_design(self, experiment_id: str) -> Optional[Dict[str, Any]]:
         """Return a stored experiment design by ID."""
 
+        session = self.session_factory()
+        try:
+            row = session.get(ExperimentDesignRecord, experiment_id)
+            if row is not None:
+                return row.record
+        finally:
+            session.close()
         raw = self._get_value(f"experiment:{experiment_id}")
         return json.loads(raw) if raw else None
 
@@ -145,21 +235,114 @@ class PredictionManager:
     ) -> None:
         """Update ``prediction_id`` to ``new_status`` and record outcome data."""
 
-        record = self.get_prediction(prediction_id)
-        if not record:
+        outcomes = {prediction_id: actual_outcome} if actual_outcome is not None else None
+        if self.update_prediction_statuses([prediction_id], new_status, outcomes):
+            return
+        # Records written by older versions that have not been migrated yet
+        raw = self._get_value(f"prediction:{prediction_id}")
+        if not raw:
             logging.warning(
                 "Prediction not found", extra={"prediction_id": prediction_id}
             )
             return
-        record["status"] = new_status
-        if actual_outcome is not None:
-            record["actual_outcome"] = actual_outcome
-            record["updated_at"] = datetime.datetime.utcnow().isoformat()
+        record = json.loads(raw)
+        _apply_status(record, new_status, actual_outcome)
         self._set_value(f"prediction:{prediction_id}", json.dumps(record))
+
+    def update_prediction_statuses(
+        self,
+        prediction_ids: Iterable[str],
+        new_status: str,
+        outcomes: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> int:
+        """Set ``new_status`` on many predictions in one transaction.
+
+        ``outcomes`` optionally maps prediction ids to their actual outcome.
+        Returns the number of predictions updated.
+        """
+
+        ids = list(dict.fromkeys(prediction_ids))
+        if not ids:
+            return 0
+        outcomes = outcomes or {}
+        now = datetime.datetime.utcnow()
+        session = self.session_factory()
+        try:
+            mappings = []
+            for start in range(0, len(ids), _BULK_CHUNK):
+                rows = session.execute(
+                    select(PredictionRecord.prediction_id, PredictionRecord.record).where(
+                        PredictionRecord.prediction_id.in_(ids[start : start + _BULK_CHUNK])
+                    )
+                )
+                for prediction_id, record in rows:
+                    record = dict(record)
+                    _apply_status(record, new_status, outcomes.get(prediction_id), now)
+                    mappings.append(
+                        {
+                            "prediction_id": prediction_id,
+                            "status": new_status,
+                            "updated_at": now,
+                            "record": record,
+                        }
+                    )
+            session.bulk_update_mappings(PredictionRecord, mappings)
+            session.commit()
+        finally:
+            session.close()
         logging.debug(
-            "Updated prediction status",
-            extra={"prediction_id": prediction_id, "status": new_status},
+            "Updated prediction statuses",
+            extra={"count": len(mappings), "status": new_status},
         )
+        return len(mappings)
+
+    def expired_pending(
+        self, now: Optional[datetime.datetime] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Pending predictions whose ``expires_at`` has passed, oldest first.
+
+        Predictions without a (valid) expiry count as expired. Served by the
+        ``(status, expires_at)`` index, so the cost depends on the number of
+        due predictions rather than the total history. Only the prediction
+        table is read: run :func:`migrate_legacy_records` first so older
+        ``prediction:*`` ``SystemState`` rows are included.
+        """
+
+        now = now or datetime.datetime.utcnow()
+        session = self.session_factory()
+        try:
+            rows = session.execute(
+                select(PredictionRecord.record)
+                .where(
+                    PredictionRecord.status == "pending",
+                    or_(
+                        PredictionRecord.expires_at.is_(None),
+                        PredictionRecord.expires_at <= now,
+                    ),
+                )
+                .order_by(PredictionRecord.expires_at, PredictionRecord.prediction_id)
+                .limit(limit)
+            )
+            return [record for (record,) in rows]
+        finally:
+            session.close()
+
+    def recent_outcomes(
+        self, limit: int = 200, status: str = "validated"
+    ) -> List[Dict[str, Any]]:
+        """The ``limit`` most recently updated predictions with ``status``."""
+
+        session = self.session_factory()
+        try:
+            rows = session.execute(
+                select(PredictionRecord.record)
+                .where(PredictionRecord.status == status)
+                .order_by(PredictionRecord.updated_at.desc())
+                .limit(limit)
+            )
+            return [record for (record,) in rows]
+        finally:
+            session.close()
 
     def schedule_annual_audit_proposal(
         self, *, current_time: Optional[datetime.datetime] = None
@@ -202,3 +385,89 @@ class PredictionManager:
         self._set_value("audit_scheduler_last_run", now.isoformat())
         return proposal_id
 
+
+def _text_or_none(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _parse_expiry(value: Any, prediction_id: str) -> Optional[datetime.datetime]:
+    """``expires_at`` as naive UTC; missing or invalid values give ``None``."""
+
+    if not value:
+        return None
+    try:
+        expires = datetime.datetime.fromisoformat(str(value))
+    except ValueError:
+        logging.warning(
+            "invalid expires_at", extra={"prediction_id": prediction_id}
+        )
+        return None
+    if expires.tzinfo is not None:
+        expires = expires.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return expires
+
+
+def _apply_status(
+    record: Dict[str, Any],
+    new_status: str,
+    actual_outcome: Optional[Dict[str, Any]],
+    now: Optional[datetime.datetime] = None,
+) -> None:
+    record["status"] = new_status
+    if actual_outcome is not None:
+        record["actual_outcome"] = actual_outcome
+        record["updated_at"] = (now or datetime.datetime.utcnow()).isoformat()
+
+
+def migrate_legacy_records(session: Session) -> Tuple[int, int]:
+    """Move ``prediction:*``/``experiment:*`` ``SystemState`` rows into their tables.
+
+    Rows that fail to parse are left in place. Returns the number of
+    predictions and experiments moved; the caller's session is committed.
+    """
+
+    moved = {"prediction:": 0, "experiment:": 0}
+    for prefix in moved:
+        rows = session.execute(
+            select(SystemState).where(
+                SystemState.key >= prefix,
+                SystemState.key < prefix[:-1] + chr(ord(prefix[-1]) + 1),
+            )
+        ).scalars()
+        for state in list(rows):
+            item_id = state.key[len(prefix):]
+            try:
+                record = json.loads(state.value)
+            except (TypeError, ValueError):
+                logging.warning("malformed legacy record", extra={"key": state.key})
+                continue
+            data = record.get("data") or {}
+            try:
+                created = datetime.datetime.fromisoformat(record.get("created_at", ""))
+            except (TypeError, ValueError):
+                created = datetime.datetime.utcnow()
+            if prefix == "prediction:":
+                if session.get(PredictionRecord, item_id) is None:
+                    session.add(
+                        PredictionRecord(
+                            prediction_id=item_id,
+                            status=record.get("status", "pending"),
+                            hypothesis_id=_text_or_none(data.get("hypothesis_id")),
+                            created_at=created,
+                            expires_at=_parse_expiry(data.get("expires_at"), item_id),
+                            record=record,
+                        )
+                    )
+            elif session.get(ExperimentDesignRecord, item_id) is None:
+                session.add(
+                    ExperimentDesignRecord(
+                        experiment_id=item_id,
+                        hypothesis_id=_text_or_none(data.get("hypothesis_id")),
+                        created_at=created,
+                        record=record,
+                    )
+                )
+            session.delete(state)
+            moved[prefix] += 1
+    session.commit()
+    return moved["prediction:"], moved["experiment:"]
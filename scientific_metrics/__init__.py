@@ -11,10 +11,17 @@ try:
     import networkx as nx
 except Exception:  # pragma: no cover - optional dependency
     nx = None
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import func, select
 from scientific_utils import ScientificModel, VerifiedScientificModel
 from causal_graph import InfluenceGraph, build_causal_graph as _build
+from causal_graph.graph_cache import influence_graph_cache
+from causal_graph.feedback_loops import strongest_feedback_loops
+from causal_graph.influence_paths import count_simple_paths, max_product_influence
 
 try:
     from config import Config
@@ -32,6 +39,17 @@ except Exception:  # pragma: no cover - fallback during circular import
     INFLUENCE_MULT = 1.2
     ENTROPY_MULT = 0.8
 
+# Path counts above this add less than 0.001 to path-count confidence
+PATH_COUNT_LIMIT = 1000
+# Edges the confidence path count may expand before settling for a lower bound
+PATH_COUNT_MAX_STEPS = 100_000
+
+# Bounds for feedback-loop detection: longest cycle (nodes), loops returned
+# and edges expanded before the search stops
+FEEDBACK_LOOP_MAX_LENGTH = 8
+FEEDBACK_LOOP_TOP_K = 100
+FEEDBACK_LOOP_MAX_STEPS = 1_000_000
+
 if TYPE_CHECKING:
     from db_models import Harmonizer
 
@@ -251,6 +269,39 @@ def calculate_interaction_entropy(
         logging.error(f"Interaction entropy calculation failed: {exc}")
         return {"value": 0.0, "unit": "bits", "confidence": None, "method": method}
 
+
+def interaction_entropy_scores(db: Session) -> Dict[int, float]:
+    """Normalized Shannon interaction entropy for every user at once.
+
+    Same value as ``calculate_interaction_entropy(user, db)["value"]`` with
+    the default arguments, but the four interaction counts come from one
+    ``GROUP BY`` query per table and the entropy is evaluated for all users
+    as a ``(users, 4)`` array instead of loading each user's relationships.
+    """
+    from db_models import Comment, Harmonizer, VibeNode, harmonizer_follows, vibenode_likes
+
+    ids = list(db.execute(select(Harmonizer.id)).scalars())
+    if not ids:
+        return {}
+    row = {uid: i for i, uid in enumerate(ids)}
+    counts = np.zeros((len(ids), 4))
+    columns = (
+        VibeNode.author_id,
+        Comment.author_id,
+        vibenode_likes.c.harmonizer_id,
+        harmonizer_follows.c.follower_id,
+    )
+    for j, column in enumerate(columns):
+        for uid, count in db.execute(select(column, func.count()).group_by(column)):
+            if uid in row:
+                counts[row[uid], j] = count
+    total = counts.sum(axis=1, keepdims=True)
+    probs = np.divide(counts, total, out=np.zeros_like(counts), where=total > 0)
+    logs = np.log2(probs, out=np.zeros_like(probs), where=probs > 0)
+    entropy = -(probs * logs).sum(axis=1) / math.log2(counts.shape[1])
+    return dict(zip(ids, entropy.tolist()))
+
+
 def build_causal_graph(db: Session) -> InfluenceGraph:
     """Construct a time-aware :class:`InfluenceGraph` from user interactions."""
     return _build(db)
@@ -265,18 +316,19 @@ def build_causal_graph(db: Session) -> InfluenceGraph:
 def generate_scientific_report(user: Any, db: Session) -> Dict[str, Any]:
     """Aggregate core metrics for a user into a structured report.
 
-    The function calls :func:`calculate_influence_score` and
-    :func:`calculate_interaction_entropy` then bundles their outputs along with
-    the ``user_id``.  No additional weighting or cross-metric correlation is
-    applied.
+    The function reads the user's PageRank influence from the shared
+    :data:`causal_graph.graph_cache.influence_graph_cache` (same schema as
+    :func:`calculate_influence_score`) and calls
+    :func:`calculate_interaction_entropy`, then bundles their outputs along
+    with the ``user_id``.  No additional weighting or cross-metric correlation
+    is applied.
 
     citation_uri: https://en.wikipedia.org/wiki/Scientific_method
     assumptions: individual metrics independent; no weighting
     validation_notes: unit test checks field presence
     approximation: aggregation
     """
-    graph = build_causal_graph(db)
-    influence_score = calculate_influence_score(graph.graph, getattr(user, "id", 0))
+    influence_score = influence_graph_cache.influence_score(db, getattr(user, "id", 0))
     entropy = calculate_interaction_entropy(user, db)
     report = {
         "user_id": getattr(user, "id", None),
@@ -300,13 +352,16 @@ def query_influence(
     target_id: int,
     *,
     perturb_iterations: int = 0,
+    max_hops: Optional[int] = None,
 ) -> Dict[str, Optional[float]]:
     """Return a probabilistic influence value from ``source_id`` to ``target_id``.
 
     The influence score is defined as the maximum product of edge weights over
     all simple paths between the two nodes.  Edge weights are assumed to lie in
     ``[0, 1]`` and represent the probability of influence propagation along that
-    edge.
+    edge.  The maximum is found with a shortest-path search over
+    ``-log(weight)`` (see :mod:`causal_graph.influence_paths`); graphs with
+    inhibitory edges fall back to exact path enumeration.
 
     Parameters
     ----------
@@ -314,6 +369,8 @@ def query_influence(
         If greater than zero, additional confidence estimation is performed by
         randomly perturbing edge weights and recomputing the path-strength
         heuristic.
+    max_hops : int, optional
+        Only consider paths with at most this many edges.
 
     citation_uri: https://en.wikipedia.org/wiki/Graph_theory
     assumptions: path strength proxy for influence
@@ -325,56 +382,43 @@ def query_influence(
 
     try:
         if isinstance(graph, InfluenceGraph):
-            prob = graph.query_influence(source_id, target_id)
+            g = graph.graph
+            prob = graph.query_influence(source_id, target_id, max_hops=max_hops)
         else:
             if nx is None:
                 logging.warning("networkx not installed; influence set to 0")
                 return {"value": 0.0, "unit": "probability", "confidence": None, "method": "path_strength"}
             if not (source_id in graph and target_id in graph):
                 return {"value": 0.0, "unit": "probability", "confidence": None, "method": "path_strength"}
-            if source_id == target_id:
-                prob = 1.0
-            elif not nx.has_path(graph, source_id, target_id):
-                prob = 0.0
-            else:
-                paths = list(nx.all_simple_paths(graph, source_id, target_id))
-                strengths = []
-                for p in paths:
-                    w = 1.0
-                    for u, v in zip(p[:-1], p[1:]):
-                        w *= graph[u][v].get("weight", 1.0)
-                    strengths.append(w)
-                prob = max(strengths) if strengths else 0.0
+            g = graph
+            prob = max_product_influence(graph, source_id, target_id, max_hops=max_hops)
             prob = max(0.0, min(1.0, prob))
 
-        # simple confidence derived from path count
+        # simple confidence derived from path count; counting stops once the
+        # confidence is within 1 / PATH_COUNT_LIMIT of saturation or after
+        # PATH_COUNT_MAX_STEPS edges, whichever comes first
         conf = None
-        if isinstance(graph, InfluenceGraph) and graph.graph:
-            path_count = len(list(nx.all_simple_paths(graph.graph, source_id, target_id)))
-            conf = max(0.0, min(1.0, 1.0 - 1.0 / (path_count + 1)))
-        elif not isinstance(graph, InfluenceGraph) and nx is not None:
-            path_count = len(list(nx.all_simple_paths(graph, source_id, target_id))) if nx.has_path(graph, source_id, target_id) else 0
+        path_count = 0
+        if g.number_of_nodes():
+            path_count = count_simple_paths(
+                g,
+                source_id,
+                target_id,
+                limit=PATH_COUNT_LIMIT,
+                max_hops=max_hops,
+                max_steps=PATH_COUNT_MAX_STEPS,
+            )
             conf = max(0.0, min(1.0, 1.0 - 1.0 / (path_count + 1)))
 
         # optional perturbation-based confidence refinement
         if perturb_iterations > 0 and nx is not None and path_count > 0:
             def _p_iter(_):
-                g2 = graph.graph.copy() if isinstance(graph, InfluenceGraph) else graph.copy()
+                g2 = g.copy()
+                # keep perturbed probabilities in [0, 1] so the fast search applies
                 for u, v, data in g2.edges(data=True):
-                    data["weight"] = data.get("weight", 1.0) * random.uniform(0.9, 1.1)
-                if isinstance(graph, InfluenceGraph):
-                    s_prob = InfluenceGraph(); s_prob.graph = g2
-                    return s_prob.query_influence(source_id, target_id)
-                if nx.has_path(g2, source_id, target_id):
-                    paths = list(nx.all_simple_paths(g2, source_id, target_id))
-                    st = []
-                    for p in paths:
-                        w = 1.0
-                        for u2, v2 in zip(p[:-1], p[1:]):
-                            w *= g2[u2][v2].get("weight", 1.0)
-                        st.append(w)
-                    return max(st) if st else 0.0
-                return 0.0
+                    w = data.get("weight", 1.0) * random.uniform(0.9, 1.1)
+                    data["weight"] = min(1.0, w) if w >= 0 else w
+                return max_product_influence(g2, source_id, target_id, max_hops=max_hops)
 
             samples = []
             try:
@@ -499,16 +543,27 @@ def log_metric_convergence(series: list[float], *, drift_threshold: float = 0.01
     validation_notes="unit tests verify detection for known cycles and strength calculation",
     approximation="heuristic",
 )
-def detect_feedback_loops(graph: InfluenceGraph) -> list[Dict[str, Any]]:
+def detect_feedback_loops(
+    graph: InfluenceGraph,
+    *,
+    max_length: Optional[int] = FEEDBACK_LOOP_MAX_LENGTH,
+    top_k: Optional[int] = FEEDBACK_LOOP_TOP_K,
+    max_steps: Optional[int] = FEEDBACK_LOOP_MAX_STEPS,
+) -> list[Dict[str, Any]]:
     """Identify recurrent influence cycles within ``graph``.
 
-    The algorithm searches for all simple directed cycles in ``graph.graph``
-    using :func:`networkx.simple_cycles` when available.  If ``networkx`` is
-    unavailable or lacks ``simple_cycles`` (as in the lightweight test stub), a
-    basic depth-first search fallback enumerates cycles.  For each detected
+    The graph is split into strongly connected components and simple directed
+    cycles of at most ``max_length`` nodes are enumerated inside each
+    non-trivial component (see :mod:`causal_graph.feedback_loops`).  For each
     cycle the function computes a *strength* heuristic: the geometric mean of
-    the edge weights along that cycle.  This provides a proxy for the
-    persistence of influence.
+    the edge weights along that cycle, computed in log space and signed by
+    the product of the weights.  This provides a proxy for the persistence of
+    influence.  The ``top_k`` strongest cycles found are returned, strongest
+    first.  The search of each component stops after expanding
+    ``max_steps`` edges, and a truncated search can miss strong cycles.
+    Pass ``None`` to lift a bound, or use
+    :func:`causal_graph.feedback_loops.iter_feedback_loops` to stream every
+    cycle.
 
     citation_uri: https://en.wikipedia.org/wiki/Graph_theory
     assumptions: graph represents directed influence
@@ -516,50 +571,9 @@ def detect_feedback_loops(graph: InfluenceGraph) -> list[Dict[str, Any]]:
     approximation: heuristic
     """
 
-    if nx is None:
-        return []
-
-    def _fallback_simple_cycles(dg: Any) -> list[list[Any]]:
-        nodes = list(getattr(dg, "_adj", dg))
-        cycles: list[list[Any]] = []
-
-        def dfs(start: Any, current: Any, path: list[Any], visited: set[Any]) -> None:
-            for nbr in dg[current]:
-                if nbr == start and len(path) > 1:
-                    cycles.append(path[:])
-                elif nbr not in visited:
-                    visited.add(nbr)
-                    path.append(nbr)
-                    dfs(start, nbr, path, visited)
-                    path.pop()
-                    visited.remove(nbr)
-
-        for n in nodes:
-            dfs(n, n, [n], {n})
-
-        # deduplicate by canonical rotation
-        unique: list[list[Any]] = []
-        for c in cycles:
-            m = min(range(len(c)), key=lambda i: str(c[i]))
-            canon = c[m:] + c[:m]
-            if canon not in unique:
-                unique.append(canon)
-        return unique
-
-    if hasattr(nx, "simple_cycles"):
-        cycles = list(nx.simple_cycles(graph.graph))
-    else:
-        cycles = _fallback_simple_cycles(graph.graph)
-
-    result: list[Dict[str, Any]] = []
-    for c in cycles:
-        strength = 1.0
-        for u, v in zip(c, c[1:] + c[:1]):
-            strength *= graph.graph[u][v].get("weight", 1.0)
-        geom_mean = strength ** (1.0 / len(c)) if c else 0.0
-        result.append({"nodes": c, "strength": geom_mean})
-
-    return result
+    return strongest_feedback_loops(
+        graph, top_k, max_length=max_length, max_steps=max_steps
+    )
 
 
 @VerifiedScientificModel(
@@ -677,8 +691,7 @@ def predict_user_interactions(
     approximation: heuristic
     """
 
-    graph = build_causal_graph(db)
-    influence = calculate_influence_score(graph.graph, user_id)
+    influence = influence_graph_cache.influence_score(db, user_id)
     from db_models import Harmonizer as HarmonizerModel  # local to avoid circular import
     user = db.query(HarmonizerModel).filter(HarmonizerModel.id == user_id).first()
     entropy = calculate_interaction_entropy(user, db)
@@ -789,7 +802,6 @@ def generate_system_predictions(db: Session, timeframe_hours: int) -> Dict[str,
     approximation: heuristic
     """
 
-    graph = build_causal_graph(db)
     from db_models import Harmonizer as HarmonizerModel
 
     users = db.query(HarmonizerModel).all()
@@ -797,7 +809,7 @@ def generate_system_predictions(db: Session, timeframe_hours: int) -> Dict[str,
     entropies: list[float] = []
 
     for u in users:
-        inf = calculate_influence_score(graph.graph, u.id)
+        inf = influence_graph_cache.influence_score(db, u.id)
         influence_scores.append((u.id, inf["value"]))
         ent = calculate_interaction_entropy(u, db)
         entropies.append(ent["value"])
@@ -4,11 +4,8 @@ from typing import Any, Dict
 
 from frontend_bridge import register_route_once
 from hook_manager import HookManager
-from scientific_metrics import (
-    predict_user_interactions,
-    calculate_influence_score,
-    build_causal_graph,
-)
+from causal_graph.graph_cache import influence_graph_cache
+from scientific_metrics import predict_user_interactions
 
 # Exposed hook manager so observers can listen to events
 ui_hook_manager = HookManager()
@@ -42,8 +39,7 @@ async def calculate_influence_ui(
 ) -> Dict[str, Any]:
     """Compute influence score for a user."""
     user_id = payload.get("user_id")
-    graph = build_causal_graph(db)
-    result = calculate_influence_score(graph.graph, user_id)
+    result = influence_graph_cache.influence_score(db, user_id)
     minimal = {"user_id": user_id, "influence_score": result.get("value", 0.0)}
     await ui_hook_manager.trigger("influence_score_computed", minimal)
     return minimal
@@ -2,10 +2,14 @@
 
 from functools import wraps, lru_cache
 from typing import Callable, List, Tuple, Dict, Any, Optional
+from bisect import bisect_left
 import importlib
+import itertools
 import math
 import inspect
 import logging
+import os
+import time
 import datetime
 import asyncio
 import html
@@ -46,6 +50,167 @@ def ScientificModel(source: str, model_type: str, approximation: str = "exact"):
     return decorator
 
 
+class VerificationSettings:
+    """Runtime switches for :func:`VerifiedScientificModel` wrappers.
+
+    In development mode (the default) every call has its arguments and result
+    checked and is logged at INFO. Production mode checks arguments on one
+    call in ``1 / sample_rate`` per model, still checks every result against
+    its bounds, and leaves per-call reporting to :data:`MODEL_METRICS`.
+    Models declared with ``strict_verification_mode`` are always checked.
+
+    The defaults come from ``SCIENTIFIC_VERIFICATION_MODE`` (``production`` or
+    ``development``) and ``SCIENTIFIC_VERIFICATION_SAMPLE_RATE``.
+    """
+
+    production: bool = os.getenv("SCIENTIFIC_VERIFICATION_MODE", "").lower() == "production"
+    sample_rate: float = float(os.getenv("SCIENTIFIC_VERIFICATION_SAMPLE_RATE", "0.01"))
+    # Check one call in ``stride``; 0 disables sampled checks.
+    stride: int = 0
+
+
+def configure_verification(
+    *, production: Optional[bool] = None, sample_rate: Optional[float] = None
+) -> None:
+    """Switch verification mode or sample rate for all wrapped models."""
+    if production is not None:
+        VerificationSettings.production = production
+    if sample_rate is not None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        VerificationSettings.sample_rate = sample_rate
+    rate = VerificationSettings.sample_rate
+    VerificationSettings.stride = max(1, round(1 / rate)) if rate > 0 else 0
+
+
+configure_verification()
+
+
+class ModelMetrics:
+    """Per-model call counters and latency histograms.
+
+    Each thread records into its own shard, so the hot path takes no lock and
+    never loses an increment; :meth:`snapshot` sums the shards. A lock is only
+    taken the first time a thread records anything.
+    """
+
+    # Upper bounds of the latency histogram buckets, in seconds; the last
+    # bucket counts everything slower.
+    LATENCY_BUCKETS: Tuple[float, ...] = (
+        1e-5, 3e-5, 1e-4, 3e-4, 1e-3, 3e-3, 1e-2, 3e-2, 0.1, 0.3, 1.0, 3.0,
+    )
+    _COUNTERS = ("calls", "checked", "failures", "out_of_bounds", "type_mismatches")
+    # Row layout: counters, total latency, max latency, histogram buckets.
+    _TOTAL = len(_COUNTERS)
+    _MAX = _TOTAL + 1
+    _BUCKETS = _TOTAL + 2
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: List[Dict[str, List[float]]] = []
+        self._shards_lock = threading.Lock()
+
+    def _row(self, model: str) -> List[float]:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        row = shard.get(model)
+        if row is None:
+            row = shard[model] = [0] * (self._BUCKETS + len(self.LATENCY_BUCKETS) + 1)
+        return row
+
+    def record(
+        self,
+        model: str,
+        latency: float,
+        *,
+        checked: bool = False,
+        failed: bool = False,
+        out_of_bounds: bool = False,
+        type_mismatches: int = 0,
+    ) -> None:
+        """Count one call of ``model`` that took ``latency`` seconds."""
+        row = self._row(model)
+        row[0] += 1
+        if checked:
+            row[1] += 1
+        if failed:
+            row[2] += 1
+        if out_of_bounds:
+            row[3] += 1
+        if type_mismatches:
+            row[4] += type_mismatches
+        row[self._TOTAL] += latency
+        if latency > row[self._MAX]:
+            row[self._MAX] = latency
+        row[self._BUCKETS + bisect_left(self.LATENCY_BUCKETS, latency)] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Totals per model: counters, mean/max latency and the histogram."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        totals: Dict[str, List[float]] = {}
+        for shard in shards:
+            for model, row in list(shard.items()):
+                total = totals.get(model)
+                if total is None:
+                    totals[model] = list(row)
+                    continue
+                for i, value in enumerate(row):
+                    if i == self._MAX:
+                        total[i] = max(total[i], value)
+                    else:
+                        total[i] += value
+        bounds = [str(b) for b in self.LATENCY_BUCKETS] + ["+Inf"]
+        report = {}
+        for model, row in sorted(totals.items()):
+            entry: Dict[str, Any] = dict(zip(self._COUNTERS, row))
+            calls = entry["calls"]
+            entry["latency_mean_s"] = row[self._TOTAL] / calls if calls else 0.0
+            entry["latency_max_s"] = row[self._MAX]
+            entry["latency_histogram"] = dict(zip(bounds, row[self._BUCKETS:]))
+            report[model] = entry
+        return report
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.clear()
+
+
+# Process-wide metrics for every VerifiedScientificModel
+MODEL_METRICS = ModelMetrics()
+
+
+def _compile_argument_checks(
+    sig: inspect.Signature,
+) -> Tuple[List[Optional[Tuple[str, type]]], Dict[str, type]]:
+    """Expected types for positional slots and keyword names of ``sig``.
+
+    Mirrors the per-call check on ``sig.bind_partial``: ``Any``, non-class
+    annotations and ``*args``/``**kwargs`` are not checked, and generic
+    aliases are checked against their origin (``list[float]`` -> ``list``).
+    """
+    positional: List[Optional[Tuple[str, type]]] = []
+    keyword: Dict[str, type] = {}
+    for name, param in sig.parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        ann = param.annotation
+        expected = getattr(ann, "__origin__", None) or ann
+        if ann is inspect._empty or ann is Any or not isinstance(expected, type):
+            expected = None
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            positional.append((name, expected) if expected else None)
+        if expected and param.kind != param.POSITIONAL_ONLY:
+            keyword[name] = expected
+    return positional, keyword
+
+
 def VerifiedScientificModel(
     citation_uri: str,
     assumptions: str,
@@ -55,15 +220,21 @@ def VerifiedScientificModel(
     strict_verification_mode: bool = False,
     value_bounds: Optional[Tuple[float, float]] = None,
 ) -> Callable:
-    """Decorator enforcing scientific metadata and runtime checks."""
+    """Decorator enforcing scientific metadata and runtime checks.
+
+    Every call is timed and counted in :data:`MODEL_METRICS`; how much is
+    checked per call depends on :class:`VerificationSettings`.
+    """
 
     def decorator(func: Callable) -> Callable:
+        model_id = f"{func.__module__}.{func.__qualname__}"
         meta = {
             "citation_uri": citation_uri,
             "assumptions": assumptions,
             "validation_notes": validation_notes,
             "approximation": approximation,
             "last_validation": None,
+            "model_id": model_id,
         }
         func._scientific_model = meta
         SCIENTIFIC_REGISTRY.append((func, meta))
@@ -77,49 +248,85 @@ def VerifiedScientificModel(
                         f"{func.__name__} docstring missing {field}"
                     )
 
-        sig = inspect.signature(func)
+        positional_checks, keyword_checks = _compile_argument_checks(inspect.signature(func))
+        call_counter = itertools.count()
+        settings = VerificationSettings
+        record = MODEL_METRICS.record
+
+        def check_arguments(args: tuple, kwargs: Dict[str, Any]) -> int:
+            mismatches = []
+            for check, val in zip(positional_checks, args):
+                if check is not None and not isinstance(val, check[1]):
+                    mismatches.append((check[0], check[1], val))
+            for name, val in kwargs.items():
+                expected = keyword_checks.get(name)
+                if expected is not None and not isinstance(val, expected):
+                    mismatches.append((name, expected, val))
+            for name, expected, val in mismatches:
+                msg = f"Parameter {name} expected {expected}, got {type(val)}"
+                logging.critical(msg)
+                if strict_verification_mode:
+                    raise ScientificVerificationError(msg)
+            return len(mismatches)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            bound = sig.bind_partial(*args, **kwargs)
-            for name, val in bound.arguments.items():
-                ann = sig.parameters[name].annotation
-                if ann is not inspect._empty:
-                    if ann is Any:
-                        continue
-                    expected = ann
-                    origin = getattr(ann, "__origin__", None)
-                    if origin is not None:
-                        expected = origin
-                    if isinstance(expected, type) and not isinstance(val, expected):
-                        msg = f"Parameter {name} expected {expected}, got {type(val)}"
-                        logging.critical(msg)
-                        if strict_verification_mode:
-                            raise ScientificVerificationError(msg)
+            production = settings.production
+            checked = (
+                not production
+                or strict_verification_mode
+                or (settings.stride and next(call_counter) % settings.stride == 0)
+            )
+            mismatches = 0
+            if checked:
+                try:
+                    mismatches = check_arguments(args, kwargs)
+                except ScientificVerificationError:
+                    record(model_id, 0.0, checked=True, failed=True, type_mismatches=1)
+                    raise
+            start = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
             except Exception as exc:  # pragma: no cover - runtime check
+                record(
+                    model_id,
+                    time.perf_counter() - start,
+                    checked=bool(checked),
+                    failed=True,
+                    type_mismatches=mismatches,
+                )
                 logging.critical(f"{func.__name__} execution failed: {exc}")
-                if strict_verification_mode:
-                    raise
                 raise
-
-            value = None
-            if isinstance(result, dict) and "value" in result:
-                value = result["value"]
-            elif isinstance(result, (int, float)):
-                value = result
-            if value_bounds is not None and value is not None:
-                low, high = value_bounds
-                if not (low <= value <= high):
-                    msg = f"{func.__name__} result {value} out of bounds {value_bounds}"
-                    logging.critical(msg)
-                    if strict_verification_mode:
-                        raise ScientificVerificationError(msg)
-            meta["last_validation"] = 1.0
-            logging.info(
-                f"VerifiedScientificModel executed: {func.__name__}",
+            latency = time.perf_counter() - start
+
+            out_of_bounds = False
+            if value_bounds is not None:
+                value = None
+                if isinstance(result, dict) and "value" in result:
+                    value = result["value"]
+                elif isinstance(result, (int, float)):
+                    value = result
+                if value is not None:
+                    low, high = value_bounds
+                    if not (low <= value <= high):
+                        out_of_bounds = True
+                        msg = f"{func.__name__} result {value} out of bounds {value_bounds}"
+                        logging.critical(msg)
+            record(
+                model_id,
+                latency,
+                checked=bool(checked),
+                out_of_bounds=out_of_bounds,
+                type_mismatches=mismatches,
             )
+            if out_of_bounds and strict_verification_mode:
+                raise ScientificVerificationError(msg)
+            if checked:
+                meta["last_validation"] = 1.0
+            if not production:
+                logging.info(
+                    f"VerifiedScientificModel executed: {func.__name__}",
+                )
             return result
 
         return wrapper
@@ -426,6 +633,57 @@ def calculate_genesis_bonus_decay(
     return Decimal("1") - Decimal(years_passed) / decay_years
 
 
+@VerifiedScientificModel(
+    citation_uri="https://en.wikipedia.org/wiki/Exponential_decay",
+    assumptions="linear decay to zero after ``decay_years`` years",
+    validation_notes="unit tests compare against calculate_genesis_bonus_decay",
+    approximation="exact",
+)
+@ScientificModel(source="Linear decay", model_type="time-decay", approximation="exact")
+def calculate_genesis_bonus_decay_many(
+    join_times: List[Optional[datetime.datetime]],
+    decay_years: int,
+    now: Optional[datetime.datetime] = None,
+) -> List[Decimal]:
+    """Batch form of :func:`calculate_genesis_bonus_decay`.
+
+    All weights are measured against a single ``now`` so a bulk update sees
+    one consistent clock, and the per-call decorator overhead is paid once.
+
+    Parameters
+    ----------
+    join_times:
+        Join ``datetime`` per user; ``None`` keeps the full bonus.
+    decay_years:
+        Number of years until the weight decays completely.
+    now:
+        Reference time. Defaults to :func:`now_utc`.
+
+    Returns
+    -------
+    list of Decimal
+        Weights in ``[0, 1]`` aligned with ``join_times``.
+
+    citation_uri: https://en.wikipedia.org/wiki/Exponential_decay
+    assumptions: linear decay to zero after ``decay_years`` years
+    validation_notes: unit tests compare against calculate_genesis_bonus_decay
+    approximation: exact
+    """
+    now = now or now_utc()
+    seconds_per_year = 365.25 * 24 * 3600
+    weights = []
+    for join_time in join_times:
+        if join_time is None:
+            weights.append(Decimal("1"))
+            continue
+        years_passed = (now - join_time).total_seconds() / seconds_per_year
+        if years_passed >= decay_years:
+            weights.append(Decimal("0"))
+        else:
+            weights.append(Decimal("1") - Decimal(years_passed) / decay_years)
+    return weights
+
+
 @VerifiedScientificModel(
     citation_uri="https://en.wikipedia.org/wiki/Exponential_decay",
     assumptions="half-life approximated at 69 days; requires numpy and matplotlib",
@@ -0,0 +1,99 @@
+# STRICTLY A SOCIAL MEDIA PLATFORM
+# Intellectual Property & Artistic Inspiration
+# Legal & Ethical Safeguards
+"""Micro-benchmark for batched consensus aggregation.
+
+Compares calling ``aggregate_validator_votes`` once per hypothesis with a
+single ``aggregate_many`` call over the same synthetic votes, and checks
+that both produce identical results. Only ``weighted_average`` is batched;
+``aggregate_many`` runs the other methods per hypothesis, so they measure
+about 1x.
+
+Usage::
+
+    python scripts/bench_aggregate_many.py [--hypotheses N] [--votes N] [--method NAME]
+"""
+import argparse
+import logging
+import pathlib
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from validators.strategies.voting_consensus_engine import (  # noqa: E402
+    VotingMethod,
+    aggregate_many,
+    aggregate_validator_votes,
+)
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _batch(hypotheses: int, votes: int, validators: int) -> dict:
+    rng = random.Random(0)
+    stamps = [(NOW - timedelta(minutes=m)).isoformat() for m in range(0, 90 * 1440, 7)]
+    return {
+        f"h{h}": [
+            {
+                "validator_id": f"v{rng.randrange(validators)}",
+                "score": rng.random(),
+                "confidence": rng.random(),
+                "decision": rng.choice(["approve", "reject", "abstain"]),
+                "credits": rng.randrange(1, 10),
+                "ranking": rng.sample(["a", "b", "c", "d"], 3),
+                "timestamp": rng.choice(stamps),
+            }
+            for _ in range(votes)
+        ]
+        for h in range(hypotheses)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hypotheses", type=int, default=20000)
+    parser.add_argument("--votes", type=int, default=8)
+    parser.add_argument("--validators", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    parser.add_argument(
+        "--method", default="weighted_average", choices=["all"] + [m.value for m in VotingMethod]
+    )
+    args = parser.parse_args()
+    logging.getLogger("superNova_2177.voting").disabled = True
+
+    batch = _batch(args.hypotheses, args.votes, args.validators)
+    rng = random.Random(1)
+    reputations = {f"v{i}": rng.random() for i in range(args.validators)}
+    methods = list(VotingMethod) if args.method == "all" else [VotingMethod(args.method)]
+
+    def timed(fn):
+        best, result = float("inf"), None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    for method in methods:
+        per_call, single = timed(
+            lambda: {
+                h: aggregate_validator_votes(votes, method, reputations, current_time=NOW)
+                for h, votes in batch.items()
+            }
+        )
+        batched, many = timed(
+            lambda: aggregate_many(batch, method, reputations, current_time=NOW)
+        )
+
+        status = "ok" if many == single else "MISMATCH"
+        print(
+            f"{method.value:20s} per-hypothesis {per_call:7.2f}s  "
+            f"aggregate_many {batched:6.2f}s  x{per_call / batched:5.1f}  {status}"
+        )
+
+
+if __name__ == "__main__":
+    main()
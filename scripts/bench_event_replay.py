@@ -0,0 +1,100 @@
+# STRICTLY A SOCIAL MEDIA PLATFORM
+# Intellectual Property & Artistic Inspiration
+# Legal & Ethical Safeguards
+"""Micro-benchmark for applying event batches through ``SQLAlchemyStorage``.
+
+Each synthetic event does what the karma handlers do: read a user row,
+adjust it and write it back.  The per-call mode opens a session and commits
+for every storage call, as event application did before; the batched modes
+wrap ``--batch`` events in one :meth:`SQLAlchemyStorage.unit_of_work`, either
+with a savepoint per event (``RemixAgent.process_events``) or without
+(``RemixAgent.load_state`` replay).
+
+Usage::
+
+    python scripts/bench_event_replay.py [--events N] [--users N] [--batch N]
+"""
+import argparse
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import db_models  # noqa: E402
+from superNova_2177 import SQLAlchemyStorage  # noqa: E402
+
+
+def _storage(path: pathlib.Path, users: int) -> SQLAlchemyStorage:
+    engine = create_engine(f"sqlite:///{path}")
+    db_models.Base.metadata.create_all(engine)
+    storage = SQLAlchemyStorage(sessionmaker(bind=engine))
+    with storage.unit_of_work():
+        for i in range(users):
+            storage.set_user(
+                f"user{i}",
+                {"email": f"user{i}@example.com", "hashed_password": "x", "karma_score": 0.0},
+            )
+    return storage
+
+
+def _apply(storage: SQLAlchemyStorage, name: str) -> None:
+    user = storage.get_user(name)
+    storage.set_user(name, {"karma_score": user["karma_score"] + 1.0})
+
+
+def run_per_call(storage: SQLAlchemyStorage, events: list) -> None:
+    for name in events:
+        _apply(storage, name)
+
+
+def run_batched(
+    storage: SQLAlchemyStorage, events: list, batch: int, savepoints: bool
+) -> None:
+    for start in range(0, len(events), batch):
+        with storage.unit_of_work():
+            for name in events[start : start + batch]:
+                if savepoints:
+                    with storage.savepoint():
+                        _apply(storage, name)
+                else:
+                    _apply(storage, name)
+
+
+def _rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - start)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    events = [f"user{rng.randrange(args.users)}" for _ in range(args.events)]
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = _storage(pathlib.Path(tmp) / "a.db", args.users)
+        per_call = _rate(lambda: run_per_call(storage, events), len(events))
+        rates = {"per-call": per_call}
+        for label, savepoints in (("savepoint", True), ("replay", False)):
+            storage = _storage(pathlib.Path(tmp) / f"{label}.db", args.users)
+            rates[label] = _rate(
+                lambda: run_batched(storage, events, args.batch, savepoints), len(events)
+            )
+    print(f"{'mode':>10} {'events/s':>10} {'speedup':>8}")
+    for label, rate in rates.items():
+        print(f"{label:>10} {rate:>10.0f} {rate / per_call:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+# STRICTLY A SOCIAL MEDIA PLATFORM
+# Intellectual Property & Artistic Inspiration
+# Legal & Ethical Safeguards
+"""Micro-benchmark for blocklist scanning on event payloads.
+
+Compares the previous per-pattern regex loop plus word x keyword Levenshtein
+scan against the :class:`moderation_utils.BlockMatcher` and symmetric-delete
+:class:`moderation_utils.FuzzyKeywordIndex` used by ``HarmonyScanner`` and
+``Vaccine``.  Every event carries fresh random words, so the per-word lookup
+cache never hits and the numbers are a worst case for the indexed scan.
+
+Usage::
+
+    python scripts/bench_harmony_scanner.py [--events N] [--sizes 10,100,1000]
+"""
+import argparse
+import json
+import pathlib
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from moderation_utils import (  # noqa: E402
+    BlockMatcher,
+    FuzzyKeywordIndex,
+    bounded_levenshtein,
+    literal_keyword,
+    tokenize,
+)
+
+THRESHOLD = 2
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(6, 12)))
+
+
+def _events(rng: random.Random, n: int) -> list:
+    return [
+        json.dumps(
+            {
+                "event": "ADD_COMMENT",
+                "user": f"user{rng.randint(0, 500)}",
+                "content": " ".join(_word(rng) for _ in range(12)),
+                "timestamp": "2025-01-01T00:00:00Z",
+                "nonce": f"{rng.getrandbits(64):x}",
+            }
+        )
+        for _ in range(n)
+    ]
+
+
+def scan_naive(patterns: list, keywords: list, text: str) -> bool:
+    lower = text.lower()
+    for pat in patterns:
+        if pat.search(lower):
+            return False
+    for word in set(re.split(r"\W+", lower)):
+        if len(word) > 2:
+            for keyword in keywords:
+                if bounded_levenshtein(word, keyword, THRESHOLD) <= THRESHOLD:
+                    return False
+    return True
+
+
+def scan_indexed(matcher: BlockMatcher, index: FuzzyKeywordIndex, text: str) -> bool:
+    lower = text.lower()
+    tokens = tokenize(lower)
+    if matcher.search(lower, tokens):
+        return False
+    return index.find(lower, tokens) is None
+
+
+def _rate(fn, events: list) -> float:
+    start = time.perf_counter()
+    for text in events:
+        fn(text)
+    return len(events) / (time.perf_counter() - start)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--sizes", default="10,100,1000,5000")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    events = _events(rng, args.events)
+    print(f"{'terms':>8} {'naive ev/s':>12} {'indexed ev/s':>14} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        block = [rf"\b({_word(rng)}x{i})\b" for i in range(size)]
+        keywords = [k for k in map(literal_keyword, block) if k]
+        naive_patterns = [re.compile(p, re.IGNORECASE) for p in block]
+        matcher = BlockMatcher(block)
+        index = FuzzyKeywordIndex(keywords, THRESHOLD)
+
+        naive_events = events[: max(20, args.events * 10 // max(size, 10))]
+        naive = _rate(lambda t: scan_naive(naive_patterns, keywords, t), naive_events)
+        indexed = _rate(lambda t: scan_indexed(matcher, index, t), events)
+        print(f"{size:>8} {naive:>12.0f} {indexed:>14.0f} {indexed / naive:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
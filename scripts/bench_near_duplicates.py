@@ -0,0 +1,103 @@
+# STRICTLY A SOCIAL MEDIA PLATFORM
+# Intellectual Property & Artistic Inspiration
+# Legal & Ethical Safeguards
+"""Benchmark for near-duplicate candidate generation on large note batches.
+
+Builds synthetic validation notes in which a share are edited copies of
+earlier notes (an appended objection, a swapped word, an inserted "not"),
+then times ``NearDuplicateIndex.for_edit_ratio`` and the indexed
+``detect_semantic_contradictions`` path. A smaller batch is also run through
+the exact all-pairs path to report recall.
+
+Usage::
+
+    python scripts/bench_near_duplicates.py [--notes N] [--check N] [--threshold R]
+"""
+import argparse
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import diversity_analyzer  # noqa: E402
+from near_duplicate_index import NearDuplicateIndex  # noqa: E402
+
+COMMON = (
+    "the a of and to in is that it for on with as was this by be are from at or an "
+    "we our results data sample effect model signal trial dose response group control "
+    "measured observed increase decrease significant replication method analysis bias "
+    "error evidence claim support weak strong consistent baseline cohort variance"
+).split()
+OBJECTIONS = [" but we disagree", " we refute it", " not replicated", " however this is false"]
+
+
+def _notes(count: int, seed: int = 0, duplicates: float = 0.2) -> list:
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    rare = ["".join(rng.choice(letters) for _ in range(rng.randrange(4, 10))) for _ in range(5000)]
+    vocab = COMMON + rare
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    notes = []
+    for _ in range(count):
+        if notes and rng.random() < duplicates:
+            words = rng.choice(notes).split()
+            edit = rng.random()
+            if edit < 0.5:
+                notes.append(" ".join(words) + rng.choice(OBJECTIONS))
+                continue
+            if edit < 0.8:
+                words[rng.randrange(len(words))] = rng.choices(vocab, weights)[0]
+            else:
+                words.insert(rng.randrange(len(words) + 1), "not")
+        else:
+            words = rng.choices(vocab, weights, k=rng.randrange(6, 20))
+        notes.append(" ".join(words))
+    return [{"validator_id": f"v{i}", "note": note} for i, note in enumerate(notes)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--check", type=int, default=3000, help="notes in the recall check")
+    parser.add_argument("--threshold", type=float, default=0.7)
+    args = parser.parse_args()
+
+    validations = _notes(args.notes)
+    texts = list(dict.fromkeys(v["note"].lower() for v in validations))
+
+    start = time.perf_counter()
+    index = NearDuplicateIndex.for_edit_ratio(texts, args.threshold)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    candidates = sum(1 for _ in index.iter_candidate_pairs())
+    streamed = time.perf_counter() - start
+    pairs = len(texts) * (len(texts) - 1) // 2
+    print(
+        f"{len(texts)} notes  {index.bands}x{index.rows} bands  index {built:.1f}s  "
+        f"stream {streamed:.1f}s  {candidates} candidates ({candidates / pairs:.2e} of pairs)"
+    )
+
+    start = time.perf_counter()
+    found = diversity_analyzer.detect_semantic_contradictions(validations, args.threshold)
+    print(f"detect_semantic_contradictions {time.perf_counter() - start:.1f}s  {len(found)} contradictions")
+
+    sample = _notes(args.check, seed=1)
+    limit = diversity_analyzer.Config.NEAR_DUPLICATE_EXACT_LIMIT
+    diversity_analyzer.Config.NEAR_DUPLICATE_EXACT_LIMIT = len(sample) + 1
+    try:
+        exact = diversity_analyzer.detect_semantic_contradictions(sample, args.threshold)
+    finally:
+        diversity_analyzer.Config.NEAR_DUPLICATE_EXACT_LIMIT = 0
+    try:
+        indexed = diversity_analyzer.detect_semantic_contradictions(sample, args.threshold)
+    finally:
+        diversity_analyzer.Config.NEAR_DUPLICATE_EXACT_LIMIT = limit
+    key = lambda found: {tuple(c["validators"]) for c in found}  # noqa: E731
+    recall = len(key(exact) & key(indexed)) / max(len(exact), 1)
+    print(f"recall on {len(sample)} notes: {recall:.3f} ({len(indexed)} of {len(exact)} contradictions)")
+
+
+if __name__ == "__main__":
+    main()
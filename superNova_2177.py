@@ -256,7 +256,7 @@ import unittest
 import uuid
 import weakref
 from collections import Counter, defaultdict, deque
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
 from decimal import (ROUND_FLOOR, ROUND_HALF_UP, Decimal, InvalidOperation,
@@ -506,6 +506,8 @@ from prometheus_client import REGISTRY
 
 import db_models
 from causal_graph import InfluenceGraph
+from causal_graph.centrality import centrality_engine
+from causal_graph.graph_cache import influence_graph_cache
 from config import Config
 from db_models import (AIPersona, Base, BranchVote, Coin, Comment,
                        CreativeGuild, Event, Group, GuinnessClaim, Harmonizer,
@@ -518,16 +520,19 @@ from db_models import (AIPersona, Base, BranchVote, Coin, Comment,
 from governance_config import calculate_entropy_divergence, quantum_consensus
 from quantum_sim import QuantumContext
 from scientific_metrics import (analyze_prediction_accuracy,
-                                build_causal_graph, calculate_influence_score,
                                 calculate_interaction_entropy,
                                 design_validation_experiments,
+                                interaction_entropy_scores,
                                 generate_system_predictions,
                                 predict_user_interactions, query_influence)
 from scientific_utils import (
+    MODEL_METRICS,
     SCIENTIFIC_REGISTRY,
+    VerificationSettings,
     ScientificModel,
     VerifiedScientificModel,
     calculate_genesis_bonus_decay,
+    calculate_genesis_bonus_decay_many,
     estimate_uncertainty,
     generate_hypotheses,
     refine_hypotheses_from_evidence,
@@ -538,7 +543,9 @@ from scientific_utils import (
 # Database engine URL resolved at runtime
 DB_ENGINE_URL = None
 from hook_manager import HookManager
-from prediction_manager import PredictionManager
+from moderation_utils import (BlockMatcher, FuzzyKeywordIndex, literal_keyword,
+                              tokenize)
+from prediction_manager import PredictionManager, migrate_legacy_records
 from resonance_music import generate_midi_from_metrics
 
 try:  # pragma: no cover - optional dependency may not be available
@@ -978,22 +985,8 @@ class TokenData(BaseModel):
 
 
 # --- MODULE: services.py ---
-class SystemStateService:
-    def __init__(self, db: Session):
-        self.db = db
-
-    def get_state(self, key: str, default: str) -> str:
-        state = self.db.query(SystemState).filter(SystemState.key == key).first()
-        return state.value if state else default
-
-    def set_state(self, key: str, value: str):
-        state = self.db.query(SystemState).filter(SystemState.key == key).first()
-        if state:
-            state.value = value
-        else:
-            state = SystemState(key=key, value=value)
-            self.db.add(state)
-        self.db.commit()
+# Cached, write-through SystemState access with batched increments
+from system_state_utils.state_service import SystemStateService
 
 
 class GenerativeAIService:
@@ -1178,28 +1171,8 @@ def detailed_error_log(exc: Exception) -> str:
     return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
 
 
-# Minimal logchain implementation used during tests. The real system may
-# provide a more robust version, but unit tests only rely on a handful of
-# methods.  Keeping it lightweight avoids optional dependencies and complex
-# state management.
-class LogChain:
-    """Simple in-memory event log used for testing."""
-
-    def __init__(self, filename: str) -> None:
-        self.filename = filename
-        self.entries: list[Dict[str, Any]] = []
-
-    def add(self, event: Dict[str, Any]) -> None:
-        self.entries.append(event)
-
-    def replay_events(
-        self, apply: Callable[[Dict[str, Any]], None], since: Any | None = None
-    ) -> None:
-        for event in self.entries:
-            apply(event)
-
-    def verify(self) -> bool:  # pragma: no cover - simple always-true stub
-        return True
+# Segment-file event log with indexed replay; see :mod:`logchain`.
+from logchain import LogChain
 
 
 async def async_add_event(logchain: "LogChain", event: Dict[str, Any]) -> None:
@@ -1452,7 +1425,7 @@ def simulate_social_entanglement(
     denote influence probability. The influence value is derived via a path
     probability computation similar to methods used in causal inference.
     """
-    graph = build_causal_graph(db)
+    graph = influence_graph_cache.get(db)
     influence = query_influence(graph, user1_id, user2_id)
     return {
         "source": user1_id,
@@ -1681,11 +1654,17 @@ class Config:
     )  # Add supported emojis
     DAILY_DECAY: Decimal = Decimal("0.99")
     SNAPSHOT_INTERVAL: int = 100
+    LOGCHAIN_SEGMENT_BYTES: int = 64 * 1024 * 1024
+    LOGCHAIN_INDEX_INTERVAL: int = 256
+    EVENT_BATCH_SIZE: int = 500
+    BULK_UPDATE_CHUNK_SIZE: int = 5000
     MAX_INPUT_LENGTH: int = 10000
     VAX_PATTERNS: Dict[str, List[str]] = field(
         default_factory=lambda: {"block": [r"\b(blocked_word)\b"]}
     )
     VAX_FUZZY_THRESHOLD: int = 2
+    VAX_FUZZY_EXACT_MAX_LEN: int = 4  # keywords this short must match exactly
+    VAX_FUZZY_ONE_EDIT_MAX_LEN: int = 8  # ...and up to this long, within one edit
     REACTOR_KARMA_PER_REACT: Decimal = Decimal("1")
     CREATOR_KARMA_PER_REACT: Decimal = Decimal("2")
     SNAPSHOT_INTERVAL: int = 100
@@ -1737,12 +1716,25 @@ class Config:
     PROPOSAL_LIFECYCLE_INTERVAL_SECONDS: int = 300
     NONCE_CLEANUP_INTERVAL_SECONDS: int = 3600
     NONCE_EXPIRATION_SECONDS: int = 86400
+    NONCE_SLOT_SECONDS: int = 60
+    NONCE_BLOOM_BITS: int = 0
+    HOOK_DISPATCH_ASYNC: bool = True
+    HOOK_QUEUE_SIZE: int = 10000
+    HOOK_TIMEOUT_SECONDS: float = 5.0
+    HOOK_SUBMIT_TIMEOUT_SECONDS: float = 0.1
+    HOOK_WORKERS_PER_HOOK: int = 2
     CONTENT_ENTROPY_UPDATE_INTERVAL_SECONDS: int = 600
     NETWORK_CENTRALITY_UPDATE_INTERVAL_SECONDS: int = 3600
+    NETWORK_CENTRALITY_FULL_RESYNC_SECONDS: int = 86400
+    CAUSAL_GRAPH_CACHE_TTL_SECONDS: int = 3600
+    CAUSAL_GRAPH_PUBLISH_INTERVAL_SECONDS: float = 5.0
+    CAUSAL_GRAPH_SNAPSHOT_INTERVAL_SECONDS: int = 900
     PROACTIVE_INTERVENTION_INTERVAL_SECONDS: int = 3600
     AI_PERSONA_EVOLUTION_INTERVAL_SECONDS: int = 86400
     GUINNESS_PURSUIT_INTERVAL_SECONDS: int = 86400 * 3
     SCIENTIFIC_REASONING_CYCLE_INTERVAL_SECONDS: int = 3600
+    PREDICTION_VALIDATION_BATCH_SIZE: int = 500
+    PREDICTION_BIAS_HISTORY: int = 200
     ADAPTIVE_OPTIMIZATION_INTERVAL_SECONDS: int = 3600
     ANNUAL_AUDIT_INTERVAL_SECONDS: int = 86400 * 365
     METRICS_PORT: int = int(os.environ.get("METRICS_PORT", "8001"))
@@ -1941,18 +1933,20 @@ class Coin:
 
 # --- MODULE: harmony_scanner.py ---
 class HarmonyScanner:
-    """Scans content for harmony, using regex and ML-based fuzzy matching."""
+    """Scans content for harmony, using regex and ML-based fuzzy matching.
+
+    Block patterns are matched by an immutable
+    :class:`moderation_utils.BlockMatcher` and fuzzy keywords live in a
+    :class:`moderation_utils.FuzzyKeywordIndex`, so the scan path takes no
+    lock and its cost does not grow with the blocklist.
+    Call :meth:`update_patterns` to swap in a new blocklist atomically.
+    """
 
     def __init__(self, config: Config):
         self.config = config
         self.lock = threading.RLock()
         self.block_counts = defaultdict(int)
-        self.compiled_patterns = [
-            re.compile(p, re.IGNORECASE) for p in config.VAX_PATTERNS.get("block", [])
-        ]
-        self.fuzzy_keywords = [
-            p.strip(r"\b") for p in config.VAX_PATTERNS.get("block", []) if r"\b" in p
-        ]
+        self.update_patterns(config.VAX_PATTERNS.get("block", []))
         self._block_queue = queue.Queue()
         self._block_writer_thread = threading.Thread(
             target=self._block_writer_loop, daemon=True
@@ -1968,32 +1962,45 @@ class HarmonyScanner:
         else:
             self.embedding_model = None
 
+    def update_patterns(self, patterns: List[str]) -> None:
+        """Recompile the blocklist; concurrent scans keep using the old one."""
+        matcher = BlockMatcher(patterns)
+        keywords = [k for k in map(literal_keyword, patterns) if k]
+        index = FuzzyKeywordIndex(
+            keywords,
+            self.config.VAX_FUZZY_THRESHOLD,
+            length_scaled=True,
+            exact_max_len=self.config.VAX_FUZZY_EXACT_MAX_LEN,
+            one_edit_max_len=self.config.VAX_FUZZY_ONE_EDIT_MAX_LEN,
+        )
+        # Publish both structures with a single reference assignment.
+        self._matchers = (matcher, index)
+
+    @property
+    def fuzzy_keywords(self) -> List[str]:
+        """Keywords extracted from ``\\b(word)\\b`` block patterns."""
+        return self._matchers[1].keywords
+
     def scan(self, text: str) -> bool:
         """Scan text for dissonant content."""
         lower_text = text.lower()
-        with self.lock:
-            for pat in self.compiled_patterns:
-                if pat.search(lower_text):
-                    self._log_block("block", pat.pattern, text)
-                    raise DissonantContentError(
-                        f"Content blocked: matches '{pat.pattern}'."
-                    )
-            # Fuzzy with Levenshtein
-            words = set(re.split(r"\W+", lower_text))
-            for word in words:
-                if len(word) > 2:
-                    for keyword in self.fuzzy_keywords:
-                        if (
-                            levenshtein_distance(word, keyword)
-                            <= self.config.VAX_FUZZY_THRESHOLD
-                        ):
-                            self._log_block("fuzzy", keyword, text)
-                            raise DissonantContentError(
-                                f"Fuzzy match: '{word}' close to '{keyword}'."
-                            )
-            # ML enhancement: embed and compare cosine similarity
-            if self._ml_detect_dissonance(text):
-                raise DissonantContentError("ML detected dissonance.")
+        matcher, index = self._matchers
+        tokens = tokenize(lower_text)
+        if matcher.search(lower_text, tokens):
+            pattern = matcher.first_match(lower_text)
+            self._log_block("block", pattern, text)
+            raise DissonantContentError(f"Content blocked: matches '{pattern}'.")
+        # Fuzzy with Levenshtein
+        hit = index.find(lower_text, tokens)
+        if hit is not None:
+            word, keyword = hit
+            self._log_block("fuzzy", keyword, text)
+            raise DissonantContentError(
+                f"Fuzzy match: '{word}' close to '{keyword}'."
+            )
+        # ML enhancement: embed and compare cosine similarity
+        if self._ml_detect_dissonance(text):
+            raise DissonantContentError("ML detected dissonance.")
         return True
 
     def _ml_detect_dissonance(self, text: str) -> bool:
@@ -2011,7 +2018,8 @@ class HarmonyScanner:
 
     def _log_block(self, level: str, pattern: str, text: str):
         """Log blocked content."""
-        self.block_counts[level] += 1
+        with self.lock:
+            self.block_counts[level] += 1
         snippet = text[:100]
         log_entry = (
             json.dumps(
@@ -2107,8 +2115,12 @@ class CosmicNexus:
                 db.add(vibenode)
                 db.commit()
                 # Reduce entropy
-                new_entropy = system_entropy - Config.ENTROPY_INTERVENTION_STEP
-                self.state_service.set_state("system_entropy", str(new_entropy))
+                self.state_service.decrement(
+                    "system_entropy",
+                    Config.ENTROPY_INTERVENTION_STEP,
+                    default=str(Config.SYSTEM_ENTROPY_BASE),
+                )
+                self.state_service.flush()
         finally:
             db.close()
 
@@ -2405,6 +2417,10 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Starlette 1.0 dropped startup/shutdown handlers; the router's lifespan
+    # context is the one hook every version runs.
+    if hasattr(app, "router"):
+        app.router.lifespan_context = influence_graph_lifespan
 
     return app
 
@@ -2424,24 +2440,6 @@ def get_db():
         db.close()
 
 
-class SystemStateService:
-    def __init__(self, db: Session):
-        self.db = db
-
-    def get_state(self, key: str, default: str) -> str:
-        state = self.db.query(SystemState).filter(SystemState.key == key).first()
-        return state.value if state else default
-
-    def set_state(self, key: str, value: str):
-        state = self.db.query(SystemState).filter(SystemState.key == key).first()
-        if state:
-            state.value = value
-        else:
-            state = SystemState(key=key, value=value)
-            self.db.add(state)
-        self.db.commit()
-
-
 class MusicGeneratorService:
     def __init__(self, db: Session, user: Harmonizer):
         self.db = db
@@ -2474,7 +2472,11 @@ def get_current_active_user(current_user: Harmonizer = Depends(get_current_user)
 
 
 def get_system_state_service(db: Session = Depends(get_db)):
-    return SystemStateService(db)
+    service = SystemStateService(db)
+    try:
+        yield service
+    finally:
+        service.close()
 
 
 def get_config_value(db: Session, key: str, default: Any) -> Any:
@@ -2564,9 +2566,8 @@ def get_user_influence_score(
     db: Session = Depends(get_db),
     current_user: Harmonizer = Depends(get_current_active_user),
 ):
-    graph = build_causal_graph(db)
-    score = calculate_influence_score(graph.graph, current_user.id)
-    current_user.network_centrality = float(score)
+    score = influence_graph_cache.influence_score(db, current_user.id)
+    current_user.network_centrality = float(score["value"])
     db.commit()
     return {"influence_score": score}
 
@@ -2609,6 +2610,12 @@ def follow_unfollow_user(
         current_user.following.append(user_to_follow)
         message = "Followed"
     db.commit()
+    centrality_engine.apply_follow_delta(
+        current_user.id, user_to_follow.id, following=message == "Followed"
+    )
+    influence_graph_cache.record_follow(
+        current_user.id, user_to_follow.id, following=message == "Followed"
+    )
     return {"message": message}
 
 
@@ -2689,6 +2696,7 @@ def remix_vibenode(
     db.add(clone)
     db.commit()
     db.refresh(clone)
+    influence_graph_cache.record_remix(current_user.id, parent.author_id)
 
     last_entry = db.query(LogEntry).order_by(LogEntry.id.desc()).first()
     prev_hash = last_entry.current_hash if last_entry else ""
@@ -2895,21 +2903,32 @@ def run_validation_cycle() -> None:
 
 @app.get("/api/epistemic-audit", tags=["System"])
 def epistemic_audit():
-    """Return JSON catalog of all models with citation and last validation."""
+    """Return JSON catalog of all models with citation, last validation and
+    per-model call metrics from ``MODEL_METRICS``."""
+    metrics = MODEL_METRICS.snapshot()
     catalog = []
     for func, meta in SCIENTIFIC_REGISTRY:
         entry = {"name": func.__name__}
         entry.update(meta)
+        if "model_id" in meta:
+            entry["metrics"] = metrics.get(meta["model_id"])
         catalog.append(entry)
-    return {"models": catalog}
+    return {
+        "models": catalog,
+        "metrics": metrics,
+        "verification": {
+            "production": VerificationSettings.production,
+            "sample_rate": VerificationSettings.sample_rate,
+        },
+    }
 
 
 @app.get("/api/global-epistemic-state", tags=["System"])
 def global_epistemic_state(db: Session = Depends(get_db)):
     """Return a summary of the agent's epistemic state."""
-    graph = build_causal_graph(db)
+    graph = influence_graph_cache.get(db)
     users = db.query(Harmonizer).limit(5).all()
-    scores = [calculate_influence_score(graph.graph, u.id)["value"] for u in users]
+    scores = [influence_graph_cache.influence_score(db, u.id)["value"] for u in users]
     uncertainty = estimate_uncertainty({"value": sum(scores)}, scores)
     obs = {u.id: s for u, s in zip(users, scores)}
     hypotheses = generate_hypotheses(obs, graph) if scores else []
@@ -2985,14 +3004,14 @@ def resonance_summary(db: Session = Depends(get_db)):
 @app.get("/api/adaptive-config-status", tags=["System"])
 def adaptive_config_status(db: Session = Depends(get_db)):
     """Return current configuration overrides applied by the optimizer."""
-    rows = db.query(SystemState).filter(SystemState.key.like("config_override:%")).all()
+    rows = SystemStateService(db).scan_prefix("config_override:")
     overrides = {}
-    for r in rows:
-        key = r.key.split("config_override:", 1)[1]
+    for full_key, value in rows.items():
+        key = full_key.split("config_override:", 1)[1]
         try:
-            overrides[key] = json.loads(r.value)
+            overrides[key] = json.loads(value)
         except Exception:
-            overrides[key] = r.value
+            overrides[key] = value
     return {"overrides": overrides}
 
 
@@ -3142,10 +3161,7 @@ def create_vibenode(
     current_user.creative_spark = str(
         Decimal(current_user.creative_spark) + creator_share
     )
-    current_wellspring = Decimal(state_service.get_state("community_wellspring", "0.0"))
-    state_service.set_state(
-        "community_wellspring", str(current_wellspring + treasury_share)
-    )
+    state_service.increment("community_wellspring", treasury_share, default="0.0")
     parent_depth = 0
     if vibenode.parent_vibenode_id:
         parent = (
@@ -3181,8 +3197,11 @@ def create_vibenode(
     db.commit()
     db.refresh(db_vibenode)
     # Reduce system entropy by injecting negentropy
-    new_entropy = Decimal(system_entropy) - Decimal(str(Config.ENTROPY_REDUCTION_STEP))
-    state_service.set_state("system_entropy", str(new_entropy))
+    state_service.decrement(
+        "system_entropy",
+        Config.ENTROPY_REDUCTION_STEP,
+        default=str(Config.SYSTEM_ENTROPY_BASE),
+    )
     out = VibeNodeOut.model_validate(db_vibenode)
     data = out.model_dump()
     data.update(likes_count=0, comments_count=0, entangled_count=0)
@@ -3241,6 +3260,9 @@ def like_vibenode(
         )
         agent.quantum_ctx.step()
     db.commit()
+    influence_graph_cache.record_like(
+        current_user.id, vibenode.author_id, liked=message == "Liked"
+    )
     return {"message": message}
 
 
@@ -3441,24 +3463,31 @@ async def update_content_entropy_task(db_session_factory):
 
 
 async def update_network_centrality_task(db_session_factory):
-    """Recalculate user network centrality based on follow graph."""
+    """Recalculate user network centrality based on follow graph.
+
+    PageRank runs once per refresh through :data:`centrality_engine`, which
+    is kept current by follow/unfollow deltas between full resyncs and
+    warm-starts from the previous stationary vector.  Every user's
+    ``network_centrality`` and ``harmony_score`` (interaction entropy for all
+    users as one array) is written back with a single bulk UPDATE.
+    """
     while True:
         db = db_session_factory()
         try:
-            G = nx.DiGraph()
-            users = db.query(Harmonizer).all()
-            for user in users:
-                G.add_node(user.id)
-            for user in users:
-                for followed in user.following:
-                    G.add_edge(user.id, followed.id)
-            for uid in G.nodes:
-                u = db.query(Harmonizer).filter(Harmonizer.id == uid).first()
-                if u:
-                    score = calculate_influence_score(G, uid)
-                    u.network_centrality = float(score)
-                    u.harmony_score = str(calculate_interaction_entropy(u, db))
+            if centrality_engine.needs_resync(
+                Config.NETWORK_CENTRALITY_FULL_RESYNC_SECONDS
+            ):
+                centrality_engine.load_follow_graph(db)
+            centrality_engine.refresh()
+            harmony = {
+                uid: {"harmony_score": str(value)}
+                for uid, value in interaction_entropy_scores(db).items()
+            }
+            centrality_engine.write_back(db, extra=harmony)
             db.commit()
+        except Exception as exc:  # pragma: no cover - keep the task alive
+            db.rollback()
+            logger.error("network centrality update failed", error=str(exc))
         finally:
             db.close()
         await asyncio.sleep(Config.NETWORK_CENTRALITY_UPDATE_INTERVAL_SECONDS)
@@ -3490,76 +3519,79 @@ async def system_prediction_task(db_session_factory):
 
 async def scientific_reasoning_cycle_task(db_session_factory):
     """Validate predictions and refine hypotheses autonomously."""
+    # ``expired_pending`` only reads the prediction table, so move rows
+    # written by older versions out of SystemState first.
+    db = db_session_factory()
+    try:
+        migrated = migrate_legacy_records(db)
+        if any(migrated):
+            logger.info("migrated legacy predictions and experiments", counts=migrated)
+    except Exception:
+        db.rollback()
+        logger.error("legacy prediction migration failed", exc_info=True)
+    finally:
+        db.close()
     while True:
         try:
             db = db_session_factory()
-            pm = PredictionManager(db_session_factory, SystemStateService(db))
-            rows = (
-                db.query(SystemState).filter(SystemState.key.like("prediction:%")).all()
-            )
-            all_predictions = []
-            for r in rows:
-                try:
-                    all_predictions.append(json.loads(r.value))
-                except Exception as exc:
-                    logger.error("malformed prediction record", error=str(exc))
-            pending = [p for p in all_predictions if p.get("status") == "pending"]
-            for pred in pending:
-                prediction_id = pred.get("prediction_id")
-                exp_str = pred.get("data", {}).get("expires_at")
-                expired = True
-                if exp_str:
+            state_service = SystemStateService(db)
+            pm = PredictionManager(db_session_factory, state_service)
+            batch_size = Config.PREDICTION_VALIDATION_BATCH_SIZE
+            history = pm.recent_outcomes(Config.PREDICTION_BIAS_HISTORY)
+            while True:
+                # Validated predictions leave the pending index, so each
+                # query returns the next batch of due predictions.
+                due = pm.expired_pending(limit=batch_size)
+                if not due:
+                    break
+                state = (
+                    db.query(SystemState).filter(SystemState.key == "hypotheses").first()
+                )
+                hypotheses = []
+                if state:
                     try:
-                        expired = (
-                            datetime.datetime.fromisoformat(exp_str)
-                            <= datetime.datetime.utcnow()
-                        )
+                        hypotheses = json.loads(state.value)
                     except Exception as exc:
-                        logger.error(
-                            "invalid expires_at",
-                            prediction=prediction_id,
-                            error=str(exc),
-                        )
-                if not expired:
-                    continue
-                logger.info(f"Validating expired prediction: {prediction_id}")
-                actual_outcome = {
-                    "create_content": random.choice([True, False]),
-                    "like_posts": random.choice([True, False]),
-                    "follow_users": random.choice([True, False]),
-                }
-                result = analyze_prediction_accuracy(
-                    prediction_id, actual_outcome, all_predictions
-                )
-                hypothesis_id = pred.get("data", {}).get("hypothesis_id")
-                if hypothesis_id:
-                    state = (
-                        db.query(SystemState)
-                        .filter(SystemState.key == "hypotheses")
-                        .first()
-                    )
-                    existing = []
-                    if state:
-                        try:
-                            existing = json.loads(state.value)
-                        except Exception as exc:
-                            logger.error("malformed hypotheses", error=str(exc))
-                    updated = refine_hypotheses_from_evidence(
-                        hypothesis_id,
-                        [
-                            {
-                                "predicted_outcome": pred.get("data", {}),
-                                "actual_outcome": actual_outcome,
-                            }
-                        ],
-                        existing,
+                        logger.error("malformed hypotheses", error=str(exc))
+                results = {}
+                for pred in due:
+                    prediction_id = pred.get("prediction_id")
+                    logger.info(f"Validating expired prediction: {prediction_id}")
+                    actual_outcome = {
+                        "create_content": random.choice([True, False]),
+                        "like_posts": random.choice([True, False]),
+                        "follow_users": random.choice([True, False]),
+                    }
+                    results[prediction_id] = analyze_prediction_accuracy(
+                        prediction_id, actual_outcome, [pred] + history
                     )
+                    hypothesis_id = pred.get("data", {}).get("hypothesis_id")
+                    if hypothesis_id:
+                        hypotheses = refine_hypotheses_from_evidence(
+                            hypothesis_id,
+                            [
+                                {
+                                    "predicted_outcome": pred.get("data", {}),
+                                    "actual_outcome": actual_outcome,
+                                }
+                            ],
+                            hypotheses,
+                        )
+                if any(p.get("data", {}).get("hypothesis_id") for p in due):
                     if state:
-                        state.value = json.dumps(updated)
+                        state.value = json.dumps(hypotheses)
                     else:
-                        db.add(SystemState(key="hypotheses", value=json.dumps(updated)))
+                        db.add(SystemState(key="hypotheses", value=json.dumps(hypotheses)))
                     db.commit()
-                pm.update_prediction_status(prediction_id, "validated", result)
+                updated = pm.update_prediction_statuses(results, "validated", results)
+                if len(due) < batch_size:
+                    break
+                if not updated:
+                    # Nothing left the pending index (e.g. records without a
+                    # prediction_id), so the next query would return this
+                    # same page again.
+                    logger.warning("no due predictions could be validated; stopping this cycle")
+                    break
         except asyncio.CancelledError:
             logger.info("scientific_reasoning_cycle_task cancelled")
             break
@@ -3597,6 +3629,71 @@ async def adaptive_optimization_task(db_session_factory):
                 pass
 
 
+async def influence_graph_snapshot_task(db_session_factory):
+    """Restore the influence graph at startup and snapshot it periodically.
+
+    The first :meth:`InfluenceGraphCache.get` restores the newest snapshot
+    when it is younger than the cache TTL, so a restarted process does not
+    rebuild the graph from every interaction row.
+    """
+    db = db_session_factory()
+    try:
+        influence_graph_cache.get(db)
+    except Exception:  # pragma: no cover - keep the task alive
+        logger.error("influence graph warm-up failed", exc_info=True)
+    finally:
+        db.close()
+    while True:
+        try:
+            await asyncio.sleep(Config.CAUSAL_GRAPH_SNAPSHOT_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            logger.info("influence_graph_snapshot_task cancelled")
+            break
+        save_influence_graph_snapshot(db_session_factory)
+
+
+def save_influence_graph_snapshot(db_session_factory) -> None:
+    """Persist the cached influence graph if one has been built."""
+    if influence_graph_cache.published_version == 0:
+        return
+    db = db_session_factory()
+    try:
+        influence_graph_cache.snapshot(db)
+    except Exception:  # pragma: no cover - best effort
+        db.rollback()
+        logger.error("influence graph snapshot failed", exc_info=True)
+    finally:
+        db.close()
+
+
+_influence_graph_snapshot_task: Optional[asyncio.Task] = None
+
+
+async def influence_graph_startup_event():
+    """Start :func:`influence_graph_snapshot_task` unless it is already running."""
+    global _influence_graph_snapshot_task
+    if _influence_graph_snapshot_task is None or _influence_graph_snapshot_task.done():
+        _influence_graph_snapshot_task = asyncio.get_running_loop().create_task(
+            influence_graph_snapshot_task(SessionLocal)
+        )
+
+
+async def shutdown_event():
+    if _influence_graph_snapshot_task is not None:
+        _influence_graph_snapshot_task.cancel()
+    save_influence_graph_snapshot(SessionLocal)
+
+
+@asynccontextmanager
+async def influence_graph_lifespan(_app):
+    """App lifespan: start the snapshot task, save a snapshot on exit."""
+    await influence_graph_startup_event()
+    try:
+        yield
+    finally:
+        await shutdown_event()
+
+
 async def startup_event():
     loop = asyncio.get_running_loop()
     loop.create_task(passive_aura_resonance_task(SessionLocal))
@@ -3735,21 +3832,154 @@ class AbstractStorage:
     def delete_marketplace_listing(self, listing_id: str):
         raise NotImplementedError
 
+    def apply_karma_decay(
+        self, multiplier: Decimal, decay_years: int, chunk_size: int = 5000
+    ) -> int:
+        """Scale every user's karma by ``multiplier`` in one pass.
+
+        Genesis users are additionally scaled by their remaining genesis
+        bonus weight. Returns the number of users updated.
+        """
+        raise NotImplementedError
+
     @contextmanager
     def transaction(self):
         """Provides a transactional context to ensure atomicity."""
         raise NotImplementedError
 
+    @contextmanager
+    def unit_of_work(self):
+        """Stage all reads and writes made in the block and apply them at once.
+
+        Backends without a notion of batching simply run the block.
+        """
+        yield
+
+    @contextmanager
+    def savepoint(self):
+        """Undo the block's writes if it raises, keeping the enclosing unit of work."""
+        yield
+
+
+def _as_utc(value: Any) -> Optional[datetime.datetime]:
+    """Parse a stored join time into an aware UTC ``datetime``."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+class _UnitOfWork:
+    """Session and identity map shared by every storage call in one batch."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self.identity: Dict[tuple[str, str], Any] = {}
+        self.cache_keys: set[str] = set()
+        self.cache_patterns: set[str] = set()
+
 
 class SQLAlchemyStorage(AbstractStorage):
+    """Storage backed by SQLAlchemy models.
+
+    Outside a :meth:`unit_of_work` every call opens its own session and
+    commits.  Inside one, all calls made by the same thread share a session
+    and an identity map keyed by username/coin id, so repeated reads of the
+    same row cost one query and all writes are flushed in a single commit.
+    """
+
     def __init__(self, session_factory: Callable[[], Session]):
         self.session_factory = session_factory
+        self._local = threading.local()
 
     def _get_session(self) -> Session:
         return self.session_factory()
 
+    def _current_uow(self) -> Optional[_UnitOfWork]:
+        return getattr(self._local, "uow", None)
+
+    @contextmanager
+    def _session_scope(self, write: bool = False):
+        uow = self._current_uow()
+        if uow is not None:
+            yield uow.session
+            return
+        db = self._get_session()
+        try:
+            yield db
+            if write:
+                db.commit()
+        finally:
+            db.close()
+
+    def _find(self, db: Session, model: Any, column: Any, key: Any) -> Any:
+        """Return the row where ``column == key``, via the identity map if staged."""
+        uow = self._current_uow()
+        ident = (model.__name__, str(key))
+        if uow is not None and ident in uow.identity:
+            return uow.identity[ident]
+        obj = db.query(model).filter(column == key).first()
+        if uow is not None:
+            uow.identity[ident] = obj
+        return obj
+
+    def _remember(self, model: Any, key: Any, obj: Any) -> None:
+        uow = self._current_uow()
+        if uow is not None:
+            uow.identity[(model.__name__, str(key))] = obj
+
+    def _invalidate(self, key: str) -> None:
+        """Drop ``key`` from Redis now, or after the unit of work commits."""
+        uow = self._current_uow()
+        if uow is not None:
+            uow.cache_keys.add(key)
+            return
+        try:
+            redis_client.delete(key)
+        except Exception:
+            pass
+
+    def _invalidate_pattern(self, pattern: str) -> None:
+        """Drop every Redis key matching ``pattern`` (deferred like :meth:`_invalidate`)."""
+        uow = self._current_uow()
+        if uow is not None:
+            uow.cache_patterns.add(pattern)
+            return
+        self._delete_pattern(pattern)
+
+    @staticmethod
+    def _delete_pattern(pattern: str) -> None:
+        try:
+            for key in redis_client.scan_iter(match=pattern):
+                redis_client.delete(key)
+        except Exception:
+            pass
+
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        if self._current_uow() is not None:
+            return None  # staged writes are newer than the cache
+        try:
+            cached = redis_client.get(key)
+        except Exception:  # redis unavailable
+            cached = None
+        return json.loads(cached) if cached else None
+
+    @staticmethod
+    def _row_dict(obj: Any) -> Dict[str, Any]:
+        data = obj.__dict__.copy()
+        data.pop("_sa_instance_state", None)
+        return data
+
     @contextmanager
     def transaction(self):
+        uow = self._current_uow()
+        if uow is not None:
+            with self.savepoint():
+                yield uow.session
+            return
         db = self._get_session()
         try:
             logging.info("Starting DB transaction")
@@ -3763,135 +3993,181 @@ class SQLAlchemyStorage(AbstractStorage):
         finally:
             db.close()
 
-    def get_user(self, name: str) -> Optional[Dict]:
-        try:
-            cached = redis_client.get(f"user:{name}")
-        except Exception:  # redis unavailable
-            cached = None
-        if cached:
-            return json.loads(cached)
-        db = self._get_session()
+    @contextmanager
+    def unit_of_work(self):
+        """Run the block against one session and commit once at the end.
+
+        Nested calls join the outer unit of work.  On error everything staged
+        is rolled back and the exception propagates.
+        """
+        if self._current_uow() is not None:
+            yield
+            return
+        uow = _UnitOfWork(self._get_session())
+        self._local.uow = uow
         try:
-            user = db.query(Harmonizer).filter(Harmonizer.username == name).first()
-            if user:
-                data = user.__dict__.copy()
-                data.pop("_sa_instance_state", None)
+            yield
+            uow.session.commit()
+        except Exception:
+            uow.session.rollback()
+            raise
+        finally:
+            self._local.uow = None
+            uow.session.close()
+            for key in uow.cache_keys:
                 try:
-                    redis_client.setex(f"user:{name}", 300, json.dumps(data))
+                    redis_client.delete(key)
                 except Exception:
                     pass
+            for pattern in uow.cache_patterns:
+                self._delete_pattern(pattern)
+
+    @contextmanager
+    def savepoint(self):
+        uow = self._current_uow()
+        if uow is None:
+            yield
+            return
+        try:
+            with uow.session.begin_nested():
+                yield
+        except Exception:
+            # Rolled-back rows may linger in the map; reload them lazily.
+            uow.identity.clear()
+            raise
+
+    def get_user(self, name: str) -> Optional[Dict]:
+        cached = self._cached(f"user:{name}")
+        if cached:
+            return cached
+        with self._session_scope() as db:
+            user = self._find(db, Harmonizer, Harmonizer.username, name)
+            if user:
+                data = self._row_dict(user)
+                if self._current_uow() is None:
+                    try:
+                        redis_client.setex(f"user:{name}", 300, json.dumps(data))
+                    except Exception:
+                        pass
                 return data
             return None
-        finally:
-            db.close()
 
     def set_user(self, name: str, data: Dict):
-        try:
-            redis_client.delete(f"user:{name}")
-        except Exception:
-            pass
-        db = self._get_session()
-        try:
-            user = db.query(Harmonizer).filter(Harmonizer.username == name).first()
+        self._invalidate(f"user:{name}")
+        with self._session_scope(write=True) as db:
+            user = self._find(db, Harmonizer, Harmonizer.username, name)
             if user:
                 for k, v in data.items():
                     setattr(user, k, v)
             else:
                 user = Harmonizer(username=name, **data)
                 db.add(user)
-            db.commit()
-        finally:
-            db.close()
+                self._remember(Harmonizer, name, user)
+
+    def apply_karma_decay(
+        self, multiplier: Decimal, decay_years: int, chunk_size: int = 5000
+    ) -> int:
+        """Decay all karma with one UPDATE plus chunked genesis updates.
+
+        Non-genesis rows are scaled in SQL. Only genesis rows, whose factor
+        depends on their join time, are read back; their new karma is
+        computed in one batch and written with bulk updates of
+        ``chunk_size`` rows.
+        """
+        factor = float(multiplier)
+        with self._session_scope(write=True) as db:
+            genesis = (
+                db.query(Harmonizer.id, Harmonizer.karma_score, Harmonizer.created_at)
+                .filter(Harmonizer.is_genesis.is_(True))
+                .all()
+            )
+            updated = (
+                db.query(Harmonizer)
+                .filter(Harmonizer.is_genesis.isnot(True))
+                .update(
+                    {Harmonizer.karma_score: Harmonizer.karma_score * factor},
+                    synchronize_session=False,
+                )
+            )
+            weights = calculate_genesis_bonus_decay_many(
+                [_as_utc(row.created_at) for row in genesis], decay_years
+            )
+            rows = [
+                {"id": row.id, "karma_score": (row.karma_score or 0.0) * factor * float(w)}
+                for row, w in zip(genesis, weights)
+            ]
+            for start in range(0, len(rows), chunk_size):
+                db.bulk_update_mappings(Harmonizer, rows[start : start + chunk_size])
+                logging.info(
+                    "Karma decay: %d/%d genesis users updated",
+                    min(start + chunk_size, len(rows)),
+                    len(rows),
+                )
+            db.expire_all()
+        self._invalidate_pattern("user:*")
+        return updated + len(rows)
 
     def get_all_users(self) -> List[Dict]:
-        db = self._get_session()
-        try:
-            return [u.__dict__ for u in db.query(Harmonizer).all()]
-        finally:
-            db.close()
+        with self._session_scope() as db:
+            users = db.query(Harmonizer).all()
+            for u in users:
+                self._remember(Harmonizer, u.username, u)
+            return [u.__dict__ for u in users]
 
     def get_coin(self, coin_id: str) -> Optional[Dict[str, Any]]:
-        try:
-            cached = redis_client.get(f"coin:{coin_id}")
-        except Exception:
-            cached = None
+        cached = self._cached(f"coin:{coin_id}")
         if cached:
-            return json.loads(cached)
-        db = self._get_session()
-        try:
-            coin = db.query(Coin).filter(Coin.coin_id == coin_id).first()
+            return cached
+        with self._session_scope() as db:
+            coin = self._find(db, Coin, Coin.token_id, coin_id)
             if coin:
-                data = coin.__dict__.copy()
-                data.pop("_sa_instance_state", None)
-                try:
-                    redis_client.setex(f"coin:{coin_id}", 300, json.dumps(data))
-                except Exception:
-                    pass
+                data = self._row_dict(coin)
+                if self._current_uow() is None:
+                    try:
+                        redis_client.setex(f"coin:{coin_id}", 300, json.dumps(data))
+                    except Exception:
+                        pass
                 return data
             return None
-        finally:
-            db.close()
 
     def set_coin(self, coin_id: str, data: Dict[str, Any]):
-        try:
-            redis_client.delete(f"coin:{coin_id}")
-        except Exception:
-            pass
-        db = self._get_session()
-        try:
-            coin = db.query(Coin).filter(Coin.coin_id == coin_id).first()
+        self._invalidate(f"coin:{coin_id}")
+        with self._session_scope(write=True) as db:
+            coin = self._find(db, Coin, Coin.token_id, coin_id)
             if coin:
                 for k, v in data.items():
                     setattr(coin, k, v)
             else:
                 coin = Coin(coin_id=coin_id, **data)
                 db.add(coin)
-            db.commit()
-        finally:
-            db.close()
+                self._remember(Coin, coin_id, coin)
 
     def delete_user(self, name: str):
-        db = self._get_session()
-        try:
-            user = db.query(Harmonizer).filter(Harmonizer.username == name).first()
+        with self._session_scope(write=True) as db:
+            user = self._find(db, Harmonizer, Harmonizer.username, name)
             if user:
                 db.delete(user)
-                db.commit()
-        finally:
-            db.close()
+                self._remember(Harmonizer, name, None)
 
     def delete_coin(self, coin_id: str):
-        db = self._get_session()
-        try:
-            coin = db.query(Coin).filter(Coin.coin_id == coin_id).first()
+        with self._session_scope(write=True) as db:
+            coin = self._find(db, Coin, Coin.token_id, coin_id)
             if coin:
                 db.delete(coin)
-                db.commit()
-        finally:
-            db.close()
+                self._remember(Coin, coin_id, None)
 
     def get_proposal(self, proposal_id: str) -> Optional[Dict[str, Any]]:
-        db = self._get_session()
-        try:
-            proposal = (
-                db.query(Proposal).filter(Proposal.id == int(proposal_id)).first()
-            )
+        with self._session_scope() as db:
+            proposal = self._find(db, Proposal, Proposal.id, int(proposal_id))
             if proposal:
                 d = proposal.__dict__.copy()
                 d["proposal_id"] = proposal_id
                 return d
             return None
-        finally:
-            db.close()
 
     def set_proposal(self, proposal_id: str, data: Dict[str, Any]):
-        db = self._get_session()
-        try:
-            proposal = (
-                db.query(Proposal)
-                .filter(Proposal.id == int(data["proposal_id"]))
-                .first()
-            )
+        with self._session_scope(write=True) as db:
+            proposal = self._find(db, Proposal, Proposal.id, int(data["proposal_id"]))
             if proposal:
                 for k, v in data.items():
                     if k != "proposal_id":
@@ -3901,29 +4177,19 @@ class SQLAlchemyStorage(AbstractStorage):
                 data_copy.pop("proposal_id", None)
                 proposal = Proposal(id=int(proposal_id), **data_copy)
                 db.add(proposal)
-            db.commit()
-        finally:
-            db.close()
+                self._remember(Proposal, int(proposal_id), proposal)
 
     def get_marketplace_listing(self, listing_id: str) -> Optional[Dict[str, Any]]:
-        db = self._get_session()
-        try:
-            listing = (
-                db.query(MarketplaceListing)
-                .filter(MarketplaceListing.listing_id == listing_id)
-                .first()
+        with self._session_scope() as db:
+            listing = self._find(
+                db, MarketplaceListing, MarketplaceListing.listing_id, listing_id
             )
             return listing.__dict__ if listing else None
-        finally:
-            db.close()
 
     def set_marketplace_listing(self, listing_id: str, data: Dict[str, Any]):
-        db = self._get_session()
-        try:
-            listing = (
-                db.query(MarketplaceListing)
-                .filter(MarketplaceListing.listing_id == listing_id)
-                .first()
+        with self._session_scope(write=True) as db:
+            listing = self._find(
+                db, MarketplaceListing, MarketplaceListing.listing_id, listing_id
             )
             if listing:
                 for k, v in data.items():
@@ -3931,23 +4197,16 @@ class SQLAlchemyStorage(AbstractStorage):
             else:
                 listing = MarketplaceListing(listing_id=listing_id, **data)
                 db.add(listing)
-            db.commit()
-        finally:
-            db.close()
+                self._remember(MarketplaceListing, listing_id, listing)
 
     def delete_marketplace_listing(self, listing_id: str):
-        db = self._get_session()
-        try:
-            listing = (
-                db.query(MarketplaceListing)
-                .filter(MarketplaceListing.listing_id == listing_id)
-                .first()
+        with self._session_scope(write=True) as db:
+            listing = self._find(
+                db, MarketplaceListing, MarketplaceListing.listing_id, listing_id
             )
             if listing:
                 db.delete(listing)
-                db.commit()
-        finally:
-            db.close()
+                self._remember(MarketplaceListing, listing_id, None)
 
     def sync_to_mainchain(self) -> None:
         """Placeholder for future synchronization with the main chain."""
@@ -3984,6 +4243,21 @@ class InMemoryStorage(AbstractStorage):
     def get_all_users(self) -> List[Dict[str, Any]]:
         return list(self.users.values())
 
+    def apply_karma_decay(
+        self, multiplier: Decimal, decay_years: int, chunk_size: int = 5000
+    ) -> int:
+        """Decay karma by updating the stored user dicts in place."""
+        users = list(self.users.values())
+        genesis = [u for u in users if u.get("is_genesis")]
+        weights = calculate_genesis_bonus_decay_many(
+            [_as_utc(u.get("join_time")) for u in genesis], decay_years
+        )
+        bonus = {id(u): w for u, w in zip(genesis, weights)}
+        for u in users:
+            factor = multiplier * bonus.get(id(u), Decimal("1"))
+            u["karma"] = str(Decimal(str(u.get("karma", "0"))) * factor)
+        return len(users)
+
     def get_coin(self, coin_id: str) -> Optional[Dict[str, Any]]:
         return self.coins.get(coin_id)
 
@@ -8,8 +8,9 @@ from typing import Any, Dict
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from db_models import SystemState
+from .state_service import SystemStateCache, SystemStateService, state_cache_for
 
-__all__ = ["log_event"]
+__all__ = ["log_event", "SystemStateCache", "SystemStateService", "state_cache_for"]
 
 
 def log_event(db: Session, category: str, payload: Dict[str, Any]) -> None:
@@ -0,0 +1,294 @@
+"""Cached, write-through access to ``SystemState`` key/value rows.
+
+``SystemStateService`` replaces the per-call SELECT/COMMIT helper that lived
+in ``superNova_2177``:
+
+* Reads are served from a process-wide :class:`SystemStateCache` (one per
+  engine). Entries
+  younger than the cache TTL are returned without touching the database;
+  older ones are revalidated by reading only the row's ``version``.
+* ``set_state`` writes through to the database and the cache.
+* ``increment``/``decrement`` are coalesced per key and applied atomically in
+  SQL (``value = value + :delta``), so concurrent writers never lose an
+  update. Pending deltas are flushed when the session commits, when
+  ``flush_interval_ms`` has passed since the first pending delta, or on
+  :meth:`SystemStateService.flush`/:meth:`SystemStateService.close`.
+* ``scan_prefix`` reads ``prefix*`` keys with an index range scan.
+
+Every ORM update of a ``SystemState`` row bumps its ``version`` (it is the
+mapper's version column), which is what keeps cached entries honest across
+sessions and processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Numeric, String, bindparam, cast, event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from db_models import SystemState
+
+__all__ = ["SystemStateCache", "SystemStateService", "state_cache_for"]
+
+# Seconds a cached value is trusted before its version is checked again.
+DEFAULT_CACHE_TTL = 1.0
+# Pending increments are flushed at the latest this long after the first one.
+DEFAULT_FLUSH_INTERVAL_MS = 250
+# ``Session.info`` key holding the services with pending increments
+_SESSION_SERVICES = "system_state_services"
+
+
+class SystemStateCache:
+    """Thread-safe process-wide map of ``key -> (value, version, loaded_at)``."""
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[Optional[str], int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], int, float]]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, value: Optional[str], version: int) -> None:
+        """Store ``value``; a missing row is cached as ``None`` with version -1."""
+        with self._lock:
+            current = self._entries.get(key)
+            # Keep a newer version read by another session; a row that has
+            # disappeared always replaces the entry.
+            if current is not None and current[1] > version and value is not None:
+                return
+            self._entries[key] = (value, version, time.monotonic())
+
+    def touch(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], entry[1], time.monotonic())
+
+    def invalidate(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Drop ``keys``, or every entry when ``keys`` is ``None``."""
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+
+
+_CACHES: "weakref.WeakKeyDictionary[Any, SystemStateCache]" = weakref.WeakKeyDictionary()
+_CACHES_LOCK = threading.Lock()
+
+
+def state_cache_for(bind: Any) -> SystemStateCache:
+    """The process-wide cache for one engine, created on first use."""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(bind)
+        if cache is None:
+            cache = _CACHES[bind] = SystemStateCache()
+        return cache
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Smallest string greater than every string starting with ``prefix``."""
+    for i in range(len(prefix) - 1, -1, -1):
+        if ord(prefix[i]) < 0x10FFFF:
+            return prefix[:i] + chr(ord(prefix[i]) + 1)
+    return None
+
+
+class SystemStateService:
+    """Read-cached, write-through access to ``SystemState`` for one session.
+
+    Args:
+        db: Session used for reads and writes
+        cache: Cache to use; defaults to the shared cache of ``db``'s engine
+        flush_interval_ms: Maximum age of pending increments before they are
+            written on the next call
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        cache: Optional[SystemStateCache] = None,
+        flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+    ) -> None:
+        self.db = db
+        self.cache = cache or state_cache_for(db.get_bind())
+        self.flush_interval = flush_interval_ms / 1000.0
+        self._pending: Dict[str, Tuple[Decimal, str]] = {}
+        self._pending_since: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get_state(self, key: str, default: Optional[str]) -> Optional[str]:
+        """Return the value of ``key`` including this service's pending deltas."""
+        value = self._read(key)
+        pending = self._pending.get(key)
+        if pending is not None:
+            base = Decimal(pending[1] if value is None else value)
+            return str(base + pending[0])
+        return default if value is None else value
+
+    def scan_prefix(self, prefix: str) -> Dict[str, str]:
+        """All ``key -> value`` pairs whose key starts with ``prefix``.
+
+        Uses a range condition on the indexed key column rather than ``LIKE``,
+        so only matching rows are read. Results refresh the cache.
+        """
+        self.flush()
+        stmt = select(SystemState.key, SystemState.value, SystemState.version).where(
+            SystemState.key >= prefix
+        )
+        upper = _prefix_upper_bound(prefix)
+        if upper is not None:
+            stmt = stmt.where(SystemState.key < upper)
+        found = {}
+        for key, value, version in self.db.execute(stmt.order_by(SystemState.key)):
+            self.cache.put(key, value, version)
+            found[key] = value
+        return found
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def set_state(self, key: str, value: str) -> None:
+        """Write ``value`` to ``key`` and commit, replacing pending deltas."""
+        self._pending.pop(key, None)
+        result = self.db.execute(
+            update(SystemState)
+            .where(SystemState.key == key)
+            .values(value=value, version=SystemState.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount and not self._insert(key, value):
+            self.db.execute(
+                update(SystemState)
+                .where(SystemState.key == key)
+                .values(value=value, version=SystemState.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+        self.db.commit()
+        self._refresh([key])
+
+    def increment(self, key: str, delta, default: str = "0") -> None:
+        """Add ``delta`` to the numeric value of ``key`` (``default`` if missing).
+
+        The change is visible to :meth:`get_state` immediately and reaches
+        the database with the next flush.
+        """
+        delta = Decimal(str(delta))
+        if not self._pending:
+            self._register()
+        current = self._pending.get(key)
+        self._pending[key] = (delta + (current[0] if current else 0), default)
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        elif now - self._pending_since >= self.flush_interval:
+            self.flush()
+
+    def decrement(self, key: str, delta, default: str = "0") -> None:
+        """Subtract ``delta`` from the numeric value of ``key``."""
+        self.increment(key, -Decimal(str(delta)), default)
+
+    def flush(self) -> None:
+        """Write pending increments and commit."""
+        if self._pending:
+            self.db.commit()  # the session's before_commit hook applies them
+
+    def close(self) -> None:
+        """Flush pending increments."""
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _read(self, key: str) -> Optional[str]:
+        entry = self.cache.get(key)
+        if entry is not None:
+            value, version, loaded_at = entry
+            if time.monotonic() - loaded_at < self.cache.ttl:
+                return value
+            current = self.db.execute(
+                select(SystemState.version).where(SystemState.key == key)
+            ).scalar_one_or_none()
+            if (current is None and version < 0) or current == version:
+                self.cache.touch(key)
+                return value
+        row = self.db.execute(
+            select(SystemState.value, SystemState.version).where(SystemState.key == key)
+        ).first()
+        if row is None:
+            self.cache.put(key, None, -1)
+            return None
+        self.cache.put(key, row.value, row.version)
+        return row.value
+
+    def _insert(self, key: str, value: str) -> bool:
+        """Insert a new row; returns ``False`` if another writer created it first."""
+        try:
+            with self.db.begin_nested():
+                self.db.execute(insert(SystemState).values(key=key, value=value, version=1))
+        except IntegrityError:
+            return False
+        return True
+
+    def _refresh(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        rows = self.db.execute(
+            select(SystemState.key, SystemState.value, SystemState.version).where(
+                SystemState.key.in_(keys)
+            )
+        )
+        self.cache.invalidate(keys)
+        for key, value, version in rows:
+            self.cache.put(key, value, version)
+
+    def _register(self) -> None:
+        """Have the next commit of ``db`` apply this service's increments."""
+        services = self.db.info.get(_SESSION_SERVICES)
+        if services is None:
+            services = self.db.info[_SESSION_SERVICES] = weakref.WeakSet()
+            event.listen(self.db, "before_commit", _apply_pending_increments)
+        services.add(self)
+
+    def _apply_pending(self, session: Session) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._pending_since = None
+        stmt = (
+            update(SystemState)
+            .where(SystemState.key == bindparam("state_key"))
+            .values(
+                value=cast(
+                    cast(SystemState.value, Numeric) + bindparam("delta", type_=Numeric),
+                    String,
+                ),
+                version=SystemState.version + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        for key, (delta, default) in pending.items():
+            params = {"state_key": key, "delta": delta}
+            if session.execute(stmt, params).rowcount:
+                continue
+            if not self._insert(key, str(Decimal(default) + delta)):
+                session.execute(stmt, params)
+        self._refresh(pending)
+
+
+def _apply_pending_increments(session: Session) -> None:
+    """``before_commit`` hook: write every service's pending increments."""
+    services = session.info.get(_SESSION_SERVICES)
+    for service in list(services or ()):
+        services.discard(service)
+        service._apply_pending(session)
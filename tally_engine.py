@@ -0,0 +1,143 @@
+"""Harmony-weighted proposal tallies over an indexed user snapshot.
+
+``RemixAgent`` used to rescan every user for each proposal, both to total the
+network's harmony and to find each voter.  :class:`TallyEngine` builds one
+name-indexed :class:`TallyIndex` per governance pass and reuses each user's
+decayed harmony weight across passes until it is invalidated.
+"""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from scientific_utils import calculate_genesis_bonus_decay_many
+
+ZERO = Decimal("0")
+
+
+def _decimal(value: Any) -> Decimal:
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return ZERO
+
+
+def _join_time(value: Any) -> Optional[datetime.datetime]:
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _name(user: Mapping[str, Any]) -> Optional[str]:
+    return user.get("name") or user.get("username")
+
+
+@dataclass
+class TallyIndex:
+    """Voting weights for one governance pass, keyed by user name."""
+
+    weights: Dict[str, Decimal] = field(default_factory=dict)
+    species: Dict[str, str] = field(default_factory=dict)
+    consenting: set = field(default_factory=set)
+    total_harmony: Decimal = ZERO
+
+
+class TallyEngine:
+    """Tally proposals using the tri-species harmony model.
+
+    Each user's weight is ``harmony_score`` scaled by their remaining genesis
+    bonus.  Weights are cached per user together with the harmony score they
+    were computed from and the engine ``epoch``; a changed score recomputes
+    that user, and :meth:`invalidate` without a name bumps the epoch so the
+    time-dependent genesis decay is refreshed for everyone.
+    """
+
+    def __init__(self, species: Iterable[str], decay_years: int) -> None:
+        self.species = list(species)
+        self.decay_years = decay_years
+        self.epoch = 0
+        self._weights: Dict[str, Tuple[int, Any, Decimal]] = {}
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget the cached weight for ``name``, or for every user."""
+        if name is None:
+            self.epoch += 1
+        else:
+            self._weights.pop(name, None)
+
+    def build_index(self, users: Iterable[Mapping[str, Any]]) -> TallyIndex:
+        """Index ``users`` by name, computing only stale weights."""
+        index = TallyIndex()
+        stale: List[Tuple[str, Any, Decimal, Optional[datetime.datetime]]] = []
+        for user in users:
+            name = _name(user)
+            if name is None:
+                continue
+            score = user.get("harmony_score", "0")
+            cached = self._weights.get(name)
+            if cached is not None and cached[0] == self.epoch and cached[1] == score:
+                weight = cached[2]
+            elif user.get("is_genesis"):
+                stale.append((name, score, _decimal(score), _join_time(user.get("join_time"))))
+                weight = None
+            else:
+                weight = _decimal(score)
+                self._weights[name] = (self.epoch, score, weight)
+            if weight is not None:
+                index.weights[name] = weight
+            index.species[name] = user.get("species", "human")
+            if user.get("consent", user.get("consent_given", False)):
+                index.consenting.add(name)
+        if stale:
+            decays = calculate_genesis_bonus_decay_many(
+                [join for _, _, _, join in stale], self.decay_years
+            )
+            for (name, score, harmony, _), decay in zip(stale, decays):
+                weight = harmony * decay
+                self._weights[name] = (self.epoch, score, weight)
+                index.weights[name] = weight
+        index.total_harmony = sum(index.weights.values(), ZERO)
+        return index
+
+    def tally(self, votes: Mapping[str, str], index: TallyIndex) -> Dict[str, Decimal]:
+        """Return ``{'yes', 'no', 'quorum'}`` fractions for ``votes``."""
+        species_votes = {s: {"yes": ZERO, "no": ZERO, "total": ZERO} for s in self.species}
+        voted_harmony = ZERO
+        for voter, vote in votes.items():
+            weight = index.weights.get(voter)
+            if weight is None or voter not in index.consenting:
+                continue
+            bucket = species_votes.get(index.species[voter])
+            if bucket is None or vote not in ("yes", "no"):
+                continue
+            bucket[vote] += weight
+            bucket["total"] += weight
+            voted_harmony += weight
+        active = [sv for sv in species_votes.values() if sv["total"] > 0]
+        if not active:
+            return {"yes": ZERO, "no": ZERO, "quorum": ZERO}
+        species_weight = Decimal("1") / len(active)
+        final_yes = sum(((sv["yes"] / sv["total"]) * species_weight for sv in active), ZERO)
+        final_no = sum(((sv["no"] / sv["total"]) * species_weight for sv in active), ZERO)
+        total = index.total_harmony
+        quorum = voted_harmony / total if total > 0 else ZERO
+        return {"yes": final_yes, "no": final_no, "quorum": quorum}
+
+    def tally_many(
+        self,
+        proposals: Iterable[Mapping[str, Any]],
+        users: Iterable[Mapping[str, Any]],
+    ) -> Dict[str, Dict[str, Decimal]]:
+        """Tally every proposal against one index built from ``users``."""
+        index = self.build_index(users)
+        return {p["proposal_id"]: self.tally(p.get("votes", {}), index) for p in proposals}
+
+
+__all__ = ["TallyEngine", "TallyIndex"]
@@ -9,9 +9,11 @@ Used to increase robustness of scientific hypothesis auditing in superNova_2177.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from statistics import mean, stdev
+
+from validation_frame import ValidationFrame
 try:
     from dateutil import parser
 except Exception:  # pragma: no cover - optional dependency may be missing
@@ -24,6 +26,7 @@ class Config:
     MAX_VALIDATION_GAP_HOURS = 96       # Warn if large time gaps appear
     MIN_VALIDATION_SPREAD_HOURS = 1.5   # Expect some temporal distribution
     CONTRADICTION_WINDOW_HOURS = 6      # Flag contradictory notes near-simultaneous
+    CONTRADICTION_KEYWORDS = ["contradict", "refute", "oppose", "disagree"]
     CONSENSUS_VOLATILITY_THRESHOLD = 0.25  # Flag shifts in scoring patterns
     
     # Business hours analysis
@@ -51,14 +54,10 @@ def analyze_temporal_consistency(
     reputations: Optional[Dict[str, float]] = None
 ) -> Dict[str, Any]:
     if not validations:
-        return {
-            "avg_delay_hours": 0.0,
-            "consensus_volatility": 0.0,
-            "weighted_volatility": 0.0,
-            "flags": ["no_validations"],
-            "timeline": [],
-            "business_hours_ratio": 0.0
-        }
+        return _empty_result("no_validations")
+
+    if isinstance(validations, ValidationFrame):
+        return _analyze_frame(validations, reputations)
 
     parsed_validations = []
     business_hours_count = 0
@@ -72,7 +71,8 @@ def analyze_temporal_consistency(
             continue
         try:
             score = float(v.get("score", 0.5))
-            validator_id = v.get("validator_id", f"unknown_{i}")
+            # Same as the frame path, where every falsy id is missing
+            validator_id = v.get("validator_id") or f"unknown_{i}"
             
             parsed_validations.append({
                 "timestamp": ts,
@@ -92,14 +92,7 @@ def analyze_temporal_consistency(
             continue
 
     if len(parsed_validations) < 2:
-        return {
-            "avg_delay_hours": 0.0,
-            "consensus_volatility": 0.0,
-            "weighted_volatility": 0.0,
-            "flags": ["insufficient_valid_timestamps"],
-            "timeline": [],
-            "business_hours_ratio": 0.0
-        }
+        return _empty_result("insufficient_valid_timestamps")
 
     sorted_validations = sorted(parsed_validations, key=lambda x: x["timestamp"])
     
@@ -115,32 +108,18 @@ def analyze_temporal_consistency(
     timeline = [(v["timestamp"].isoformat(), v["score"], v["validator_id"]) 
                 for v in sorted_validations]
     
-    flags = []
-    
     total_span = (timestamps[-1] - timestamps[0]).total_seconds() / 3600.0
-    avg_gap = total_span / (len(timestamps) - 1) if len(timestamps) > 1 else 0.0
-
-    if avg_gap > Config.MAX_VALIDATION_GAP_HOURS:
-        flags.append("large_time_gap")
-    if total_span < Config.MIN_VALIDATION_SPREAD_HOURS:
-        flags.append("temporal_cluster")
-    if out_of_order_ratio > Config.MAX_OUT_OF_ORDER_TOLERANCE:
-        flags.append("chronological_disorder")
-    if business_hours_ratio > Config.SUSPICIOUS_BUSINESS_HOURS_RATIO:
-        flags.append("suspicious_business_hours_concentration")
 
     contradiction_indices = []
     for i, v in enumerate(sorted_validations):
-        if any(k in v["note"] for k in ["contradict", "refute", "oppose", "disagree"]):
+        if any(k in v["note"] for k in Config.CONTRADICTION_KEYWORDS):
             contradiction_indices.append(i)
 
-    if len(contradiction_indices) > 1:
-        for i in range(len(contradiction_indices) - 1):
-            t1 = timestamps[contradiction_indices[i]]
-            t2 = timestamps[contradiction_indices[i+1]]
-            gap = abs((t2 - t1).total_seconds()) / 3600.0
-            if gap <= Config.CONTRADICTION_WINDOW_HOURS:
-                flags.append("contradiction_near_simultaneous")
+    contradiction_gaps = []
+    for i in range(len(contradiction_indices) - 1):
+        t1 = timestamps[contradiction_indices[i]]
+        t2 = timestamps[contradiction_indices[i+1]]
+        contradiction_gaps.append(abs((t2 - t1).total_seconds()) / 3600.0)
 
     volatility = stdev(scores) if len(scores) >= 2 else 0.0
     weighted_volatility = 0.0
@@ -159,6 +138,110 @@ def analyze_temporal_consistency(
             normalized_weighted_scores = [s / total_weight for s in weighted_scores]
             weighted_volatility = stdev(normalized_weighted_scores) if len(normalized_weighted_scores) >= 2 else 0.0
 
+    return _consistency_result(
+        timeline,
+        total_span,
+        out_of_order_ratio,
+        business_hours_ratio,
+        contradiction_gaps,
+        volatility,
+        weighted_volatility,
+    )
+
+def _analyze_frame(
+    frame: ValidationFrame, reputations: Optional[Dict[str, float]]
+) -> Dict[str, Any]:
+    """Columnar :func:`analyze_temporal_consistency` for a ``ValidationFrame``."""
+    import numpy as np
+
+    rows = np.flatnonzero(frame.ts_valid & ~np.isnan(frame.score))
+    count = len(rows)
+    if count < 2:
+        return _empty_result("insufficient_valid_timestamps")
+
+    ordered = rows[np.argsort(frame.timestamp[rows], kind="stable")]
+    out_of_order_ratio = int(np.count_nonzero(ordered != np.arange(count))) / count
+    hours = frame.ts_hour[rows]
+    business_hours_ratio = int(np.count_nonzero(
+        (hours >= Config.BUSINESS_START_HOUR) & (hours <= Config.BUSINESS_END_HOUR)
+    )) / count
+
+    timestamps = frame.timestamp[ordered]
+    scores = frame.score[ordered]
+    codes = frame.validator[ordered]
+    names = [
+        frame.validator_ids[c] if c >= 0 else f"unknown_{i}"
+        for c, i in zip(codes.tolist(), ordered.tolist())
+    ]
+    iso = [frame.ts_iso[c] for c in frame.ts_code[ordered].tolist()]
+    timeline = list(zip(iso, scores.tolist(), names))
+
+    total_span = (int(timestamps[-1]) - int(timestamps[0])) / 10**6 / 3600.0
+
+    contradicts = frame.note_flags(
+        lambda note: any(k in str(note).lower() for k in Config.CONTRADICTION_KEYWORDS)
+    )[ordered]
+    contradiction_gaps = (
+        np.diff(timestamps[contradicts]) / 10**6 / 3600.0
+    ).tolist()
+
+    volatility = float(np.std(scores, ddof=1))
+    weighted_volatility = 0.0
+    if reputations:
+        weights = np.array(
+            [reputations.get(v, 0.5) for v in frame.validator_ids] + [0.5], dtype=np.float64
+        )[codes]
+        total_weight = float(weights.sum())
+        if total_weight > 0:
+            weighted_volatility = float(np.std(scores * weights / total_weight, ddof=1))
+
+    return _consistency_result(
+        timeline,
+        total_span,
+        out_of_order_ratio,
+        business_hours_ratio,
+        contradiction_gaps,
+        volatility,
+        weighted_volatility,
+    )
+
+def _empty_result(flag: str) -> Dict[str, Any]:
+    return {
+        "avg_delay_hours": 0.0,
+        "consensus_volatility": 0.0,
+        "weighted_volatility": 0.0,
+        "flags": [flag],
+        "timeline": [],
+        "business_hours_ratio": 0.0
+    }
+
+def _consistency_result(
+    timeline: List[Tuple[str, float, Any]],
+    total_span: float,
+    out_of_order_ratio: float,
+    business_hours_ratio: float,
+    contradiction_gaps: List[float],
+    volatility: float,
+    weighted_volatility: float,
+) -> Dict[str, Any]:
+    """Flag and package the measurements of one temporal analysis."""
+    flags = []
+
+    avg_gap = total_span / (len(timeline) - 1) if len(timeline) > 1 else 0.0
+
+    if avg_gap > Config.MAX_VALIDATION_GAP_HOURS:
+        flags.append("large_time_gap")
+    if total_span < Config.MIN_VALIDATION_SPREAD_HOURS:
+        flags.append("temporal_cluster")
+    if out_of_order_ratio > Config.MAX_OUT_OF_ORDER_TOLERANCE:
+        flags.append("chronological_disorder")
+    if business_hours_ratio > Config.SUSPICIOUS_BUSINESS_HOURS_RATIO:
+        flags.append("suspicious_business_hours_concentration")
+
+    for gap in contradiction_gaps:
+        if gap <= Config.CONTRADICTION_WINDOW_HOURS:
+            flags.append("contradiction_near_simultaneous")
+
     if volatility > Config.CONSENSUS_VOLATILITY_THRESHOLD:
         flags.append("unstable_consensus")
     if weighted_volatility > Config.CONSENSUS_VOLATILITY_THRESHOLD:
@@ -5,6 +5,10 @@
 """Pytest configuration for optional UI dependencies."""
 
 import importlib.util
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
 import pytest
 
 try:
@@ -60,3 +64,54 @@ def _disable_network(monkeypatch: pytest.MonkeyPatch) -> None:
     yield
     monkeypatch.setattr(socket, "create_connection", real_create_connection)
 
+
+def _make_validations(
+    n: int,
+    seed: int,
+    *,
+    validators: int = 20,
+    hypotheses: Optional[Sequence[str]] = None,
+    notes: Sequence[Optional[str]] = ("",),
+    start: Optional[datetime] = datetime(2025, 3, 1, 8, tzinfo=timezone.utc),
+    minutes: int = 3000,
+    score_digits: Optional[int] = 2,
+    floats: Sequence[str] = (),
+    choices: Optional[Dict[str, Sequence[Any]]] = None,
+    tweak: Optional[Callable[[int, Dict[str, Any], random.Random], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Synthetic validation dicts for the frame, monitor and reputation tests.
+
+    Each row has ``validator_id`` (``v00``..), ``score`` (rounded to
+    ``score_digits`` unless ``None``), ``note`` and an ISO ``timestamp``
+    within ``minutes`` after ``start`` (none when ``start`` is ``None``),
+    plus ``hypothesis_id`` when ``hypotheses`` is given, a uniform float for
+    each of ``floats`` and a random pick for each ``choices`` field.
+    ``tweak(i, row, rng)`` may then edit or corrupt the row in place.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        score = rng.random()
+        row: Dict[str, Any] = {
+            "validator_id": f"v{rng.randrange(validators):02d}",
+            "score": round(score, score_digits) if score_digits is not None else score,
+            "note": rng.choice(notes),
+        }
+        if hypotheses is not None:
+            row["hypothesis_id"] = rng.choice(hypotheses)
+        if start is not None:
+            row["timestamp"] = (start + timedelta(minutes=rng.randrange(minutes))).isoformat()
+        for name in floats:
+            row[name] = rng.random()
+        for name, options in (choices or {}).items():
+            row[name] = rng.choice(options)
+        if tweak is not None:
+            tweak(i, row, rng)
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture
+def make_validations() -> Callable[..., List[Dict[str, Any]]]:
+    """Factory fixture building synthetic validations; see ``_make_validations``."""
+    return _make_validations
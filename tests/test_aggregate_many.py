@@ -0,0 +1,88 @@
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from validators.strategies.voting_consensus_engine import (  # noqa: E402
+    VotingMethod,
+    aggregate_many,
+    aggregate_validator_votes,
+)
+
+NOW = datetime(2025, 6, 1, 12, tzinfo=timezone.utc)
+
+
+def _votes(rng, n):
+    votes = []
+    for _ in range(n):
+        vote = {
+            "validator_id": f"v{rng.randrange(40)}",
+            "score": round(rng.random(), 2),
+            "confidence": round(rng.random(), 2),
+            "decision": rng.choice(["approve", "reject", "abstain"]),
+            "credits": rng.randrange(0, 9),
+            "ranking": rng.sample(["a", "b", "c", "d"], rng.randrange(0, 4)),
+        }
+        kind = rng.randrange(4)
+        if kind == 1:
+            vote["timestamp"] = (NOW - timedelta(hours=rng.randrange(2000))).isoformat()
+        elif kind == 2:
+            vote["timestamp"] = (NOW - timedelta(hours=rng.randrange(2000))).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+        elif kind == 3:
+            vote["timestamp"] = "not a date"
+        votes.append(vote)
+    return votes
+
+
+@pytest.mark.parametrize("method", list(VotingMethod))
+def test_aggregate_many_matches_per_hypothesis(method):
+    rng = random.Random(11)
+    reputations = {f"v{i}": rng.random() for i in range(40)}
+    trust = {f"v{i}": rng.random() for i in range(0, 40, 2)}
+    batch = {f"h{i}": _votes(rng, rng.randrange(0, 12)) for i in range(150)}
+    batch["h_delegated"] = _votes(rng, 6)
+    batch["h_delegated"][0]["delegate_to"] = "v3"
+
+    got = aggregate_many(batch, method, reputations, 0.4, trust, current_time=NOW)
+    assert list(got) == list(batch)
+    for hypothesis_id, votes in batch.items():
+        expected = aggregate_validator_votes(
+            votes, method, reputations, 0.4, trust, current_time=NOW
+        )
+        assert got[hypothesis_id] == expected, hypothesis_id
+
+
+def test_naive_clock_ignores_aware_timestamps():
+    votes = [
+        {"validator_id": f"v{i}", "decision": "approve", "timestamp": ts}
+        for i, ts in enumerate(["2020-01-01T00:00:00", "2020-01-01T00:00:00Z", None])
+    ]
+    now = datetime(2020, 3, 1)
+    got = aggregate_many({"h": votes}, VotingMethod.MAJORITY_RULE, current_time=now)["h"]
+    assert got == aggregate_validator_votes(votes, VotingMethod.MAJORITY_RULE, current_time=now)
+    assert got["vote_breakdown"]["decision_counts"] == {"approve": 11}
+
+
+def test_aggregate_many_uses_delegation_graph():
+    from validators.strategies.delegation_graph import DelegationGraph
+
+    rng = random.Random(5)
+    reputations = {f"v{i}": rng.random() for i in range(40)}
+    graph = DelegationGraph({f"v{i}": f"v{i + 1}" for i in range(0, 30, 3)}, reputations)
+    batch = {f"h{i}": _votes(rng, rng.randrange(3, 12)) for i in range(60)}
+    for method in (VotingMethod.REPUTATION_WEIGHTED, VotingMethod.MAJORITY_RULE):
+        got = aggregate_many(batch, method, reputations, current_time=NOW, delegation=graph)
+        for hypothesis_id, votes in batch.items():
+            assert got[hypothesis_id] == aggregate_validator_votes(
+                votes, method, reputations, current_time=NOW, delegation=graph
+            )
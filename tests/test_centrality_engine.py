@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+pytest.importorskip("scipy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from causal_graph.centrality import CentralityEngine  # noqa: E402
+
+
+def _graph():
+    return nx.gnp_random_graph(60, 0.08, directed=True, seed=3)
+
+
+def test_refresh_matches_networkx_pagerank():
+    g = _graph()
+    engine = CentralityEngine(seed=0)
+    engine.load(g.nodes, g.edges)
+    scores = engine.refresh()
+    expected = nx.pagerank(g)
+    assert max(abs(scores[n] - expected[n]) for n in g) < 1e-5
+    conf = engine.influence_score(0)["confidence"]
+    assert conf is not None and 0.0 <= conf <= 1.0
+
+
+def test_follow_deltas_warm_start():
+    g = _graph()
+    engine = CentralityEngine(seed=0)
+    engine.load(g.nodes, g.edges)
+    engine.refresh()
+    cold_iterations = engine.iterations
+
+    engine.apply_follow_delta(1, 2, following=True)
+    engine.apply_follow_delta(100, 1, following=True)
+    g.add_edge(1, 2)
+    g.add_edge(100, 1)
+    assert engine.dirty
+    scores = engine.refresh()
+    expected = nx.pagerank(g)
+    assert max(abs(scores[n] - expected[n]) for n in g) < 1e-5
+    assert engine.iterations <= cold_iterations
+
+    engine.apply_follow_delta(100, 1, following=False)
+    g.remove_edge(100, 1)
+    scores = engine.refresh()
+    assert abs(scores[1] - nx.pagerank(g)[1]) < 1e-5
+
+
+def test_interaction_entropy_scores_match_per_user():
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from sqlalchemy.orm import sessionmaker
+
+    import db_models
+    from db_models import Comment, Harmonizer, VibeNode
+    from scientific_metrics import calculate_interaction_entropy, interaction_entropy_scores
+
+    engine = sqlalchemy.create_engine("sqlite://")
+    db_models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    users = [
+        Harmonizer(username=f"u{i}", email=f"u{i}@x.io", hashed_password="x")
+        for i in range(4)
+    ]
+    db.add_all(users)
+    db.flush()
+    node = VibeNode(name="n", author_id=users[0].id)
+    db.add(node)
+    db.flush()
+    db.add(Comment(content="c", author_id=users[0].id, vibenode_id=node.id))
+    db.add(Comment(content="d", author_id=users[1].id, vibenode_id=node.id))
+    users[1].liked_vibenodes.append(node)
+    users[2].following.append(users[0])
+    users[0].following.append(users[1])
+    db.commit()
+
+    scores = interaction_entropy_scores(db)
+    for user in users:
+        expected = calculate_interaction_entropy(user, db)["value"]
+        assert scores[user.id] == pytest.approx(expected)
+    assert scores[users[3].id] == 0.0
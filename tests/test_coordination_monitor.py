@@ -0,0 +1,195 @@
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from network import network_coordination_detector as ncd  # noqa: E402
+from network.coordination_monitor import CoordinationMonitor  # noqa: E402
+from network.embedding_cache import EmbeddingCache  # noqa: E402
+
+NOTES = [
+    "strong replication across independent labs",
+    "methodology looks sound and well documented",
+    "sample size is too small to conclude anything",
+    "zebra quokka jinx vexed fjord",
+]
+
+
+class FakeModel:
+    def encode(self, texts):
+        return np.array(
+            [[t.count(c) for c in "abcdefghijklmnopqrstuvwxyz"] for t in texts], dtype=float
+        )
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    monkeypatch.setattr(ncd, "_sentence_model", lambda: FakeModel())
+    monkeypatch.setattr(ncd, "_embedding_cache", EmbeddingCache())
+
+
+def _validator_note(i, row, rng):
+    row["note"] = NOTES[int(row["validator_id"][1:]) % len(NOTES)] + " " * rng.randrange(3)
+
+
+@pytest.fixture
+def validations(make_validations):
+    def build(seed=5, n=400):
+        return make_validations(
+            n,
+            seed,
+            validators=12,
+            hypotheses=[f"h{k}" for k in range(30)],
+            start=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            tweak=_validator_note,
+        )
+
+    return build
+
+
+def _pairs(clusters):
+    return {tuple(sorted(c["validators"])) for c in clusters}
+
+
+def _score_clusters(clusters):
+    return sorted(
+        (tuple(c["validators"]), c["similar_score_count"], c["avg_score_difference"]) for c in clusters
+    )
+
+
+def test_monitor_matches_batch_analysis(fake_model, validations):
+    rows = validations()
+    batch = ncd.analyze_coordination_patterns(rows)
+    monitor = CoordinationMonitor()
+    for v in rows:
+        monitor.ingest(v)
+    report = monitor.report()
+
+    for kind in ("temporal", "semantic"):
+        assert _pairs(report["coordination_clusters"][kind]) == _pairs(
+            batch["coordination_clusters"][kind]
+        )
+    assert report["risk_breakdown"] == batch["risk_breakdown"]
+    assert _score_clusters(report["coordination_clusters"]["score"]) == _score_clusters(
+        batch["coordination_clusters"]["score"]
+    )
+    score_flags = lambda result: sorted(f for f in result["flags"] if f.startswith("score_"))  # noqa: E731
+    assert score_flags(report) == score_flags(batch)
+    assert sorted(map(tuple, report["graph"]["edges"])) == sorted(batch["graph"]["edges"])
+    assert report["graph"]["nodes"] == batch["graph"]["nodes"]
+    assert 0.0 < monitor.overall_risk_score == report["overall_risk_score"]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_score_pairs_match_batch_ordering(seed):
+    # Few validators over many hypotheses, with re-submissions, so both
+    # orderings of a pair build up counts.
+    rng = random.Random(seed)
+    validations = [
+        {
+            "validator_id": f"v{rng.randrange(6)}",
+            "hypothesis_id": f"h{rng.randrange(40)}",
+            "score": round(rng.random(), 2),
+        }
+        for _ in range(600)
+    ]
+    batch = ncd.detect_score_coordination(validations)
+    monitor = CoordinationMonitor(encode=lambda texts: np.ones((len(texts), 2)))
+    monitor.ingest_many(validations)
+    report = monitor.report()
+    assert report["risk_breakdown"]["score"] == len(batch["score_clusters"])
+    assert _score_clusters(report["coordination_clusters"]["score"]) == _score_clusters(
+        batch["score_clusters"]
+    )
+    assert any(c["validators"][0] > c["validators"][1] for c in batch["score_clusters"])
+
+
+def test_score_resubmission_replaces_previous_score():
+    monitor = CoordinationMonitor(encode=lambda texts: np.ones((len(texts), 2)))
+    for h in range(4):
+        monitor.ingest_many(
+            [
+                {"validator_id": "a", "hypothesis_id": f"h{h}", "score": 0.5},
+                {"validator_id": "b", "hypothesis_id": f"h{h}", "score": 0.55},
+            ]
+        )
+    assert monitor.risk_breakdown["score"] == 1
+    monitor.ingest({"validator_id": "b", "hypothesis_id": "h0", "score": 0.9})
+    assert monitor.risk_breakdown["score"] == 0
+    assert monitor.similar_counts[("a", "b")] == 3
+
+
+def test_micro_batches_and_checkpoint_round_trip(tmp_path, fake_model, validations):
+    rows = validations(seed=9, n=200)
+    single = CoordinationMonitor()
+    for v in rows:
+        single.ingest(v)
+
+    batched = CoordinationMonitor()
+    batched.ingest_many(rows[:120])
+    path = str(tmp_path / "monitor.pkl")
+    batched.checkpoint(path)
+    resumed = CoordinationMonitor.restore(path)
+    for i in range(120, 200, 25):
+        resumed.ingest_many(rows[i : i + 25])
+
+    assert resumed.count == single.count == 200
+    assert resumed.risk_breakdown == single.risk_breakdown
+    assert resumed.overall_risk_score == single.overall_risk_score
+    assert resumed.report()["flags"] == single.report()["flags"]
+    assert list(tmp_path.iterdir()) == [tmp_path / "monitor.pkl"]
+
+
+def test_old_submissions_leave_retention(monkeypatch):
+    monkeypatch.setattr(ncd.Config, "MONITOR_SUBMISSION_RETENTION_MINUTES", 60)
+    monitor = CoordinationMonitor(encode=lambda texts: np.ones((len(texts), 2)))
+    start = datetime(2025, 1, 1)
+    for minute in range(0, 600, 2):
+        monitor.ingest(
+            {"validator_id": f"v{minute % 3}", "timestamp": (start + timedelta(minutes=minute)).isoformat()}
+        )
+    retained = sum(len(b) for b in monitor._submissions.values())
+    assert retained <= 60 // 2 + 2 * ncd.Config.TEMPORAL_WINDOW_MINUTES
+    assert len(monitor._submissions) == len(monitor._submission_buckets)
+    assert monitor.close_counts[("v0", "v1")] > 0
+
+
+def test_integrity_analysis_folds_batches_into_monitor(fake_model, validations):
+    vc = pytest.importorskip("validation_certifier")
+    from validation_frame import ValidationFrame
+
+    rows = validations(seed=3, n=200)
+    expected = CoordinationMonitor()
+    expected.ingest_many(rows)
+
+    monitor = CoordinationMonitor()
+    vc.run_full_integrity_analysis(rows[:80], 0.6, "strong", coordination_monitor=monitor)
+    frame = ValidationFrame.from_dicts(rows[80:])
+    analysis, _, _ = vc.run_full_integrity_analysis(
+        frame, 0.6, "strong", coordination_monitor=monitor
+    )
+    assert monitor.count == 200
+    assert monitor.report()["flags"] == expected.report()["flags"]
+    assert analysis["component_scores"]["coordination_safety"] == max(
+        0.0, 1.0 - expected.overall_risk_score
+    )
+
+
+def test_monitor_certifies_like_batch_analysis(fake_model, validations):
+    vc = pytest.importorskip("validation_certifier")
+
+    rows = validations(seed=11, n=300)
+    batch = vc.run_full_integrity_analysis(rows, 0.6, "strong")
+    monitored = vc.run_full_integrity_analysis(
+        rows, 0.6, "strong", coordination_monitor=CoordinationMonitor()
+    )
+    assert monitored[0]["component_scores"] == batch[0]["component_scores"]
+    assert monitored[2] == batch[2]
@@ -0,0 +1,67 @@
+import itertools
+import random
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("scipy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from network import network_coordination_detector as ncd  # noqa: E402
+from network.covalidation_graph import union_find_communities  # noqa: E402
+
+
+def _reference_edges(validations):
+    """The per-hypothesis combinations loop the sparse builder replaces."""
+    coverage = defaultdict(list)
+    for v in validations:
+        coverage[v["hypothesis_id"]].append(v["validator_id"])
+    weights = defaultdict(float)
+    for validators in coverage.values():
+        for v1, v2 in itertools.combinations(set(validators), 2):
+            weights[tuple(sorted([v1, v2]))] += 1.0
+    top = max(weights.values())
+    return sorted((a, b, w / top) for (a, b), w in weights.items() if w / top >= 0.1)
+
+
+def test_sparse_graph_matches_pairwise_reference():
+    rng = random.Random(4)
+    validations = [
+        {"validator_id": f"v{rng.randrange(60)}", "hypothesis_id": f"h{rng.randrange(40)}"}
+        for _ in range(900)
+    ]
+    validations.append({"validator_id": "v1"})  # ignored: no hypothesis
+    graph = ncd.build_validation_graph(validations)
+    expected = _reference_edges(validations[:-1])
+    assert [(a, b) for a, b, _ in graph["edges"]] == [(a, b) for a, b, _ in expected]
+    assert all(abs(w - e[2]) < 1e-9 for (_, _, w), e in zip(graph["edges"], expected))
+    assert graph["nodes"] == list(dict.fromkeys(v["validator_id"] for v in validations[:-1]))
+    assert sum(map(len, graph["hypothesis_coverage"].values())) == 900
+
+
+def test_union_find_handles_long_chains():
+    nodes = [f"n{i}" for i in range(20000)]
+    edges = [(a, b, 1.0) for a, b in zip(nodes, nodes[1:])]
+    edges.append(("x", "y", 0.2))
+    communities = ncd.detect_graph_communities(edges, set(nodes) | {"x", "y"})
+    assert len(communities) == 1 and communities[0] == set(nodes)
+    assert union_find_communities(edges, ["x", "y"], 0.1, 2) == [{"x", "y"}]
+
+
+def test_louvain_splits_weakly_joined_groups():
+    pytest.importorskip("networkx")
+    left = [f"a{i}" for i in range(5)]
+    right = [f"b{i}" for i in range(5)]
+    edges = [(a, b, 1.0) for group in (left, right) for a, b in itertools.combinations(group, 2)]
+    edges.append(("a0", "b0", 1.0))
+    nodes = set(left + right)
+    assert len(ncd.detect_graph_communities(edges, nodes)) == 1
+    louvain = ncd.detect_graph_communities(edges, nodes, "louvain")
+    assert sorted(map(sorted, louvain)) == [sorted(left), sorted(right)]
+    with pytest.raises(ValueError):
+        ncd.detect_graph_communities(edges, nodes, "leiden")
@@ -0,0 +1,74 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from validators.strategies.delegation_graph import DelegationGraph  # noqa: E402
+from validators.strategies.voting_consensus_engine import (  # noqa: E402
+    VotingMethod,
+    aggregate_validator_votes,
+)
+
+
+def test_chains_resolve_transitively_and_cycles_break_at_smallest_id():
+    reps = {"a": 0.1, "b": 0.2, "c": 0.3, "x": 0.4, "y": 0.5, "z": 0.6}
+    graph = DelegationGraph({"a": "b", "b": "c", "y": "z", "z": "x", "x": "y"}, reps)
+    assert graph.terminal("a") == "c"
+    assert graph.effective_weight("c") == pytest.approx(0.6)
+    assert graph.effective_weight("a") == 0.0
+    assert graph.cycle_roots == {"x"}
+    assert [graph.terminal(v) for v in "xyz"] == ["x", "x", "x"]
+    assert graph.effective_weight("x") == pytest.approx(1.5)
+    assert graph.effective_weight("unknown") == 0.5
+
+
+def test_incremental_updates_match_a_fresh_build():
+    rng = random.Random(7)
+    names = [f"v{i}" for i in range(60)]
+    reps = {n: rng.random() for n in names}
+    delegations = {}
+    graph = DelegationGraph(reputations=reps)
+    for _ in range(400):
+        v = rng.choice(names)
+        if rng.random() < 0.5:
+            reps[v] = rng.random()
+            graph.set_reputation(v, reps[v])
+        else:
+            target = rng.choice(names + [None])
+            graph.set_delegation(v, target)
+            if target is None or target == v:
+                delegations.pop(v, None)
+            else:
+                delegations[v] = target
+        fresh = DelegationGraph(delegations, reps)
+        assert graph.cycle_roots == fresh.cycle_roots
+        for n in names:
+            assert graph.terminal(n) == fresh.terminal(n)
+            assert graph.effective_weight(n) == pytest.approx(fresh.effective_weight(n))
+
+
+def test_consensus_counts_delegation_chains():
+    votes = [
+        {"validator_id": "a", "delegate_to": "b", "decision": "reject"},
+        {"validator_id": "b", "delegate_to": "c", "decision": "reject"},
+        {"validator_id": "c", "decision": "approve"},
+        {"validator_id": "d", "decision": "reject"},
+    ]
+    reps = {"a": 0.5, "b": 0.5, "c": 0.5, "d": 0.9}
+    result = aggregate_validator_votes(votes, VotingMethod.QUADRATIC, reps)
+    assert result["consensus_decision"] == "approve"
+    assert result["vote_breakdown"]["decision_weights"] == {"approve": 1.5, "reject": 0.9}
+
+    graph = DelegationGraph({"d": "c"}, reps)
+    plain = [{k: v for k, v in vote.items() if k != "delegate_to"} for vote in votes]
+    result = aggregate_validator_votes(plain, VotingMethod.QUADRATIC, reps, delegation=graph)
+    assert result["valid_votes"] == 3
+    assert result["vote_breakdown"]["decision_weights"] == {
+        "reject": 1.0,
+        "approve": 1.4,
+    }
@@ -0,0 +1,97 @@
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from causal_graph import InfluenceGraph  # noqa: E402
+from causal_graph.feedback_loops import (  # noqa: E402
+    cycle_strength,
+    iter_feedback_loops,
+    strongly_connected_components,
+)
+from scientific_metrics import detect_feedback_loops  # noqa: E402
+
+
+def _canon(cycle):
+    m = cycle.index(min(cycle))
+    return tuple(cycle[m:] + cycle[:m])
+
+
+def _random_graph(seed, n=9, m=30):
+    rng = random.Random(seed)
+    g = InfluenceGraph()
+    for _ in range(m):
+        g.add_edge(rng.randrange(n), rng.randrange(n), weight=rng.uniform(-1, 1))
+    return g
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_networkx_cycles(seed):
+    g = _random_graph(seed)
+    for bound in (1, 3, 5, None):
+        expected = {_canon(c) for c in nx.simple_cycles(g.graph, length_bound=bound)}
+        found = [_canon(loop["nodes"]) for loop in iter_feedback_loops(g, max_length=bound)]
+        assert len(found) == len(set(found))
+        assert set(found) == expected
+    sccs = {frozenset(c) for c in strongly_connected_components(g)}
+    assert sccs == {frozenset(c) for c in nx.strongly_connected_components(g.graph)}
+
+
+def test_strength_is_signed_geometric_mean():
+    assert cycle_strength([0.5, 0.5, 2.0]) == pytest.approx(0.5 ** (1 / 3))
+    assert cycle_strength([-0.25, 1.0]) == pytest.approx(-0.5)
+    assert cycle_strength([-0.5, -0.5]) == pytest.approx(0.5)
+    assert cycle_strength([0.7, 0.0]) == 0.0
+    # A product that underflows still has a meaningful mean
+    assert cycle_strength([1e-200] * 3) == pytest.approx(1e-200)
+    assert not math.isnan(cycle_strength([1e-320, 1.0]))
+
+
+def test_detect_returns_strongest_first():
+    g = InfluenceGraph()
+    g.add_edge("a", "b", weight=0.9)
+    g.add_edge("b", "a", weight=0.9)
+    g.add_edge("b", "c", weight=0.2)
+    g.add_edge("c", "a", weight=0.2)
+    g.add_edge("d", "d", weight=0.5)
+    g.add_edge("c", "e", weight=1.0)  # not on any cycle
+
+    loops = detect_feedback_loops(g)
+    assert [sorted(loop["nodes"]) for loop in loops] == [["a", "b"], ["d"], ["a", "b", "c"]]
+    assert loops[0]["strength"] == pytest.approx(0.9)
+    assert detect_feedback_loops(g, top_k=1) == loops[:1]
+    assert len(detect_feedback_loops(g, max_length=2)) == 2
+
+
+def test_search_budget_bounds_work():
+    g = InfluenceGraph()
+    nodes = range(30)
+    for u in nodes:
+        for v in nodes:
+            if u != v:
+                g.add_edge(u, v, weight=0.5)
+    loops = list(iter_feedback_loops(g, max_length=None, max_steps=5000))
+    assert 0 < len(loops) <= 5000
+    assert len(detect_feedback_loops(g, top_k=10, max_steps=20000)) == 10
+
+
+def test_search_budget_is_per_component():
+    g = InfluenceGraph()
+    for offset in (0, 100):
+        nodes = range(offset, offset + 20)
+        for u in nodes:
+            for v in nodes:
+                if u != v:
+                    g.add_edge(u, v, weight=0.5)
+    g.add_edge(0, 100, weight=0.5)  # one-way bridge keeps the components apart
+    loops = list(iter_feedback_loops(g, max_length=None, max_steps=2000))
+    assert {loop["nodes"][0] >= 100 for loop in loops} == {False, True}
+    assert all(len({n >= 100 for n in loop["nodes"]}) == 1 for loop in loops)
@@ -0,0 +1,101 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from hook_manager import HookManager  # noqa: E402
+
+
+def test_dispatch_does_not_wait_for_slow_hooks():
+    manager = HookManager()
+    release = threading.Event()
+    seen = []
+
+    def slow(event):
+        release.wait(2)
+        seen.append(event)
+
+    async def fast(event):
+        seen.append(("async", event))
+
+    manager.register_hook("E", slow)
+    manager.register_hook("E", fast)
+    dispatcher = manager.start_dispatcher(hook_timeout=5)
+    started = time.perf_counter()
+    for i in range(5):
+        assert manager.dispatch("E", i)
+    assert time.perf_counter() - started < 0.5
+    release.set()
+    assert dispatcher.flush(5)
+    assert sorted(e for e in seen if isinstance(e, int)) == list(range(5))
+    stats = manager.hook_stats()
+    assert {s["calls"] for s in stats.values()} == {5}
+    dispatcher.close(1)
+
+
+def test_timeouts_failures_and_backpressure_are_counted():
+    manager = HookManager()
+    gate = threading.Event()
+
+    async def hang(event):
+        await asyncio.sleep(10)
+
+    def boom(event):
+        raise RuntimeError("boom")
+
+    def blocker(event):
+        gate.wait(2)
+
+    manager.register_hook("T", hang)
+    manager.register_hook("F", boom)
+    manager.register_hook("B", blocker)
+    dispatcher = manager.start_dispatcher(max_pending=2, hook_timeout=0.05)
+    manager.dispatch("T", 1)
+    manager.dispatch("F", 1)
+    assert dispatcher.flush(2)
+    stats = manager.hook_stats()
+    assert stats["T:test_timeouts_failures_and_backpressure_are_counted.<locals>.hang"]["timeouts"] == 1
+    assert stats["F:test_timeouts_failures_and_backpressure_are_counted.<locals>.boom"]["failures"] == 1
+
+    dispatcher.hook_timeout = 5
+    assert manager.dispatch("B", 1) and manager.dispatch("B", 2)
+    assert not manager.dispatch("B", 3)
+    assert dispatcher.dropped == 1
+    gate.set()
+    assert dispatcher.flush(5)
+    dispatcher.close(1)
+
+
+def test_fire_hooks_inside_running_loop():
+    manager = HookManager()
+    manager.register_hook("X", lambda v: v * 2)
+
+    async def main():
+        return manager.fire_hooks("X", 21)
+
+    assert asyncio.run(main()) == [42]
+    assert manager.dispatch("X", 1)
+
+
+def test_stop_dispatcher_drains_and_unregisters_atexit(monkeypatch):
+    import atexit
+
+    registered = []
+    monkeypatch.setattr(atexit, "register", lambda func, *a: registered.append(func))
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+    manager = HookManager()
+    seen = []
+    manager.register_hook("S", seen.append)
+    dispatcher = manager.start_dispatcher()
+    assert registered == [dispatcher.close]
+    assert manager.dispatch("S", 1)
+    manager.stop_dispatcher(5)
+    assert seen == [1] and registered == [] and manager.dispatcher is None
+    assert not dispatcher._thread.is_alive()
+    dispatcher.close()  # idempotent
+    assert manager.dispatch("S", 2) and seen == [1, 2]
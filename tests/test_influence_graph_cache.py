@@ -0,0 +1,150 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("networkx")
+pytest.importorskip("scipy")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import db_models  # noqa: E402
+from causal_graph import build_causal_graph  # noqa: E402
+from causal_graph.graph_cache import InfluenceGraphCache  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    engine = sqlalchemy.create_engine("sqlite://")
+    db_models.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    users = [
+        db_models.Harmonizer(
+            username=f"u{i}", email=f"u{i}@example.com", hashed_password="x"
+        )
+        for i in range(4)
+    ]
+    session.add_all(users)
+    session.commit()
+    users[0].following.append(users[1])
+    users[1].following.append(users[2])
+    node = db_models.VibeNode(name="n", author_id=users[2].id)
+    session.add(node)
+    session.commit()
+    yield session
+    session.close()
+
+
+def _edges(graph):
+    return {(u, v): d["edge_type"] for u, v, d in graph.graph.edges(data=True)}
+
+
+def test_cache_tracks_deltas_like_a_rebuild(db):
+    cache = InfluenceGraphCache(publish_interval=0)
+    graph = cache.get(db)
+    assert _edges(graph) == _edges(build_causal_graph(db))
+    assert cache.get(db) is graph
+
+    u0, u1, u2, u3 = (u.id for u in db.query(db_models.Harmonizer).order_by("id"))
+    node = db.query(db_models.VibeNode).first()
+    node.likes.append(db.get(db_models.Harmonizer, u1))
+    db.get(db_models.Harmonizer, u3).following.append(db.get(db_models.Harmonizer, u0))
+    db.commit()
+    cache.record_like(u1, u2, liked=True)
+    cache.record_follow(u3, u0, following=True)
+    assert cache.version > cache.published_version
+
+    updated = cache.get(db)
+    assert updated is not graph
+    assert _edges(updated) == _edges(build_causal_graph(db))
+    assert (u3, u0) not in _edges(graph)
+
+    # The like keeps the shared edge alive after the follow is removed.
+    db.get(db_models.Harmonizer, u1).following.remove(db.get(db_models.Harmonizer, u2))
+    db.commit()
+    cache.record_follow(u1, u2, following=False)
+    assert _edges(cache.get(db)) == _edges(build_causal_graph(db))
+
+    node.likes.clear()
+    db.commit()
+    cache.record_like(u1, u2, liked=False)
+    assert _edges(cache.get(db)) == _edges(build_causal_graph(db))
+
+
+def test_influence_score_and_snapshot_restore(db):
+    cache = InfluenceGraphCache(publish_interval=0)
+    u0, u1, u2, _ = (u.id for u in db.query(db_models.Harmonizer).order_by("id"))
+    score = cache.influence_score(db, u2)
+    assert score["method"] == "PageRank"
+    assert score["value"] > cache.influence_score(db, u0)["value"]
+
+    key = cache.snapshot(db)
+    restored = InfluenceGraphCache(publish_interval=0)
+    assert restored.restore(db, key)
+    assert _edges(restored.get(db)) == _edges(cache.get(db))
+
+
+def test_snapshots_are_pruned_and_restored_on_cold_start(db, monkeypatch):
+    from causal_graph import graph_cache
+
+    cache = InfluenceGraphCache(publish_interval=0)
+    cache.get(db)
+    clock = iter(range(1_700_000_000, 1_700_000_010))
+
+    class _Clock:
+        @staticmethod
+        def utcnow():
+            from datetime import datetime
+
+            return datetime.utcfromtimestamp(next(clock))
+
+    import causal_graph
+
+    monkeypatch.setattr(causal_graph, "datetime", _Clock)
+    keys = [cache.snapshot(db, keep=2) for _ in range(4)]
+    monkeypatch.undo()
+    stored = {
+        k for (k,) in db.query(db_models.SystemState.key)
+        if k.startswith("graph_snapshot_")
+    }
+    assert stored == set(keys[-2:])
+
+    cold = graph_cache.InfluenceGraphCache(publish_interval=0, ttl_seconds=10**10)
+    monkeypatch.setattr(
+        graph_cache, "load_interactions", lambda _db: pytest.fail("rebuilt from db")
+    )
+    assert _edges(cold.get(db)) == _edges(cache.get(db))
+
+
+def test_create_app_starts_and_stops_the_snapshot_task(monkeypatch):
+    import asyncio
+
+    sn = pytest.importorskip("superNova_2177")
+    sn.create_app()
+    assert sn.app.router.lifespan_context is sn.influence_graph_lifespan
+
+    started, saved = asyncio.Event(), []
+
+    async def snapshot_task(_factory):
+        started.set()
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(sn, "influence_graph_snapshot_task", snapshot_task)
+    monkeypatch.setattr(sn, "save_influence_graph_snapshot", saved.append)
+    monkeypatch.setattr(sn, "_influence_graph_snapshot_task", None)
+
+    async def lifecycle():
+        async with sn.app.router.lifespan_context(sn.app):
+            await asyncio.wait_for(started.wait(), 5)
+            task = sn._influence_graph_snapshot_task
+            assert not saved
+        await asyncio.sleep(0)
+        return task
+
+    assert asyncio.run(lifecycle()).cancelled()
+    assert saved == [sn.SessionLocal]
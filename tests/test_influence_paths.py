@@ -0,0 +1,72 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from causal_graph import InfluenceGraph  # noqa: E402
+from causal_graph.influence_paths import (  # noqa: E402
+    count_simple_paths,
+    max_product_influence,
+    single_source_influence,
+)
+
+
+def _brute_force(g, source, target, cutoff=None):
+    best = 0.0 if source != target else 1.0
+    found = None
+    for path in nx.all_simple_paths(g, source, target, cutoff=cutoff):
+        w = 1.0
+        for u, v in zip(path[:-1], path[1:]):
+            w *= g[u][v].get("weight", 1.0)
+        found = w if found is None or w > found else found
+    return found if found is not None else best
+
+
+@pytest.mark.parametrize("negative", [False, True])
+@pytest.mark.parametrize("max_hops", [None, 2, 3])
+def test_matches_simple_path_enumeration(negative, max_hops):
+    rng = random.Random(7)
+    for seed in range(25):
+        g = nx.gnp_random_graph(8, 0.35, directed=True, seed=seed)
+        for u, v in g.edges:
+            g[u][v]["weight"] = rng.uniform(-1, 1) if negative else rng.uniform(0, 1)
+        for target in range(1, 8):
+            expected = _brute_force(g, 0, target, max_hops)
+            assert max_product_influence(g, 0, target, max_hops=max_hops) == pytest.approx(expected)
+            batched = single_source_influence(g, 0, max_hops=max_hops)
+            assert batched.get(target, 0.0) == pytest.approx(expected)
+
+
+def test_influence_graph_queries_and_path_count():
+    g = InfluenceGraph()
+    g.add_interaction(1, 2, weight=0.5)
+    g.add_interaction(2, 3, weight=0.5)
+    g.add_interaction(1, 3, weight=0.2)
+    assert g.query_influence(1, 3) == pytest.approx(0.25)
+    assert g.query_influence(1, 3, max_hops=1) == pytest.approx(0.2)
+    assert g.influence_from(1) == pytest.approx({1: 1.0, 2: 0.5, 3: 0.25})
+    assert g.query_influence(3, 1) == 0.0
+    assert count_simple_paths(g, 1, 3) == 2
+    assert count_simple_paths(g, 1, 3, limit=1) == 1
+
+
+def test_path_count_is_bounded_on_dense_graphs():
+    import time
+
+    g = nx.complete_graph(11, create_using=nx.DiGraph)
+    g.add_node("island")
+    g.add_edge("island", 0)
+    started = time.perf_counter()
+    assert count_simple_paths(g, 0, "island") == 0
+    # Hop pruning matches brute-force enumeration.
+    expected = sum(1 for _ in nx.all_simple_paths(g, 0, 5, cutoff=3))
+    assert count_simple_paths(g, 0, 5, max_hops=3, limit=10**6) == expected
+    assert 0 < count_simple_paths(g, 0, 5, limit=10**9, max_steps=5000) < 5000
+    assert time.perf_counter() - started < 5
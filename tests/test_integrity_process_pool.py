@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+import validation_certifier as vc  # noqa: E402
+from validation_frame import ValidationFrame  # noqa: E402
+
+
+@pytest.fixture
+def validations(make_validations):
+    def build(n, seed=5):
+        return make_validations(
+            n,
+            seed,
+            hypotheses=["default_hypothesis", "h1", "h2"],
+            notes=["I support this result", "We refute this claim entirely", ""],
+            score_digits=None,
+            floats=("confidence", "signal_strength"),
+            choices={"specialty": ["bio", "chem", "phys"], "affiliation": ["A", "B"]},
+        )
+
+    return build
+
+
+@pytest.fixture
+def small_pool(monkeypatch, tmp_path):
+    monkeypatch.setattr(vc.Config, "PROCESS_POOL_WORKERS", 2)
+    monkeypatch.setattr(vc.Config, "PROCESS_POOL_MIN_VALIDATIONS", 0)
+    monkeypatch.setattr(vc.Config, "SHARED_FRAME_DIR", str(tmp_path))
+    vc.shutdown_process_pool()
+    yield tmp_path
+    vc.shutdown_process_pool()
+
+
+def test_process_pool_matches_in_process(small_pool, validations):
+    frame = ValidationFrame.from_dicts(validations(300))
+    vc.warm_process_pool()
+    pool = vc.get_process_pool()
+    expected = vc.run_full_integrity_analysis(frame, 0.6, "strong", use_process_pool=False)
+    assert vc.run_full_integrity_analysis(frame, 0.6, "strong", use_process_pool=True) == expected
+    # The pool persists across calls and shared frames are cleaned up.
+    assert vc.run_full_integrity_analysis(frame, 0.6, "strong", use_process_pool=True) == expected
+    assert vc.get_process_pool() is pool
+    assert not list(small_pool.iterdir())
+
+
+def test_small_batches_stay_in_process(small_pool, monkeypatch, validations):
+    monkeypatch.setattr(vc.Config, "PROCESS_POOL_MIN_VALIDATIONS", 10_000)
+    vc.run_full_integrity_analysis(validations(50), 0.6, "strong", use_process_pool=True)
+    assert vc._process_pool is None
+
+
+def test_worker_releases_frame_after_task(tmp_path, monkeypatch, validations):
+    import gc
+    import weakref
+
+    ValidationFrame.from_dicts(validations(30)).save(tmp_path)
+    loaded = []
+    load = ValidationFrame.load
+
+    def tracking_load(directory, mmap=True):
+        frame = load(directory, mmap)
+        loaded.append(weakref.ref(frame))
+        return frame
+
+    monkeypatch.setattr(ValidationFrame, "load", tracking_load)
+    assert "diversity_score" in vc._run_shared("diversity", str(tmp_path))
+    gc.collect()
+    assert len(loaded) == 1 and loaded[0]() is None
@@ -0,0 +1,69 @@
+import datetime
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import db_models  # noqa: E402
+import superNova_2177 as sn  # noqa: E402
+from scientific_utils import (  # noqa: E402
+    calculate_genesis_bonus_decay,
+    calculate_genesis_bonus_decay_many,
+)
+
+UTC = datetime.timezone.utc
+
+
+def test_batch_genesis_decay_matches_single_calls():
+    now = datetime.datetime.now(UTC)
+    joins = [now - datetime.timedelta(days=d) for d in (0, 100, 365 * 3, 365 * 6)]
+    batch = calculate_genesis_bonus_decay_many(joins + [None], 5, now=now)
+    assert batch[-1] == Decimal("1")
+    assert batch[3] == Decimal("0")
+    for join, weight in zip(joins, batch):
+        assert abs(weight - calculate_genesis_bonus_decay(join, 5)) < Decimal("1e-6")
+
+
+def test_in_memory_decay_updates_dicts_in_place():
+    storage = sn.InMemoryStorage()
+    joined = (datetime.datetime.now(UTC) - datetime.timedelta(days=365.25)).isoformat()
+    storage.set_user("a", {"karma": "100", "is_genesis": False, "species": "human"})
+    storage.set_user("g", {"karma": "100", "is_genesis": True, "join_time": joined})
+    assert storage.apply_karma_decay(Decimal("0.5"), 2) == 2
+    assert Decimal(storage.get_user("a")["karma"]) == Decimal("50")
+    assert float(storage.get_user("g")["karma"]) == pytest.approx(25.0, abs=0.01)
+    assert storage.get_user("a")["species"] == "human"
+
+
+def test_sql_decay_uses_bulk_updates():
+    engine = sqlalchemy.create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    db_models.Base.metadata.create_all(engine)
+    storage = sn.SQLAlchemyStorage(sessionmaker(bind=engine))
+    year_ago = datetime.datetime.utcnow() - datetime.timedelta(days=365.25)
+    with storage.unit_of_work():
+        for i in range(7):
+            storage.set_user(
+                f"u{i}",
+                {
+                    "email": f"u{i}@example.com",
+                    "hashed_password": "x",
+                    "karma_score": 100.0,
+                    "is_genesis": i < 3,
+                    "created_at": year_ago,
+                },
+            )
+    assert storage.apply_karma_decay(Decimal("0.5"), 2, chunk_size=2) == 7
+    assert storage.get_user("u5")["karma_score"] == pytest.approx(50.0)
+    assert storage.get_user("u0")["karma_score"] == pytest.approx(25.0, abs=0.01)
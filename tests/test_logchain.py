@@ -0,0 +1,75 @@
+import sys
+import threading
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from logchain import LogChain  # noqa: E402
+
+
+def _events(n, start=0):
+    return [{"event": "TEST", "n": i} for i in range(start, start + n)]
+
+
+def test_reopen_replay_since_and_verify(tmp_path):
+    path = str(tmp_path / "chain.log")
+    log = LogChain(path, segment_bytes=400, index_interval=4)
+    for event in _events(20):
+        log.add(event)
+    checkpoint = log._last_ts
+    for event in _events(5, 20):
+        log.add(event)
+    log.close()
+    assert len(list(tmp_path.glob("chain.log.*.seg"))) > 1
+
+    reopened = LogChain(path, segment_bytes=400, index_interval=4)
+    assert len(reopened) == 25
+    assert reopened.verify()
+    seen = []
+    assert reopened.replay_events(seen.append, since=checkpoint) == 5
+    assert [e["n"] for e in seen] == list(range(20, 25))
+    assert [e["n"] for e in reopened.iter_events()] == list(range(25))
+    assert reopened.verify(since=checkpoint)
+
+    reopened.add({"event": "TEST", "n": 25})
+    assert [e["n"] for e in reopened.entries][-2:] == [24, 25]
+
+
+def test_torn_tail_is_truncated_and_tampering_detected(tmp_path):
+    path = str(tmp_path / "chain.log")
+    log = LogChain(path, index_interval=2, fsync=False)
+    for event in _events(6):
+        log.add(event)
+    log.close()
+    segment = tmp_path / "chain.log.000000.seg"
+    data = segment.read_bytes()
+    segment.write_bytes(data[:-3])
+
+    log = LogChain(path, index_interval=2, fsync=False)
+    assert len(log) == 5
+    log.add({"event": "TEST", "n": 99})
+    assert len(log) == 6
+    assert log.verify()
+    log.close()
+
+    data = bytearray(segment.read_bytes())
+    data[data.index(b'"n": 2') + 5] = ord("7")
+    segment.write_bytes(bytes(data))
+    assert not LogChain(path, index_interval=2, fsync=False).verify()
+
+
+def test_concurrent_adds_share_group_commits(tmp_path):
+    log = LogChain(str(tmp_path / "chain.log"), index_interval=16)
+    threads = [
+        threading.Thread(target=lambda i=i: [log.add(e) for e in _events(50, i * 50)])
+        for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(log) == 200
+    assert sorted(e["n"] for e in log.iter_events()) == list(range(200))
+    assert log.verify()
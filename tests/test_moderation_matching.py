@@ -0,0 +1,136 @@
+import random
+import re
+import string
+import sys
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from moderation_utils import (  # noqa: E402
+    BlockMatcher,
+    FuzzyKeywordIndex,
+    Vaccine,
+    bounded_levenshtein,
+    keyword_edit_distance,
+    literal_keyword,
+)
+from scientific_utils import levenshtein_distance  # noqa: E402
+
+
+def test_block_matcher_agrees_with_individual_regexes():
+    patterns = [
+        r"\b(blocked_word)\b",
+        r"\bspam\b",
+        r"\b(?:scam)\b",
+        r"buy\s+now",
+        r"(ab)\1",
+    ]
+    matcher = BlockMatcher(patterns)
+    assert matcher.words == {"blocked_word", "spam", "scam"}
+    texts = [
+        "hello world",
+        "this is SPAM",
+        "spammer here",
+        "blocked_word!",
+        "xblocked_word",
+        "please buy   now",
+        "abab",
+        "ab ab",
+        '{"content": "scam"}',
+    ]
+    for text in texts:
+        expected = any(re.search(p, text, re.IGNORECASE) for p in patterns)
+        assert matcher.search(text.lower()) == expected, text
+    assert matcher.first_match("please buy now") == r"buy\s+now"
+
+
+def test_fuzzy_index_matches_brute_force():
+    rng = random.Random(1)
+
+    def word(lo, hi):
+        return "".join(rng.choice("abcde") for _ in range(rng.randint(lo, hi)))
+
+    keywords = {word(3, 7) for _ in range(60)}
+    for threshold in (0, 1, 2):
+        index = FuzzyKeywordIndex(keywords, threshold)
+        for _ in range(300):
+            w = word(3, 8)
+            expected = any(levenshtein_distance(w, k) <= threshold for k in keywords)
+            hit = index.match(w)
+            assert (hit is not None) == expected
+            if hit is not None:
+                assert levenshtein_distance(w, hit) <= threshold
+
+
+def test_bounded_levenshtein_and_keyword_extraction():
+    for _ in range(200):
+        a = "".join(random.choice(string.ascii_lowercase[:4]) for _ in range(random.randint(0, 6)))
+        b = "".join(random.choice(string.ascii_lowercase[:4]) for _ in range(random.randint(0, 6)))
+        exact = levenshtein_distance(a, b)
+        assert bounded_levenshtein(a, b, 2) == min(exact, 3)
+    assert literal_keyword(r"\b(blocked_word)\b") == "blocked_word"
+    assert literal_keyword(r"\bBad\b") == "bad"
+    assert literal_keyword(r"buy\s+now") is None
+
+
+def test_vaccine_uses_block_matcher():
+    class Cfg:
+        VAX_PATTERNS = {"block": [r"\b(blocked_word)\b", r"evil\d+"]}
+
+    vaccine = Vaccine(Cfg())
+    assert vaccine.scan("all good")
+    assert not vaccine.scan('{"content": "Blocked_Word"}')
+    assert not vaccine.scan("evil42")
+    assert not vaccine.scan("badword")
+
+
+def test_length_scaled_fuzzy_matching_spares_short_words():
+    index = FuzzyKeywordIndex(["hate", "violence", "disinformation"], 2, length_scaled=True)
+    for word in ("have", "date", "hat", "late", "that", "here", "make"):
+        assert index.match(word) is None, word
+    assert index.match("hate") == "hate"
+    assert index.match("violense") == "violence"
+    assert index.match("vilense") is None
+    assert index.match("disinfromation") == "disinformation"
+
+    rng = random.Random(2)
+    keywords = {"".join(rng.choice("abcd") for _ in range(rng.randint(3, 11))) for _ in range(40)}
+    scaled = FuzzyKeywordIndex(keywords, 2, length_scaled=True)
+    for _ in range(300):
+        w = "".join(rng.choice("abcd") for _ in range(rng.randint(3, 12)))
+        expected = any(
+            levenshtein_distance(w, k) <= keyword_edit_distance(k, 2) for k in keywords
+        )
+        assert (scaled.match(w) is not None) == expected
+
+
+def test_harmony_scanner_allows_near_misses_of_short_keywords():
+    import pytest
+
+    sn = pytest.importorskip("superNova_2177")
+
+    config = sn.Config()
+    config.VAX_PATTERNS = {"block": [r"\b(hate)\b", r"\b(propaganda)\b"]}
+    scanner = sn.HarmonyScanner(config)
+    assert scanner.scan("I have a date later, make that here")
+    with pytest.raises(sn.DissonantContentError):
+        scanner.scan("we hate this")
+    with pytest.raises(sn.DissonantContentError):
+        scanner.scan("pure propoganda")
+
+
+def test_harmony_scanner_fuzzy_lengths_come_from_config():
+    import pytest
+
+    sn = pytest.importorskip("superNova_2177")
+
+    config = sn.Config()
+    config.VAX_PATTERNS = {"block": [r"\b(hate)\b"]}
+    config.VAX_FUZZY_EXACT_MAX_LEN = 3
+    scanner = sn.HarmonyScanner(config)
+    with pytest.raises(sn.DissonantContentError):
+        scanner.scan("I have a plan")
+    assert keyword_edit_distance("hate", 2, 3, 8) == 1
+    assert keyword_edit_distance("propaganda", 2, 4, 10) == 1
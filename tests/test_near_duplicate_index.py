@@ -0,0 +1,150 @@
+import random
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+import diversity_analyzer  # noqa: E402
+import hypothesis_reasoner  # noqa: E402
+from near_duplicate_index import (  # noqa: E402
+    NearDuplicateIndex,
+    candidate_pairs,
+    candidate_probability,
+    edit_ratio_jaccard,
+    lsh_parameters,
+)
+
+
+def _texts(n=300, seed=5):
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnop") for _ in range(rng.randrange(3, 8))) for _ in range(400)]
+    bases = [" ".join(rng.choice(vocab) for _ in range(rng.randrange(5, 15))) for _ in range(n // 5)]
+    texts = []
+    for _ in range(n):
+        chars = list(rng.choice(bases))
+        for _ in range(rng.randrange(0, len(chars) // 10 + 1)):
+            chars[rng.randrange(len(chars))] = rng.choice("xyz ")
+        texts.append("".join(chars))
+    return texts
+
+
+def _edited_texts(n=300, seed=5, edits=2):
+    """Copies of base texts with a few words inserted, dropped or replaced."""
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnop") for _ in range(rng.randrange(3, 8))) for _ in range(400)]
+    bases = [[rng.choice(vocab) for _ in range(rng.randrange(5, 15))] for _ in range(n // 5)]
+    texts = []
+    for _ in range(n):
+        words = list(rng.choice(bases))
+        for _ in range(rng.randrange(0, edits + 1)):
+            edit = rng.random()
+            if edit < 0.4:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(vocab))
+            elif edit < 0.7 and len(words) > 1:
+                del words[rng.randrange(len(words))]
+            else:
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+        texts.append(" ".join(words))
+    return texts
+
+
+def test_candidates_cover_near_duplicates():
+    texts = _texts() + ["", "", "ab"]
+    pairs = candidate_pairs(texts)
+    assert pairs == sorted(set(pairs))
+    assert all(i < j for i, j in pairs)
+    assert (len(texts) - 3, len(texts) - 2) in pairs  # empty texts share the empty signature
+    found = set(pairs)
+    for i, j in combinations(range(len(texts) - 3), 2):
+        if texts[i] == texts[j]:
+            assert (i, j) in found
+    assert len(found) < len(texts) * (len(texts) - 1) // 4
+
+
+def test_banding_tracks_threshold_and_streams_in_order():
+    for threshold in (0.1, 0.3, 0.5, 0.7):
+        bands, rows = lsh_parameters(threshold, 256)
+        assert bands * rows <= 256
+        assert abs((1 / bands) ** (1 / rows) - threshold) < 0.06
+    index = NearDuplicateIndex(_texts(), threshold=0.5)
+    assert (index.bands, index.rows) == lsh_parameters(0.5)
+    assert list(index.iter_candidate_pairs(chunk_size=7)) == index.candidate_pairs()
+    assert len(index.candidate_pairs()) < len(NearDuplicateIndex(_texts()).candidate_pairs())
+
+
+def test_recall_tuning_adds_rows_and_filters_lengths():
+    jaccard = edit_ratio_jaccard(0.7)
+    bands, rows = lsh_parameters(jaccard, 256, recall=0.95)
+    assert candidate_probability(jaccard, bands, rows) >= 0.95
+    assert candidate_probability(jaccard, 256 // (rows + 1), rows + 1) < 0.95
+    assert rows > lsh_parameters(0.1, 256)[1]
+
+    texts = _edited_texts()
+    index = NearDuplicateIndex.for_edit_ratio(texts, 0.7)
+    assert (index.bands, index.rows) == (bands, rows)
+    pairs = index.candidate_pairs()
+    assert all(2 * min(len(texts[i]), len(texts[j])) >= 0.7 * (len(texts[i]) + len(texts[j])) for i, j in pairs)
+    assert list(index.iter_candidate_pairs(chunk_size=7)) == pairs
+    assert NearDuplicateIndex.for_edit_ratio(["abcdefgh", "abcdefgh" * 3], 0.7).candidate_pairs() == []
+
+
+def test_signatures_are_deterministic():
+    texts = _texts(20)
+    a = NearDuplicateIndex(texts, seed=3).signatures
+    b = NearDuplicateIndex(texts, seed=3).signatures
+    assert (a == b).all()
+    assert len(NearDuplicateIndex(texts)) == 20
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(texts, shingle_size=8)
+
+
+def _contradicting_notes(edits):
+    rng = random.Random(2)
+    return [
+        {"validator_id": f"v{i}", "note": text + rng.choice(["", " but we disagree", " we refute it"])}
+        for i, text in enumerate(_edited_texts(250, edits=edits))
+    ]
+
+
+def test_semantic_contradictions_match_exact(monkeypatch):
+    validations = _contradicting_notes(edits=0)
+    expected = diversity_analyzer.detect_semantic_contradictions(validations)
+    assert expected
+    monkeypatch.setattr(diversity_analyzer.Config, "NEAR_DUPLICATE_EXACT_LIMIT", 10)
+    assert diversity_analyzer.detect_semantic_contradictions(validations) == expected
+
+
+def test_semantic_contradictions_recall_with_scattered_edits(monkeypatch):
+    validations = _contradicting_notes(edits=2)
+    expected = diversity_analyzer.detect_semantic_contradictions(validations)
+    monkeypatch.setattr(diversity_analyzer.Config, "NEAR_DUPLICATE_EXACT_LIMIT", 10)
+    found = diversity_analyzer.detect_semantic_contradictions(validations)
+    assert all(c in expected for c in found)
+    assert len(found) >= 0.95 * len(expected)
+
+
+def test_conflicting_hypotheses_match_exact(monkeypatch):
+    rng = random.Random(4)
+    hypotheses = [
+        {
+            "hypothesis_id": f"HYP_{i}",
+            "status": "open",
+            "text": text,
+            "score": rng.random(),
+            "supporting_nodes": rng.sample(range(20), 3),
+        }
+        for i, text in enumerate(_edited_texts(80, seed=7))
+    ]
+    hypotheses.append({"hypothesis_id": "HYP_none", "status": "open", "text": None})
+    monkeypatch.setattr(hypothesis_reasoner, "_get_all_hypotheses", lambda db: hypotheses)
+    expected = hypothesis_reasoner.detect_conflicting_hypotheses(None)
+    assert expected
+    monkeypatch.setattr(hypothesis_reasoner.CONFIG, "NEAR_DUPLICATE_EXACT_LIMIT", 10, raising=False)
+    assert hypothesis_reasoner.detect_conflicting_hypotheses(None) == expected
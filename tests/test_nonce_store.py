@@ -0,0 +1,117 @@
+import sys
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from nonce_store import NonceStore  # noqa: E402
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_slots_expire_after_ttl():
+    clock = Clock()
+    store = NonceStore(ttl_seconds=300, slot_seconds=60, clock=clock)
+    assert store.add("a")
+    assert not store.add("a")
+    clock.now += 120
+    assert store.add("b")
+    assert "a" in store and len(store) == 2
+    clock.now += 250
+    assert store.expire() == 1
+    assert "a" not in store and "b" in store
+    assert len(store._slots) == 1
+    assert store.add("a")
+
+
+def test_bloom_prefilter_keeps_exact_answers():
+    clock = Clock()
+    store = NonceStore(ttl_seconds=600, slot_seconds=60, bloom_bits=1 << 12, clock=clock)
+    for i in range(500):
+        assert store.add(f"n{i}")
+        clock.now += 1
+    assert all(f"n{i}" in store for i in range(500))
+    assert not any(f"m{i}" in store for i in range(500))
+    assert not store.add("n42")
+    clock.now += 700
+    assert store.add("n499")
+
+
+def test_round_trip_through_snapshot_dict():
+    clock = Clock()
+    store = NonceStore(ttl_seconds=600, clock=clock)
+    for i in range(10):
+        store.add(f"n{i}")
+        clock.now += 30
+    data = store.to_dict()
+
+    restored = NonceStore(ttl_seconds=600, bloom_bits=1 << 10, clock=clock)
+    restored.load_dict(data)
+    assert len(restored) == 10
+    assert not restored.add("n3")
+    clock.now += 500
+    assert restored.expire() > 0
+    assert "n0" not in restored and "n9" in restored
+
+
+def test_add_at_records_past_nonces_within_ttl():
+    clock = Clock()
+    store = NonceStore(ttl_seconds=600, slot_seconds=60, bloom_bits=1 << 10, clock=clock)
+    assert store.add("live")
+    assert store.add_at("old", clock.now - 300)
+    assert not store.add_at("stale", clock.now - 601)
+    assert not store.add_at("old", clock.now - 100)
+    assert not store.add("old") and store.add("stale")
+    clock.now += 360  # expiry is slot-granular
+    store.expire()
+    assert "old" not in store and "live" in store
+
+
+def test_agent_rejects_replayed_nonce_after_restart(tmp_path, monkeypatch):
+    import json
+    import time
+
+    import pytest
+
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    sn = pytest.importorskip("superNova_2177")
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    import db_models
+    from agent_core import RemixAgent
+
+    engine = sqlalchemy.create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    db_models.Base.metadata.create_all(engine)
+    monkeypatch.setattr(sn, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.chdir(tmp_path)
+
+    for in_memory in (False, True):
+        monkeypatch.setattr(sn, "USE_IN_MEMORY_STORAGE", in_memory)
+        log, snap = f"log_{in_memory}.chain", f"snap_{in_memory}.json"
+        agent = RemixAgent(cosmic_nexus=None, filename=log, snapshot=snap)
+        before = {"event": "NOOP", "nonce": f"before-{in_memory}"}
+        after = {"event": "NOOP", "nonce": f"after-{in_memory}"}
+        assert agent.process_events([before]) == 1
+        if not in_memory:
+            # Only ``before`` is covered by the snapshot's nonces.
+            with open(snap, "w") as f:
+                json.dump(
+                    {"timestamp": sn.ts(), "nonces": agent.processed_nonces.to_dict()}, f
+                )
+            time.sleep(0.01)
+        assert agent.process_events([after]) == 1
+
+        restarted = RemixAgent(cosmic_nexus=None, filename=log, snapshot=snap)
+        assert restarted.process_events([before]) == 0
+        assert restarted.process_events([after]) == 0
+        assert restarted.process_events([{"event": "NOOP", "nonce": f"new-{in_memory}"}]) == 1
@@ -0,0 +1,139 @@
+import datetime
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+import db_models  # noqa: E402
+from db_models import PredictionRecord, SystemState  # noqa: E402
+from prediction_manager import PredictionManager, migrate_legacy_records  # noqa: E402
+
+NOW = datetime.datetime(2026, 1, 10, 12, 0)
+
+
+@pytest.fixture()
+def session_factory():
+    engine = sqlalchemy.create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    db_models.Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def _expiry(hours):
+    return (NOW + datetime.timedelta(hours=hours)).isoformat()
+
+
+def test_store_and_expired_pending(session_factory):
+    pm = PredictionManager(session_factory)
+    late = pm.store_prediction({"expires_at": _expiry(-1), "hypothesis_id": "h1"})
+    early = pm.store_prediction({"expires_at": _expiry(-5)})
+    pm.store_prediction({"expires_at": _expiry(3)})
+    no_expiry = pm.store_prediction({})
+    bad = pm.store_prediction({"expires_at": "soon"})
+    aware = pm.store_prediction({"expires_at": "2026-01-10T12:30:00+02:00"})
+
+    assert pm.get_prediction(late)["data"]["hypothesis_id"] == "h1"
+    due = [p["prediction_id"] for p in pm.expired_pending(now=NOW)]
+    # Missing or invalid expiries are due first, then by expiry time
+    assert sorted(due[:2]) == sorted([no_expiry, bad])
+    assert due[2:] == [early, aware, late]
+    assert len(pm.expired_pending(now=NOW, limit=2)) == 2
+
+
+def test_bulk_status_update(session_factory):
+    pm = PredictionManager(session_factory)
+    ids = [pm.store_prediction({"expires_at": _expiry(-i)}) for i in range(1, 6)]
+    outcomes = {pid: {"accuracy_score": i / 10} for i, pid in enumerate(ids[:3])}
+    assert pm.update_prediction_statuses(ids[:3] + ["missing"], "validated", outcomes) == 3
+
+    remaining = {p["prediction_id"] for p in pm.expired_pending(now=NOW)}
+    assert remaining == set(ids[3:])
+    record = pm.get_prediction(ids[1])
+    assert record["status"] == "validated"
+    assert record["actual_outcome"] == {"accuracy_score": 0.1}
+    history = pm.recent_outcomes(10)
+    assert {p["prediction_id"] for p in history} == set(ids[:3])
+
+    pm.update_prediction_status(ids[4], "rejected")
+    assert pm.get_prediction(ids[4])["status"] == "rejected"
+    assert "actual_outcome" not in pm.get_prediction(ids[4])
+
+
+def test_migrate_legacy_records(session_factory):
+    legacy = {
+        "prediction_id": "old",
+        "created_at": NOW.isoformat(),
+        "status": "pending",
+        "data": {"expires_at": _expiry(-2), "hypothesis_id": "h9"},
+    }
+    session = session_factory()
+    session.add(SystemState(key="prediction:old", value=json.dumps(legacy)))
+    session.add(SystemState(key="experiment:e1", value=json.dumps({"experiment_id": "e1"})))
+    session.add(SystemState(key="prediction:broken", value="{"))
+    session.add(SystemState(key="predictions_total", value="3"))
+    session.commit()
+
+    pm = PredictionManager(session_factory)
+    # Unmigrated records are still readable
+    assert pm.get_prediction("old") == legacy
+    assert migrate_legacy_records(session) == (1, 1)
+    session.close()
+
+    session = session_factory()
+    keys = {row.key for row in session.query(SystemState)}
+    assert keys == {"prediction:broken", "predictions_total"}
+    row = session.get(PredictionRecord, "old")
+    assert row.hypothesis_id == "h9"
+    assert row.expires_at == NOW - datetime.timedelta(hours=2)
+    session.close()
+    assert [p["prediction_id"] for p in pm.expired_pending(now=NOW)] == ["old"]
+    assert pm.get_experiment_design("e1") == {"experiment_id": "e1"}
+
+
+def test_reasoning_cycle_migrates_and_stops_without_progress(session_factory, monkeypatch):
+    import asyncio
+
+    sn = pytest.importorskip("superNova_2177")
+
+    legacy = {
+        "prediction_id": "old",
+        "created_at": NOW.isoformat(),
+        "status": "pending",
+        "data": {"expires_at": "2000-01-01T00:00:00"},
+    }
+    session = session_factory()
+    session.add(SystemState(key="prediction:old", value=json.dumps(legacy)))
+    for i in range(3):
+        # Records without a prediction_id can never be marked validated.
+        session.add(
+            PredictionRecord(
+                prediction_id=f"stuck{i}",
+                status="pending",
+                expires_at=datetime.datetime(2001, 1, 1, i),
+                record={"status": "pending", "data": {}},
+            )
+        )
+    session.commit()
+    session.close()
+
+    async def stop(_seconds):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(sn.Config, "PREDICTION_VALIDATION_BATCH_SIZE", 2)
+    monkeypatch.setattr(sn.asyncio, "sleep", stop)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(asyncio.wait_for(sn.scientific_reasoning_cycle_task(session_factory), 10))
+
+    pm = PredictionManager(session_factory)
+    assert pm.get_prediction("old")["status"] == "validated"
+    assert len(pm.expired_pending()) == 3
@@ -0,0 +1,154 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import db_models  # noqa: E402
+from validation_frame import ValidationFrame  # noqa: E402
+from validator_reputation_tracker import (  # noqa: E402
+    ReputationAccumulator,
+    load_reputation_accumulator,
+    load_reputations,
+    save_reputations,
+    update_validator_reputations,
+)
+
+NOW = datetime(2026, 5, 1, 12)
+
+
+def _drop_timestamps(i, row, rng):
+    if not i % 5:
+        del row["timestamp"]
+
+
+@pytest.fixture
+def validations(make_validations):
+    def build(n=200, seed=11):
+        return make_validations(
+            n,
+            seed,
+            validators=15,
+            notes=["", "We disagree with the method", "looks right"],
+            start=NOW - timedelta(days=400),
+            minutes=400 * 1440,
+            choices={"certification": ["strong", "weak", "disputed", "unknown"]},
+            tweak=_drop_timestamps,
+        )
+
+    return build
+
+
+def _expected(rows):
+    """Reputations recomputed from the full history, with ages measured at NOW."""
+    totals = {}
+    for v in rows:
+        acc = ReputationAccumulator()
+        acc.add_validation(v)
+        count, delta = acc.mean_deltas(NOW)[v["validator_id"]]
+        totals.setdefault(v["validator_id"], []).append(delta)
+    return {
+        vid: min(1.0, max(0.0, sum(d) / len(d) + 0.5)) for vid, d in totals.items() if len(d) >= 2
+    }
+
+
+def test_incremental_updates_match_full_recompute(validations):
+    rows = validations()
+    acc = ReputationAccumulator()
+    for v in rows:
+        acc.add_validation(v)
+    expected = _expected(rows)
+    assert acc.reputations(NOW) == pytest.approx(expected, abs=1e-12)
+    assert acc.reputation("missing", NOW) == 0.5
+
+    frame_acc = ReputationAccumulator()
+    frame_acc.update(ValidationFrame.from_dicts(rows[:120]))
+    frame_acc.update(rows[120:])
+    assert frame_acc.reputations(NOW) == pytest.approx(expected, abs=1e-12)
+
+
+def test_decay_halves_per_half_life():
+    acc = ReputationAccumulator(half_life_days=10)
+    acc.add("v", 0.4, NOW)
+    acc.add("v", 0.2)
+    assert acc.mean_delta("v", NOW + timedelta(days=10)) == pytest.approx((0.2 + 0.2) / 2)
+    # Far-apart timestamps move the reference epoch instead of overflowing.
+    acc.add("w", 1.0, NOW + timedelta(days=10 * 2000))
+    assert acc.reference == NOW + timedelta(days=10 * 2000)
+    assert acc.mean_delta("w", NOW + timedelta(days=10 * 2001)) == pytest.approx(0.5)
+    assert acc.mean_delta("v", NOW + timedelta(days=10 * 2001)) == pytest.approx(0.1)
+
+
+def test_update_validator_reputations_with_accumulator(validations):
+    rows = validations()
+    full = update_validator_reputations(rows)
+    acc = ReputationAccumulator()
+    update_validator_reputations(rows[:100], accumulator=acc)
+    result = update_validator_reputations(rows[100:], accumulator=acc)
+    # The full recompute measures ages in whole days, the accumulator does not.
+    assert result["reputations"] == pytest.approx(full["reputations"], abs=5e-3)
+
+
+def test_accumulator_round_trips_through_db(validations):
+    engine = sqlalchemy.create_engine("sqlite://")
+    db_models.Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    rows = validations()
+
+    acc = ReputationAccumulator()
+    acc.update(rows[:150])
+    save_reputations(acc.reputations(NOW), db, acc)
+    loaded = load_reputation_accumulator(db)
+    assert loaded.reputations(NOW) == pytest.approx(acc.reputations(NOW), abs=1e-12)
+
+    # Later batches resume from the stored state and upsert existing rows.
+    loaded.update(rows[150:])
+    save_reputations(loaded.reputations(NOW), db, loaded)
+    assert load_reputations(db) == pytest.approx(_expected(rows), abs=1e-12)
+    assert load_reputation_accumulator(db).reputations(NOW) == pytest.approx(
+        _expected(rows), abs=1e-12
+    )
+    db.close()
+
+
+def test_far_older_timestamps_do_not_rebase_backwards():
+    acc = ReputationAccumulator(half_life_days=1)
+    acc.add("v", 0.3, NOW)
+    acc.add("v", 0.3, "0001-01-01T00:00:00")
+    assert acc.reference == NOW
+    assert acc.mean_delta("v", NOW) == pytest.approx(0.3 / 2)
+
+    rows = [
+        {"validator_id": "w", "score": 0.9, "certification": "strong", "timestamp": ts}
+        for ts in (NOW.isoformat(), "1900-01-01T00:00:00", (NOW - timedelta(days=400)).isoformat())
+    ]
+    frame_acc = ReputationAccumulator(half_life_days=1)
+    frame_acc.update(ValidationFrame.from_dicts(rows))
+    assert frame_acc.reference == NOW
+    assert 0.0 < frame_acc.mean_delta("w", NOW) < float("inf")
+
+
+def test_reputation_route_resumes_stored_state(validations):
+    import asyncio
+
+    ui_hook = pytest.importorskip("validators.ui_hook")
+    engine = sqlalchemy.create_engine("sqlite://")
+    db_models.Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    rows = validations()
+    for batch in (rows[:120], rows[120:]):
+        asyncio.run(ui_hook.update_reputations_ui({"validations": batch}, db))
+    stored = load_reputation_accumulator(db)
+    expected = ReputationAccumulator()
+    expected.update(rows)
+    assert {vid: stored.count(vid) for vid in stored} == {vid: expected.count(vid) for vid in expected}
+    db.close()
@@ -0,0 +1,131 @@
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from network import network_coordination_detector as ncd  # noqa: E402
+from network.embedding_cache import EmbeddingCache, similar_pairs  # noqa: E402
+
+
+class FakeModel:
+    """Deterministic bag-of-letters encoder that records what it encodes."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return np.array(
+            [[t.count(c) for c in "abcdefghijklmnopqrstuvwxyz"] for t in texts], dtype=float
+        )
+
+
+def test_similar_pairs_matches_brute_force():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(5, 16))
+    vectors = np.vstack([base[rng.integers(5)] + rng.normal(scale=0.3, size=16) for _ in range(120)])
+    vectors[7] = 0.0
+    expected = []
+    for i, j in itertools.combinations(range(len(vectors)), 2):
+        a, b = vectors[i], vectors[j]
+        norm = np.linalg.norm(a) * np.linalg.norm(b)
+        sim = float(a @ b / norm) if norm else 0.0
+        if sim >= 0.8:
+            expected.append((i, j))
+    got = similar_pairs(vectors, 0.8, block=17)
+    assert [(i, j) for i, j, _ in got] == expected
+
+
+def test_cache_persists_and_recovers_torn_append(tmp_path):
+    prefix = str(tmp_path / "emb")
+    model = FakeModel()
+    cache = EmbeddingCache(prefix)
+    first = cache.get_many(["alpha note", "beta note", "alpha note"], model.encode)
+    assert model.encoded == ["alpha note", "beta note"]
+    assert np.array_equal(first[0], first[2])
+
+    with open(prefix + ".f32", "ab") as fh:
+        fh.write(b"\x00" * 10)  # torn vector append without its key
+    reopened = EmbeddingCache(prefix)
+    assert len(reopened) == 2
+    again = reopened.get_many(["beta note", "gamma note"], model.encode)
+    assert model.encoded[-1] == "gamma note" and len(model.encoded) == 3
+    assert np.array_equal(again[0], first[1])
+
+
+def _fill_cache(prefix, texts):
+    EmbeddingCache(prefix).get_many(texts, FakeModel().encode)
+
+
+def test_cache_shared_between_writers(tmp_path):
+    prefix = str(tmp_path / "emb")
+    model = FakeModel()
+    first, second = EmbeddingCache(prefix), EmbeddingCache(prefix)
+    first.get_many(["alpha note"], model.encode)
+    second.get_many(["beta note"], model.encode)
+    # The second writer picked up the first writer's row instead of re-encoding it.
+    got = second.get_many(["alpha note", "beta note"], model.encode)
+    assert model.encoded == ["alpha note", "beta note"]
+    assert np.array_equal(got, FakeModel().encode(["alpha note", "beta note"]))
+    assert len(EmbeddingCache(prefix)) == 2
+
+
+def test_cache_concurrent_processes(tmp_path):
+    import multiprocessing
+
+    prefix = str(tmp_path / "emb")
+    texts = [f"note {c * (i + 1)}" for i, c in enumerate("abcdefghijklmnopqrst")]
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_fill_cache, args=(prefix, texts[k : k + 10]))
+        for k in range(0, len(texts), 3)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+    cache = EmbeddingCache(prefix)
+    assert len(cache) == len(texts)
+    model = FakeModel()
+    assert np.array_equal(cache.get_many(texts, model.encode), FakeModel().encode(texts))
+    assert model.encoded == []
+
+
+def test_semantic_detection_uses_cache(monkeypatch):
+    model = FakeModel()
+    monkeypatch.setattr(ncd, "_sentence_model", lambda: model)
+    monkeypatch.setattr(ncd, "_embedding_cache", EmbeddingCache())
+    notes = {
+        "v1": ["the results replicate cleanly", "strong replication evidence"],
+        "v2": ["the results replicate cleanly", "strong replication evidence here"],
+        "v3": ["zzzz qqqq xxxx wwww", "kkkk jjjj vvvv yyyy"],
+    }
+    validations = [{"validator_id": v, "note": n} for v, ns in notes.items() for n in ns]
+    result = ncd.detect_semantic_coordination(validations)
+    assert result["flags"] == ["semantic_coordination_v1_v2"]
+    assert result["semantic_clusters"][0]["similarity_score"] > 0.9
+    encoded = len(model.encoded)
+    assert ncd.detect_semantic_coordination(validations) == result
+    assert len(model.encoded) == encoded
+
+
+def test_similar_pairs_near_identical_rows():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=384) + rng.normal(scale=1e-3, size=(600, 384))
+    got = similar_pairs(vectors.astype(np.float32), 0.9, block=128)
+    assert len(got) == 600 * 599 // 2
+    assert all(0.99 < score <= 1.0 + 1e-6 for _, _, score in got)
+
+    # A pair straddling the threshold is decided in float64.
+    a = np.array([1.0, 0.0])
+    b = np.array([0.9, np.sqrt(1 - 0.9**2)])
+    assert similar_pairs(np.vstack([a, b]), 0.9)[0][:2] == (0, 1)
+    assert similar_pairs(np.vstack([a, b]), 0.9 + 1e-9) == []
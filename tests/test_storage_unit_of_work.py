@@ -0,0 +1,113 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import db_models  # noqa: E402
+import superNova_2177 as sn  # noqa: E402
+from hook_manager import HookManager  # noqa: E402
+from logchain import LogChain  # noqa: E402
+from moderation_utils import Vaccine  # noqa: E402
+from nonce_store import NonceStore  # noqa: E402
+
+
+@pytest.fixture
+def storage():
+    engine = sqlalchemy.create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    db_models.Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    commits = []
+    event.listen(factory, "after_commit", lambda session: commits.append(session))
+    store = sn.SQLAlchemyStorage(factory)
+    store.commits = commits
+    return store
+
+
+def _user(i):
+    return {"email": f"u{i}@example.com", "hashed_password": "x", "karma_score": 0.0}
+
+
+def test_unit_of_work_commits_once_and_reads_staged_writes(storage):
+    with storage.unit_of_work():
+        for i in range(5):
+            storage.set_user(f"u{i}", _user(i))
+        storage.set_user("u0", {"karma_score": 3.0})
+        assert storage.get_user("u0")["karma_score"] == 3.0
+        assert storage.get_user("missing") is None
+        assert storage.commits == []
+    assert len(storage.commits) == 1
+    assert storage.get_user("u0")["karma_score"] == 3.0
+    assert len(storage.get_all_users()) == 5
+
+
+def test_savepoint_discards_only_the_failing_block(storage):
+    with storage.unit_of_work():
+        storage.set_user("keep", _user(1))
+        with pytest.raises(RuntimeError):
+            with storage.savepoint():
+                storage.set_user("drop", _user(2))
+                storage.set_user("keep", {"karma_score": 9.0})
+                raise RuntimeError("boom")
+        assert storage.get_user("drop") is None
+        assert storage.get_user("keep")["karma_score"] == 0.0
+    assert storage.get_user("drop") is None
+    assert storage.get_user("keep") is not None
+
+
+def test_unit_of_work_rolls_back_on_error(storage):
+    with pytest.raises(ValueError):
+        with storage.unit_of_work():
+            storage.set_user("u1", _user(1))
+            raise ValueError
+    assert storage.commits == []
+    assert storage.get_user("u1") is None
+
+
+def test_process_events_batches_log_and_skips_failures(tmp_path):
+    agent = sn.RemixAgent.__new__(sn.RemixAgent)
+    agent.config = sn.Config()
+    agent.vaccine = Vaccine(agent.config)
+    agent.storage = sn.InMemoryStorage()
+    agent.logchain = LogChain(str(tmp_path / "chain.log"), fsync=False)
+    agent.lock = threading.RLock()
+    agent.hooks = HookManager()
+    agent.processed_nonces = NonceStore(3600)
+    agent.event_count = 0
+    agent._use_simple = True
+    fired = []
+    agent.hooks.register_hook("ADD_USER", fired.append)
+
+    batch = [
+        {"event": "ADD_USER", "user": "alice", "nonce": "1"},
+        {"event": "ADD_USER", "user": "bob", "nonce": "2"},
+        {"event": "ADD_USER", "nonce": "3"},  # missing user -> fails, is skipped
+        {"event": "ADD_USER", "user": "bob", "nonce": "2"},  # duplicate nonce
+    ]
+    assert agent.process_events(batch) == 2
+    assert agent.event_count == 2
+    assert len(agent.logchain) == 3
+    assert [e["user"] for e in fired] == ["alice", "bob"]
+    assert agent.storage.get_user("bob") is not None
+
+    with pytest.raises(sn.BlockedContentError):
+        agent.process_events(
+            [
+                {"event": "ADD_USER", "user": "carol", "nonce": "4"},
+                {"event": "ADD_USER", "user": "blocked_word", "nonce": "5"},
+            ]
+        )
+    assert len(agent.logchain) == 3
+    assert agent.storage.get_user("carol") is None
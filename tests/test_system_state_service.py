@@ -0,0 +1,101 @@
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import db_models  # noqa: E402
+from system_state_utils import SystemStateService  # noqa: E402
+
+
+@pytest.fixture
+def sessions():
+    engine = sqlalchemy.create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    db_models.Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    opened = []
+
+    def make():
+        opened.append(factory())
+        return opened[-1]
+
+    yield make
+    for session in opened:
+        session.close()
+
+
+def _count_queries(session):
+    statements = []
+    sqlalchemy.event.listen(
+        session.get_bind(), "before_cursor_execute", lambda *a: statements.append(a[2])
+    )
+    return statements
+
+
+def test_reads_are_cached_and_revalidated(sessions):
+    db = sessions()
+    service = SystemStateService(db)
+    service.set_state("mode", "calm")
+    statements = _count_queries(db)
+    for _ in range(5):
+        assert service.get_state("mode", "x") == "calm"
+    assert statements == []
+    assert service.get_state("missing", "fallback") == "fallback"
+
+    # An ORM write elsewhere bumps the version, so revalidation notices it.
+    other = sessions()
+    row = other.query(db_models.SystemState).filter_by(key="mode").one()
+    row.value = "stormy"
+    other.commit()
+    service.cache.ttl = 0.0
+    assert service.get_state("mode", "x") == "stormy"
+    assert service.get_state("mode", "x") == "stormy"
+
+
+def test_increments_are_coalesced_and_atomic(sessions):
+    db = sessions()
+    first = SystemStateService(db, flush_interval_ms=60_000)
+    second = SystemStateService(sessions(), flush_interval_ms=60_000)
+    first.set_state("wellspring", "1.5")
+
+    statements = _count_queries(db)
+    for _ in range(4):
+        first.increment("wellspring", Decimal("0.25"))
+    first.decrement("entropy", 2, default="10")
+    assert statements == []
+    assert Decimal(first.get_state("wellspring", "0")) == Decimal("2.5")
+    assert Decimal(first.get_state("entropy", "0")) == 8
+
+    second.increment("wellspring", 1)
+    second.close()
+    db.commit()  # transaction end flushes pending increments
+    updates = [s for s in statements if s.startswith("UPDATE")]
+    assert len(updates) == 3  # one per pending key and session
+
+    check = SystemStateService(sessions())
+    check.cache.ttl = 0.0
+    assert Decimal(check.get_state("wellspring", "0")) == Decimal("3.5")
+    assert Decimal(check.get_state("entropy", "0")) == 8
+
+
+def test_scan_prefix_reads_only_matching_keys(sessions):
+    service = SystemStateService(sessions())
+    for key in ["prediction:a", "prediction:b", "predictions", "config_override:x"]:
+        service.set_state(key, key.upper())
+    assert service.scan_prefix("prediction:") == {
+        "prediction:a": "PREDICTION:A",
+        "prediction:b": "PREDICTION:B",
+    }
+    assert service.scan_prefix("config_override:") == {"config_override:x": "CONFIG_OVERRIDE:X"}
+    assert service.scan_prefix("nothing:") == {}
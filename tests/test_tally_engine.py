@@ -0,0 +1,93 @@
+import datetime
+import random
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from scientific_utils import calculate_genesis_bonus_decay  # noqa: E402
+from tally_engine import TallyEngine  # noqa: E402
+
+SPECIES = ["human", "ai", "company"]
+
+
+def _users(rng, n):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        {
+            "name": f"u{i}",
+            "harmony_score": str(rng.randint(1, 100)),
+            "is_genesis": i % 7 == 0,
+            "join_time": (now - datetime.timedelta(days=rng.randint(0, 2000))).isoformat(),
+            "consent": i % 11 != 0,
+            "species": SPECIES[i % 3],
+        }
+        for i in range(n)
+    ]
+
+
+def _reference_tally(users, votes):
+    """The original per-proposal scan the engine replaces."""
+
+    def weight(u):
+        decay = (
+            calculate_genesis_bonus_decay(datetime.datetime.fromisoformat(u["join_time"]), 5)
+            if u["is_genesis"]
+            else Decimal("1")
+        )
+        return Decimal(u["harmony_score"]) * decay
+
+    total = sum(weight(u) for u in users)
+    species_votes = {s: {"yes": Decimal(0), "no": Decimal(0), "total": Decimal(0)} for s in SPECIES}
+    voted = Decimal(0)
+    for voter, vote in votes.items():
+        u = next((u for u in users if u["name"] == voter), None)
+        if u and u["consent"]:
+            w = weight(u)
+            species_votes[u["species"]][vote] += w
+            species_votes[u["species"]]["total"] += w
+            voted += w
+    active = [sv for sv in species_votes.values() if sv["total"] > 0]
+    yes = sum(sv["yes"] / sv["total"] / len(active) for sv in active)
+    return yes, voted / total
+
+
+def test_tally_many_matches_reference_scan():
+    rng = random.Random(3)
+    users = _users(rng, 300)
+    proposals = [
+        {
+            "proposal_id": str(p),
+            "votes": {f"u{rng.randrange(300)}": rng.choice(["yes", "no"]) for _ in range(40)},
+        }
+        for p in range(5)
+    ]
+    engine = TallyEngine(SPECIES, 5)
+    tallies = engine.tally_many(proposals, users)
+    for proposal in proposals:
+        yes, quorum = _reference_tally(users, proposal["votes"])
+        got = tallies[proposal["proposal_id"]]
+        assert abs(got["yes"] - yes) < Decimal("1e-9")
+        assert abs(got["quorum"] - quorum) < Decimal("1e-9")
+    assert engine.tally_many([{"proposal_id": "x", "votes": {}}], users)["x"]["quorum"] == 0
+
+
+def test_cached_weights_follow_score_changes_and_epochs():
+    users = [
+        {"name": "a", "harmony_score": "10", "species": "human", "consent": True},
+        {"name": "b", "harmony_score": "30", "species": "ai", "consent": True},
+    ]
+    engine = TallyEngine(SPECIES, 5)
+    assert engine.build_index(users).total_harmony == Decimal("40")
+    users[0]["harmony_score"] = "20"
+    index = engine.build_index(users)
+    assert index.weights["a"] == Decimal("20")
+    assert engine.tally({"a": "yes"}, index)["quorum"] == Decimal("0.4")
+
+    engine._weights["b"] = (engine.epoch, "30", Decimal("999"))
+    assert engine.build_index(users).weights["b"] == Decimal("999")
+    engine.invalidate()
+    assert engine.build_index(users).weights["b"] == Decimal("30")
@@ -0,0 +1,72 @@
+import itertools
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from network import network_coordination_detector as ncd  # noqa: E402
+
+
+def _reference(validations):
+    """Pairwise scan the sweep replaces."""
+    stamps = {}
+    for v in validations:
+        ts = datetime.fromisoformat(v["timestamp"].replace("Z", "+00:00"))
+        stamps.setdefault(v["validator_id"], []).append(ts)
+    window = timedelta(minutes=ncd.Config.TEMPORAL_WINDOW_MINUTES)
+    clusters, flags = [], []
+    for v1, v2 in itertools.combinations(stamps, 2):
+        close = sum(1 for a in stamps[v1] for b in stamps[v2] if abs(a - b) <= window)
+        if close >= ncd.Config.MIN_TEMPORAL_OCCURRENCES:
+            clusters.append(
+                {
+                    "validators": [v1, v2],
+                    "close_submissions": close,
+                    "coordination_likelihood": min(1.0, close / 10.0),
+                }
+            )
+            flags.append(f"temporal_coordination_{v1}_{v2}")
+    return {"temporal_clusters": clusters, "flags": flags}
+
+
+def test_sweep_matches_pairwise_scan():
+    rng = random.Random(7)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    validations = [
+        {
+            "validator_id": f"v{rng.randrange(25)}",
+            "timestamp": (base + timedelta(minutes=rng.uniform(0, 600))).isoformat(),
+        }
+        for _ in range(400)
+    ]
+    # Exactly on the window edge still counts.
+    for i in range(3):
+        t = base + timedelta(days=1, hours=i)
+        validations.append({"validator_id": "edge_a", "timestamp": t.isoformat()})
+        validations.append(
+            {"validator_id": "edge_b", "timestamp": (t + timedelta(minutes=5)).isoformat()}
+        )
+    result = ncd.detect_temporal_coordination(validations)
+    assert result == _reference(validations)
+    assert "temporal_coordination_edge_a_edge_b" in result["flags"]
+
+
+def test_small_blocks_and_missing_fields(monkeypatch):
+    monkeypatch.setattr(ncd, "_SWEEP_BLOCK_PAIRS", 3)
+    validations = [
+        {"validator_id": "a", "timestamp": "2025-01-01T00:00:00Z"},
+        {"validator_id": "b", "timestamp": "2025-01-01T00:01:00Z"},
+        {"validator_id": "a", "timestamp": "2025-01-01T00:02:00Z"},
+        {"validator_id": "b", "timestamp": "2025-01-01T00:03:00Z"},
+        {"validator_id": "c", "timestamp": "not a time"},
+        {"validator_id": None, "timestamp": "2025-01-01T00:00:00Z"},
+    ]
+    assert ncd.detect_temporal_coordination(validations) == _reference(validations[:4])
+    assert ncd.detect_temporal_coordination(validations[:1]) == {
+        "temporal_clusters": [],
+        "flags": [],
+    }
@@ -0,0 +1,108 @@
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from causal_graph import InfluenceGraph, temporal_causality_analysis  # noqa: E402
+from causal_graph.temporal_paths import TemporalEdgeIndex  # noqa: E402
+
+T0 = datetime(2026, 3, 1)
+
+
+def _longest_brute(edges, start):
+    """Longest time-respecting walk by exhaustive search."""
+    edges = [e for e in edges if e[2]["timestamp"] >= start]
+
+    def extend(node, after):
+        best = 0
+        for u, v, d in edges:
+            if u == node and d["timestamp"] > after:
+                best = max(best, 1 + extend(v, d["timestamp"]))
+        return best
+
+    return max((1 + extend(v, d["timestamp"]) for _, v, d in edges), default=0)
+
+
+def _is_time_respecting(chain, edges):
+    stamps = {}
+    for u, v, d in edges:
+        stamps.setdefault((u, v), []).append(d["timestamp"])
+    last = None
+    for u, v in zip(chain, chain[1:]):
+        later = [t for t in stamps.get((u, v), []) if last is None or t > last]
+        if not later:
+            return False
+        last = min(later)
+    return True
+
+
+def test_longest_chain_beats_greedy():
+    # Greedy continuation from a takes a->x (earliest) and stops; the DP
+    # waits for a->b, which leads on to c and d.
+    edges = [
+        ("s", "a", {"timestamp": T0, "weight": 0.5}),
+        ("a", "x", {"timestamp": T0 + timedelta(hours=1), "weight": 0.5}),
+        ("a", "b", {"timestamp": T0 + timedelta(hours=2), "weight": 0.5}),
+        ("b", "c", {"timestamp": T0 + timedelta(hours=3), "weight": 0.5}),
+        ("c", "d", {"timestamp": T0 + timedelta(hours=4), "weight": 0.5}),
+        # Same timestamp as b->c, so it cannot follow it
+        ("c", "e", {"timestamp": T0 + timedelta(hours=3), "weight": 0.5}),
+    ]
+    index = TemporalEdgeIndex(edges)
+    assert index.longest_chain(T0) == ["s", "a", "b", "c", "d"]
+    assert index.longest_chain(T0 + timedelta(hours=3)) == ["b", "c", "d"]
+    assert index.longest_chain(T0 + timedelta(days=1)) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_exhaustive_search(seed):
+    rng = random.Random(seed)
+    edges = [
+        (
+            rng.randrange(6),
+            rng.randrange(6),
+            {"timestamp": T0 + timedelta(minutes=rng.randrange(12)), "weight": rng.random()},
+        )
+        for _ in range(14)
+    ]
+    index = TemporalEdgeIndex(edges)
+    for minutes in (0, 3, 7, 11):
+        start = T0 + timedelta(minutes=minutes)
+        chain = index.longest_chain(start)
+        assert max(len(chain) - 1, 0) == _longest_brute(edges, start)
+        window = [e for e in edges if e[2]["timestamp"] >= start]
+        assert _is_time_respecting(chain, window)
+
+
+def test_analysis_answers_every_period():
+    graph = InfluenceGraph()
+    now = datetime.utcnow()
+    graph.add_edge("a", "b", weight=0.9, timestamp=now - timedelta(days=5))
+    graph.add_edge("b", "c", weight=0.4, timestamp=now - timedelta(hours=3))
+    graph.add_edge("c", "d", weight=0.3, timestamp=now - timedelta(hours=2))
+    graph.add_edge("x", "y", weight=-0.8, timestamp=now - timedelta(hours=1))
+    graph.add_edge("u", "v", weight=1.0)  # timestamp defaults to now
+
+    result = temporal_causality_analysis(graph, ["last_hour", "last_24_hours", "last_week"])
+    by_period = {a["time_period"]: a for a in result["analyses"]}
+    assert by_period["last_24_hours"]["longest_causal_chain"] == ["b", "c", "d"]
+    assert by_period["last_week"]["longest_causal_chain"] == ["a", "b", "c", "d"]
+    assert by_period["last_hour"]["longest_causal_chain"] == ["u", "v"]
+    link = by_period["last_week"]["most_impactful_temporal_link"]
+    assert link["edge"] == ("u", "v")
+    assert link["score"] == pytest.approx(1.0, abs=1e-3)
+
+
+def test_edge_times_are_microseconds():
+    stamps = [T0 + timedelta(microseconds=7), T0 + timedelta(days=1)]
+    index = TemporalEdgeIndex((f"n{i}", f"n{i + 1}", {"timestamp": ts}) for i, ts in enumerate(stamps))
+    epoch = datetime(1970, 1, 1)
+    assert [int(us) for us in index.micros] == [(ts - epoch) // timedelta(microseconds=1) for ts in stamps]
+    assert index.window_start(T0 + timedelta(microseconds=7)) == 0
+    assert index.window_start(T0 + timedelta(microseconds=8)) == 1
@@ -0,0 +1,171 @@
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from diversity_analyzer import compute_diversity_score  # noqa: E402
+from network import network_coordination_detector as ncd  # noqa: E402
+from network.embedding_cache import EmbeddingCache  # noqa: E402
+from temporal_consistency_checker import analyze_temporal_consistency  # noqa: E402
+from validation_certifier import (  # noqa: E402
+    certify_validations_comprehensive,
+    score_validation,
+    score_validations,
+)
+from validation_frame import ValidationFrame  # noqa: E402
+from validator_reputation_tracker import update_validator_reputations  # noqa: E402
+from validators.reputation_influence_tracker import compute_validator_reputations  # noqa: E402
+
+NOTES = [
+    "I support this result and confirm the analysis",
+    "We disagree; the data refute the claim",
+    "short",
+    "",
+    None,
+    "Independent replication looks consistent",
+]
+
+
+def _corrupt(i, row, rng):
+    row["timestamp"] = row["timestamp"].replace("+00:00", "Z")
+    if i % 37 == 0:
+        row["timestamp"] = "not a timestamp"
+    if i % 53 == 0:
+        row["confidence"] = "high"
+    if i % 41 == 0:
+        del row["score"]
+
+
+@pytest.fixture
+def validations(make_validations):
+    def build(n=400, seed=3, aware=True):
+        return make_validations(
+            n,
+            seed,
+            validators=25,
+            hypotheses=[f"h{k}" for k in range(12)],
+            notes=NOTES,
+            start=datetime(2025, 3, 1, 8, tzinfo=timezone.utc if aware else None),
+            floats=("confidence", "signal_strength"),
+            choices={
+                "specialty": ["bio", "chem", "phys", None],
+                "affiliation": ["A", "B", ""],
+                "certification": ["strong", "weak", "provisional"],
+            },
+            tweak=_corrupt,
+        )
+
+    return build
+
+
+def test_frame_columns(validations):
+    rows = validations(50)
+    frame = ValidationFrame.from_dicts(rows)
+    assert len(frame) == 50
+    assert ValidationFrame.ensure(frame) is frame
+    for i, row in enumerate(rows):
+        assert frame.validator_ids[frame.validator[i]] == row["validator_id"]
+        assert frame.score[i] == row.get("score", 0.5)
+        assert frame.has_score[i] == ("score" in row)
+        assert frame.ts_valid[i] == (row["timestamp"] != "not a timestamp")
+        if row["note"]:
+            assert frame.notes[frame.note[i]] == row["note"]
+        else:
+            assert frame.note[i] == -1
+    assert np.isnan(frame.confidence[0])
+
+
+def test_scores_match_row_scoring(validations):
+    rows = validations()
+    expected = [score_validation(v) for v in rows]
+    assert score_validations(ValidationFrame.from_dicts(rows)).tolist() == expected
+
+
+def test_diversity_matches(validations):
+    rows = validations()
+    frame = ValidationFrame.from_dicts(rows)
+    assert compute_diversity_score(frame) == compute_diversity_score(rows)
+
+
+def test_reputations_match(validations):
+    rows = validations()
+    frame = ValidationFrame.from_dicts(rows)
+    consensus = {f"h{i}": 0.1 * i for i in range(10)}
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    expected = compute_validator_reputations(rows, consensus, current_time=now)
+    got = compute_validator_reputations(frame, consensus, current_time=now)
+    assert got == expected
+    assert list(got["validator_reputations"]) == list(expected["validator_reputations"])
+
+
+def test_temporal_consistency_matches(validations):
+    rows = validations()
+    frame = ValidationFrame.from_dicts(rows)
+    reputations = {f"v{i}": i / 25 for i in range(25)}
+    assert analyze_temporal_consistency(frame, reputations) == analyze_temporal_consistency(
+        rows, reputations
+    )
+
+
+def test_temporal_consistency_names_missing_validators_alike(validations):
+    rows = validations(60)
+    rows[3]["validator_id"] = None
+    rows[4]["validator_id"] = ""
+    del rows[5]["validator_id"]
+    frame = ValidationFrame.from_dicts(rows)
+    result = analyze_temporal_consistency(rows)
+    assert analyze_temporal_consistency(frame) == result
+    names = {name for _, _, name in result["timeline"]}
+    assert {"unknown_3", "unknown_4", "unknown_5"} <= names and None not in names
+
+
+def test_validator_reputation_update_matches(validations):
+    rows = validations(aware=False)
+    expected = update_validator_reputations(rows)
+    got = update_validator_reputations(ValidationFrame.from_dicts(rows))
+    assert got["diversity"] == expected["diversity"]
+    assert list(got["reputations"]) == list(expected["reputations"])
+    for vid, rep in expected["reputations"].items():
+        assert got["reputations"][vid] == pytest.approx(rep, abs=1e-12)
+
+
+def test_coordination_matches(monkeypatch, validations):
+    monkeypatch.setattr(ncd, "_sentence_model", lambda: None)
+    monkeypatch.setattr(ncd, "_embedding_cache", EmbeddingCache())
+    rows = validations()
+    frame = ValidationFrame.from_dicts(rows)
+    assert ncd.build_validation_graph(frame) == ncd.build_validation_graph(rows)
+    assert ncd.detect_temporal_coordination(frame) == ncd.detect_temporal_coordination(rows)
+    assert ncd.detect_score_coordination(frame) == ncd.detect_score_coordination(rows)
+    # ``None`` and non-text notes are skipped on both paths.
+    rows[1]["note"] = 12345678901
+    frame = ValidationFrame.from_dicts(rows)
+    assert ncd.detect_semantic_coordination(frame) == ncd.detect_semantic_coordination(rows)
+
+
+def test_certification_runs_on_one_frame(monkeypatch, validations):
+    monkeypatch.setattr(ncd, "_sentence_model", lambda: None)
+    rows = validations(120)
+    result = certify_validations_comprehensive(rows)
+    assert "error" not in result["integrity_analysis"]
+    assert result["validator_count"] == len({v["validator_id"] for v in rows})
+    assert "has_contradiction" in result["flags"]
+
+
+def test_save_and_load_round_trip(tmp_path, validations):
+    rows = validations(80)
+    frame = ValidationFrame.from_dicts(rows)
+    loaded = ValidationFrame.load(frame.save(tmp_path / "frame"))
+    assert len(loaded) == len(frame)
+    assert isinstance(loaded.score, np.memmap)
+    np.testing.assert_array_equal(loaded.timestamp, frame.timestamp)
+    assert loaded.notes == frame.notes
+    assert analyze_temporal_consistency(loaded, {}) == analyze_temporal_consistency(frame, {})
@@ -0,0 +1,85 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+import scientific_utils as su  # noqa: E402
+
+
+@pytest.fixture
+def production():
+    previous = (su.VerificationSettings.production, su.VerificationSettings.sample_rate)
+    su.configure_verification(production=True, sample_rate=0.25)
+    su.MODEL_METRICS.reset()
+    yield
+    su.configure_verification(production=previous[0], sample_rate=previous[1])
+
+
+def _model(**kwargs):
+    @su.VerifiedScientificModel(
+        citation_uri="https://example.org",
+        assumptions="none",
+        validation_notes="test",
+        value_bounds=(0.0, 1.0),
+        **kwargs,
+    )
+    def model(x: float, items: list[int], *, scale: int = 1) -> float:
+        """citation_uri assumptions validation_notes"""
+        return x * scale
+
+    return model
+
+
+def test_sampled_checks_and_counters(production, caplog):
+    model = _model()
+    model_id = model.__wrapped__._scientific_model["model_id"]
+    for _ in range(8):
+        assert model(0.5, [1]) == 0.5
+    model(3, "not a list", scale=1)
+    model(0.9, [1], scale=2)
+    stats = su.MODEL_METRICS.snapshot()[model_id]
+    assert stats["calls"] == 10
+    assert stats["checked"] == 3  # every fourth call
+    assert stats["type_mismatches"] == 2
+    assert stats["out_of_bounds"] == 2
+    assert sum(stats["latency_histogram"].values()) == 10
+    assert stats["latency_max_s"] >= stats["latency_mean_s"] > 0
+    assert "VerifiedScientificModel executed" not in caplog.text
+
+
+def test_strict_models_check_every_call(production):
+    model = _model(strict_verification_mode=True)
+    model_id = model.__wrapped__._scientific_model["model_id"]
+    for _ in range(3):
+        with pytest.raises(su.ScientificVerificationError):
+            model("x", [1])
+    with pytest.raises(su.ScientificVerificationError):
+        model(0.9, [1], scale=2)
+    stats = su.MODEL_METRICS.snapshot()[model_id]
+    assert stats["calls"] == 4
+    assert stats["failures"] == 3
+    assert stats["out_of_bounds"] == 1
+
+
+def test_counts_from_many_threads_are_not_lost(production):
+    metrics = su.ModelMetrics()
+
+    def work():
+        for _ in range(2000):
+            metrics.record("m", 0.002)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = metrics.snapshot()["m"]
+    assert stats["calls"] == 8000
+    assert stats["latency_histogram"]["0.003"] == 8000
+    metrics.reset()
+    assert metrics.snapshot() == {}
@@ -6,22 +6,43 @@ dimensions: quality scoring, diversity analysis, reputation tracking, temporal
 consistency, and coordination detection.
 
 This is the primary interface for comprehensive validation analysis in superNova_2177.
+
+The integrity analyzers run in-process by default. Set the environment
+variable ``INTEGRITY_USE_PROCESS_POOL=1`` (or pass ``use_process_pool=True``)
+to run them in parallel on a persistent process pool; each batch is then
+published once as a memory-mapped ``ValidationFrame`` rather than pickled to
+every worker.
 """
 
 import logging
-from typing import List, Dict, Any, Tuple
+import math
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
-from statistics import mean
 
 # Import all v4.x analysis modules
 from diversity_analyzer import compute_diversity_score
 from validators.reputation_influence_tracker import compute_validator_reputations
 from network.network_coordination_detector import analyze_coordination_patterns
 from temporal_consistency_checker import analyze_temporal_consistency, assess_temporal_trust_factor
+from validation_frame import ValidationFrame
+
+try:
+    from network.coordination_monitor import CoordinationMonitor
+except Exception:  # pragma: no cover - optional dependency
+    CoordinationMonitor = None
 
 logger = logging.getLogger("superNova_2177.certifier")
 logger.propagate = False
 
+USE_PROCESS_POOL = os.environ.get("INTEGRITY_USE_PROCESS_POOL") == "1"
+
 class Config:
     """Unified configuration for all validation analysis components."""
 
@@ -54,6 +75,14 @@ class Config:
 
     MAX_NOTE_SCORE = 1.0
 
+    # Process-pool execution of the integrity analyzers
+    PROCESS_POOL_WORKERS = min(4, os.cpu_count() or 1)
+    PROCESS_POOL_MIN_VALIDATIONS = 20_000  # smaller batches run in-process
+    # Where shared frames are written; /dev/shm keeps them in RAM on Linux
+    SHARED_FRAME_DIR = os.environ.get("INTEGRITY_SHARED_FRAME_DIR") or (
+        "/dev/shm" if os.path.isdir("/dev/shm") else None
+    )
+
 def score_validation(val: Dict[str, Any]) -> float:
     """
     Score a single validation based on confidence, signal strength, and note sentiment.
@@ -67,19 +96,7 @@ def score_validation(val: Dict[str, Any]) -> float:
     try:
         confidence = float(val.get("confidence", 0.5))
         signal = float(val.get("signal_strength", 0.5))
-        note = str(val.get("note", "")).lower()
-
-        # Sentiment analysis on validation note
-        note_score = 0.0
-        for keyword in Config.AGREEMENT_KEYWORDS:
-            if keyword in note:
-                note_score += 0.5
-        for keyword in Config.CONTRADICTION_KEYWORDS:
-            if keyword in note:
-                note_score -= 0.5
-
-        # Clamp note score
-        note_score = max(min(note_score, Config.MAX_NOTE_SCORE), -Config.MAX_NOTE_SCORE)
+        note_score = _note_score(val.get("note", ""))
 
         # Weighted combination
         final_score = (
@@ -94,6 +111,39 @@ def score_validation(val: Dict[str, Any]) -> float:
         logger.warning(f"Malformed validation dict: {val} — {e}")
         return 0.0
 
+def _note_score(note: Any) -> float:
+    """Sentiment of a validation note, clamped to ``±MAX_NOTE_SCORE``."""
+    note = str(note).lower()
+    note_score = 0.0
+    for keyword in Config.AGREEMENT_KEYWORDS:
+        if keyword in note:
+            note_score += 0.5
+    for keyword in Config.CONTRADICTION_KEYWORDS:
+        if keyword in note:
+            note_score -= 0.5
+    return max(min(note_score, Config.MAX_NOTE_SCORE), -Config.MAX_NOTE_SCORE)
+
+def score_validations(frame: ValidationFrame):
+    """Vectorized :func:`score_validation` over every row of ``frame``.
+
+    Note sentiment is computed once per distinct note. Rows whose confidence
+    or signal strength is not numeric score 0.0.
+    """
+    import numpy as np
+
+    note_score = frame.note_values(_note_score, 0.0)
+    final_score = (
+        Config.CONFIDENCE_WEIGHT * frame.confidence +
+        Config.SIGNAL_WEIGHT * frame.signal_strength +
+        Config.NOTE_MATCH_WEIGHT * (note_score + 1) / 2
+    )
+    final_score = np.clip(final_score, 0.0, 1.0)
+    malformed = np.isnan(final_score)
+    if malformed.any():
+        logger.warning(f"{int(malformed.sum())} malformed validations scored 0.0")
+        final_score[malformed] = 0.0
+    return final_score
+
 def calculate_integrity_score(
    diversity_result: Dict[str, Any],
    reputation_result: Dict[str, Any],
@@ -159,41 +209,149 @@ def calculate_integrity_score(
     }
 
 
-def run_full_integrity_analysis(
-    validations: List[Dict[str, Any]],
-    avg_score: float,
-    certification: str,
-) -> Tuple[Dict[str, Any], List[str], str]:
-    """Run integrity analysis modules and update certification."""
+# --- Process-pool execution ---
+_ANALYZERS = {
+    "diversity": compute_diversity_score,
+    "coordination": analyze_coordination_patterns,
+    "reputation": compute_validator_reputations,
+    "temporal": analyze_temporal_consistency,
+}
 
-    consensus_scores = {"default_hypothesis": avg_score}
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the persistent analyzer pool, creating it on first use."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=Config.PROCESS_POOL_WORKERS,
+                mp_context=get_context("spawn"),
+            )
+        return _process_pool
+
+
+def warm_process_pool() -> None:
+    """Start every pool worker now so the first batch pays no startup cost."""
+    pool = get_process_pool()
+    list(pool.map(_warm_worker, [0.05] * Config.PROCESS_POOL_WORKERS))
 
-    # Run diversity, coordination, and reputation analysis concurrently
-    import concurrent.futures
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        diversity_future = executor.submit(compute_diversity_score, validations)
-        coordination_future = executor.submit(
-            analyze_coordination_patterns, validations
+def shutdown_process_pool() -> None:
+    """Stop the analyzer pool; the next process-pool call starts a new one."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _warm_worker(delay: float) -> int:
+    # Holding each task briefly makes the executor spawn a worker for it.
+    time.sleep(delay)
+    return os.getpid()
+
+
+def _run_shared(name: str, directory: str, *args: Any) -> Dict[str, Any]:
+    """Worker entry point: run one analyzer on a memory-mapped frame."""
+    # Mapped per task and released on return: an idle worker still holding
+    # it would pin the deleted batch's pages in SHARED_FRAME_DIR.
+    frame = ValidationFrame.load(directory)
+    return _ANALYZERS[name](frame, *args)
+
+
+def _analyze_in_process(
+    frame: ValidationFrame, consensus_scores: Dict[str, float], coordination: bool = True
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]:
+    diversity_result = compute_diversity_score(frame)
+    coordination_result = analyze_coordination_patterns(frame) if coordination else None
+    reputation_result = compute_validator_reputations(frame, consensus_scores)
+    # Reputation is needed for temporal analysis
+    temporal_result = analyze_temporal_consistency(
+        frame,
+        reputation_result.get("validator_reputations", {}),
+    )
+    return diversity_result, coordination_result, reputation_result, temporal_result
+
+
+def _analyze_in_pool(
+    frame: ValidationFrame, consensus_scores: Dict[str, float], coordination: bool = True
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]:
+    pool = get_process_pool()
+    with tempfile.TemporaryDirectory(
+        prefix="validation_frame_", dir=Config.SHARED_FRAME_DIR
+    ) as directory:
+        frame.save(directory)
+        diversity_future = pool.submit(_run_shared, "diversity", directory)
+        coordination_future = (
+            pool.submit(_run_shared, "coordination", directory) if coordination else None
         )
-        reputation_future = executor.submit(
-            compute_validator_reputations,
-            validations,
-            consensus_scores,
+        reputation_future = pool.submit(
+            _run_shared, "reputation", directory, consensus_scores
         )
 
         # Reputation is needed for temporal analysis
         reputation_result = reputation_future.result()
-
-        temporal_future = executor.submit(
-            analyze_temporal_consistency,
-            validations,
+        temporal_future = pool.submit(
+            _run_shared,
+            "temporal",
+            directory,
             reputation_result.get("validator_reputations", {}),
         )
+        return (
+            diversity_future.result(),
+            coordination_future.result() if coordination_future is not None else None,
+            reputation_result,
+            temporal_future.result(),
+        )
 
-        diversity_result = diversity_future.result()
-        coordination_result = coordination_future.result()
-        temporal_result = temporal_future.result()
+
+def run_full_integrity_analysis(
+    validations: Union[List[Dict[str, Any]], ValidationFrame],
+    avg_score: float,
+    certification: str,
+    use_process_pool: Optional[bool] = None,
+    coordination_monitor: Optional["CoordinationMonitor"] = None,
+) -> Tuple[Dict[str, Any], List[str], str]:
+    """Run integrity analysis modules and update certification.
+
+    ``validations`` is converted to a :class:`ValidationFrame` once and every
+    analyzer reads the same columns. By default the analyzers run one after
+    another in this process, because on threads they only contend for the
+    GIL. With ``use_process_pool`` (default: ``INTEGRITY_USE_PROCESS_POOL``),
+    batches of at least ``Config.PROCESS_POOL_MIN_VALIDATIONS`` run on the
+    persistent pool instead. Diversity, coordination and reputation run in
+    parallel there, and temporal analysis starts once reputations are ready.
+
+    With a ``coordination_monitor`` the batch is folded into it and its
+    running report replaces the batch coordination analysis, so
+    coordination is scored over everything the monitor has seen.
+    """
+
+    frame = ValidationFrame.ensure(validations)
+    consensus_scores = {"default_hypothesis": avg_score}
+
+    if use_process_pool is None:
+        use_process_pool = USE_PROCESS_POOL
+    batch_coordination = coordination_monitor is None
+    results = None
+    if use_process_pool and len(frame) >= Config.PROCESS_POOL_MIN_VALIDATIONS:
+        try:
+            results = _analyze_in_pool(frame, consensus_scores, batch_coordination)
+        except BrokenProcessPool:
+            logger.warning("Integrity process pool broke; analyzing in-process")
+            shutdown_process_pool()
+    if results is None:
+        results = _analyze_in_process(frame, consensus_scores, batch_coordination)
+    diversity_result, coordination_result, reputation_result, temporal_result = results
+    if coordination_monitor is not None:
+        if isinstance(validations, ValidationFrame):
+            coordination_monitor.ingest_frame(validations)
+        else:
+            coordination_monitor.ingest_many(validations)
+        coordination_result = coordination_monitor.report()
 
     integrity_analysis = calculate_integrity_score(
         diversity_result,
@@ -238,7 +396,8 @@ def run_full_integrity_analysis(
 
 def certify_validations_comprehensive(
    validations: List[Dict[str, Any]],
-   enable_full_analysis: bool = True
+   enable_full_analysis: bool = True,
+   coordination_monitor: Optional["CoordinationMonitor"] = None,
 ) -> Dict[str, Any]:
     """
     Complete validation certification with full integrity analysis.
@@ -250,6 +409,8 @@ def certify_validations_comprehensive(
     Args:
         validations: List of validation dictionaries
         enable_full_analysis: If True, runs all v4.x analysis modules
+        coordination_monitor: Optional long-lived CoordinationMonitor that
+            accumulates coordination evidence across calls
 
     Returns:
         Dict containing:
@@ -268,9 +429,12 @@ def certify_validations_comprehensive(
             "recommendations": ["Collect more validations before certification"]
         }
 
+    # Columnar view shared by scoring and every integrity analyzer
+    frame = ValidationFrame.from_dicts(validations)
+
     # Step 1: Basic validation scoring
-    scores = [score_validation(v) for v in validations]
-    avg_score = mean(scores)
+    scores = score_validations(frame)
+    avg_score = math.fsum(scores.tolist()) / len(scores)
 
     # TODO: In future versions, upgrade to SUPERMAJORITY_THRESHOLD (e.g., 0.66 or 0.75 or anything else) instead of fixed 0.66
     # SUPERMAJORITY_THRESHOLD = 0.75  # Placeholder for symbolic governance upgrade (currently unused)
@@ -280,10 +444,9 @@ def certify_validations_comprehensive(
 
 
     # Step 2: Check for contradictions
-    contradictory = any(
-        any(keyword in str(v.get("note", "")).lower() for keyword in Config.CONTRADICTION_KEYWORDS)
-        for v in validations
-    )
+    contradictory = bool(frame.note_flags(
+        lambda note: any(keyword in str(note).lower() for keyword in Config.CONTRADICTION_KEYWORDS)
+    ).any())
 
     # Step 3: Determine base certification level
     if contradictory:
@@ -309,9 +472,10 @@ def certify_validations_comprehensive(
                 recommendations,
                 certification,
             ) = run_full_integrity_analysis(
-                validations,
+                frame,
                 avg_score,
                 certification,
+                coordination_monitor=coordination_monitor,
             )
         except Exception as e:
             logger.exception("Integrity analysis failed")
@@ -337,7 +501,7 @@ def certify_validations_comprehensive(
         "integrity_analysis": integrity_analysis,
         "recommendations": recommendations or ["No specific recommendations"],
         "analysis_timestamp": datetime.utcnow().isoformat(),
-        "validator_count": len(set(v.get("validator_id") for v in validations if v.get("validator_id")))
+        "validator_count": len(frame.validator_ids)
     }
 
     logger.info(f"Comprehensive certification complete: {certification} "
@@ -0,0 +1,281 @@
+"""
+validation_frame.py — Columnar validation batches (v4.7)
+
+The integrity analyzers all consume the same validation records. Walking a
+``List[Dict]`` in every analyzer re-reads each key, re-parses every
+timestamp and float, and keeps millions of small Python objects alive.
+``ValidationFrame`` converts a batch once into NumPy columns:
+
+* ``score``, ``confidence`` and ``signal_strength`` as float64 (missing keys
+  take the analyzers' 0.5 default, unparseable values become NaN),
+* timestamps as int64 epoch microseconds (naive values taken as UTC) plus
+  validity, timezone-awareness and local-hour columns,
+* string fields (validator, hypothesis, specialty, affiliation, validator
+  type, certification, note) as int32 codes into interned value lists,
+  with ``-1`` for missing or empty values.
+
+Analyzers accept either a frame or the original list; lists are converted
+at the boundary with :meth:`ValidationFrame.ensure`. Building a frame needs
+NumPy, but importing this module does not.
+
+:meth:`ValidationFrame.save` writes one ``.npy`` file per column, and
+:meth:`ValidationFrame.load` memory-maps them read-only. Worker processes
+can therefore share one copy of a batch instead of unpickling it.
+"""
+
+from __future__ import annotations
+
+import pickle
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from dateutil import parser as _dateutil_parser
+except Exception:  # pragma: no cover - optional dependency may be missing
+    _dateutil_parser = None
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROS_PER_DAY = 86_400_000_000
+
+# Array columns and the interned value lists they index, as persisted by save().
+_COLUMNS = (
+    "validator", "hypothesis", "specialty", "affiliation", "validator_type",
+    "certification", "note", "score", "has_score", "confidence",
+    "signal_strength", "timestamp", "ts_valid", "ts_aware", "ts_hour", "ts_code",
+)
+_INTERNED = (
+    "validator_ids", "hypothesis_ids", "specialties", "affiliations",
+    "validator_types", "certifications", "notes", "ts_iso",
+)
+_INTERNED_FILE = "interned.pickle"
+
+
+def _intern(values: Sequence[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """Return int32 codes for ``values`` and the distinct values in order.
+
+    Falsy values get code ``-1`` and are not interned.
+    """
+    table: Dict[Any, int] = dict.fromkeys(values, -1)
+    names = [v for v in table if v]
+    table.update(zip(names, range(len(names))))
+    codes = np.fromiter(map(table.__getitem__, values), dtype=np.int32, count=len(values))
+    return codes, names
+
+
+def _floats(values: Sequence[Any]) -> np.ndarray:
+    """Convert ``values`` with ``float()`` semantics; failures become NaN."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp, returning ``None`` when it is invalid.
+
+    Strings longer than 40 characters are rejected, as in the temporal checker.
+    """
+    if not value or not isinstance(value, str) or len(value) > 40:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    if _dateutil_parser is not None:
+        try:
+            return _dateutil_parser.isoparse(value)
+        except (ValueError, OverflowError, TypeError):
+            return None
+    return None
+
+
+def epoch_micros(ts: datetime) -> int:
+    """Microseconds since the epoch; naive datetimes are taken as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // timedelta(microseconds=1)
+
+
+class ValidationFrame:
+    """A batch of validation records stored column by column.
+
+    Build one with :meth:`from_dicts`; analyzers read the columns directly.
+    Each code column (``validator``, ``note``, ...) indexes the interned
+    value list next to it (``validator_ids``, ``notes``, ...).
+    """
+
+    def __init__(self, size: int) -> None:
+        if np is None:  # pragma: no cover - optional dependency
+            raise ImportError("ValidationFrame requires numpy")
+        self.size = size
+        self.validator = np.full(size, -1, dtype=np.int32)
+        self.validator_ids: List[Any] = []
+        self.hypothesis = np.full(size, -1, dtype=np.int32)
+        self.hypothesis_ids: List[Any] = []
+        self.specialty = np.full(size, -1, dtype=np.int32)
+        self.specialties: List[Any] = []
+        self.affiliation = np.full(size, -1, dtype=np.int32)
+        self.affiliations: List[Any] = []
+        self.validator_type = np.full(size, -1, dtype=np.int32)
+        self.validator_types: List[Any] = []
+        self.certification = np.full(size, -1, dtype=np.int32)
+        self.certifications: List[Any] = []
+        self.note = np.full(size, -1, dtype=np.int32)
+        self.notes: List[Any] = []
+        self.score = np.full(size, 0.5)
+        self.has_score = np.zeros(size, dtype=bool)
+        self.confidence = np.full(size, 0.5)
+        self.signal_strength = np.full(size, 0.5)
+        self.timestamp = np.zeros(size, dtype=np.int64)
+        self.ts_valid = np.zeros(size, dtype=bool)
+        self.ts_aware = np.zeros(size, dtype=bool)
+        self.ts_hour = np.zeros(size, dtype=np.int8)
+        self.ts_code = np.full(size, -1, dtype=np.int32)
+        self.ts_iso: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def ensure(cls, validations: Any) -> "ValidationFrame":
+        """Return ``validations`` as a frame, converting a list if needed."""
+        if isinstance(validations, cls):
+            return validations
+        return cls.from_dicts(validations)
+
+    @classmethod
+    def from_dicts(cls, validations: Sequence[Dict[str, Any]]) -> "ValidationFrame":
+        """Build a frame from validation dictionaries in one pass per column."""
+        frame = cls(len(validations))
+        if not validations:
+            return frame
+
+        def column(key: str, default: Any = None) -> List[Any]:
+            return [v.get(key, default) for v in validations]
+
+        frame.validator, frame.validator_ids = _intern(column("validator_id"))
+        frame.hypothesis, frame.hypothesis_ids = _intern(column("hypothesis_id"))
+        frame.specialty, frame.specialties = _intern(column("specialty"))
+        frame.affiliation, frame.affiliations = _intern(column("affiliation"))
+        frame.validator_type, frame.validator_types = _intern(
+            [v.get("validator_type") or v.get("type") for v in validations]
+        )
+        frame.certification, frame.certifications = _intern(
+            column("certification", "experimental")
+        )
+        frame.note, frame.notes = _intern(column("note"))
+
+        frame.has_score = np.fromiter(
+            (v.get("score") is not None for v in validations), dtype=bool, count=frame.size
+        )
+        frame.score = _floats(column("score", 0.5))
+        frame.confidence = _floats(column("confidence", 0.5))
+        frame.signal_strength = _floats(column("signal_strength", 0.5))
+
+        frame.ts_code, raw_stamps = _intern(column("timestamp"))
+        frame._set_timestamps(raw_stamps)
+        return frame
+
+    def _set_timestamps(self, raw_stamps: List[Any]) -> None:
+        count = len(raw_stamps)
+        micros = np.zeros(count + 1, dtype=np.int64)
+        valid = np.zeros(count + 1, dtype=bool)
+        aware = np.zeros(count + 1, dtype=bool)
+        hours = np.zeros(count + 1, dtype=np.int8)
+        self.ts_iso = [None] * count
+        for i, raw in enumerate(raw_stamps):
+            ts = parse_timestamp(raw)
+            if ts is None:
+                continue
+            micros[i] = epoch_micros(ts)
+            valid[i] = True
+            aware[i] = ts.tzinfo is not None
+            hours[i] = ts.hour
+            self.ts_iso[i] = ts.isoformat()
+        # Code -1 (missing) indexes the trailing invalid slot.
+        self.timestamp = micros[self.ts_code]
+        self.ts_valid = valid[self.ts_code]
+        self.ts_aware = aware[self.ts_code]
+        self.ts_hour = hours[self.ts_code]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, directory: Union[str, Path]) -> Path:
+        """Write one ``.npy`` file per column plus the interned values."""
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in _COLUMNS:
+            np.save(path / f"{name}.npy", getattr(self, name))
+        with open(path / _INTERNED_FILE, "wb") as fh:
+            pickle.dump(
+                {name: getattr(self, name) for name in _INTERNED},
+                fh,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        return path
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "ValidationFrame":
+        """Open a frame written by :meth:`save`.
+
+        Columns are memory-mapped read-only unless ``mmap`` is false. The
+        interned values are unpickled, so only load directories you wrote.
+        """
+        path = Path(directory)
+        with open(path / _INTERNED_FILE, "rb") as fh:
+            interned = pickle.load(fh)
+        frame = cls(0)
+        for name in _COLUMNS:
+            setattr(frame, name, np.load(path / f"{name}.npy", mmap_mode="r" if mmap else None))
+        for name in _INTERNED:
+            setattr(frame, name, interned[name])
+        frame.size = len(frame.score)
+        return frame
+
+    # ------------------------------------------------------------------
+    # Helpers shared by analyzers
+    # ------------------------------------------------------------------
+    def datetime_at(self, row: int) -> Optional[datetime]:
+        """The timestamp of ``row`` as a datetime, or ``None`` if invalid.
+
+        Aware timestamps come back in UTC; naive ones stay naive.
+        """
+        if not self.ts_valid[row]:
+            return None
+        ts = _EPOCH + timedelta(microseconds=int(self.timestamp[row]))
+        return ts if self.ts_aware[row] else ts.replace(tzinfo=None)
+
+    def note_flags(self, predicate: Callable[[Any], bool], missing: bool = False) -> np.ndarray:
+        """Evaluate ``predicate`` once per distinct note and spread to rows."""
+        table = np.fromiter(
+            (bool(predicate(n)) for n in self.notes), dtype=bool, count=len(self.notes)
+        )
+        return np.append(table, missing)[self.note]
+
+    def note_values(self, fn: Callable[[Any], float], missing: float) -> np.ndarray:
+        """Evaluate ``fn`` once per distinct note and spread to rows."""
+        table = np.fromiter((fn(n) for n in self.notes), dtype=np.float64, count=len(self.notes))
+        return np.append(table, missing)[self.note]
+
+    @staticmethod
+    def first_appearance(codes: np.ndarray) -> np.ndarray:
+        """Distinct non-negative ``codes`` in order of first appearance."""
+        present = codes[codes >= 0]
+        uniq, first = np.unique(present, return_index=True)
+        return uniq[np.argsort(first, kind="stable")]
+
+
+__all__ = ["MICROS_PER_DAY", "ValidationFrame", "epoch_micros", "parse_timestamp"]
@@ -4,17 +4,25 @@ validator_reputation_tracker.py — Validator Reputation Scoring System (v4.1+)
 Tracks and updates trust scores for validators based on validation history,
 consistency, and certification alignment. Used in consensus weighting, peer
 review selection, and governance escalation in superNova_2177.
+
+``ReputationAccumulator`` keeps each validator's decayed delta sum and count
+so that new validations are folded in one at a time instead of rescoring the
+full history; it persists through the ``ValidatorReputation`` table.
 """
 
 import logging
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Tuple, Union
+from datetime import datetime, timedelta, timezone
 from statistics import mean
 from exceptions import DataAccessError
 import sys
 
 from diversity_analyzer import compute_diversity_score
 from semantic_contradiction_resolver import semantic_contradiction_resolver
+from validation_frame import MICROS_PER_DAY, ValidationFrame, epoch_micros, parse_timestamp
+
+if TYPE_CHECKING:  # pragma: no cover - for type hints only
+    import numpy as np
 
 
 logger = logging.getLogger("superNova_2177.reputation")
@@ -40,6 +48,7 @@ class Config:
 def update_validator_reputations(
     validations: List[Dict[str, Any]],
     db=None,
+    accumulator: Optional["ReputationAccumulator"] = None,
 ) -> Dict[str, Any]:
     """
     Updates validator reputations based on validation quality and certification.
@@ -52,10 +61,75 @@ def update_validator_reputations(
             - timestamp: str (ISO format, optional)
             - note: str (optional)
             - specialty: str (optional)
+            A ``ValidationFrame`` of the same records is also accepted.
+        db: Optional session to persist the results to
+        accumulator: Optional ``ReputationAccumulator`` holding earlier
+            history. ``validations`` are then only the new records; they
+            are folded into the accumulator and reputations are read from it.
 
     Returns:
         Dict with ``reputations`` and ``diversity`` information.
     """
+    if isinstance(validations, ValidationFrame):
+        deltas, specialties, affiliations = _frame_deltas(validations)
+    else:
+        deltas, specialties, affiliations = _deltas(validations)
+    if accumulator is not None:
+        accumulator.update(validations)
+        deltas = accumulator.mean_deltas()
+
+    # Aggregate scores
+    final_scores = {}
+    for vid, (count, mean_delta) in deltas.items():
+        if count >= Config.MIN_VALIDATIONS_FOR_SCORING:
+            rep = min(
+                Config.MAX_REPUTATION,
+                max(
+                    Config.MIN_REPUTATION,
+                    mean_delta + Config.DEFAULT_REPUTATION,
+                ),
+            )
+            final_scores[vid] = rep
+            logger.info(
+                f"Validator {vid} updated reputation: {rep:.3f} — Specialty: {specialties.get(vid, 'N/A')}"
+            )
+
+    diversity = {
+        "unique_specialties": len(set(specialties.values())),
+        "unique_affiliations": len(set(affiliations.values())),
+        "validator_count": len(final_scores),
+    }
+
+    logger.info(f"Updated reputations for {len(final_scores)} validators")
+
+    if db is not None:
+        save_reputations(final_scores, db, accumulator)
+        profile_map = {
+            vid: {
+                "specialty": specialties.get(vid),
+                "affiliation": affiliations.get(vid),
+            }
+            for vid in final_scores.keys()
+        }
+        if profile_map:
+            save_validator_profiles(profile_map, db)
+
+    return {"reputations": final_scores, "diversity": diversity}
+
+
+# validator -> (delta count, mean delta), plus last specialty/affiliation seen
+DeltaStats = Tuple[Dict[str, Tuple[int, float]], Dict[str, str], Dict[str, str]]
+
+
+def _base_delta(score: float, certification: Any, note: Any) -> float:
+    """Score plus certification reward and contradiction penalty, undecayed."""
+    reward = Config.CERTIFICATION_REWARD.get(certification, 0.0)
+    penalty = -Config.CONTRADICTION_PENALTY if semantic_contradiction_resolver(note) else 0.0
+    return score + reward + penalty
+
+
+def _deltas(validations: List[Dict[str, Any]]) -> DeltaStats:
+    """Per-validator reputation deltas, in first-appearance order."""
     reputations: Dict[str, List[float]] = {}
     specialties: Dict[str, str] = {}
     affiliations: Dict[str, str] = {}
@@ -90,54 +164,309 @@ def update_validator_reputations(
                 logger.warning(f"Invalid timestamp for validator {validator_id}: {e}")
 
         # Reputation delta
-        reward = Config.CERTIFICATION_REWARD.get(cert, 0.0)
-        note_text = v.get("note", "")
-        penalty = -Config.CONTRADICTION_PENALTY if semantic_contradiction_resolver(note_text) else 0.0
-        delta = (score + reward + penalty) * decay_factor
+        delta = _base_delta(score, cert, v.get("note", "")) * decay_factor
 
         reputations.setdefault(validator_id, []).append(delta)
 
-    # Aggregate scores
-    final_scores = {}
-    for vid, deltas in reputations.items():
-        if len(deltas) >= Config.MIN_VALIDATIONS_FOR_SCORING:
-            rep = min(
-                Config.MAX_REPUTATION,
-                max(
-                    Config.MIN_REPUTATION,
-                    mean(deltas) + Config.DEFAULT_REPUTATION,
-                ),
-            )
-            final_scores[vid] = rep
-            logger.info(
-                f"Validator {vid} updated reputation: {rep:.3f} — Specialty: {specialties.get(vid, 'N/A')}"
-            )
+    deltas = {vid: (len(d), mean(d)) for vid, d in reputations.items()}
+    return deltas, specialties, affiliations
 
-    diversity = {
-        "unique_specialties": len(set(specialties.values())),
-        "unique_affiliations": len(set(affiliations.values())),
-        "validator_count": len(final_scores),
+
+def _frame_deltas(frame: ValidationFrame) -> DeltaStats:
+    """:func:`_deltas` over a frame's columns.
+
+    Rewards, contradiction penalties and decay are evaluated once per
+    distinct certification, note and timestamp rather than once per row.
+    """
+    import numpy as np
+
+    rows, base = _frame_base_deltas(frame)
+    codes = frame.validator[rows]
+
+    decay = np.ones(len(rows))
+    naive = frame.ts_valid[rows] & ~frame.ts_aware[rows]
+    age_days = (epoch_micros(datetime.utcnow()) - frame.timestamp[rows][naive]) // MICROS_PER_DAY
+    decay[naive] = 0.5 ** (age_days / Config.DECAY_HALF_LIFE_DAYS)
+    delta = base * decay
+
+    n = len(frame.validator_ids)
+    counts = np.bincount(codes, minlength=n).tolist()
+    sums = np.bincount(codes, delta, minlength=n).tolist()
+    deltas = {
+        frame.validator_ids[c]: (counts[c], sums[c] / counts[c])
+        for c in ValidationFrame.first_appearance(codes).tolist()
     }
 
-    logger.info(f"Updated reputations for {len(final_scores)} validators")
+    def last_value(column: "np.ndarray", values: List[str]) -> Dict[str, str]:
+        present = rows[column[rows] >= 0][::-1]
+        owners, last = np.unique(frame.validator[present], return_index=True)
+        picked = column[present[last]]
+        return {
+            frame.validator_ids[v]: values[c]
+            for v, c in zip(owners.tolist(), picked.tolist())
+        }
 
-    if db is not None:
-        save_reputations(final_scores, db)
-        profile_map = {
-            vid: {
-                "specialty": specialties.get(vid),
-                "affiliation": affiliations.get(vid),
-            }
-            for vid in final_scores.keys()
+    return (
+        deltas,
+        last_value(frame.specialty, frame.specialties),
+        last_value(frame.affiliation, frame.affiliations),
+    )
+
+def _frame_base_deltas(frame: ValidationFrame) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Rows with a string validator id and their :func:`_base_delta` values."""
+    import numpy as np
+
+    if np.isnan(frame.score).any():
+        raise ValueError("validation scores must be numeric")
+
+    string_ids = np.array(
+        [isinstance(v, str) for v in frame.validator_ids] + [False], dtype=bool
+    )
+    rows = np.flatnonzero(string_ids[frame.validator])
+    reward = np.array(
+        [Config.CERTIFICATION_REWARD.get(c, 0.0) for c in frame.certifications] + [0.0]
+    )[frame.certification[rows]]
+    penalty = np.where(
+        frame.note_flags(semantic_contradiction_resolver)[rows],
+        -Config.CONTRADICTION_PENALTY,
+        0.0,
+    )
+    return rows, frame.score[rows] + reward + penalty
+
+
+# --- Incremental State ---
+class ReputationAccumulator:
+    """Per-validator decayed delta sums with O(1) updates.
+
+    A delta ``x`` recorded at time ``t`` is worth ``x * 0.5 ** (age / half_life)``
+    at evaluation time. Because that factor splits into a part fixed at ``t``
+    and a part shared by every delta, each validator only needs the sum of
+    ``x * 2 ** ((t - reference) / half_life)`` over its dated deltas; reading
+    at ``now`` multiplies that sum by ``0.5 ** ((now - reference) / half_life)``.
+    Undated deltas never decay and are summed separately.
+
+    Unlike :func:`update_validator_reputations` without an accumulator, ages
+    are measured in fractional rather than whole days. Naive timestamps are
+    taken as UTC.
+
+    Args:
+        half_life_days: Decay half-life in days
+        reference: Reference epoch; defaults to the first dated delta
+    """
+
+    # Move the reference epoch forward once a delta would be scaled by more
+    # than 2**REBASE_HALF_LIVES.
+    REBASE_HALF_LIVES = 256
+
+    def __init__(
+        self,
+        half_life_days: float = Config.DECAY_HALF_LIFE_DAYS,
+        reference: Optional[datetime] = None,
+    ) -> None:
+        if half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        self.half_life_days = half_life_days
+        self._reference_days: Optional[float] = (
+            None if reference is None else self._days(reference)
+        )
+        # validator -> [count, undated sum, decayed sum]
+        self._state: Dict[str, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def __contains__(self, validator_id: str) -> bool:
+        return validator_id in self._state
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._state)
+
+    @property
+    def reference(self) -> Optional[datetime]:
+        """Reference epoch of the decayed sums (naive UTC), if any."""
+        if self._reference_days is None:
+            return None
+        return self._datetime(self._reference_days)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def add(
+        self,
+        validator_id: str,
+        delta: float,
+        timestamp: Union[datetime, str, None] = None,
+    ) -> None:
+        """Record one undecayed ``delta`` for ``validator_id``."""
+        state = self._state.setdefault(validator_id, [0, 0.0, 0.0])
+        state[0] += 1
+        if isinstance(timestamp, str):
+            timestamp = parse_timestamp(timestamp)
+        if timestamp is None:
+            state[1] += delta
+        else:
+            state[2] += delta * self._growth(self._days(timestamp))
+
+    def add_validation(self, validation: Dict[str, Any]) -> None:
+        """Record a validation dictionary as :func:`update_validator_reputations` scores it."""
+        validator_id = validation.get("validator_id")
+        if not validator_id or not isinstance(validator_id, str):
+            return
+        delta = _base_delta(
+            float(validation.get("score", 0.5)),
+            validation.get("certification", "experimental"),
+            validation.get("note", ""),
+        )
+        self.add(validator_id, delta, validation.get("timestamp"))
+
+    def update(self, validations: Union[List[Dict[str, Any]], ValidationFrame]) -> None:
+        """Record a batch of validations, or every row of a ``ValidationFrame``."""
+        if not isinstance(validations, ValidationFrame):
+            for validation in validations:
+                self.add_validation(validation)
+            return
+
+        import numpy as np
+
+        frame = validations
+        rows, base = _frame_base_deltas(frame)
+        dated = frame.ts_valid[rows]
+        if dated.any():
+            days = frame.timestamp[rows[dated]] / MICROS_PER_DAY
+            # Rebases for the newest row; older rows can only shrink.
+            self._growth(float(days.max()))
+            base = base.copy()
+            base[dated] *= np.exp2((days - self._reference_days) / self.half_life_days)
+        codes = frame.validator[rows]
+        n = len(frame.validator_ids)
+        counts = np.bincount(codes, minlength=n).tolist()
+        undated = np.bincount(codes, np.where(dated, 0.0, base), minlength=n).tolist()
+        decayed = np.bincount(codes, np.where(dated, base, 0.0), minlength=n).tolist()
+        for code in ValidationFrame.first_appearance(codes).tolist():
+            state = self._state.setdefault(frame.validator_ids[code], [0, 0.0, 0.0])
+            state[0] += counts[code]
+            state[1] += undated[code]
+            state[2] += decayed[code]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def count(self, validator_id: str) -> int:
+        state = self._state.get(validator_id)
+        return int(state[0]) if state else 0
+
+    def mean_delta(self, validator_id: str, now: Optional[datetime] = None) -> float:
+        """Mean decayed delta of ``validator_id`` at ``now`` (default: current UTC time)."""
+        count, undated, decayed = self._state[validator_id]
+        return (undated + decayed * self._decay(now)) / count
+
+    def mean_deltas(self, now: Optional[datetime] = None) -> Dict[str, Tuple[int, float]]:
+        """``validator -> (count, mean decayed delta)`` for every validator."""
+        decay = self._decay(now)
+        return {
+            vid: (int(count), (undated + decayed * decay) / count)
+            for vid, (count, undated, decayed) in self._state.items()
         }
-        if profile_map:
-            save_validator_profiles(profile_map, db)
 
-    return {"reputations": final_scores, "diversity": diversity}
+    def reputation(self, validator_id: str, now: Optional[datetime] = None) -> float:
+        """Current reputation, or the default below ``MIN_VALIDATIONS_FOR_SCORING``."""
+        if self.count(validator_id) < Config.MIN_VALIDATIONS_FOR_SCORING:
+            return Config.DEFAULT_REPUTATION
+        return _clamp_reputation(self.mean_delta(validator_id, now))
+
+    def reputations(self, now: Optional[datetime] = None) -> Dict[str, float]:
+        """Reputations of validators with enough validations to be scored."""
+        return {
+            vid: _clamp_reputation(delta)
+            for vid, (count, delta) in self.mean_deltas(now).items()
+            if count >= Config.MIN_VALIDATIONS_FOR_SCORING
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence helpers
+    # ------------------------------------------------------------------
+    def state(self, validator_id: str) -> Tuple[int, float, float]:
+        """``(count, undated sum, decayed sum)`` relative to :attr:`reference`."""
+        count, undated, decayed = self._state[validator_id]
+        return int(count), undated, decayed
+
+    def merge_state(
+        self,
+        validator_id: str,
+        count: int,
+        undated_sum: float,
+        decayed_sum: float,
+        reference: Optional[datetime],
+    ) -> None:
+        """Add stored state whose decayed sum is relative to ``reference``."""
+        state = self._state.setdefault(validator_id, [0, 0.0, 0.0])
+        state[0] += count
+        state[1] += undated_sum
+        if decayed_sum and reference is not None:
+            state[2] += decayed_sum * self._growth(self._days(reference))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _days(ts: datetime) -> float:
+        return epoch_micros(ts) / MICROS_PER_DAY
+
+    @staticmethod
+    def _datetime(days: float) -> datetime:
+        return datetime(1970, 1, 1) + timedelta(microseconds=round(days * MICROS_PER_DAY))
+
+    def _growth(self, days: float) -> float:
+        """``2 ** ((days - reference) / half_life)``, rebasing when it gets large.
+
+        The reference only moves forward, so the factor stays at most
+        ``2 ** REBASE_HALF_LIVES``; deltas far older than it underflow to 0.
+        """
+        if self._reference_days is None:
+            self._reference_days = days
+        exponent = (days - self._reference_days) / self.half_life_days
+        if exponent > self.REBASE_HALF_LIVES:
+            self._rebase(days)
+            exponent = 0.0
+        return 2.0 ** exponent
+
+    def _rebase(self, days: float) -> None:
+        scale = 2.0 ** ((self._reference_days - days) / self.half_life_days)
+        for state in self._state.values():
+            state[2] *= scale
+        self._reference_days = days
+
+    def _decay(self, now: Optional[datetime]) -> float:
+        if self._reference_days is None:
+            return 0.0
+        now = now or datetime.now(timezone.utc)
+        return 0.5 ** ((self._days(now) - self._reference_days) / self.half_life_days)
+
+
+def _clamp_reputation(mean_delta: float) -> float:
+    return min(
+        Config.MAX_REPUTATION,
+        max(Config.MIN_REPUTATION, mean_delta + Config.DEFAULT_REPUTATION),
+    )
+
 
 # --- Placeholder Persistence Functions ---
-def save_reputations(reputations: Dict[str, float], db) -> None:
-    """Persist reputation scores using the provided session."""
+# Validator ids per IN (...) lookup when upserting reputations.
+_UPSERT_CHUNK = 500
+
+
+def save_reputations(
+    reputations: Dict[str, float],
+    db,
+    accumulator: Optional[ReputationAccumulator] = None,
+) -> None:
+    """Persist reputation scores using the provided session.
+
+    Rows are upserted in bulk: one query finds the existing validators, then
+    updates and inserts are each issued as a single batch. With an
+    ``accumulator``, the incremental state of every validator it tracks is
+    stored alongside, so :func:`load_reputation_accumulator` can resume it.
+    """
 
     try:
         from db_models import ValidatorReputation
@@ -146,16 +475,43 @@ def save_reputations(reputations: Dict[str, float], db) -> None:
         sys.modules.pop("db_models", None)  # allow later imports
         return
 
-    for vid, rep in reputations.items():
-        row = db.query(ValidatorReputation).filter(
-            ValidatorReputation.validator_id == vid
-        ).first()
-        if row:
-            row.reputation = float(rep)
-        else:
-            row = ValidatorReputation(validator_id=vid, reputation=float(rep))
-            db.add(row)
+    now = datetime.utcnow()
+    mappings: Dict[str, Dict[str, Any]] = {
+        vid: {"validator_id": vid, "reputation": float(rep), "updated_at": now}
+        for vid, rep in reputations.items()
+    }
+    if accumulator is not None:
+        reference = accumulator.reference
+        for vid in accumulator:
+            count, undated, decayed = accumulator.state(vid)
+            row = mappings.setdefault(
+                vid,
+                {"validator_id": vid, "reputation": accumulator.reputation(vid), "updated_at": now},
+            )
+            row.update(
+                validation_count=count,
+                undated_sum=undated,
+                decayed_sum=decayed,
+                reference_epoch=reference,
+            )
+    if not mappings:
+        return
 
+    existing = set()
+    ids = list(mappings)
+    for start in range(0, len(ids), _UPSERT_CHUNK):
+        existing.update(
+            vid
+            for (vid,) in db.query(ValidatorReputation.validator_id).filter(
+                ValidatorReputation.validator_id.in_(ids[start : start + _UPSERT_CHUNK])
+            )
+        )
+    db.bulk_update_mappings(
+        ValidatorReputation, [m for vid, m in mappings.items() if vid in existing]
+    )
+    db.bulk_insert_mappings(
+        ValidatorReputation, [m for vid, m in mappings.items() if vid not in existing]
+    )
     db.commit()
 
 
@@ -173,6 +529,34 @@ def load_reputations(db) -> Dict[str, float]:
     return {row.validator_id: float(row.reputation) for row in rows}
 
 
+def load_reputation_accumulator(
+    db, half_life_days: float = Config.DECAY_HALF_LIFE_DAYS
+) -> ReputationAccumulator:
+    """Rebuild a ``ReputationAccumulator`` from the stored incremental state.
+
+    Validators saved without accumulator state are skipped.
+    """
+
+    try:
+        from db_models import ValidatorReputation
+    except Exception as e:  # pragma: no cover - fallback handling
+        logger.error(f"DB models unavailable: {e}")
+        sys.modules.pop("db_models", None)  # allow later imports
+        raise DataAccessError("ValidatorReputation model unavailable") from e
+
+    accumulator = ReputationAccumulator(half_life_days)
+    rows = db.query(
+        ValidatorReputation.validator_id,
+        ValidatorReputation.validation_count,
+        ValidatorReputation.undated_sum,
+        ValidatorReputation.decayed_sum,
+        ValidatorReputation.reference_epoch,
+    ).filter(ValidatorReputation.validation_count > 0)
+    for vid, count, undated, decayed, reference in rows:
+        accumulator.merge_state(vid, count, undated or 0.0, decayed or 0.0, reference)
+    return accumulator
+
+
 def save_validator_profiles(profiles: Dict[str, Dict[str, str]], db) -> None:
     """Persist validator specialty and affiliation data."""
 
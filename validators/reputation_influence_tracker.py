@@ -9,11 +9,13 @@ Used in superNova_2177 to weight validations and detect manipulation.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict
 from statistics import mean, stdev
 from datetime import datetime
 
+from validation_frame import ValidationFrame
+
 logger = logging.getLogger("superNova_2177.reputation")
 logger.propagate = False
 
@@ -38,6 +40,9 @@ class Config:
     # Reputation decay
     DECAY_HALF_LIFE_DAYS = 90
 
+# validator -> (validation count, mean agreement, mean deviation, last timestamp)
+AgreementStats = Dict[str, Tuple[int, float, float, Optional[datetime]]]
+
 def compute_validator_reputations(
     all_validations: List[Dict[str, Any]],
     consensus_scores: Dict[str, float],
@@ -51,7 +56,8 @@ def compute_validator_reputations(
     Compute reputation scores for each validator based on their validation patterns.
 
     Args:
-        all_validations: List of validations across multiple hypotheses
+        all_validations: List of validations across multiple hypotheses, or
+            a ``ValidationFrame`` of them
         consensus_scores: Average score per hypothesis_id
         temporal_trust: Optional trust factors for validators (0.0-1.0)
         diversity_scores: Optional diversity contributions per validator (0.0-1.0)
@@ -87,52 +93,20 @@ def compute_validator_reputations(
     if half_life <= 0:
         half_life = Config.DECAY_HALF_LIFE_DAYS
 
-    validator_scores = defaultdict(list)
-    validator_deviations = defaultdict(list)
-    last_timestamps: Dict[str, datetime] = {}
-
-    for v in all_validations:
-        try:
-            validator = v.get("validator_id")
-            hypothesis = v.get("hypothesis_id")
-            val_score = float(v.get("score", 0.5))
-            timestamp_str = v.get("timestamp")
-
-            if not validator or not hypothesis:
-                continue
-
-            consensus = consensus_scores.get(hypothesis)
-            if consensus is None:
-                continue
-
-            deviation = abs(val_score - consensus)
-            agreement_score = max(0.0, 1.0 - deviation)
-
-            validator_scores[validator].append(agreement_score)
-            validator_deviations[validator].append(deviation)
-            if timestamp_str:
-                try:
-                    ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    prev = last_timestamps.get(validator)
-                    if not prev or ts > prev:
-                        last_timestamps[validator] = ts
-                except Exception as e:
-                    logger.warning(f"Invalid timestamp for validator {validator}: {e}")
-
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid validation data: {v} - {e}")
-            continue
+    if isinstance(all_validations, ValidationFrame):
+        agreement_stats = _frame_agreement_stats(all_validations, consensus_scores)
+    else:
+        agreement_stats = _agreement_stats(all_validations, consensus_scores)
 
     reputations = {}
     flags = []
 
-    for validator, agreements in validator_scores.items():
+    for validator, (count, base_agreement, avg_deviation, ts) in agreement_stats.items():
         try:
-            if len(agreements) < Config.MIN_VALIDATIONS_REQUIRED:
+            if count < Config.MIN_VALIDATIONS_REQUIRED:
                 reputations[validator] = Config.DEFAULT_REPUTATION
                 continue
 
-            base_agreement = mean(agreements)
             temporal = max(0.0, min(1.0, temporal_trust.get(validator, 0.5)))
             diversity = max(0.0, min(1.0, diversity_scores.get(validator, 0.0)))
 
@@ -144,7 +118,6 @@ def compute_validator_reputations(
 
             final_reputation = max(Config.MIN_REPUTATION, min(Config.MAX_REPUTATION, reputation))
 
-            ts = last_timestamps.get(validator)
             if ts:
                 age_days = (current_time - ts).days
                 decay_factor = 0.5 ** (age_days / half_life)
@@ -155,8 +128,6 @@ def compute_validator_reputations(
                 3,
             )
 
-            avg_deviation = mean(validator_deviations[validator])
-
             if base_agreement > Config.HIGH_AGREEMENT_THRESHOLD and diversity < Config.LOW_DIVERSITY_THRESHOLD:
                 flags.append(f"validator_{validator}_suspicious_agreement_pattern")
 
@@ -188,6 +159,99 @@ def compute_validator_reputations(
         "stats": stats
     }
 
+def _agreement_stats(
+    all_validations: List[Dict[str, Any]], consensus_scores: Dict[str, float]
+) -> AgreementStats:
+    """Per-validator agreement with consensus, in first-appearance order."""
+    validator_scores = defaultdict(list)
+    validator_deviations = defaultdict(list)
+    last_timestamps: Dict[str, datetime] = {}
+
+    for v in all_validations:
+        try:
+            validator = v.get("validator_id")
+            hypothesis = v.get("hypothesis_id")
+            val_score = float(v.get("score", 0.5))
+            timestamp_str = v.get("timestamp")
+
+            if not validator or not hypothesis:
+                continue
+
+            consensus = consensus_scores.get(hypothesis)
+            if consensus is None:
+                continue
+
+            deviation = abs(val_score - consensus)
+            agreement_score = max(0.0, 1.0 - deviation)
+
+            validator_scores[validator].append(agreement_score)
+            validator_deviations[validator].append(deviation)
+            if timestamp_str:
+                try:
+                    ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                    prev = last_timestamps.get(validator)
+                    if not prev or ts > prev:
+                        last_timestamps[validator] = ts
+                except Exception as e:
+                    logger.warning(f"Invalid timestamp for validator {validator}: {e}")
+
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid validation data: {v} - {e}")
+            continue
+
+    return {
+        validator: (
+            len(agreements),
+            mean(agreements),
+            mean(validator_deviations[validator]),
+            last_timestamps.get(validator),
+        )
+        for validator, agreements in validator_scores.items()
+    }
+
+def _frame_agreement_stats(
+    frame: ValidationFrame, consensus_scores: Dict[str, float]
+) -> AgreementStats:
+    """:func:`_agreement_stats` over a frame's columns, grouped with ``bincount``."""
+    import numpy as np
+
+    consensus = np.array(
+        [consensus_scores.get(h) for h in frame.hypothesis_ids] + [None], dtype=np.float64
+    )[frame.hypothesis]
+    rows = np.flatnonzero(
+        (frame.validator >= 0) & ~np.isnan(frame.score) & ~np.isnan(consensus)
+    )
+    codes = frame.validator[rows]
+    deviation = np.abs(frame.score[rows] - consensus[rows])
+    agreement = np.maximum(0.0, 1.0 - deviation)
+
+    n = len(frame.validator_ids)
+    counts = np.bincount(codes, minlength=n).tolist()
+    agreement_sums = np.bincount(codes, agreement, minlength=n).tolist()
+    deviation_sums = np.bincount(codes, deviation, minlength=n).tolist()
+
+    # Latest timestamp per validator; the earliest row wins ties.
+    last_row = np.full(n, -1, dtype=np.int64)
+    stamped = rows[frame.ts_valid[rows]]
+    if len(stamped):
+        order = stamped[
+            np.lexsort((stamped, -frame.timestamp[stamped], frame.validator[stamped]))
+        ]
+        owner = frame.validator[order]
+        head = np.r_[True, owner[1:] != owner[:-1]]
+        last_row[owner[head]] = order[head]
+
+    stats: AgreementStats = {}
+    for code in ValidationFrame.first_appearance(codes).tolist():
+        count, row = counts[code], int(last_row[code])
+        stats[frame.validator_ids[code]] = (
+            count,
+            agreement_sums[code] / count,
+            deviation_sums[code] / count,
+            frame.datetime_at(row) if row >= 0 else None,
+        )
+    return stats
+
 def get_reputation_weighted_score(
     validations: List[Dict[str, Any]],
     reputations: Dict[str, float]
@@ -1,5 +1,5 @@
 """Strategies used by validators."""
 
-from . import voting_consensus_engine
+from . import delegation_graph, voting_consensus_engine
 
-__all__ = ["voting_consensus_engine"]
+__all__ = ["delegation_graph", "voting_consensus_engine"]
@@ -0,0 +1,198 @@
+"""
+delegation_graph.py — Transitive Vote Delegation (v4.6)
+
+Resolves liquid-democracy style ``delegate_to`` chains for the voting
+consensus engine. Every validator either votes directly or hands its weight
+to another validator; chains are followed to the validator that finally
+votes (its *terminal*), so A→B→C credits C with the reputation of all three.
+
+Delegation forms a functional graph, so each connected group contains at most
+one cycle. Cycles are broken deterministically: the member with the smallest
+id keeps its own vote and the rest of the cycle resolves to it.
+
+Terminals and effective weights are cached. Changing one delegation only
+re-resolves the validators that (transitively) delegate through the changed
+validator.
+"""
+
+import logging
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger("superNova_2177.voting")
+logger.propagate = False
+
+
+class DelegationGraph:
+    """Cached transitive delegation over a validator pool.
+
+    Args:
+        delegations: Optional mapping of validator id to delegate id
+        reputations: Optional reputation per validator
+        default_reputation: Reputation for validators missing from ``reputations``
+    """
+
+    def __init__(
+        self,
+        delegations: Optional[Dict[str, str]] = None,
+        reputations: Optional[Dict[str, float]] = None,
+        default_reputation: float = 0.5,
+    ) -> None:
+        self.default_reputation = default_reputation
+        self._reputations: Dict[str, float] = dict(reputations or {})
+        self._delegates: Dict[str, str] = {}
+        self._delegators: Dict[str, Set[str]] = defaultdict(set)
+        self._nodes: Set[str] = set(self._reputations)
+        self._terminal: Dict[str, str] = {}
+        self._weights: Dict[str, float] = defaultdict(float)
+        self._cycle_roots: Set[str] = set()
+        for validator, delegate in (delegations or {}).items():
+            self._link(validator, delegate)
+        self._resolve(sorted(self._nodes))
+        for node in self._nodes:
+            self._weights[self._terminal[node]] += self.reputation(node)
+
+    @classmethod
+    def from_votes(
+        cls, votes: Iterable[Dict[str, Any]], reputations: Optional[Dict[str, float]] = None
+    ) -> "DelegationGraph":
+        """Build a graph from the ``delegate_to`` fields of ``votes``."""
+        reputations = reputations or {}
+        delegations = {
+            v["validator_id"]: v["delegate_to"]
+            for v in votes
+            if v.get("validator_id") and v.get("delegate_to")
+        }
+        nodes = set(delegations) | set(delegations.values())
+        return cls(delegations, {n: reputations[n] for n in nodes if n in reputations})
+
+    def __contains__(self, validator: str) -> bool:
+        return validator in self._nodes
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def reputation(self, validator: str) -> float:
+        return self._reputations.get(validator, self.default_reputation)
+
+    def terminal(self, validator: str) -> str:
+        """Return the validator that ultimately casts ``validator``'s vote."""
+        return self._terminal.get(validator, validator)
+
+    def is_delegating(self, validator: str) -> bool:
+        """True if ``validator``'s vote is cast by someone else."""
+        return self.terminal(validator) != validator
+
+    def effective_weight(self, validator: str) -> float:
+        """Own reputation plus everything delegated to ``validator``.
+
+        Validators who delegate away have an effective weight of 0.
+        """
+        if validator not in self._nodes:
+            return self.reputation(validator)
+        if self._terminal[validator] != validator:
+            return 0.0
+        return self._weights[validator]
+
+    def effective_weights(self) -> Dict[str, float]:
+        """Effective weight of every validator that votes directly."""
+        return {v: w for v, w in self._weights.items() if self._terminal.get(v) == v}
+
+    @property
+    def cycle_roots(self) -> Set[str]:
+        """Validators whose delegation was ignored to break a cycle."""
+        return set(self._cycle_roots)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def set_delegation(self, validator: str, delegate_to: Optional[str]) -> None:
+        """Point ``validator`` at ``delegate_to``; ``None`` revokes delegation."""
+        if delegate_to == validator:
+            delegate_to = None
+        known = validator in self._nodes
+        if known and self._delegates.get(validator) == delegate_to:
+            return
+        affected = self._upstream(validator) if known else [validator]
+        if known:
+            for node in affected:
+                self._weights[self._terminal[node]] -= self.reputation(node)
+        previous = self._delegates.pop(validator, None)
+        if previous is not None:
+            self._delegators[previous].discard(validator)
+        self._nodes.add(validator)
+        if delegate_to is not None:
+            if delegate_to not in self._nodes:
+                self._nodes.add(delegate_to)
+                self._resolve([delegate_to])
+                self._weights[delegate_to] += self.reputation(delegate_to)
+            self._link(validator, delegate_to)
+        for node in affected:
+            self._terminal.pop(node, None)
+            self._cycle_roots.discard(node)
+        self._resolve(sorted(affected))
+        for node in affected:
+            self._weights[self._terminal[node]] += self.reputation(node)
+
+    def set_reputation(self, validator: str, reputation: float) -> None:
+        """Change one validator's reputation and its terminal's weight."""
+        if validator not in self._nodes:
+            self._nodes.add(validator)
+            self._resolve([validator])
+            self._weights[validator] += self.reputation(validator)
+        delta = reputation - self.reputation(validator)
+        self._reputations[validator] = reputation
+        self._weights[self._terminal[validator]] += delta
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _link(self, validator: str, delegate_to: str) -> None:
+        self._delegates[validator] = delegate_to
+        self._delegators[delegate_to].add(validator)
+        self._nodes.add(validator)
+        self._nodes.add(delegate_to)
+
+    def _upstream(self, validator: str) -> List[str]:
+        """``validator`` and everyone whose delegation chain passes through it."""
+        seen = {validator}
+        queue = deque([validator])
+        while queue:
+            for delegator in self._delegators.get(queue.popleft(), ()):
+                if delegator not in seen:
+                    seen.add(delegator)
+                    queue.append(delegator)
+        return list(seen)
+
+    def _resolve(self, nodes: Iterable[str]) -> None:
+        """Assign terminals to ``nodes`` by walking each chain once."""
+        for start in nodes:
+            if start in self._terminal:
+                continue
+            path: List[str] = []
+            position: Dict[str, int] = {}
+            node = start
+            while True:
+                if node in self._terminal:
+                    terminal = self._terminal[node]
+                    break
+                if node in position:
+                    cycle = path[position[node] :]
+                    terminal = min(cycle)
+                    self._cycle_roots.add(terminal)
+                    logger.warning(
+                        "Delegation cycle %s broken at %s", " -> ".join(cycle), terminal
+                    )
+                    break
+                position[node] = len(path)
+                path.append(node)
+                nxt = self._delegates.get(node)
+                if nxt is None:
+                    terminal = node
+                    break
+                node = nxt
+            for member in path:
+                self._terminal[member] = terminal
+
+
+__all__ = ["DelegationGraph"]
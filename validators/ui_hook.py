@@ -6,7 +6,11 @@ from typing import Any, Dict
 from frontend_bridge import register_route_once
 from hook_manager import HookManager
 from hooks import events
-from validator_reputation_tracker import update_validator_reputations
+from exceptions import DataAccessError
+from validator_reputation_tracker import (
+    load_reputation_accumulator,
+    update_validator_reputations,
+)
 from diversity_analyzer import compute_diversity_score
 
 from .reputation_influence_tracker import compute_validator_reputations
@@ -46,10 +50,20 @@ async def compute_reputation_ui(payload: Dict[str, Any]) -> Dict[str, Any]:
 async def update_reputations_ui(
     payload: Dict[str, Any], db, **_: Any
 ) -> Dict[str, Any]:
-    """Update validator reputations and emit an internal event."""
+    """Update validator reputations and emit an internal event.
+
+    ``validations`` are new records: they are folded into the reputation
+    state stored by earlier calls rather than rescored on their own.
+    """
 
     validations = payload.get("validations", [])
-    result = update_validator_reputations(validations, db=db)
+    accumulator = None
+    if db is not None:
+        try:
+            accumulator = load_reputation_accumulator(db)
+        except DataAccessError:
+            logging.warning("Stored reputation state unavailable; scoring batch alone")
+    result = update_validator_reputations(validations, db=db, accumulator=accumulator)
 
     minimal = {
         "reputations": result.get("reputations", {}),